@@ -0,0 +1,140 @@
+"""add crawl_log message search index
+
+Revision ID: 3c8f1a6e9d27
+Revises: 9b2e5d4c7f18
+Create Date: 2026-10-16 18:05:31.402716
+
+Adds a trigram GIN index on (job_id, message) to every crawl_log partition so
+job log searches (message ILIKE '%text%') use an index instead of scanning all
+of a job's log rows. New partitions get the index from create_crawl_log_partition.
+
+On large deployments, build the indexes on existing partitions without blocking
+writes before upgrading:
+
+    python scripts/maintain_partitions.py create-indexes
+
+The upgrade then skips every partition that already has its index.
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c8f1a6e9d27"
+down_revision: str | Sequence[str] | None = "9b2e5d4c7f18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTITION_FUNCTION_TEMPLATE = """
+    CREATE OR REPLACE FUNCTION create_crawl_log_partition(partition_date DATE)
+    RETURNS TEXT AS $$
+    DECLARE
+        partition_name TEXT;
+        start_date DATE;
+        end_date DATE;
+    BEGIN
+        start_date := DATE_TRUNC('month', partition_date);
+        end_date := start_date + INTERVAL '1 month';
+        partition_name := 'crawl_log_' || TO_CHAR(start_date, 'YYYY_MM');
+
+        IF EXISTS (
+            SELECT 1 FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE c.relname = partition_name
+            AND n.nspname = 'public'
+        ) THEN
+            RETURN 'Partition ' || partition_name || ' already exists';
+        END IF;
+
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF crawl_log FOR VALUES FROM (%L) TO (%L)',
+            partition_name,
+            start_date,
+            end_date
+        );
+
+        EXECUTE format('CREATE INDEX %I ON %I(job_id)',
+            partition_name || '_job_id_idx', partition_name);
+        EXECUTE format('CREATE INDEX %I ON %I(website_id)',
+            partition_name || '_website_id_idx', partition_name);
+        EXECUTE format('CREATE INDEX %I ON %I(log_level)',
+            partition_name || '_log_level_idx', partition_name);
+        EXECUTE format('CREATE INDEX %I ON %I(trace_id)',
+            partition_name || '_trace_id_idx', partition_name);
+        EXECUTE format('CREATE INDEX %I ON %I(job_id, created_at)',
+            partition_name || '_job_created_idx', partition_name);{search_index}
+
+        -- Add foreign key constraints to the partition
+        EXECUTE format(
+            'ALTER TABLE %I ADD CONSTRAINT %I FOREIGN KEY (job_id) REFERENCES crawl_job(id) ON DELETE CASCADE',
+            partition_name, partition_name || '_job_id_fkey'
+        );
+        EXECUTE format(
+            'ALTER TABLE %I ADD CONSTRAINT %I FOREIGN KEY (website_id) REFERENCES website(id) ON DELETE CASCADE',
+            partition_name, partition_name || '_website_id_fkey'
+        );
+
+        RETURN 'Created partition ' || partition_name || ' for range [' ||
+               start_date || ', ' || end_date || ')';
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+SEARCH_INDEX_STATEMENT = """
+        EXECUTE format('CREATE INDEX %I ON %I USING gin (job_id, message gin_trgm_ops)',
+            partition_name || '_message_trgm_idx', partition_name);"""
+
+PARTITIONS_QUERY = """
+    SELECT tablename
+    FROM pg_tables
+    WHERE schemaname = 'public'
+    AND tablename ~ '^crawl_log_[0-9]{4}_[0-9]{2}$'
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # btree_gin lets the uuid job_id share the GIN index with the message trigrams
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    op.execute(PARTITION_FUNCTION_TEMPLATE.format(search_index=SEARCH_INDEX_STATEMENT))
+
+    op.execute(f"""
+        DO $$
+        DECLARE
+            partition_record RECORD;
+        BEGIN
+            FOR partition_record IN {PARTITIONS_QUERY} LOOP
+                EXECUTE format(
+                    'CREATE INDEX IF NOT EXISTS %I ON %I '
+                    'USING gin (job_id, message gin_trgm_ops)',
+                    partition_record.tablename || '_message_trgm_idx',
+                    partition_record.tablename
+                );
+            END LOOP;
+        END;
+        $$
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(f"""
+        DO $$
+        DECLARE
+            partition_record RECORD;
+        BEGIN
+            FOR partition_record IN {PARTITIONS_QUERY} LOOP
+                EXECUTE format(
+                    'DROP INDEX IF EXISTS %I',
+                    partition_record.tablename || '_message_trgm_idx'
+                );
+            END LOOP;
+        END;
+        $$
+    """)
+
+    op.execute(PARTITION_FUNCTION_TEMPLATE.format(search_index=""))
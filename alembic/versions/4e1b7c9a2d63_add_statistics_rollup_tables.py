@@ -0,0 +1,381 @@
+"""add statistics rollup tables
+
+Revision ID: 4e1b7c9a2d63
+Revises: d72f8322ac3d
+Create Date: 2026-10-16 14:05:12.481377
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e1b7c9a2d63"
+down_revision: str | Sequence[str] | None = "d72f8322ac3d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Folded per-website counters
+    op.execute("""
+    CREATE TABLE website_stats (
+        website_id UUID PRIMARY KEY REFERENCES website(id) ON DELETE CASCADE,
+        total_jobs INT NOT NULL DEFAULT 0,
+        completed_jobs INT NOT NULL DEFAULT 0,
+        failed_jobs INT NOT NULL DEFAULT 0,
+        cancelled_jobs INT NOT NULL DEFAULT 0,
+        total_pages BIGINT NOT NULL DEFAULT 0,
+        duplicate_pages BIGINT NOT NULL DEFAULT 0,
+        duplicate_similarity_sum BIGINT NOT NULL DEFAULT 0,
+        scored_duplicate_pages BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+    """)
+
+    # Changes not yet folded into website_stats. Triggers only ever insert here, so
+    # long-running job transactions never wait on each other for a counter row.
+    # No foreign key: deltas of deleted websites are dropped when folded.
+    op.execute("""
+    CREATE TABLE website_stats_delta (
+        id BIGSERIAL PRIMARY KEY,
+        website_id UUID NOT NULL,
+        total_jobs INT NOT NULL DEFAULT 0,
+        completed_jobs INT NOT NULL DEFAULT 0,
+        failed_jobs INT NOT NULL DEFAULT 0,
+        cancelled_jobs INT NOT NULL DEFAULT 0,
+        total_pages BIGINT NOT NULL DEFAULT 0,
+        duplicate_pages BIGINT NOT NULL DEFAULT 0,
+        duplicate_similarity_sum BIGINT NOT NULL DEFAULT 0,
+        scored_duplicate_pages BIGINT NOT NULL DEFAULT 0,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+    """)
+
+    op.execute("""
+    CREATE INDEX ix_website_stats_delta_website_id
+    ON website_stats_delta(website_id);
+    """)
+
+    # Latest completed job per website, read directly instead of rolled up: a MAX
+    # cannot be lowered by a delta when that job is deleted or leaves 'completed'
+    op.execute("""
+    CREATE INDEX ix_crawl_job_website_completed_at
+    ON crawl_job(website_id, completed_at)
+    WHERE status = 'completed';
+    """)
+
+    # Per-group counters maintained alongside duplicate_group.group_size
+    op.execute("""
+    CREATE TABLE duplicate_group_stats (
+        group_id UUID PRIMARY KEY REFERENCES duplicate_group(id) ON DELETE CASCADE,
+        relationship_count INT NOT NULL DEFAULT 0,
+        similarity_sum BIGINT NOT NULL DEFAULT 0,
+        scored_relationship_count INT NOT NULL DEFAULT 0,
+        first_detected_at TIMESTAMPTZ,
+        last_detected_at TIMESTAMPTZ
+    );
+    """)
+
+    # One delta per job insert, delete or status change
+    op.execute("""
+    CREATE OR REPLACE FUNCTION record_crawl_job_stats_delta()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND OLD.website_id IS NOT DISTINCT FROM NEW.website_id THEN
+            IF NEW.website_id IS NOT NULL AND OLD.status IS DISTINCT FROM NEW.status THEN
+                INSERT INTO website_stats_delta (
+                    website_id, completed_jobs, failed_jobs, cancelled_jobs
+                ) VALUES (
+                    NEW.website_id,
+                    (NEW.status = 'completed')::INT - (OLD.status = 'completed')::INT,
+                    (NEW.status = 'failed')::INT - (OLD.status = 'failed')::INT,
+                    (NEW.status = 'cancelled')::INT - (OLD.status = 'cancelled')::INT
+                );
+            END IF;
+            RETURN NULL;
+        END IF;
+
+        IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.website_id IS NOT NULL THEN
+            INSERT INTO website_stats_delta (
+                website_id, total_jobs, completed_jobs, failed_jobs, cancelled_jobs
+            ) VALUES (
+                OLD.website_id,
+                -1,
+                -(OLD.status = 'completed')::INT,
+                -(OLD.status = 'failed')::INT,
+                -(OLD.status = 'cancelled')::INT
+            );
+        END IF;
+
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.website_id IS NOT NULL THEN
+            INSERT INTO website_stats_delta (
+                website_id, total_jobs, completed_jobs, failed_jobs, cancelled_jobs
+            ) VALUES (
+                NEW.website_id,
+                1,
+                (NEW.status = 'completed')::INT,
+                (NEW.status = 'failed')::INT,
+                (NEW.status = 'cancelled')::INT
+            );
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trigger_record_crawl_job_stats_delta
+    AFTER INSERT OR DELETE OR UPDATE OF status, website_id ON crawl_job
+    FOR EACH ROW
+    EXECUTE FUNCTION record_crawl_job_stats_delta();
+    """)
+
+    # One delta per website per statement, so bulk page upserts add a single row
+    op.execute("""
+    CREATE OR REPLACE FUNCTION record_crawled_page_stats_delta()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO website_stats_delta (
+                website_id, total_pages, duplicate_pages, duplicate_similarity_sum,
+                scored_duplicate_pages
+            )
+            SELECT
+                website_id,
+                COUNT(*),
+                COUNT(*) FILTER (WHERE is_duplicate),
+                COALESCE(SUM(similarity_score) FILTER (WHERE is_duplicate), 0),
+                COUNT(similarity_score) FILTER (WHERE is_duplicate)
+            FROM new_pages
+            GROUP BY website_id;
+        ELSIF TG_OP = 'DELETE' THEN
+            INSERT INTO website_stats_delta (
+                website_id, total_pages, duplicate_pages, duplicate_similarity_sum,
+                scored_duplicate_pages
+            )
+            SELECT
+                website_id,
+                -COUNT(*),
+                -COUNT(*) FILTER (WHERE is_duplicate),
+                -COALESCE(SUM(similarity_score) FILTER (WHERE is_duplicate), 0),
+                -COUNT(similarity_score) FILTER (WHERE is_duplicate)
+            FROM old_pages
+            GROUP BY website_id;
+        ELSE
+            INSERT INTO website_stats_delta (
+                website_id, total_pages, duplicate_pages, duplicate_similarity_sum,
+                scored_duplicate_pages
+            )
+            SELECT
+                website_id,
+                SUM(pages),
+                SUM(duplicates),
+                SUM(similarity),
+                SUM(scored)
+            FROM (
+                SELECT
+                    website_id,
+                    1 AS pages,
+                    is_duplicate::INT AS duplicates,
+                    CASE WHEN is_duplicate THEN COALESCE(similarity_score, 0) ELSE 0 END
+                        AS similarity,
+                    (is_duplicate AND similarity_score IS NOT NULL)::INT AS scored
+                FROM new_pages
+                UNION ALL
+                SELECT
+                    website_id,
+                    -1,
+                    -is_duplicate::INT,
+                    CASE WHEN is_duplicate THEN -COALESCE(similarity_score, 0) ELSE 0 END,
+                    -(is_duplicate AND similarity_score IS NOT NULL)::INT
+                FROM old_pages
+            ) changes
+            GROUP BY website_id
+            HAVING SUM(pages) <> 0 OR SUM(duplicates) <> 0
+                OR SUM(similarity) <> 0 OR SUM(scored) <> 0;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trigger_record_crawled_page_insert_stats_delta
+    AFTER INSERT ON crawled_page
+    REFERENCING NEW TABLE AS new_pages
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION record_crawled_page_stats_delta();
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trigger_record_crawled_page_update_stats_delta
+    AFTER UPDATE ON crawled_page
+    REFERENCING OLD TABLE AS old_pages NEW TABLE AS new_pages
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION record_crawled_page_stats_delta();
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trigger_record_crawled_page_delete_stats_delta
+    AFTER DELETE ON crawled_page
+    REFERENCING OLD TABLE AS old_pages
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION record_crawled_page_stats_delta();
+    """)
+
+    # Keep duplicate_group_stats in step with relationships, like group_size
+    op.execute("""
+    CREATE OR REPLACE FUNCTION update_duplicate_group_stats()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO duplicate_group_stats (
+                group_id, relationship_count, similarity_sum, scored_relationship_count,
+                first_detected_at, last_detected_at
+            ) VALUES (
+                NEW.group_id,
+                1,
+                COALESCE(NEW.similarity_score, 0),
+                (NEW.similarity_score IS NOT NULL)::INT,
+                NEW.detected_at,
+                NEW.detected_at
+            )
+            ON CONFLICT (group_id) DO UPDATE SET
+                relationship_count = duplicate_group_stats.relationship_count + 1,
+                similarity_sum = duplicate_group_stats.similarity_sum
+                    + EXCLUDED.similarity_sum,
+                scored_relationship_count = duplicate_group_stats.scored_relationship_count
+                    + EXCLUDED.scored_relationship_count,
+                first_detected_at = LEAST(
+                    duplicate_group_stats.first_detected_at, EXCLUDED.first_detected_at
+                ),
+                last_detected_at = GREATEST(
+                    duplicate_group_stats.last_detected_at, EXCLUDED.last_detected_at
+                );
+        ELSIF TG_OP = 'UPDATE' THEN
+            UPDATE duplicate_group_stats
+            SET similarity_sum = similarity_sum
+                    - COALESCE(OLD.similarity_score, 0) + COALESCE(NEW.similarity_score, 0),
+                scored_relationship_count = scored_relationship_count
+                    - (OLD.similarity_score IS NOT NULL)::INT
+                    + (NEW.similarity_score IS NOT NULL)::INT
+            WHERE group_id = NEW.group_id;
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE duplicate_group_stats
+            SET relationship_count = relationship_count - 1,
+                similarity_sum = similarity_sum - COALESCE(OLD.similarity_score, 0),
+                scored_relationship_count = scored_relationship_count
+                    - (OLD.similarity_score IS NOT NULL)::INT
+            WHERE group_id = OLD.group_id;
+
+            -- Only re-read the group when the removed relationship bounded its range
+            UPDATE duplicate_group_stats s
+            SET first_detected_at = r.first_detected,
+                last_detected_at = r.last_detected
+            FROM (
+                SELECT MIN(detected_at) AS first_detected, MAX(detected_at) AS last_detected
+                FROM duplicate_relationship
+                WHERE group_id = OLD.group_id
+            ) r
+            WHERE s.group_id = OLD.group_id
+              AND OLD.detected_at IN (s.first_detected_at, s.last_detected_at);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trigger_update_duplicate_group_stats
+    AFTER INSERT OR DELETE OR UPDATE OF similarity_score ON duplicate_relationship
+    FOR EACH ROW
+    EXECUTE FUNCTION update_duplicate_group_stats();
+    """)
+
+    # Backfill from existing rows
+    op.execute("""
+    INSERT INTO website_stats (
+        website_id, total_jobs, completed_jobs, failed_jobs, cancelled_jobs,
+        total_pages, duplicate_pages, duplicate_similarity_sum, scored_duplicate_pages
+    )
+    SELECT
+        w.id,
+        COALESCE(j.total_jobs, 0),
+        COALESCE(j.completed_jobs, 0),
+        COALESCE(j.failed_jobs, 0),
+        COALESCE(j.cancelled_jobs, 0),
+        COALESCE(p.total_pages, 0),
+        COALESCE(p.duplicate_pages, 0),
+        COALESCE(p.duplicate_similarity_sum, 0),
+        COALESCE(p.scored_duplicate_pages, 0)
+    FROM website w
+    LEFT JOIN (
+        SELECT
+            website_id,
+            COUNT(*) AS total_jobs,
+            COUNT(*) FILTER (WHERE status = 'completed') AS completed_jobs,
+            COUNT(*) FILTER (WHERE status = 'failed') AS failed_jobs,
+            COUNT(*) FILTER (WHERE status = 'cancelled') AS cancelled_jobs
+        FROM crawl_job
+        WHERE website_id IS NOT NULL
+        GROUP BY website_id
+    ) j ON j.website_id = w.id
+    LEFT JOIN (
+        SELECT
+            website_id,
+            COUNT(*) AS total_pages,
+            COUNT(*) FILTER (WHERE is_duplicate) AS duplicate_pages,
+            COALESCE(SUM(similarity_score) FILTER (WHERE is_duplicate), 0)
+                AS duplicate_similarity_sum,
+            COUNT(similarity_score) FILTER (WHERE is_duplicate) AS scored_duplicate_pages
+        FROM crawled_page
+        GROUP BY website_id
+    ) p ON p.website_id = w.id;
+    """)
+
+    op.execute("""
+    INSERT INTO duplicate_group_stats (
+        group_id, relationship_count, similarity_sum, scored_relationship_count,
+        first_detected_at, last_detected_at
+    )
+    SELECT
+        group_id,
+        COUNT(*),
+        COALESCE(SUM(similarity_score), 0),
+        COUNT(similarity_score),
+        MIN(detected_at),
+        MAX(detected_at)
+    FROM duplicate_relationship
+    GROUP BY group_id;
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Drop triggers first
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_update_duplicate_group_stats ON duplicate_relationship;"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_record_crawled_page_delete_stats_delta ON crawled_page;"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_record_crawled_page_update_stats_delta ON crawled_page;"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_record_crawled_page_insert_stats_delta ON crawled_page;"
+    )
+    op.execute("DROP TRIGGER IF EXISTS trigger_record_crawl_job_stats_delta ON crawl_job;")
+    op.execute("DROP FUNCTION IF EXISTS update_duplicate_group_stats();")
+    op.execute("DROP FUNCTION IF EXISTS record_crawled_page_stats_delta();")
+    op.execute("DROP FUNCTION IF EXISTS record_crawl_job_stats_delta();")
+
+    op.execute("DROP INDEX IF EXISTS ix_crawl_job_website_completed_at;")
+    op.execute("DROP INDEX IF EXISTS ix_website_stats_delta_website_id;")
+
+    op.execute("DROP TABLE IF EXISTS duplicate_group_stats;")
+    op.execute("DROP TABLE IF EXISTS website_stats_delta;")
+    op.execute("DROP TABLE IF EXISTS website_stats;")
@@ -0,0 +1,53 @@
+"""add job checkpoint tables
+
+Revision ID: 6f2a9c4e1b58
+Revises: 3c8f1a6e9d27
+Create Date: 2026-10-16 19:12:44.305816
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6f2a9c4e1b58"
+down_revision: str | Sequence[str] | None = "3c8f1a6e9d27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Output of each completed step of a job, restored when a retry resumes the job.
+    # config_hash identifies the step configuration the output was produced with.
+    op.execute("""
+    CREATE TABLE job_step_checkpoint (
+        job_id UUID NOT NULL REFERENCES crawl_job(id) ON DELETE CASCADE,
+        step_name VARCHAR(255) NOT NULL,
+        config_hash VARCHAR(64) NOT NULL,
+        result JSONB NOT NULL,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (job_id, step_name)
+    );
+    """)
+
+    # Pages a scrape step already scraped, so a retry only fetches the remaining URLs
+    op.execute("""
+    CREATE TABLE job_page_checkpoint (
+        job_id UUID NOT NULL REFERENCES crawl_job(id) ON DELETE CASCADE,
+        step_name VARCHAR(255) NOT NULL,
+        url_hash VARCHAR(64) NOT NULL,
+        config_hash VARCHAR(64) NOT NULL,
+        url TEXT NOT NULL,
+        page JSONB NOT NULL,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (job_id, step_name, url_hash)
+    );
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TABLE IF EXISTS job_page_checkpoint;")
+    op.execute("DROP TABLE IF EXISTS job_step_checkpoint;")
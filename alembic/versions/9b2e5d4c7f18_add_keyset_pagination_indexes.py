@@ -0,0 +1,44 @@
+"""add keyset pagination indexes
+
+Revision ID: 9b2e5d4c7f18
+Revises: 4e1b7c9a2d63
+Create Date: 2026-10-16 16:42:08.917305
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b2e5d4c7f18"
+down_revision: str | Sequence[str] | None = "4e1b7c9a2d63"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pages seek to (created_at, id) > cursor within a job or website and read
+    # forward, so the position costs one index descent instead of skipping OFFSET rows.
+    op.execute(
+        "CREATE INDEX ix_crawled_page_job_id_created_at_id ON crawled_page (job_id, created_at, id)"
+    )
+    op.execute(
+        "CREATE INDEX ix_crawled_page_website_id_created_at_id "
+        "ON crawled_page (website_id, created_at, id)"
+    )
+    op.execute("CREATE INDEX ix_duplicate_group_created_at_id ON duplicate_group (created_at, id)")
+
+    # Supersedes idx_dlq_added_at; the id column makes the newest-first order total
+    op.execute("CREATE INDEX idx_dlq_added_at_id ON dead_letter_queue (added_to_dlq_at, id)")
+    op.execute("DROP INDEX IF EXISTS idx_dlq_added_at")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("CREATE INDEX idx_dlq_added_at ON dead_letter_queue (added_to_dlq_at DESC)")
+    op.execute("DROP INDEX IF EXISTS idx_dlq_added_at_id")
+    op.execute("DROP INDEX IF EXISTS ix_duplicate_group_created_at_id")
+    op.execute("DROP INDEX IF EXISTS ix_crawled_page_website_id_created_at_id")
+    op.execute("DROP INDEX IF EXISTS ix_crawled_page_job_id_created_at_id")
@@ -0,0 +1,40 @@
+"""add simhash band indexes to content hash
+
+Revision ID: d72f8322ac3d
+Revises: 55248686c997
+Create Date: 2026-10-16 09:12:40.318204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d72f8322ac3d"
+down_revision: str | Sequence[str] | None = "55248686c997"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Bit offset of each 16-bit band within the 64-bit fingerprint
+BAND_SHIFTS = (0, 16, 32, 48)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One expression index per 16-bit band. Two fingerprints within Hamming distance 3
+    # must agree on at least one of the 4 bands, so near-duplicate lookups can probe
+    # these indexes and verify only the candidates instead of scanning the table.
+    # The expressions must match FindSimilarContentByBands exactly.
+    for band, shift in enumerate(BAND_SHIFTS):
+        op.execute(
+            f"CREATE INDEX idx_content_hash_simhash_band_{band} ON content_hash "
+            f"(((simhash_fingerprint >> {shift}) & 65535)) "
+            "WHERE simhash_fingerprint IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for band in range(len(BAND_SHIFTS)):
+        op.execute(f"DROP INDEX IF EXISTS idx_content_hash_simhash_band_{band}")
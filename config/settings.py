@@ -82,6 +82,80 @@ class Settings(BaseSettings):
     nats_url: str = Field(default="nats://localhost:4222", description="NATS server URL")
     nats_stream_name: str = "CRAWLER_TASKS"
     nats_consumer_name: str = "crawler-worker"
+    nats_max_ack_pending: int = Field(
+        default=100,
+        description="Maximum unacknowledged messages across all consumers of the job queue",
+    )
+
+    # Worker
+    worker_concurrency: int = Field(
+        default=4,
+        description="Maximum number of crawl jobs a single worker process runs concurrently",
+    )
+    worker_heartbeat_interval: float = Field(
+        default=60.0,
+        description="Seconds between in-progress acks for running jobs (must be below ack_wait)",
+    )
+    worker_drain_timeout: float = Field(
+        default=300.0,
+        description="Seconds to wait for in-flight jobs on shutdown before requeueing them",
+    )
+    scrape_streaming_enabled: bool = Field(
+        default=True,
+        description="Persist scraped pages while a scrape step runs instead of at job end",
+    )
+    scrape_pipeline_max_pending: int = Field(
+        default=200,
+        description="Scraped pages buffered for persistence before scraping waits",
+    )
+    step_pipelining_enabled: bool = Field(
+        default=True,
+        description="Start a scrape step on URLs from its crawl step while the crawl still runs",
+    )
+    step_pipeline_max_batches: int = Field(
+        default=32,
+        description="URL batches (one per crawled page) queued for a pipelined scrape step",
+    )
+    incremental_recrawl_enabled: bool = Field(
+        default=True,
+        description="Re-crawl saved pages with conditional requests and skip unchanged ones",
+    )
+    job_checkpoint_enabled: bool = Field(
+        default=True,
+        description="Checkpoint completed steps and scraped pages so job retries resume",
+    )
+    job_checkpoint_batch_size: int = Field(
+        default=100,
+        description="Scraped pages buffered before their checkpoints are written",
+    )
+    job_cancellation_push_enabled: bool = Field(
+        default=True,
+        description="Receive job cancellations over Redis pub/sub and stop running steps",
+    )
+    crawl_log_buffer_size: int = Field(
+        default=10000,
+        description="Crawl log entries buffered per worker before the drop policy applies",
+    )
+    crawl_log_batch_size: int = Field(
+        default=500,
+        description="Maximum crawl log entries written per INSERT",
+    )
+    crawl_log_flush_interval: float = Field(
+        default=1.0,
+        description="Seconds between flushes of a partial crawl log batch",
+    )
+    crawl_log_drop_policy: Literal["drop_oldest", "drop_newest"] = Field(
+        default="drop_oldest",
+        description="Crawl log entry dropped when the buffer is full",
+    )
+    website_stats_fold_interval: int = Field(
+        default=30,
+        description="Seconds between folds of pending statistics deltas into website_stats",
+    )
+    website_stats_fold_batch_size: int = Field(
+        default=10000,
+        description="Maximum statistics deltas folded per transaction",
+    )
 
     # Google Cloud Storage
     gcs_bucket_name: str = Field(
@@ -91,6 +165,28 @@ class Settings(BaseSettings):
         default=None, description="Base64-encoded GCS service account credentials JSON"
     )
 
+    # Raw HTML Storage
+    raw_html_storage_enabled: bool = Field(
+        default=False,
+        description="Upload raw HTML of scraped pages to object storage",
+    )
+    storage_backend: Literal["gcs", "local"] = Field(
+        default="gcs",
+        description="Object storage backend (local writes to storage_local_path)",
+    )
+    storage_local_path: str = Field(
+        default="./data/storage",
+        description="Root directory of the local storage backend",
+    )
+    storage_compression: Literal["none", "gzip", "zstd"] = Field(
+        default="gzip",
+        description="Compression applied to stored HTML",
+    )
+    storage_max_concurrency: int = Field(
+        default=16,
+        description="Maximum concurrent object storage requests per process",
+    )
+
     # Crawler Settings
     max_concurrent_requests: int = 5
     request_timeout: int = 30
@@ -127,10 +223,38 @@ class Settings(BaseSettings):
         default=2.0,
         description="Base multiplier for exponential backoff (seconds = base^attempt)",
     )
+    browser_warm_contexts_per_browser: int = Field(
+        default=1,
+        description="Browser contexts created per browser at startup, ready for first use",
+    )
+    browser_context_max_uses: int = Field(
+        default=50,
+        description="Uses before a reused browser context is closed (1 disables reuse)",
+    )
+    browser_static_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Size of the static asset cache shared by browser contexts (0 disables it)",
+    )
 
     # Rate Limiting
     rate_limit_requests: int = 1000
     rate_limit_period: int = 60  # seconds
+    host_rate_limit_enabled: bool = Field(
+        default=True,
+        description="Pace requests per host across all jobs and workers through Redis",
+    )
+    host_requests_per_second: float = Field(
+        default=2.0,
+        description="Default per-host request rate when a job sets no rate_limit",
+    )
+    host_rate_limit_burst: int = Field(
+        default=10,
+        description="Default per-host requests allowed back to back",
+    )
+    host_rate_limit_lease_size: int = Field(
+        default=4,
+        description="Per-host request slots a worker reserves per Redis round trip",
+    )
 
     # Monitoring
     enable_metrics: bool = True
@@ -141,6 +265,46 @@ class Settings(BaseSettings):
     log_format: str = "json"
     log_file: str = "logs/crawler.log"
 
+    @field_validator("worker_concurrency")
+    @classmethod
+    def validate_worker_concurrency(cls, v: int) -> int:
+        """Validate worker concurrency is positive."""
+        if v < 1:
+            raise ValueError("worker_concurrency must be at least 1")
+        return v
+
+    @field_validator("scrape_pipeline_max_pending")
+    @classmethod
+    def validate_scrape_pipeline_max_pending(cls, v: int) -> int:
+        """Validate the scrape pipeline buffer is positive."""
+        if v < 1:
+            raise ValueError("scrape_pipeline_max_pending must be at least 1")
+        return v
+
+    @field_validator("step_pipeline_max_batches")
+    @classmethod
+    def validate_step_pipeline_max_batches(cls, v: int) -> int:
+        """Validate the step pipeline buffer is positive."""
+        if v < 1:
+            raise ValueError("step_pipeline_max_batches must be at least 1")
+        return v
+
+    @field_validator("job_checkpoint_batch_size")
+    @classmethod
+    def validate_job_checkpoint_batch_size(cls, v: int) -> int:
+        """Validate the job checkpoint batch size is positive."""
+        if v < 1:
+            raise ValueError("job_checkpoint_batch_size must be at least 1")
+        return v
+
+    @field_validator("storage_max_concurrency")
+    @classmethod
+    def validate_storage_max_concurrency(cls, v: int) -> int:
+        """Validate storage concurrency is positive."""
+        if v < 1:
+            raise ValueError("storage_max_concurrency must be at least 1")
+        return v
+
     @field_validator("browser_max_recovery_attempts")
     @classmethod
     def validate_max_recovery_attempts(cls, v: int) -> int:
@@ -149,6 +313,30 @@ class Settings(BaseSettings):
             raise ValueError("browser_max_recovery_attempts must be at least 1")
         return v
 
+    @field_validator("browser_warm_contexts_per_browser")
+    @classmethod
+    def validate_warm_contexts_per_browser(cls, v: int) -> int:
+        """Validate warm context count is not negative."""
+        if v < 0:
+            raise ValueError("browser_warm_contexts_per_browser must not be negative")
+        return v
+
+    @field_validator("browser_context_max_uses")
+    @classmethod
+    def validate_context_max_uses(cls, v: int) -> int:
+        """Validate context max uses is positive."""
+        if v < 1:
+            raise ValueError("browser_context_max_uses must be at least 1")
+        return v
+
+    @field_validator("browser_static_cache_max_bytes")
+    @classmethod
+    def validate_static_cache_max_bytes(cls, v: int) -> int:
+        """Validate static cache size is not negative."""
+        if v < 0:
+            raise ValueError("browser_static_cache_max_bytes must not be negative")
+        return v
+
     @field_validator("browser_recovery_backoff_base")
     @classmethod
     def validate_recovery_backoff_base(cls, v: float) -> float:
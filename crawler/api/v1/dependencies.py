@@ -13,10 +13,12 @@ from crawler.api.v1.services import (
     DuplicateService,
     JobService,
     LogService,
+    PageExportService,
     ScheduledJobService,
     WebsiteService,
 )
 from crawler.core.dependencies import DBSessionDep, JobCancellationFlagDep, NATSQueueDep
+from crawler.db import session as db_session
 from crawler.db.repositories import (
     CrawlJobRepository,
     CrawlLogRepository,
@@ -247,6 +249,24 @@ async def get_scheduled_job_service(
     )
 
 
+async def get_page_export_service() -> PageExportService:
+    """Get page export service with injected dependencies.
+
+    Returns:
+        PageExportService instance with the database engine
+
+    Usage:
+        async def my_route(page_export_service: PageExportServiceDep):
+            chunks = await page_export_service.export_job_pages(job_id)
+
+    Note:
+        No request session is opened: the streamed body outlives the route, so
+        the service takes connections from the engine for exactly as long as it
+        reads. The engine is looked up per request so a replaced engine is honored.
+    """
+    return PageExportService(engine=db_session.engine)
+
+
 # Type aliases for dependency injection
 WebsiteServiceDep = Annotated[WebsiteService, Depends(get_website_service)]
 JobServiceDep = Annotated[JobService, Depends(get_job_service)]
@@ -254,3 +274,4 @@ LogServiceDep = Annotated[LogService, Depends(get_log_service)]
 DuplicateServiceDep = Annotated[DuplicateService, Depends(get_duplicate_service)]
 DLQServiceDep = Annotated[DLQService, Depends(get_dlq_service)]
 ScheduledJobServiceDep = Annotated[ScheduledJobService, Depends(get_scheduled_job_service)]
+PageExportServiceDep = Annotated[PageExportService, Depends(get_page_export_service)]
@@ -19,6 +19,7 @@ from .jobs import (
     generate_ws_token_handler,
 )
 from .logs import get_job_logs_handler
+from .pages import export_job_pages_handler, export_website_pages_handler
 from .scheduled_jobs import (
     delete_scheduled_job_handler,
     get_scheduled_job_handler,
@@ -46,6 +47,8 @@ __all__ = [
     "create_website_handler",
     "delete_scheduled_job_handler",
     "delete_website_handler",
+    "export_job_pages_handler",
+    "export_website_pages_handler",
     "generate_ws_token_handler",
     "get_config_history_handler",
     "get_config_version_handler",
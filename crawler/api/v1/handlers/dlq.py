@@ -27,6 +27,7 @@ async def list_dlq_entries_handler(
     unresolved_only: bool | None = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> DLQEntriesResponse:
     """Handle DLQ entry listing with HTTP error translation.
 
@@ -37,6 +38,7 @@ async def list_dlq_entries_handler(
         unresolved_only: Optional filter by resolved status
         limit: Number of entries per page
         offset: Offset for pagination
+        cursor: Optional cursor from a previous page, replacing offset
 
     Returns:
         Paginated DLQ entries response
@@ -50,6 +52,7 @@ async def list_dlq_entries_handler(
         "unresolved_only": unresolved_only,
         "limit": limit,
         "offset": offset,
+        "cursor": cursor,
     }
     logger.info("list_dlq_entries_request", **log_context)
 
@@ -60,6 +63,7 @@ async def list_dlq_entries_handler(
         unresolved_only=unresolved_only,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
 
@@ -4,6 +4,8 @@ This module contains HTTP handlers that coordinate between FastAPI routes
 and business logic services using dependency injection.
 """
 
+from fastapi import Response
+
 from crawler.api.v1.decorators import handle_service_errors
 from crawler.api.v1.services import DuplicateService
 from crawler.core.logging import get_logger
@@ -13,22 +15,33 @@ from crawler.db.generated.duplicate_group import (
     ListDuplicatesInGroupRow,
 )
 from crawler.db.generated.models import DuplicateGroup
+from crawler.utils.cursor import encode_cursor
 
 logger = get_logger(__name__)
 
+# Response header carrying the cursor of the next page of a bare-list response
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @handle_service_errors(operation="listing duplicate groups")
 async def list_duplicate_groups_handler(
     duplicate_service: DuplicateService,
+    response: Response,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> list[DuplicateGroup]:
     """Handle listing duplicate groups with HTTP error translation.
 
+    The response body is a bare list, so the next page's cursor is returned in
+    the X-Next-Cursor header when the page is full.
+
     Args:
         duplicate_service: Injected duplicate service
+        response: Outgoing response, used to set the next cursor header
         limit: Maximum number of groups to return
         offset: Number of groups to skip for pagination
+        cursor: Optional cursor from a previous page, replacing offset
 
     Returns:
         List of duplicate groups
@@ -36,8 +49,13 @@ async def list_duplicate_groups_handler(
     Raises:
         HTTPException: If validation fails or operation fails (via decorator)
     """
-    logger.info("list_duplicate_groups_request", limit=limit, offset=offset)
-    return await duplicate_service.list_duplicate_groups(limit=limit, offset=offset)
+    logger.info("list_duplicate_groups_request", limit=limit, offset=offset, cursor=cursor)
+    groups = await duplicate_service.list_duplicate_groups(
+        limit=limit, offset=offset, cursor=cursor
+    )
+    if len(groups) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(groups[-1].created_at, groups[-1].id)
+    return groups
 
 
 @handle_service_errors(operation="retrieving duplicate group details")
@@ -9,6 +9,7 @@ from datetime import datetime
 from crawler.api.generated import CrawlLogsResponse, LogLevelEnum
 from crawler.api.v1.decorators import handle_service_errors
 from crawler.api.v1.services import LogService
+from crawler.api.v1.services.logs import LogCountMode
 from crawler.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +25,8 @@ async def get_job_logs_handler(
     search: str | None = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: str | None = None,
+    count_mode: LogCountMode = "exact",
 ) -> CrawlLogsResponse:
     """Handle job log retrieval with HTTP error translation.
 
@@ -39,6 +42,8 @@ async def get_job_logs_handler(
         search: Optional text search in message
         limit: Number of logs per page
         offset: Offset for pagination
+        cursor: Optional cursor from a previous page, replacing offset
+        count_mode: "exact" or "estimated" total count
 
     Returns:
         Paginated log response
@@ -54,6 +59,8 @@ async def get_job_logs_handler(
         "search": search,
         "limit": limit,
         "offset": offset,
+        "cursor": cursor,
+        "count_mode": count_mode,
     }
     logger.info("get_job_logs_request", **log_context)
 
@@ -66,4 +73,6 @@ async def get_job_logs_handler(
         search=search,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        count_mode=count_mode,
     )
@@ -0,0 +1,98 @@
+"""Crawled page export request handlers with dependency injection.
+
+This module contains HTTP handlers that coordinate between FastAPI routes
+and business logic services using dependency injection.
+"""
+
+from collections.abc import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+from crawler.api.v1.decorators import handle_service_errors
+from crawler.api.v1.services import PageExportService
+from crawler.api.v1.services.pages import ExportCompression
+from crawler.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+GZIP_MEDIA_TYPE = "application/gzip"
+
+
+def _export_response(
+    chunks: AsyncIterator[bytes], filename: str, compression: ExportCompression
+) -> StreamingResponse:
+    """Wrap exported chunks in a streaming attachment response.
+
+    Args:
+        chunks: Async iterator of body chunks
+        filename: Attachment file name without extension
+        compression: Compression applied to the chunks
+
+    Returns:
+        Streaming response with the matching media type and file name
+    """
+    if compression == "gzip":
+        media_type, extension = GZIP_MEDIA_TYPE, "ndjson.gz"
+    else:
+        media_type, extension = NDJSON_MEDIA_TYPE, "ndjson"
+
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'},
+    )
+
+
+@handle_service_errors(operation="exporting job pages")
+async def export_job_pages_handler(
+    job_id: str,
+    page_export_service: PageExportService,
+    compression: ExportCompression = "none",
+) -> StreamingResponse:
+    """Handle job page export with HTTP error translation.
+
+    The job is validated before the response starts, so a missing job is a 404
+    rather than a truncated stream.
+
+    Args:
+        job_id: Job ID to export pages for
+        page_export_service: Injected page export service
+        compression: "gzip" to gzip the stream, "none" for plain NDJSON
+
+    Returns:
+        Streaming NDJSON response
+
+    Raises:
+        HTTPException: If job not found or operation fails (via decorator)
+    """
+    logger.info("export_job_pages_request", job_id=job_id, compression=compression)
+    chunks = await page_export_service.export_job_pages(job_id, compression)
+    return _export_response(chunks, f"job-{job_id}-pages", compression)
+
+
+@handle_service_errors(operation="exporting website pages")
+async def export_website_pages_handler(
+    website_id: str,
+    page_export_service: PageExportService,
+    compression: ExportCompression = "none",
+) -> StreamingResponse:
+    """Handle website page export with HTTP error translation.
+
+    The website is validated before the response starts, so a missing website
+    is a 404 rather than a truncated stream.
+
+    Args:
+        website_id: Website ID to export pages for
+        page_export_service: Injected page export service
+        compression: "gzip" to gzip the stream, "none" for plain NDJSON
+
+    Returns:
+        Streaming NDJSON response
+
+    Raises:
+        HTTPException: If website not found or operation fails (via decorator)
+    """
+    logger.info("export_website_pages_request", website_id=website_id, compression=compression)
+    chunks = await page_export_service.export_website_pages(website_id, compression)
+    return _export_response(chunks, f"website-{website_id}-pages", compression)
@@ -44,6 +44,8 @@ router = APIRouter()
     **Pagination:**
     - Use `limit` and `offset` for pagination
     - Default limit is 100, max is 500
+    - Pass `next_cursor` back as `cursor` to read the next page without an offset scan;
+      `total` is null for cursor pages
     """,
     responses={
         200: {"description": "DLQ entries retrieved successfully"},
@@ -67,6 +69,9 @@ async def list_dlq_entries(
     ),
     limit: int = Query(100, ge=1, le=500, description="Number of entries to return (max 500)"),
     offset: int = Query(0, ge=0, description="Number of entries to skip for pagination"),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's next_cursor (replaces offset)"
+    ),
 ) -> DLQEntriesResponse:
     """List DLQ entries with filtering and pagination.
 
@@ -77,6 +82,7 @@ async def list_dlq_entries(
         unresolved_only: Optional filter by resolved status
         limit: Number of entries per page (1-500)
         offset: Number of entries to skip
+        cursor: Optional cursor from a previous page, replacing offset
 
     Returns:
         Paginated DLQ entries response
@@ -86,7 +92,7 @@ async def list_dlq_entries(
         HTTPException 500: If database operation fails
     """
     return await list_dlq_entries_handler(
-        dlq_service, error_category, website_id, unresolved_only, limit, offset
+        dlq_service, error_category, website_id, unresolved_only, limit, offset, cursor
     )
 
 
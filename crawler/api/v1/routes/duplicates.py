@@ -1,6 +1,6 @@
 """Duplicate content management routes for API v1."""
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Response, status
 
 from crawler.api.generated import ErrorResponse
 from crawler.api.v1.dependencies import DuplicateServiceDep
@@ -38,9 +38,19 @@ router = APIRouter()
     - Default limit: 50 groups
     - Maximum limit: 100 groups
     - Use offset for page navigation
+    - A full page sets the `X-Next-Cursor` header; pass it back as `cursor` to read the
+      next page without an offset scan
     """,
     responses={
-        200: {"description": "List of duplicate groups retrieved successfully"},
+        200: {
+            "description": "List of duplicate groups retrieved successfully",
+            "headers": {
+                "X-Next-Cursor": {
+                    "description": "Cursor for the next page, absent on the last page",
+                    "schema": {"type": "string"},
+                }
+            },
+        },
         400: {
             "description": "Validation error (e.g., limit exceeds maximum)",
             "model": ErrorResponse,
@@ -53,15 +63,21 @@ router = APIRouter()
 )
 async def list_duplicate_groups(
     duplicate_service: DuplicateServiceDep,
+    response: Response,
     limit: int = Query(50, ge=1, le=100, description="Number of groups to return"),
     offset: int = Query(0, ge=0, description="Number of groups to skip"),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's X-Next-Cursor header (replaces offset)"
+    ),
 ) -> list[DuplicateGroup]:
     """List all duplicate groups with pagination.
 
     Args:
         duplicate_service: Injected duplicate service
+        response: Outgoing response, used to set the next cursor header
         limit: Maximum number of groups to return (1-100)
         offset: Number of groups to skip for pagination
+        cursor: Optional cursor from a previous page, replacing offset
 
     Returns:
         List of duplicate groups
@@ -70,7 +86,7 @@ async def list_duplicate_groups(
         HTTPException 400: If validation fails
         HTTPException 500: If database operation fails
     """
-    return await list_duplicate_groups_handler(duplicate_service, limit, offset)
+    return await list_duplicate_groups_handler(duplicate_service, response, limit, offset, cursor)
 
 
 @router.get(
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Query, status
+from fastapi.responses import StreamingResponse
 
 from crawler.api.generated import (
     CancelJobRequest,
@@ -15,14 +16,17 @@ from crawler.api.generated import (
     SeedJobResponse,
     WSTokenResponse,
 )
-from crawler.api.v1.dependencies import JobServiceDep, LogServiceDep
+from crawler.api.v1.dependencies import JobServiceDep, LogServiceDep, PageExportServiceDep
 from crawler.api.v1.handlers import (
     cancel_job_handler,
     create_seed_job_handler,
     create_seed_job_inline_handler,
+    export_job_pages_handler,
     generate_ws_token_handler,
     get_job_logs_handler,
 )
+from crawler.api.v1.services.logs import LogCountMode
+from crawler.api.v1.services.pages import ExportCompression
 from crawler.core.dependencies import DBSessionDep, WebSocketTokenServiceDep
 from crawler.db.repositories import CrawlJobRepository
 
@@ -359,15 +363,23 @@ async def generate_ws_token(
     - `log_level`: Filter by specific log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     - `start_time`: Only return logs after this timestamp
     - `end_time`: Only return logs before this timestamp
-    - `search`: Search for text in log messages (case-insensitive)
+    - `search`: Search for text in log messages (case-insensitive, indexed for 3+ characters)
 
     **Pagination:**
     - Use `limit` and `offset` for pagination
     - Default limit is 100, max is 1000
     - `total` field indicates total logs matching filters
+    - `count_mode=estimated` stops counting past 10,000 logs; `total_is_estimate` is then
+      true and `total` is a lower bound
+    - Pass `next_cursor` back as `cursor` to read the next page without an offset scan;
+      `total` is null for cursor pages
     """,
     responses={
         200: {"description": "Logs retrieved successfully"},
+        400: {
+            "description": "Invalid cursor, or cursor combined with offset",
+            "model": ErrorResponse,
+        },
         404: {
             "description": "Job not found",
             "model": ErrorResponse,
@@ -390,6 +402,12 @@ async def get_job_logs(
     ),
     limit: int = Query(100, ge=1, le=1000, description="Number of logs to return (max 1000)"),
     offset: int = Query(0, ge=0, description="Number of logs to skip for pagination"),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's next_cursor (replaces offset)"
+    ),
+    count_mode: LogCountMode = Query(
+        "exact", description="Count all matching logs (exact) or stop at 10,000 (estimated)"
+    ),
 ) -> CrawlLogsResponse:
     """Get historical logs for a crawl job.
 
@@ -402,6 +420,8 @@ async def get_job_logs(
         search: Optional text search in message
         limit: Number of logs per page
         offset: Offset for pagination
+        cursor: Optional cursor from a previous page, replacing offset
+        count_mode: Exact or estimated total count
 
     Returns:
         Paginated log response
@@ -418,4 +438,66 @@ async def get_job_logs(
         search=search,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        count_mode=count_mode,
     )
+
+
+@router.get(
+    "/{job_id}/pages/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Export the crawled pages of a job",
+    operation_id="exportJobPages",
+    description="""
+    Stream every crawled page of a job as newline-delimited JSON (one page per line).
+
+    This endpoint:
+    1. Validates that the job exists (404 before any body is sent)
+    2. Reads pages oldest first from a server-side database cursor
+    3. Writes them in chunks as the client reads, so large exports are never held in memory
+
+    **Compression:**
+    - `none` (default): `application/x-ndjson`
+    - `gzip`: `application/gzip`, a single gzip member of the same NDJSON
+    """,
+    responses={
+        200: {
+            "description": "Crawled pages streamed as NDJSON",
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "application/gzip": {"schema": {"type": "string", "format": "binary"}},
+            },
+        },
+        404: {
+            "description": "Job not found",
+            "model": ErrorResponse,
+        },
+        422: {"description": "Validation error (invalid parameters)"},
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def export_job_pages(
+    job_id: str,
+    page_export_service: PageExportServiceDep,
+    compression: ExportCompression = Query(
+        "none", description="Compression of the stream: none or gzip"
+    ),
+) -> StreamingResponse:
+    """Stream the crawled pages of a job as NDJSON.
+
+    Args:
+        job_id: Job ID to export pages for
+        page_export_service: Injected page export service
+        compression: "gzip" to gzip the stream, "none" for plain NDJSON
+
+    Returns:
+        Streaming NDJSON response
+
+    Raises:
+        HTTPException: If job not found or export fails
+    """
+    return await export_job_pages_handler(job_id, page_export_service, compression)
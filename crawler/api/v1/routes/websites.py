@@ -3,6 +3,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Path, Query, status
+from fastapi.responses import StreamingResponse
 
 from crawler.api.generated import (
     ConfigHistoryListResponse,
@@ -21,10 +22,11 @@ from crawler.api.generated import (
     WebsiteResponse,
     WebsiteWithStatsResponse,
 )
-from crawler.api.v1.dependencies import WebsiteServiceDep
+from crawler.api.v1.dependencies import PageExportServiceDep, WebsiteServiceDep
 from crawler.api.v1.handlers import (
     create_website_handler,
     delete_website_handler,
+    export_website_pages_handler,
     get_config_history_handler,
     get_config_version_handler,
     get_website_by_id_handler,
@@ -35,6 +37,7 @@ from crawler.api.v1.handlers import (
     trigger_crawl_handler,
     update_website_handler,
 )
+from crawler.api.v1.services.pages import ExportCompression
 
 router = APIRouter()
 
@@ -793,3 +796,59 @@ async def resume_website_schedule(
         HTTPException: If website or scheduled job not found, or resume fails
     """
     return await resume_schedule_handler(id, website_service)
+
+
+@router.get(
+    "/{id}/pages/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Export the crawled pages of a website",
+    operation_id="exportWebsitePages",
+    description="""
+    Stream every crawled page of a website as newline-delimited JSON (one page per line).
+
+    This endpoint:
+    1. Validates that the website exists (404 before any body is sent)
+    2. Reads pages oldest first from a server-side database cursor
+    3. Writes them in chunks as the client reads, so large exports are never held in memory
+
+    **Compression:**
+    - `none` (default): `application/x-ndjson`
+    - `gzip`: `application/gzip`, a single gzip member of the same NDJSON
+    """,
+    responses={
+        200: {
+            "description": "Crawled pages streamed as NDJSON",
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "application/gzip": {"schema": {"type": "string", "format": "binary"}},
+            },
+        },
+        404: {
+            "description": "Website not found",
+            "model": ErrorResponse,
+        },
+        422: {"description": "Validation error"},
+    },
+)
+async def export_website_pages(
+    id: Annotated[str, Path(description="Website ID")],
+    page_export_service: PageExportServiceDep,
+    compression: Annotated[
+        ExportCompression, Query(description="Compression of the stream: none or gzip")
+    ] = "none",
+) -> StreamingResponse:
+    """Stream the crawled pages of a website as NDJSON.
+
+    Args:
+        id: Website ID
+        page_export_service: Injected page export service
+        compression: "gzip" to gzip the stream, "none" for plain NDJSON
+
+    Returns:
+        Streaming NDJSON response
+
+    Raises:
+        HTTPException: If website not found or export fails
+    """
+    return await export_website_pages_handler(id, page_export_service, compression)
@@ -4,6 +4,7 @@ from .dlq import DLQService
 from .duplicates import DuplicateService
 from .jobs import JobService
 from .logs import LogService
+from .pages import PageExportService
 from .scheduled_jobs import ScheduledJobService
 from .websites import WebsiteService
 
@@ -12,6 +13,7 @@ __all__ = [
     "DuplicateService",
     "JobService",
     "LogService",
+    "PageExportService",
     "ScheduledJobService",
     "WebsiteService",
 ]
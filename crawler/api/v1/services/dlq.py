@@ -14,6 +14,7 @@ from crawler.core.logging import get_logger
 from crawler.db.generated.models import ErrorCategoryEnum as DBErrorCategoryEnum
 from crawler.db.generated.models import JobTypeEnum as DBJobTypeEnum
 from crawler.db.repositories import CrawlJobRepository, DeadLetterQueueRepository
+from crawler.utils.cursor import decode_cursor, encode_cursor
 
 logger = get_logger(__name__)
 
@@ -42,6 +43,7 @@ class DLQService:
         unresolved_only: bool | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> DLQEntriesResponse:
         """List DLQ entries with filtering and pagination.
 
@@ -51,18 +53,27 @@ class DLQService:
             unresolved_only: Optional filter by resolved status
             limit: Number of entries per page (max 500)
             offset: Offset for pagination
+            cursor: Cursor from a previous page's next_cursor, replacing offset
 
         Returns:
             Paginated DLQ entries response
 
         Raises:
-            ValueError: If parameters are invalid
+            ValueError: If parameters or the cursor are invalid
             RuntimeError: If retrieval fails
         """
         # Guard: Validate limit
         if limit > 500:
             raise ValueError("Limit cannot exceed 500")
 
+        # Guard: Cursor and offset are alternative positions
+        if cursor is not None and offset:
+            raise ValueError("cursor cannot be combined with offset")
+
+        after = decode_cursor(cursor) if cursor is not None else None
+        if after is not None and not isinstance(after[1], int):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+
         logger.info(
             "listing_dlq_entries",
             error_category=error_category.value if error_category else None,
@@ -70,26 +81,40 @@ class DLQService:
             unresolved_only=unresolved_only,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
         # Convert API enum to DB enum if provided (values are now identical)
         db_error_category = DBErrorCategoryEnum(error_category.value) if error_category else None
 
         try:
-            # Get entries and count in parallel
-            entries = await self.dlq_repo.list_entries(
-                error_category=db_error_category,
-                website_id=website_id,
-                unresolved_only=unresolved_only,
-                limit=limit,
-                offset=offset,
-            )
+            total: int | None
+            if after is None:
+                # Get entries and count in parallel
+                entries = await self.dlq_repo.list_entries(
+                    error_category=db_error_category,
+                    website_id=website_id,
+                    unresolved_only=unresolved_only,
+                    limit=limit,
+                    offset=offset,
+                )
 
-            total = await self.dlq_repo.count_entries(
-                error_category=db_error_category,
-                website_id=website_id,
-                unresolved_only=unresolved_only,
-            )
+                total = await self.dlq_repo.count_entries(
+                    error_category=db_error_category,
+                    website_id=website_id,
+                    unresolved_only=unresolved_only,
+                )
+            else:
+                # Keyset page: seek past the cursor, skipping the count
+                entries = await self.dlq_repo.list_entries_after(
+                    cursor_added_at=after[0],
+                    cursor_id=int(after[1]),
+                    error_category=db_error_category,
+                    website_id=website_id,
+                    unresolved_only=unresolved_only,
+                    limit=limit,
+                )
+                total = None
 
             # Convert DB models to API models
             api_entries = [self._db_entry_to_api(entry) for entry in entries]
@@ -102,11 +127,19 @@ class DLQService:
                 offset=offset,
             )
 
+            # A full page may have a successor; a short page is the last one
+            next_cursor = (
+                encode_cursor(entries[-1].added_to_dlq_at, entries[-1].id)
+                if len(entries) == limit
+                else None
+            )
+
             return DLQEntriesResponse(
                 entries=api_entries,
                 total=total,
                 limit=limit,
                 offset=offset,
+                next_cursor=next_cursor,
             )
 
         except Exception as e:
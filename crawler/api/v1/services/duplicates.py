@@ -8,6 +8,7 @@ from crawler.db.generated.duplicate_group import (
 )
 from crawler.db.generated.models import DuplicateGroup
 from crawler.db.repositories import DuplicateGroupRepository
+from crawler.utils.cursor import decode_cursor
 
 logger = get_logger(__name__)
 
@@ -23,24 +24,37 @@ class DuplicateService:
         """
         self.duplicate_repo = duplicate_repo
 
-    async def list_duplicate_groups(self, limit: int = 50, offset: int = 0) -> list[DuplicateGroup]:
-        """List all duplicate groups with pagination.
+    async def list_duplicate_groups(
+        self, limit: int = 50, offset: int = 0, cursor: str | None = None
+    ) -> list[DuplicateGroup]:
+        """List all duplicate groups with pagination, newest first.
 
         Args:
             limit: Maximum number of groups to return (max 100)
             offset: Number of groups to skip for pagination
+            cursor: Cursor of the last group already read, replacing offset
 
         Returns:
             List of duplicate groups
 
         Raises:
-            ValueError: If limit exceeds maximum
+            ValueError: If limit exceeds maximum or the cursor is invalid
         """
         if limit > 100:
             raise ValueError("limit cannot exceed 100")
-
-        logger.info("list_duplicate_groups", limit=limit, offset=offset)
-        groups = await self.duplicate_repo.list_all_groups(limit=limit, offset=offset)
+        if cursor is not None and offset:
+            raise ValueError("cursor cannot be combined with offset")
+
+        logger.info("list_duplicate_groups", limit=limit, offset=offset, cursor=cursor)
+        if cursor is None:
+            groups = await self.duplicate_repo.list_all_groups(limit=limit, offset=offset)
+        else:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            if not isinstance(cursor_id, str):
+                raise ValueError(f"Invalid cursor: {cursor!r}")
+            groups = await self.duplicate_repo.list_groups_after(
+                cursor_created_at=cursor_created_at, cursor_id=cursor_id, limit=limit
+            )
         logger.info("duplicate_groups_listed", count=len(groups), limit=limit, offset=offset)
         return groups
 
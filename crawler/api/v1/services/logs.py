@@ -1,14 +1,21 @@
 """Log service with business logic for log retrieval."""
 
 from datetime import datetime
+from typing import Literal
 
 from crawler.api.generated import CrawlLogEntry, CrawlLogsResponse, LogLevelEnum
 from crawler.core.logging import get_logger
 from crawler.db.generated.models import LogLevelEnum as DBLogLevelEnum
 from crawler.db.repositories import CrawlJobRepository, CrawlLogRepository
+from crawler.utils.cursor import decode_cursor, encode_cursor
 
 logger = get_logger(__name__)
 
+LogCountMode = Literal["exact", "estimated"]
+
+# An estimated total stops counting past this many logs and reports the cap
+ESTIMATED_COUNT_CAP = 10_000
+
 
 class LogService:
     """Service for crawl log operations with dependency injection."""
@@ -36,14 +43,16 @@ class LogService:
         search: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
+        count_mode: LogCountMode = "exact",
     ) -> CrawlLogsResponse:
         """Get filtered logs for a crawl job.
 
         This method:
         1. Validates that the job exists
         2. Retrieves logs from database with filters
-        3. Counts total logs matching filters
-        4. Returns paginated response
+        3. Counts total logs matching filters (offset pagination only)
+        4. Returns paginated response with a cursor for the next page
 
         Args:
             job_id: Job ID
@@ -53,12 +62,14 @@ class LogService:
             search: Optional text search in message
             limit: Number of logs per page
             offset: Offset for pagination
+            cursor: Cursor from a previous page's next_cursor, replacing offset
+            count_mode: "estimated" stops counting at ESTIMATED_COUNT_CAP logs
 
         Returns:
             Paginated log response
 
         Raises:
-            ValueError: If job not found
+            ValueError: If job not found or the cursor is invalid
             RuntimeError: If log retrieval fails
         """
         logger.info(
@@ -70,8 +81,18 @@ class LogService:
             search=search,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
         )
 
+        # Guard: Cursor and offset are alternative positions
+        if cursor is not None and offset:
+            raise ValueError("cursor cannot be combined with offset")
+
+        after = decode_cursor(cursor) if cursor is not None else None
+        if after is not None and not isinstance(after[1], int):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+
         # Guard: Validate job exists
         job = await self.crawl_job_repo.get_by_id(job_id)
         if not job:
@@ -81,17 +102,40 @@ class LogService:
         # Convert API log level enum to DB log level enum
         db_log_level = DBLogLevelEnum[log_level.value] if log_level else None
 
+        # One log past the cap tells an exact total at the cap from a larger one
+        count_cap = ESTIMATED_COUNT_CAP + 1 if count_mode == "estimated" else None
+
         try:
-            # Get filtered logs with pagination and total count in single query
-            logs, total = await self.crawl_log_repo.get_job_logs_filtered(
-                job_id=job_id,
-                log_level=db_log_level,
-                start_time=start_time,
-                end_time=end_time,
-                search_text=search,
-                limit=limit,
-                offset=offset,
-            )
+            total: int | None
+            if after is None:
+                # Get filtered logs with pagination and total count
+                logs, total = await self.crawl_log_repo.get_job_logs_filtered(
+                    job_id=job_id,
+                    log_level=db_log_level,
+                    start_time=start_time,
+                    end_time=end_time,
+                    search_text=search,
+                    limit=limit,
+                    offset=offset,
+                    count_cap=count_cap,
+                )
+            else:
+                # Keyset page: seek past the cursor, skipping the count
+                logs = await self.crawl_log_repo.get_job_logs_after_cursor(
+                    job_id=job_id,
+                    cursor_created_at=after[0],
+                    cursor_id=int(after[1]),
+                    log_level=db_log_level,
+                    start_time=start_time,
+                    end_time=end_time,
+                    search_text=search,
+                    limit=limit,
+                )
+                total = None
+
+            total_is_estimate = count_cap is not None and total is not None and total >= count_cap
+            if total_is_estimate:
+                total = ESTIMATED_COUNT_CAP
 
             # Convert DB models to API models
             log_entries = [
@@ -114,15 +158,23 @@ class LogService:
                 job_id=job_id,
                 log_count=len(log_entries),
                 total=total,
+                total_is_estimate=total_is_estimate,
                 limit=limit,
                 offset=offset,
             )
 
+            # A full page may have a successor; a short page is the last one
+            next_cursor = (
+                encode_cursor(logs[-1].created_at, logs[-1].id) if len(logs) == limit else None
+            )
+
             return CrawlLogsResponse(
                 logs=log_entries,
                 total=total,
+                total_is_estimate=total_is_estimate,
                 limit=limit,
                 offset=offset,
+                next_cursor=next_cursor,
             )
 
         except Exception as e:
@@ -0,0 +1,131 @@
+"""Crawled page export service with business logic."""
+
+import zlib
+from collections.abc import AsyncIterator, Callable
+from typing import Literal
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from crawler.core.logging import get_logger
+from crawler.db.generated.models import CrawledPage
+from crawler.db.repositories import CrawledPageRepository, CrawlJobRepository, WebsiteRepository
+
+logger = get_logger(__name__)
+
+ExportCompression = Literal["none", "gzip"]
+
+# Serialized pages are buffered into chunks of about this size before being
+# compressed and written, so each write carries many small NDJSON lines
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# zlib window bits selecting a gzip header and trailer with the maximum window
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class PageExportService:
+    """Service streaming crawled pages as NDJSON with dependency injection.
+
+    The response body is sent after the route returns, so the service does not use
+    the request session. It validates the export target on a short-lived connection
+    and streams the pages on a connection it holds until the body is complete.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        """Initialize service with dependencies.
+
+        Args:
+            engine: Database engine providing the validation and streaming connections
+        """
+        self.engine = engine
+
+    async def export_job_pages(
+        self, job_id: str, compression: ExportCompression = "none"
+    ) -> AsyncIterator[bytes]:
+        """Export all crawled pages of a job.
+
+        Args:
+            job_id: Job ID
+            compression: "gzip" to gzip the stream, "none" for plain NDJSON
+
+        Returns:
+            Async iterator of body chunks, one JSON page per line
+
+        Raises:
+            ValueError: If job not found
+        """
+        # Guard: Validate job exists before the response starts
+        async with self.engine.connect() as conn:
+            job = await CrawlJobRepository(conn).get_by_id(job_id)
+        if not job:
+            logger.warning("job_not_found", job_id=job_id)
+            raise ValueError(f"Job with ID '{job_id}' not found")
+
+        logger.info("exporting_job_pages", job_id=job_id, compression=compression)
+        return self._stream_pages(lambda repo: repo.stream_by_job(job_id), compression)
+
+    async def export_website_pages(
+        self, website_id: str, compression: ExportCompression = "none"
+    ) -> AsyncIterator[bytes]:
+        """Export all crawled pages of a website.
+
+        Args:
+            website_id: Website ID
+            compression: "gzip" to gzip the stream, "none" for plain NDJSON
+
+        Returns:
+            Async iterator of body chunks, one JSON page per line
+
+        Raises:
+            ValueError: If website not found
+        """
+        # Guard: Validate website exists before the response starts
+        async with self.engine.connect() as conn:
+            website = await WebsiteRepository(conn).get_by_id(website_id)
+        if not website:
+            logger.warning("website_not_found", website_id=website_id)
+            raise ValueError(f"Website with ID '{website_id}' not found")
+
+        logger.info("exporting_website_pages", website_id=website_id, compression=compression)
+        return self._stream_pages(lambda repo: repo.stream_by_website(website_id), compression)
+
+    async def _stream_pages(
+        self,
+        select_pages: Callable[[CrawledPageRepository], AsyncIterator[CrawledPage]],
+        compression: ExportCompression,
+    ) -> AsyncIterator[bytes]:
+        """Read pages from a server-side cursor and yield NDJSON chunks.
+
+        Only one chunk of pages is held in memory at a time; the cursor fetches
+        the next rows as the client consumes the body.
+
+        Args:
+            select_pages: Opens the page iterator on a repository
+            compression: "gzip" to gzip the stream, "none" for plain NDJSON
+
+        Yields:
+            Body chunks
+        """
+        compressor = zlib.compressobj(wbits=GZIP_WBITS) if compression == "gzip" else None
+        buffer = bytearray()
+        page_count = 0
+
+        async with self.engine.connect() as conn, conn.begin():
+            async for page in select_pages(CrawledPageRepository(conn)):
+                buffer += page.model_dump_json().encode()
+                buffer += b"\n"
+                page_count += 1
+
+                if len(buffer) >= EXPORT_CHUNK_BYTES:
+                    chunk = compressor.compress(buffer) if compressor else bytes(buffer)
+                    buffer.clear()
+                    # Guard: the compressor may hold everything back until it fills a block
+                    if chunk:
+                        yield chunk
+
+        tail = bytes(buffer)
+        if compressor:
+            tail = compressor.compress(tail) + compressor.flush()
+        if tail:
+            yield tail
+
+        logger.info("pages_exported", page_count=page_count, compression=compression)
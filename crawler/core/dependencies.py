@@ -127,14 +127,14 @@ async def get_cache_service(
 
 async def get_storage_service(
     settings: SettingsDep,
-) -> StorageService:
+) -> AsyncGenerator[StorageService]:
     """Get storage service with injected dependencies.
 
     Args:
         settings: Application settings from dependency
 
-    Returns:
-        StorageService instance
+    Yields:
+        StorageService instance, closed once the request finishes
 
     Usage:
         async def my_route(storage: StorageServiceDep):
@@ -142,7 +142,11 @@ async def get_storage_service(
     """
     from crawler.services.storage import StorageService
 
-    return StorageService(settings=settings)
+    service = StorageService(settings=settings)
+    try:
+        yield service
+    finally:
+        await service.close()
 
 
 async def get_url_dedup_cache(
@@ -1,6 +1,10 @@
 """Prometheus metrics configuration."""
 
+from contextvars import ContextVar
+from urllib.parse import urlsplit
+
 from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.context_managers import Timer
 
 # HTTP Metrics
 http_requests_total = Counter(
@@ -59,6 +63,33 @@ browser_crash_recoveries_total = Counter(
     "browser_crash_recoveries_total", "Total number of successful browser crash recoveries"
 )
 
+browser_pool_contexts_warm = Gauge(
+    "browser_pool_contexts_warm", "Number of reset browser contexts waiting for reuse"
+)
+
+browser_context_acquire_seconds = Histogram(
+    "browser_context_acquire_seconds",
+    "Time to obtain a browser context once a pool slot is free",
+    ["source"],  # created (new context) or reused (warm context)
+)
+
+browser_contexts_recycled_total = Counter(
+    "browser_contexts_recycled_total",
+    "Total browser contexts closed instead of returned to the warm pool",
+    ["reason"],
+)
+
+browser_requests_blocked_total = Counter(
+    "browser_requests_blocked_total",
+    "Total browser subresource requests aborted by a step's resource policy",
+    ["reason"],  # resource_type, url_pattern or third_party
+)
+
+browser_bytes_saved_total = Counter(
+    "browser_bytes_saved_total",
+    "Total response bytes served from the static asset cache instead of the network",
+)
+
 # Queue Metrics
 queue_messages_pending = Gauge(
     "queue_messages_pending", "Number of pending messages in queue", ["queue_name"]
@@ -68,6 +99,12 @@ queue_messages_processed_total = Counter(
     "queue_messages_processed_total", "Total messages processed from queue", ["queue_name"]
 )
 
+queue_lag_seconds = Gauge(
+    "queue_lag_seconds",
+    "Time the most recently received message waited in the queue in seconds",
+    ["queue_name"],
+)
+
 # Database Metrics
 db_connections_active = Gauge("db_connections_active", "Number of active database connections")
 
@@ -130,3 +167,89 @@ scheduled_jobs_skipped_total = Counter(
     "Total scheduled jobs skipped (outside catch-up threshold)",
     ["reason"],  # missed_threshold, etc.
 )
+
+# Crawl Log Sink Metrics
+crawl_log_sink_enqueued_total = Counter(
+    "crawl_log_sink_enqueued_total", "Total crawl log entries accepted by the log sink"
+)
+
+crawl_log_sink_dropped_total = Counter(
+    "crawl_log_sink_dropped_total",
+    "Total crawl log entries dropped by the log sink",
+    ["reason"],  # buffer_full, flush_failed, closed
+)
+
+crawl_log_sink_flushed_total = Counter(
+    "crawl_log_sink_flushed_total", "Total crawl log entries written to the database"
+)
+
+crawl_log_sink_flush_duration_seconds = Histogram(
+    "crawl_log_sink_flush_duration_seconds", "Duration of a crawl log sink batch flush in seconds"
+)
+
+crawl_log_sink_buffer_size = Gauge(
+    "crawl_log_sink_buffer_size", "Number of crawl log entries waiting in the log sink"
+)
+
+# Host Politeness Metrics
+host_rate_limit_wait_seconds = Histogram(
+    "host_rate_limit_wait_seconds",
+    "Time requests waited for a cluster-wide per-host request slot in seconds",
+)
+
+# Pagination Metrics
+pagination_prefetch_discarded_total = Counter(
+    "pagination_prefetch_discarded_total",
+    "Prefetched pagination pages discarded or cancelled after a stop condition fired",
+)
+
+# Incremental Recrawl Metrics
+pages_unchanged_total = Counter(
+    "pages_unchanged_total",
+    "Re-crawled pages skipped because they did not change since the last crawl",
+    ["reason"],
+)
+
+# Statistics Rollup Metrics
+website_stats_deltas_folded_total = Counter(
+    "website_stats_deltas_folded_total",
+    "Statistics deltas folded into website_stats",
+)
+
+website_stats_deltas_pending = Gauge(
+    "website_stats_deltas_pending",
+    "Statistics deltas waiting to be folded into website_stats",
+)
+
+# Crawl Stage Metrics
+crawl_stage_duration_seconds = Histogram(
+    "crawl_stage_duration_seconds",
+    "Duration of a crawl pipeline stage in seconds",
+    # fetch, extract, normalize, simhash, dedup_lookup, persist, log_write
+    ["stage", "step_type", "host"],
+)
+
+# Step type of the workflow step running in the current task, set by the orchestrator
+current_step_type: ContextVar[str] = ContextVar("current_step_type", default="")
+
+
+def observe_stage(stage: str, *urls: str | None) -> Timer:
+    """Time a crawl stage for the step type running in the current context.
+
+    Usage:
+        with observe_stage("fetch", url):
+            response = await client.get(url)
+
+    Args:
+        stage: Stage name
+        urls: URLs the stage works on. The host label is empty when they span
+            several hosts or none are given.
+
+    Returns:
+        Timer observing crawl_stage_duration_seconds when it exits
+    """
+    hosts = {urlsplit(url).hostname or "" for url in urls if url}
+    host = hosts.pop() if len(hosts) == 1 else ""
+    return crawl_stage_duration_seconds.labels(
+        stage=stage, step_type=current_step_type.get(), host=host
+    ).time()
@@ -4,7 +4,7 @@
 # source: content_hash.sql
 import datetime
 import pydantic
-from typing import Any, AsyncIterator, Optional
+from typing import Any, AsyncIterator, List, Optional
 import uuid
 
 import sqlalchemy
@@ -13,6 +13,34 @@ import sqlalchemy.ext.asyncio
 from crawler.db.generated import models
 
 
+BULK_UPSERT_CONTENT_HASHES = """-- name: bulk_upsert_content_hashes \\:exec
+INSERT INTO content_hash (
+    content_hash,
+    first_seen_page_id,
+    occurrence_count,
+    simhash_fingerprint,
+    last_seen_at
+)
+SELECT
+    hash.content_hash,
+    hash.first_seen_page_id,
+    hash.occurrence_count,
+    hash.simhash_fingerprint,
+    CURRENT_TIMESTAMP
+FROM unnest(
+    :p1\\:\\:VARCHAR[],
+    :p2\\:\\:UUID[],
+    :p3\\:\\:INTEGER[],
+    :p4\\:\\:BIGINT[]
+) AS hash(content_hash, first_seen_page_id, occurrence_count, simhash_fingerprint)
+ON CONFLICT (content_hash)
+DO UPDATE SET
+    occurrence_count = content_hash.occurrence_count + EXCLUDED.occurrence_count,
+    simhash_fingerprint = COALESCE(EXCLUDED.simhash_fingerprint, content_hash.simhash_fingerprint),
+    last_seen_at = CURRENT_TIMESTAMP
+"""
+
+
 DELETE_OLD_CONTENT_HASHES = """-- name: delete_old_content_hashes \\:exec
 DELETE FROM content_hash
 WHERE last_seen_at < CURRENT_TIMESTAMP - INTERVAL '90 days'
@@ -41,6 +69,65 @@ class FindSimilarContentRow(pydantic.BaseModel):
     hamming_distance: float
 
 
+FIND_SIMILAR_CONTENT_BATCH = """-- name: find_similar_content_batch \\:many
+SELECT
+    target.fingerprint AS target_fingerprint,
+    match.content_hash,
+    match.hamming_distance
+FROM unnest(:p1\\:\\:BIGINT[]) AS target(fingerprint)
+CROSS JOIN LATERAL (
+    SELECT
+        content_hash.content_hash,
+        length(replace((content_hash.simhash_fingerprint # target.fingerprint)\\:\\:bit(64)\\:\\:text, '0', '')) AS hamming_distance
+    FROM content_hash
+    WHERE content_hash.simhash_fingerprint IS NOT NULL
+        AND (
+            ((content_hash.simhash_fingerprint >> 0) & 65535) = ((target.fingerprint >> 0) & 65535)
+            OR ((content_hash.simhash_fingerprint >> 16) & 65535) = ((target.fingerprint >> 16) & 65535)
+            OR ((content_hash.simhash_fingerprint >> 32) & 65535) = ((target.fingerprint >> 32) & 65535)
+            OR ((content_hash.simhash_fingerprint >> 48) & 65535) = ((target.fingerprint >> 48) & 65535)
+        )
+        AND length(replace((content_hash.simhash_fingerprint # target.fingerprint)\\:\\:bit(64)\\:\\:text, '0', '')) <= :p2
+    ORDER BY hamming_distance ASC
+    LIMIT 1
+) AS match
+"""
+
+
+class FindSimilarContentBatchRow(pydantic.BaseModel):
+    target_fingerprint: int
+    content_hash: str
+    hamming_distance: float
+
+
+FIND_SIMILAR_CONTENT_BY_BANDS = """-- name: find_similar_content_by_bands \\:many
+SELECT content_hash, first_seen_page_id, occurrence_count, last_seen_at, created_at, simhash_fingerprint,
+    length(replace((simhash_fingerprint # :p1\\:\\:BIGINT)\\:\\:bit(64)\\:\\:text, '0', '')) as hamming_distance
+FROM content_hash
+WHERE simhash_fingerprint IS NOT NULL
+    AND (
+        ((simhash_fingerprint >> 0) & 65535) = :p2\\:\\:BIGINT
+        OR ((simhash_fingerprint >> 16) & 65535) = :p3\\:\\:BIGINT
+        OR ((simhash_fingerprint >> 32) & 65535) = :p4\\:\\:BIGINT
+        OR ((simhash_fingerprint >> 48) & 65535) = :p5\\:\\:BIGINT
+    )
+    AND length(replace((simhash_fingerprint # :p1\\:\\:BIGINT)\\:\\:bit(64)\\:\\:text, '0', '')) <= :p6
+    AND content_hash != :p7
+ORDER BY hamming_distance ASC
+LIMIT :p8
+"""
+
+
+class FindSimilarContentByBandsRow(pydantic.BaseModel):
+    content_hash: str
+    first_seen_page_id: Optional[uuid.UUID]
+    occurrence_count: int
+    last_seen_at: datetime.datetime
+    created_at: datetime.datetime
+    simhash_fingerprint: Optional[int]
+    hamming_distance: float
+
+
 GET_CONTENT_HASH = """-- name: get_content_hash \\:one
 SELECT content_hash, first_seen_page_id, occurrence_count, last_seen_at, created_at, simhash_fingerprint FROM content_hash
 WHERE content_hash = :p1
@@ -85,6 +172,22 @@ OFFSET :p1 LIMIT :p2
 """
 
 
+LIST_CONTENT_HASHES_FOR_CLUSTERING = """-- name: list_content_hashes_for_clustering \\:many
+SELECT content_hash, simhash_fingerprint, occurrence_count
+FROM content_hash
+WHERE content_hash > :p1
+    AND (simhash_fingerprint IS NOT NULL OR occurrence_count > 1)
+ORDER BY content_hash
+LIMIT :p2
+"""
+
+
+class ListContentHashesForClusteringRow(pydantic.BaseModel):
+    content_hash: str
+    simhash_fingerprint: Optional[int]
+    occurrence_count: int
+
+
 UPSERT_CONTENT_HASH = """-- name: upsert_content_hash \\:one
 INSERT INTO content_hash (
     content_hash,
@@ -132,6 +235,14 @@ class AsyncQuerier:
     def __init__(self, conn: sqlalchemy.ext.asyncio.AsyncConnection):
         self._conn = conn
 
+    async def bulk_upsert_content_hashes(self, *, content_hashes: List[str], first_seen_page_ids: List[uuid.UUID], occurrence_counts: List[int], simhash_fingerprints: List[int]) -> None:
+        await self._conn.execute(sqlalchemy.text(BULK_UPSERT_CONTENT_HASHES), {
+            "p1": content_hashes,
+            "p2": first_seen_page_ids,
+            "p3": occurrence_counts,
+            "p4": simhash_fingerprints,
+        })
+
     async def delete_old_content_hashes(self) -> None:
         await self._conn.execute(sqlalchemy.text(DELETE_OLD_CONTENT_HASHES))
 
@@ -153,6 +264,37 @@ class AsyncQuerier:
                 hamming_distance=row[6],
             )
 
+    async def find_similar_content_batch(self, *, target_fingerprints: List[int], max_distance: Optional[int]) -> AsyncIterator[FindSimilarContentBatchRow]:
+        result = await self._conn.stream(sqlalchemy.text(FIND_SIMILAR_CONTENT_BATCH), {"p1": target_fingerprints, "p2": max_distance})
+        async for row in result:
+            yield FindSimilarContentBatchRow(
+                target_fingerprint=row[0],
+                content_hash=row[1],
+                hamming_distance=row[2],
+            )
+
+    async def find_similar_content_by_bands(self, *, target_fingerprint: int, band_0: int, band_1: int, band_2: int, band_3: int, max_distance: Optional[int], exclude_hash: str, limit_count: int) -> AsyncIterator[FindSimilarContentByBandsRow]:
+        result = await self._conn.stream(sqlalchemy.text(FIND_SIMILAR_CONTENT_BY_BANDS), {
+            "p1": target_fingerprint,
+            "p2": band_0,
+            "p3": band_1,
+            "p4": band_2,
+            "p5": band_3,
+            "p6": max_distance,
+            "p7": exclude_hash,
+            "p8": limit_count,
+        })
+        async for row in result:
+            yield FindSimilarContentByBandsRow(
+                content_hash=row[0],
+                first_seen_page_id=row[1],
+                occurrence_count=row[2],
+                last_seen_at=row[3],
+                created_at=row[4],
+                simhash_fingerprint=row[5],
+                hamming_distance=row[6],
+            )
+
     async def get_content_hash(self, *, content_hash: str) -> Optional[models.ContentHash]:
         row = (await self._conn.execute(sqlalchemy.text(GET_CONTENT_HASH), {"p1": content_hash})).first()
         if row is None:
@@ -214,6 +356,15 @@ class AsyncQuerier:
                 simhash_fingerprint=row[5],
             )
 
+    async def list_content_hashes_for_clustering(self, *, after_hash: str, limit_count: int) -> AsyncIterator[ListContentHashesForClusteringRow]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_CONTENT_HASHES_FOR_CLUSTERING), {"p1": after_hash, "p2": limit_count})
+        async for row in result:
+            yield ListContentHashesForClusteringRow(
+                content_hash=row[0],
+                simhash_fingerprint=row[1],
+                occurrence_count=row[2],
+            )
+
     async def upsert_content_hash(self, *, content_hash: str, first_seen_page_id: Optional[uuid.UUID]) -> Optional[models.ContentHash]:
         row = (await self._conn.execute(sqlalchemy.text(UPSERT_CONTENT_HASH), {"p1": content_hash, "p2": first_seen_page_id})).first()
         if row is None:
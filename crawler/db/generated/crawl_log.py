@@ -4,7 +4,7 @@
 # source: crawl_log.sql
 import datetime
 import pydantic
-from typing import Any, AsyncIterator, Optional
+from typing import Any, AsyncIterator, List, Optional
 import uuid
 
 import sqlalchemy
@@ -13,13 +13,65 @@ import sqlalchemy.ext.asyncio
 from crawler.db.generated import models
 
 
+BULK_CREATE_CRAWL_LOGS = """-- name: bulk_create_crawl_logs \\:many
+INSERT INTO crawl_log (
+    job_id,
+    website_id,
+    step_name,
+    log_level,
+    message,
+    context,
+    trace_id,
+    created_at
+)
+SELECT
+    entry.job_id,
+    entry.website_id,
+    entry.step_name,
+    entry.log_level\\:\\:log_level_enum,
+    entry.message,
+    entry.context\\:\\:jsonb,
+    entry.trace_id,
+    entry.created_at
+FROM unnest(
+    :p1\\:\\:UUID[],
+    :p2\\:\\:UUID[],
+    :p3\\:\\:VARCHAR[],
+    :p4\\:\\:TEXT[],
+    :p5\\:\\:TEXT[],
+    :p6\\:\\:TEXT[],
+    :p7\\:\\:UUID[],
+    :p8\\:\\:TIMESTAMPTZ[]
+) WITH ORDINALITY AS entry(
+    job_id, website_id, step_name, log_level, message, context, trace_id, created_at, position
+)
+ORDER BY entry.position
+RETURNING id, job_id, website_id, step_name, log_level, message, context, trace_id, created_at
+"""
+
+
+COUNT_JOB_LOG_SEARCH = """-- name: count_job_log_search \\:one
+SELECT COUNT(*) FROM (
+    SELECT 1 FROM crawl_log
+    WHERE job_id = :p1
+        AND message ILIKE '%' || :p2\\:\\:TEXT || '%'
+        AND log_level = COALESCE(:p3, log_level)
+        AND (:p4\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= :p4\\:\\:TIMESTAMP WITH TIME ZONE)
+        AND (:p5\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= :p5\\:\\:TIMESTAMP WITH TIME ZONE)
+    LIMIT :p6
+) AS matched_logs
+"""
+
+
 COUNT_JOB_LOGS_FILTERED = """-- name: count_job_logs_filtered \\:one
-SELECT COUNT(*) FROM crawl_log
-WHERE job_id = :p1
-    AND log_level = COALESCE(:p2, log_level)
-    AND (:p3\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= :p3\\:\\:TIMESTAMP WITH TIME ZONE)
-    AND (:p4\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= :p4\\:\\:TIMESTAMP WITH TIME ZONE)
-    AND (:p5\\:\\:TEXT IS NULL OR message ILIKE '%' || :p5\\:\\:TEXT || '%')
+SELECT COUNT(*) FROM (
+    SELECT 1 FROM crawl_log
+    WHERE job_id = :p1
+        AND log_level = COALESCE(:p2, log_level)
+        AND (:p3\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= :p3\\:\\:TIMESTAMP WITH TIME ZONE)
+        AND (:p4\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= :p4\\:\\:TIMESTAMP WITH TIME ZONE)
+    LIMIT :p5
+) AS matched_logs
 """
 
 
@@ -106,7 +158,7 @@ LIMIT :p2
 """
 
 
-GET_JOB_LOGS_FILTERED = """-- name: get_job_logs_filtered \\:many
+GET_JOB_LOGS_AFTER_CURSOR = """-- name: get_job_logs_after_cursor \\:many
 SELECT
     id,
     job_id,
@@ -116,30 +168,37 @@ SELECT
     message,
     context,
     trace_id,
-    created_at,
-    COUNT(*) OVER() as total_count
+    created_at
 FROM crawl_log
 WHERE job_id = :p1
     AND log_level = COALESCE(:p2, log_level)
     AND (:p3\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= :p3\\:\\:TIMESTAMP WITH TIME ZONE)
     AND (:p4\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= :p4\\:\\:TIMESTAMP WITH TIME ZONE)
-    AND (:p5\\:\\:TEXT IS NULL OR message ILIKE '%' || :p5\\:\\:TEXT || '%')
-ORDER BY created_at ASC
-OFFSET :p6 LIMIT :p7
+    AND (created_at, id) > (:p5\\:\\:TIMESTAMP WITH TIME ZONE, :p6\\:\\:BIGINT)
+ORDER BY created_at ASC, id ASC
+LIMIT :p7
 """
 
 
-class GetJobLogsFilteredRow(pydantic.BaseModel):
-    id: int
-    job_id: uuid.UUID
-    website_id: uuid.UUID
-    step_name: Optional[str]
-    log_level: models.LogLevelEnum
-    message: str
-    context: Optional[Any]
-    trace_id: Optional[uuid.UUID]
-    created_at: datetime.datetime
-    total_count: int
+GET_JOB_LOGS_FILTERED = """-- name: get_job_logs_filtered \\:many
+SELECT
+    id,
+    job_id,
+    website_id,
+    step_name,
+    log_level,
+    message,
+    context,
+    trace_id,
+    created_at
+FROM crawl_log
+WHERE job_id = :p1
+    AND log_level = COALESCE(:p2, log_level)
+    AND (:p3\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= :p3\\:\\:TIMESTAMP WITH TIME ZONE)
+    AND (:p4\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= :p4\\:\\:TIMESTAMP WITH TIME ZONE)
+ORDER BY created_at ASC, id ASC
+OFFSET :p5 LIMIT :p6
+"""
 
 
 GET_LOG_STATS_BY_JOB = """-- name: get_log_stats_by_job \\:one
@@ -260,6 +319,51 @@ OFFSET :p3 LIMIT :p4
 """
 
 
+SEARCH_JOB_LOGS = """-- name: search_job_logs \\:many
+SELECT
+    id,
+    job_id,
+    website_id,
+    step_name,
+    log_level,
+    message,
+    context,
+    trace_id,
+    created_at
+FROM crawl_log
+WHERE job_id = :p1
+    AND message ILIKE '%' || :p2\\:\\:TEXT || '%'
+    AND log_level = COALESCE(:p3, log_level)
+    AND (:p4\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= :p4\\:\\:TIMESTAMP WITH TIME ZONE)
+    AND (:p5\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= :p5\\:\\:TIMESTAMP WITH TIME ZONE)
+ORDER BY created_at ASC, id ASC
+OFFSET :p6 LIMIT :p7
+"""
+
+
+SEARCH_JOB_LOGS_AFTER_CURSOR = """-- name: search_job_logs_after_cursor \\:many
+SELECT
+    id,
+    job_id,
+    website_id,
+    step_name,
+    log_level,
+    message,
+    context,
+    trace_id,
+    created_at
+FROM crawl_log
+WHERE job_id = :p1
+    AND message ILIKE '%' || :p2\\:\\:TEXT || '%'
+    AND log_level = COALESCE(:p3, log_level)
+    AND (:p4\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= :p4\\:\\:TIMESTAMP WITH TIME ZONE)
+    AND (:p5\\:\\:TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= :p5\\:\\:TIMESTAMP WITH TIME ZONE)
+    AND (created_at, id) > (:p6\\:\\:TIMESTAMP WITH TIME ZONE, :p7\\:\\:BIGINT)
+ORDER BY created_at ASC, id ASC
+LIMIT :p8
+"""
+
+
 STREAM_LOGS_BY_JOB = """-- name: stream_logs_by_job \\:many
 SELECT
     id,
@@ -284,13 +388,50 @@ class AsyncQuerier:
     def __init__(self, conn: sqlalchemy.ext.asyncio.AsyncConnection):
         self._conn = conn
 
-    async def count_job_logs_filtered(self, *, job_id: uuid.UUID, log_level: models.LogLevelEnum, start_time: datetime.datetime, end_time: datetime.datetime, search_text: str) -> Optional[int]:
+    async def bulk_create_crawl_logs(self, *, job_ids: List[uuid.UUID], website_ids: List[uuid.UUID], step_names: List[str], log_levels: List[str], messages: List[str], contexts: List[str], trace_ids: List[uuid.UUID], created_ats: List[datetime.datetime]) -> AsyncIterator[models.CrawlLog]:
+        result = await self._conn.stream(sqlalchemy.text(BULK_CREATE_CRAWL_LOGS), {
+            "p1": job_ids,
+            "p2": website_ids,
+            "p3": step_names,
+            "p4": log_levels,
+            "p5": messages,
+            "p6": contexts,
+            "p7": trace_ids,
+            "p8": created_ats,
+        })
+        async for row in result:
+            yield models.CrawlLog(
+                id=row[0],
+                job_id=row[1],
+                website_id=row[2],
+                step_name=row[3],
+                log_level=row[4],
+                message=row[5],
+                context=row[6],
+                trace_id=row[7],
+                created_at=row[8],
+            )
+
+    async def count_job_log_search(self, *, job_id: uuid.UUID, search_text: str, log_level: models.LogLevelEnum, start_time: datetime.datetime, end_time: datetime.datetime, count_cap: int) -> Optional[int]:
+        row = (await self._conn.execute(sqlalchemy.text(COUNT_JOB_LOG_SEARCH), {
+            "p1": job_id,
+            "p2": search_text,
+            "p3": log_level,
+            "p4": start_time,
+            "p5": end_time,
+            "p6": count_cap,
+        })).first()
+        if row is None:
+            return None
+        return row[0]
+
+    async def count_job_logs_filtered(self, *, job_id: uuid.UUID, log_level: models.LogLevelEnum, start_time: datetime.datetime, end_time: datetime.datetime, count_cap: int) -> Optional[int]:
         row = (await self._conn.execute(sqlalchemy.text(COUNT_JOB_LOGS_FILTERED), {
             "p1": job_id,
             "p2": log_level,
             "p3": start_time,
             "p4": end_time,
-            "p5": search_text,
+            "p5": count_cap,
         })).first()
         if row is None:
             return None
@@ -369,18 +510,40 @@ class AsyncQuerier:
                 created_at=row[8],
             )
 
-    async def get_job_logs_filtered(self, *, job_id: uuid.UUID, log_level: models.LogLevelEnum, start_time: datetime.datetime, end_time: datetime.datetime, search_text: str, offset_count: int, limit_count: int) -> AsyncIterator[GetJobLogsFilteredRow]:
-        result = await self._conn.stream(sqlalchemy.text(GET_JOB_LOGS_FILTERED), {
+    async def get_job_logs_after_cursor(self, *, job_id: uuid.UUID, log_level: models.LogLevelEnum, start_time: datetime.datetime, end_time: datetime.datetime, cursor_created_at: datetime.datetime, cursor_id: int, limit_count: int) -> AsyncIterator[models.CrawlLog]:
+        result = await self._conn.stream(sqlalchemy.text(GET_JOB_LOGS_AFTER_CURSOR), {
             "p1": job_id,
             "p2": log_level,
             "p3": start_time,
             "p4": end_time,
-            "p5": search_text,
-            "p6": offset_count,
+            "p5": cursor_created_at,
+            "p6": cursor_id,
             "p7": limit_count,
         })
         async for row in result:
-            yield GetJobLogsFilteredRow(
+            yield models.CrawlLog(
+                id=row[0],
+                job_id=row[1],
+                website_id=row[2],
+                step_name=row[3],
+                log_level=row[4],
+                message=row[5],
+                context=row[6],
+                trace_id=row[7],
+                created_at=row[8],
+            )
+
+    async def get_job_logs_filtered(self, *, job_id: uuid.UUID, log_level: models.LogLevelEnum, start_time: datetime.datetime, end_time: datetime.datetime, offset_count: int, limit_count: int) -> AsyncIterator[models.CrawlLog]:
+        result = await self._conn.stream(sqlalchemy.text(GET_JOB_LOGS_FILTERED), {
+            "p1": job_id,
+            "p2": log_level,
+            "p3": start_time,
+            "p4": end_time,
+            "p5": offset_count,
+            "p6": limit_count,
+        })
+        async for row in result:
+            yield models.CrawlLog(
                 id=row[0],
                 job_id=row[1],
                 website_id=row[2],
@@ -390,7 +553,6 @@ class AsyncQuerier:
                 context=row[6],
                 trace_id=row[7],
                 created_at=row[8],
-                total_count=row[9],
             )
 
     async def get_log_stats_by_job(self, *, job_id: uuid.UUID) -> Optional[GetLogStatsByJobRow]:
@@ -503,6 +665,53 @@ class AsyncQuerier:
                 created_at=row[8],
             )
 
+    async def search_job_logs(self, *, job_id: uuid.UUID, search_text: str, log_level: models.LogLevelEnum, start_time: datetime.datetime, end_time: datetime.datetime, offset_count: int, limit_count: int) -> AsyncIterator[models.CrawlLog]:
+        result = await self._conn.stream(sqlalchemy.text(SEARCH_JOB_LOGS), {
+            "p1": job_id,
+            "p2": search_text,
+            "p3": log_level,
+            "p4": start_time,
+            "p5": end_time,
+            "p6": offset_count,
+            "p7": limit_count,
+        })
+        async for row in result:
+            yield models.CrawlLog(
+                id=row[0],
+                job_id=row[1],
+                website_id=row[2],
+                step_name=row[3],
+                log_level=row[4],
+                message=row[5],
+                context=row[6],
+                trace_id=row[7],
+                created_at=row[8],
+            )
+
+    async def search_job_logs_after_cursor(self, *, job_id: uuid.UUID, search_text: str, log_level: models.LogLevelEnum, start_time: datetime.datetime, end_time: datetime.datetime, cursor_created_at: datetime.datetime, cursor_id: int, limit_count: int) -> AsyncIterator[models.CrawlLog]:
+        result = await self._conn.stream(sqlalchemy.text(SEARCH_JOB_LOGS_AFTER_CURSOR), {
+            "p1": job_id,
+            "p2": search_text,
+            "p3": log_level,
+            "p4": start_time,
+            "p5": end_time,
+            "p6": cursor_created_at,
+            "p7": cursor_id,
+            "p8": limit_count,
+        })
+        async for row in result:
+            yield models.CrawlLog(
+                id=row[0],
+                job_id=row[1],
+                website_id=row[2],
+                step_name=row[3],
+                log_level=row[4],
+                message=row[5],
+                context=row[6],
+                trace_id=row[7],
+                created_at=row[8],
+            )
+
     async def stream_logs_by_job(self, *, job_id: uuid.UUID, after_timestamp: datetime.datetime, log_level: models.LogLevelEnum, limit_count: int) -> AsyncIterator[models.CrawlLog]:
         result = await self._conn.stream(sqlalchemy.text(STREAM_LOGS_BY_JOB), {
             "p1": job_id,
@@ -4,7 +4,7 @@
 # source: crawled_page.sql
 import datetime
 import pydantic
-from typing import Any, AsyncIterator, Optional
+from typing import Any, AsyncIterator, List, Optional
 import uuid
 
 import sqlalchemy
@@ -13,6 +13,73 @@ import sqlalchemy.ext.asyncio
 from crawler.db.generated import models
 
 
+BULK_MARK_PAGES_AS_DUPLICATE = """-- name: bulk_mark_pages_as_duplicate \\:exec
+UPDATE crawled_page
+SET
+    is_duplicate = true,
+    duplicate_of = dup.duplicate_of,
+    similarity_score = dup.similarity_score
+FROM unnest(
+    :p1\\:\\:UUID[],
+    :p2\\:\\:UUID[],
+    :p3\\:\\:INTEGER[]
+) AS dup(id, duplicate_of, similarity_score)
+WHERE crawled_page.id = dup.id
+"""
+
+
+BULK_UPSERT_CRAWLED_PAGES = """-- name: bulk_upsert_crawled_pages \\:many
+INSERT INTO crawled_page (
+    website_id,
+    job_id,
+    url,
+    url_hash,
+    content_hash,
+    title,
+    extracted_content,
+    metadata,
+    gcs_html_path,
+    crawled_at
+)
+SELECT
+    :p1\\:\\:UUID,
+    :p2\\:\\:UUID,
+    page.url,
+    page.url_hash,
+    page.content_hash,
+    page.title,
+    page.extracted_content,
+    page.metadata\\:\\:JSONB,
+    page.gcs_html_path,
+    :p3\\:\\:TIMESTAMPTZ
+FROM unnest(
+    :p4\\:\\:VARCHAR[],
+    :p5\\:\\:VARCHAR[],
+    :p6\\:\\:VARCHAR[],
+    :p7\\:\\:VARCHAR[],
+    :p8\\:\\:TEXT[],
+    :p9\\:\\:TEXT[],
+    :p10\\:\\:VARCHAR[]
+) AS page(url, url_hash, content_hash, title, extracted_content, metadata, gcs_html_path)
+ON CONFLICT (website_id, url_hash)
+DO UPDATE SET
+    job_id = EXCLUDED.job_id,
+    content_hash = EXCLUDED.content_hash,
+    title = EXCLUDED.title,
+    extracted_content = EXCLUDED.extracted_content,
+    metadata = EXCLUDED.metadata,
+    gcs_html_path = EXCLUDED.gcs_html_path,
+    gcs_documents = EXCLUDED.gcs_documents,
+    crawled_at = EXCLUDED.crawled_at
+RETURNING id, url_hash
+"""
+
+
+class BulkUpsertCrawledPagesRow(pydantic.BaseModel):
+    id: uuid.UUID
+    url_hash: str
+
+
 COUNT_DUPLICATE_PAGES = """-- name: count_duplicate_pages \\:one
 SELECT COUNT(*) FROM crawled_page
 WHERE is_duplicate = true
@@ -108,6 +175,19 @@ OFFSET :p2 LIMIT :p3
 """
 
 
+GET_FIRST_PAGES_BY_CONTENT_HASHES = """-- name: get_first_pages_by_content_hashes \\:many
+SELECT DISTINCT ON (content_hash) id, content_hash
+FROM crawled_page
+WHERE content_hash = ANY(:p1\\:\\:VARCHAR[])
+ORDER BY content_hash, crawled_at ASC
+"""
+
+
+class GetFirstPagesByContentHashesRow(pydantic.BaseModel):
+    id: uuid.UUID
+    content_hash: str
+
+
 GET_PAGE_BY_CONTENT_HASH = """-- name: get_page_by_content_hash \\:one
 SELECT id, website_id, job_id, url, url_hash, content_hash, title, extracted_content, metadata, gcs_html_path, gcs_documents, is_duplicate, duplicate_of, similarity_score, crawled_at, created_at FROM crawled_page
 WHERE content_hash = :p1
@@ -123,13 +203,33 @@ WHERE website_id = :p1 AND url_hash = :p2
 
 
 GET_PAGE_STATS = """-- name: get_page_stats \\:one
+WITH pending AS (
+    SELECT
+        COALESCE(SUM(total_pages), 0) AS total_pages,
+        COALESCE(SUM(duplicate_pages), 0) AS duplicate_pages,
+        COALESCE(SUM(duplicate_similarity_sum), 0) AS duplicate_similarity_sum,
+        COALESCE(SUM(scored_duplicate_pages), 0) AS scored_duplicate_pages
+    FROM website_stats_delta
+    WHERE website_id = :p1
+),
+totals AS (
+    SELECT
+        COALESCE(ws.total_pages, 0) + p.total_pages AS total_pages,
+        COALESCE(ws.duplicate_pages, 0) + p.duplicate_pages AS duplicate_pages,
+        COALESCE(ws.duplicate_similarity_sum, 0) + p.duplicate_similarity_sum
+            AS duplicate_similarity_sum,
+        COALESCE(ws.scored_duplicate_pages, 0) + p.scored_duplicate_pages
+            AS scored_duplicate_pages
+    FROM pending p
+    LEFT JOIN website_stats ws ON ws.website_id = :p1
+)
 SELECT
-    COUNT(*) as total_pages,
-    COUNT(*) FILTER (WHERE is_duplicate = false) as unique_pages,
-    COUNT(*) FILTER (WHERE is_duplicate = true) as duplicate_pages,
-    AVG(similarity_score) FILTER (WHERE is_duplicate = true) as avg_similarity_score
-FROM crawled_page
-WHERE website_id = :p1
+    total_pages\\:\\:BIGINT as total_pages,
+    (total_pages - duplicate_pages)\\:\\:BIGINT as unique_pages,
+    duplicate_pages\\:\\:BIGINT as duplicate_pages,
+    (duplicate_similarity_sum\\:\\:FLOAT / NULLIF(scored_duplicate_pages, 0))\\:\\:FLOAT
+        as avg_similarity_score
+FROM totals
 """
 
 
@@ -140,22 +240,74 @@ class GetPageStatsRow(pydantic.BaseModel):
     avg_similarity_score: float
 
 
+GET_PAGE_VALIDATORS_BY_URL_HASHES = """-- name: get_page_validators_by_url_hashes \\:many
+SELECT
+    url_hash,
+    content_hash,
+    (metadata->>'etag')\\:\\:VARCHAR AS etag,
+    (metadata->>'last_modified')\\:\\:VARCHAR AS last_modified
+FROM crawled_page
+WHERE website_id = :p1
+    AND url_hash = ANY(:p2\\:\\:VARCHAR[])
+"""
+
+
+class GetPageValidatorsByURLHashesRow(pydantic.BaseModel):
+    url_hash: str
+    content_hash: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+LIST_PAGE_IDS_BY_CONTENT_HASHES = """-- name: list_page_ids_by_content_hashes \\:many
+SELECT id, content_hash
+FROM crawled_page
+WHERE content_hash = ANY(:p1\\:\\:VARCHAR[])
+ORDER BY crawled_at ASC, id ASC
+"""
+
+
+class ListPageIdsByContentHashesRow(pydantic.BaseModel):
+    id: uuid.UUID
+    content_hash: str
+
+
 LIST_PAGES_BY_JOB = """-- name: list_pages_by_job \\:many
 SELECT id, website_id, job_id, url, url_hash, content_hash, title, extracted_content, metadata, gcs_html_path, gcs_documents, is_duplicate, duplicate_of, similarity_score, crawled_at, created_at FROM crawled_page
 WHERE job_id = :p1
-ORDER BY crawled_at DESC
+ORDER BY crawled_at DESC, id DESC
 OFFSET :p2 LIMIT :p3
 """
 
 
+LIST_PAGES_BY_JOB_AFTER_CURSOR = """-- name: list_pages_by_job_after_cursor \\:many
+SELECT id, website_id, job_id, url, url_hash, content_hash, title, extracted_content, metadata, gcs_html_path, gcs_documents, is_duplicate, duplicate_of, similarity_score, crawled_at, created_at FROM crawled_page
+WHERE job_id = :p1
+    AND (:p2\\:\\:TIMESTAMP WITH TIME ZONE IS NULL
+        OR (created_at, id) > (:p2\\:\\:TIMESTAMP WITH TIME ZONE, :p3\\:\\:UUID))
+ORDER BY created_at ASC, id ASC
+LIMIT :p4
+"""
+
+
 LIST_PAGES_BY_WEBSITE = """-- name: list_pages_by_website \\:many
 SELECT id, website_id, job_id, url, url_hash, content_hash, title, extracted_content, metadata, gcs_html_path, gcs_documents, is_duplicate, duplicate_of, similarity_score, crawled_at, created_at FROM crawled_page
 WHERE website_id = :p1
-ORDER BY crawled_at DESC
+ORDER BY crawled_at DESC, id DESC
 OFFSET :p2 LIMIT :p3
 """
 
 
+LIST_PAGES_BY_WEBSITE_AFTER_CURSOR = """-- name: list_pages_by_website_after_cursor \\:many
+SELECT id, website_id, job_id, url, url_hash, content_hash, title, extracted_content, metadata, gcs_html_path, gcs_documents, is_duplicate, duplicate_of, similarity_score, crawled_at, created_at FROM crawled_page
+WHERE website_id = :p1
+    AND (:p2\\:\\:TIMESTAMP WITH TIME ZONE IS NULL
+        OR (created_at, id) > (:p2\\:\\:TIMESTAMP WITH TIME ZONE, :p3\\:\\:UUID))
+ORDER BY created_at ASC, id ASC
+LIMIT :p4
+"""
+
+
 MARK_PAGE_AS_DUPLICATE = """-- name: mark_page_as_duplicate \\:one
 UPDATE crawled_page
 SET
@@ -184,6 +336,28 @@ class AsyncQuerier:
     def __init__(self, conn: sqlalchemy.ext.asyncio.AsyncConnection):
         self._conn = conn
 
+    async def bulk_mark_pages_as_duplicate(self, *, page_ids: List[uuid.UUID], duplicate_of_ids: List[uuid.UUID], similarity_scores: List[int]) -> None:
+        await self._conn.execute(sqlalchemy.text(BULK_MARK_PAGES_AS_DUPLICATE), {"p1": page_ids, "p2": duplicate_of_ids, "p3": similarity_scores})
+
+    async def bulk_upsert_crawled_pages(self, *, website_id: uuid.UUID, job_id: uuid.UUID, crawled_at: datetime.datetime, urls: List[str], url_hashes: List[str], content_hashes: List[str], titles: List[str], extracted_contents: List[str], metadatas: List[str], gcs_html_paths: List[str]) -> AsyncIterator[BulkUpsertCrawledPagesRow]:
+        result = await self._conn.stream(sqlalchemy.text(BULK_UPSERT_CRAWLED_PAGES), {
+            "p1": website_id,
+            "p2": job_id,
+            "p3": crawled_at,
+            "p4": urls,
+            "p5": url_hashes,
+            "p6": content_hashes,
+            "p7": titles,
+            "p8": extracted_contents,
+            "p9": metadatas,
+            "p10": gcs_html_paths,
+        })
+        async for row in result:
+            yield BulkUpsertCrawledPagesRow(
+                id=row[0],
+                url_hash=row[1],
+            )
+
     async def count_duplicate_pages(self, *, website_id: uuid.UUID) -> Optional[int]:
         row = (await self._conn.execute(sqlalchemy.text(COUNT_DUPLICATE_PAGES), {"p1": website_id})).first()
         if row is None:
@@ -285,6 +459,14 @@ class AsyncQuerier:
                 created_at=row[15],
             )
 
+    async def get_first_pages_by_content_hashes(self, *, content_hashes: List[str]) -> AsyncIterator[GetFirstPagesByContentHashesRow]:
+        result = await self._conn.stream(sqlalchemy.text(GET_FIRST_PAGES_BY_CONTENT_HASHES), {"p1": content_hashes})
+        async for row in result:
+            yield GetFirstPagesByContentHashesRow(
+                id=row[0],
+                content_hash=row[1],
+            )
+
     async def get_page_by_content_hash(self, *, content_hash: str) -> Optional[models.CrawledPage]:
         row = (await self._conn.execute(sqlalchemy.text(GET_PAGE_BY_CONTENT_HASH), {"p1": content_hash})).first()
         if row is None:
@@ -342,6 +524,24 @@ class AsyncQuerier:
             avg_similarity_score=row[3],
         )
 
+    async def get_page_validators_by_url_hashes(self, *, website_id: uuid.UUID, url_hashes: List[str]) -> AsyncIterator[GetPageValidatorsByURLHashesRow]:
+        result = await self._conn.stream(sqlalchemy.text(GET_PAGE_VALIDATORS_BY_URL_HASHES), {"p1": website_id, "p2": url_hashes})
+        async for row in result:
+            yield GetPageValidatorsByURLHashesRow(
+                url_hash=row[0],
+                content_hash=row[1],
+                etag=row[2],
+                last_modified=row[3],
+            )
+
+    async def list_page_ids_by_content_hashes(self, *, content_hashes: List[str]) -> AsyncIterator[ListPageIdsByContentHashesRow]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_PAGE_IDS_BY_CONTENT_HASHES), {"p1": content_hashes})
+        async for row in result:
+            yield ListPageIdsByContentHashesRow(
+                id=row[0],
+                content_hash=row[1],
+            )
+
     async def list_pages_by_job(self, *, job_id: uuid.UUID, offset_count: int, limit_count: int) -> AsyncIterator[models.CrawledPage]:
         result = await self._conn.stream(sqlalchemy.text(LIST_PAGES_BY_JOB), {"p1": job_id, "p2": offset_count, "p3": limit_count})
         async for row in result:
@@ -364,6 +564,28 @@ class AsyncQuerier:
                 created_at=row[15],
             )
 
+    async def list_pages_by_job_after_cursor(self, *, job_id: uuid.UUID, cursor_created_at: datetime.datetime, cursor_id: uuid.UUID, limit_count: int) -> AsyncIterator[models.CrawledPage]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_PAGES_BY_JOB_AFTER_CURSOR), {"p1": job_id, "p2": cursor_created_at, "p3": cursor_id, "p4": limit_count})
+        async for row in result:
+            yield models.CrawledPage(
+                id=row[0],
+                website_id=row[1],
+                job_id=row[2],
+                url=row[3],
+                url_hash=row[4],
+                content_hash=row[5],
+                title=row[6],
+                extracted_content=row[7],
+                metadata=row[8],
+                gcs_html_path=row[9],
+                gcs_documents=row[10],
+                is_duplicate=row[11],
+                duplicate_of=row[12],
+                similarity_score=row[13],
+                crawled_at=row[14],
+                created_at=row[15],
+            )
+
     async def list_pages_by_website(self, *, website_id: uuid.UUID, offset_count: int, limit_count: int) -> AsyncIterator[models.CrawledPage]:
         result = await self._conn.stream(sqlalchemy.text(LIST_PAGES_BY_WEBSITE), {"p1": website_id, "p2": offset_count, "p3": limit_count})
         async for row in result:
@@ -386,6 +608,28 @@ class AsyncQuerier:
                 created_at=row[15],
             )
 
+    async def list_pages_by_website_after_cursor(self, *, website_id: uuid.UUID, cursor_created_at: datetime.datetime, cursor_id: uuid.UUID, limit_count: int) -> AsyncIterator[models.CrawledPage]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_PAGES_BY_WEBSITE_AFTER_CURSOR), {"p1": website_id, "p2": cursor_created_at, "p3": cursor_id, "p4": limit_count})
+        async for row in result:
+            yield models.CrawledPage(
+                id=row[0],
+                website_id=row[1],
+                job_id=row[2],
+                url=row[3],
+                url_hash=row[4],
+                content_hash=row[5],
+                title=row[6],
+                extracted_content=row[7],
+                metadata=row[8],
+                gcs_html_path=row[9],
+                gcs_documents=row[10],
+                is_duplicate=row[11],
+                duplicate_of=row[12],
+                similarity_score=row[13],
+                crawled_at=row[14],
+                created_at=row[15],
+            )
+
     async def mark_page_as_duplicate(self, *, duplicate_of: Optional[uuid.UUID], similarity_score: Optional[int], id: uuid.UUID) -> Optional[models.CrawledPage]:
         row = (await self._conn.execute(sqlalchemy.text(MARK_PAGE_AS_DUPLICATE), {"p1": duplicate_of, "p2": similarity_score, "p3": id})).first()
         if row is None:
@@ -143,11 +143,24 @@ WHERE (:p1\\:\\:error_category_enum IS NULL OR error_category = :p1)
   AND (:p3\\:\\:boolean IS NULL OR
        (:p3 = true AND resolved_at IS NULL) OR
        (:p3 = false AND resolved_at IS NOT NULL))
-ORDER BY added_to_dlq_at DESC
+ORDER BY added_to_dlq_at DESC, id DESC
 LIMIT :p4 OFFSET :p5
 """
 
 
+LIST_DLQ_ENTRIES_AFTER_CURSOR = """-- name: list_dlq_entries_after_cursor \\:many
+SELECT id, job_id, seed_url, website_id, job_type, priority, error_category, error_message, stack_trace, http_status, total_attempts, first_attempt_at, last_attempt_at, added_to_dlq_at, retry_attempted, retry_attempted_at, retry_success, resolved_at, resolution_notes FROM dead_letter_queue
+WHERE (:p1\\:\\:error_category_enum IS NULL OR error_category = :p1)
+  AND (:p2\\:\\:uuid IS NULL OR website_id = :p2)
+  AND (:p3\\:\\:boolean IS NULL OR
+       (:p3 = true AND resolved_at IS NULL) OR
+       (:p3 = false AND resolved_at IS NOT NULL))
+  AND (added_to_dlq_at, id) < (:p4\\:\\:TIMESTAMP WITH TIME ZONE, :p5\\:\\:BIGINT)
+ORDER BY added_to_dlq_at DESC, id DESC
+LIMIT :p6
+"""
+
+
 MARK_DLQ_RESOLVED = """-- name: mark_dlq_resolved \\:one
 UPDATE dead_letter_queue
 SET
@@ -377,6 +390,38 @@ class AsyncQuerier:
                 resolution_notes=row[18],
             )
 
+    async def list_dlq_entries_after_cursor(self, *, dollar_1: models.ErrorCategoryEnum, dollar_2: uuid.UUID, dollar_3: bool, dollar_4: datetime.datetime, dollar_5: int, limit: int) -> AsyncIterator[models.DeadLetterQueue]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_DLQ_ENTRIES_AFTER_CURSOR), {
+            "p1": dollar_1,
+            "p2": dollar_2,
+            "p3": dollar_3,
+            "p4": dollar_4,
+            "p5": dollar_5,
+            "p6": limit,
+        })
+        async for row in result:
+            yield models.DeadLetterQueue(
+                id=row[0],
+                job_id=row[1],
+                seed_url=row[2],
+                website_id=row[3],
+                job_type=row[4],
+                priority=row[5],
+                error_category=row[6],
+                error_message=row[7],
+                stack_trace=row[8],
+                http_status=row[9],
+                total_attempts=row[10],
+                first_attempt_at=row[11],
+                last_attempt_at=row[12],
+                added_to_dlq_at=row[13],
+                retry_attempted=row[14],
+                retry_attempted_at=row[15],
+                retry_success=row[16],
+                resolved_at=row[17],
+                resolution_notes=row[18],
+            )
+
     async def mark_dlq_resolved(self, *, id: int, resolution_notes: Optional[str]) -> Optional[models.DeadLetterQueue]:
         row = (await self._conn.execute(sqlalchemy.text(MARK_DLQ_RESOLVED), {"p1": id, "p2": resolution_notes})).first()
         if row is None:
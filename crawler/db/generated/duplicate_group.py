@@ -4,7 +4,7 @@
 # source: duplicate_group.sql
 import datetime
 import pydantic
-from typing import Any, AsyncIterator, Optional
+from typing import Any, AsyncIterator, List, Optional
 import uuid
 
 import sqlalchemy
@@ -27,6 +27,67 @@ INSERT INTO duplicate_relationship (
 """
 
 
+BULK_ADD_DUPLICATE_RELATIONSHIPS = """-- name: bulk_add_duplicate_relationships \\:exec
+INSERT INTO duplicate_relationship (
+    group_id,
+    duplicate_page_id,
+    detection_method,
+    similarity_score,
+    confidence_threshold,
+    detected_by
+)
+SELECT
+    rel.group_id,
+    rel.duplicate_page_id,
+    rel.detection_method,
+    rel.similarity_score,
+    rel.confidence_threshold,
+    :p1
+FROM unnest(
+    :p2\\:\\:UUID[],
+    :p3\\:\\:UUID[],
+    :p4\\:\\:VARCHAR[],
+    :p5\\:\\:INTEGER[],
+    :p6\\:\\:INTEGER[]
+) AS rel(group_id, duplicate_page_id, detection_method, similarity_score, confidence_threshold)
+WHERE NOT EXISTS (
+    SELECT 1 FROM duplicate_relationship dr
+    WHERE dr.duplicate_page_id = rel.duplicate_page_id
+)
+"""
+
+
+BULK_GET_OR_CREATE_DUPLICATE_GROUPS = """-- name: bulk_get_or_create_duplicate_groups \\:many
+WITH canonical AS (
+    SELECT DISTINCT unnest(:p1\\:\\:UUID[]) AS page_id
+),
+existing AS (
+    SELECT DISTINCT ON (dg.canonical_page_id) dg.id, dg.canonical_page_id
+    FROM duplicate_group dg
+    JOIN canonical c ON c.page_id = dg.canonical_page_id
+    ORDER BY dg.canonical_page_id, dg.created_at ASC
+),
+inserted AS (
+    INSERT INTO duplicate_group (canonical_page_id)
+    SELECT c.page_id
+    FROM canonical c
+    WHERE NOT EXISTS (
+        SELECT 1 FROM existing e
+        WHERE e.canonical_page_id = c.page_id
+    )
+    RETURNING id, canonical_page_id
+)
+SELECT id, canonical_page_id FROM existing
+UNION ALL
+SELECT id, canonical_page_id FROM inserted
+"""
+
+
+class BulkGetOrCreateDuplicateGroupsRow(pydantic.BaseModel):
+    id: uuid.UUID
+    canonical_page_id: uuid.UUID
+
+
 COUNT_DUPLICATES_BY_METHOD = """-- name: count_duplicates_by_method \\:many
 SELECT
     detection_method,
@@ -52,6 +113,21 @@ INSERT INTO duplicate_group (
 """
 
 
+DELETE_DETECTED_DUPLICATE_RELATIONSHIPS = """-- name: delete_detected_duplicate_relationships \\:exec
+DELETE FROM duplicate_relationship
+WHERE detection_method IN ('exact_hash', 'fuzzy_match')
+"""
+
+
+DELETE_EMPTY_DUPLICATE_GROUPS = """-- name: delete_empty_duplicate_groups \\:exec
+DELETE FROM duplicate_group dg
+WHERE NOT EXISTS (
+    SELECT 1 FROM duplicate_relationship dr
+    WHERE dr.group_id = dg.id
+)
+"""
+
+
 FIND_DUPLICATE_GROUP_FOR_PAGE = """-- name: find_duplicate_group_for_page \\:one
 SELECT dg.id, dg.canonical_page_id, dg.group_size, dg.created_at, dg.updated_at
 FROM duplicate_group dg
@@ -98,14 +174,13 @@ SELECT
     dg.id,
     dg.canonical_page_id,
     dg.group_size,
-    COUNT(dr.id) as relationship_count,
-    AVG(dr.similarity_score) as avg_similarity,
-    MIN(dr.detected_at) as first_detected,
-    MAX(dr.detected_at) as last_detected
+    COALESCE(dgs.relationship_count, 0)\\:\\:BIGINT as relationship_count,
+    (dgs.similarity_sum\\:\\:FLOAT / NULLIF(dgs.scored_relationship_count, 0))\\:\\:FLOAT as avg_similarity,
+    dgs.first_detected_at as first_detected,
+    dgs.last_detected_at as last_detected
 FROM duplicate_group dg
-LEFT JOIN duplicate_relationship dr ON dr.group_id = dg.id
+LEFT JOIN duplicate_group_stats dgs ON dgs.group_id = dg.id
 WHERE dg.id = :p1
-GROUP BY dg.id, dg.canonical_page_id, dg.group_size
 """
 
 
@@ -115,8 +190,8 @@ class GetDuplicateGroupStatsRow(pydantic.BaseModel):
     group_size: int
     relationship_count: int
     avg_similarity: float
-    first_detected: Any
-    last_detected: Any
+    first_detected: Optional[datetime.datetime]
+    last_detected: Optional[datetime.datetime]
 
 
 GET_DUPLICATE_RELATIONSHIP = """-- name: get_duplicate_relationship \\:one
@@ -156,11 +231,19 @@ class GetGroupWithCanonicalPageRow(pydantic.BaseModel):
 
 LIST_ALL_DUPLICATE_GROUPS = """-- name: list_all_duplicate_groups \\:many
 SELECT id, canonical_page_id, group_size, created_at, updated_at FROM duplicate_group
-ORDER BY created_at DESC
+ORDER BY created_at DESC, id DESC
 LIMIT :p1 OFFSET :p2
 """
 
 
+LIST_DUPLICATE_GROUPS_AFTER_CURSOR = """-- name: list_duplicate_groups_after_cursor \\:many
+SELECT id, canonical_page_id, group_size, created_at, updated_at FROM duplicate_group
+WHERE (created_at, id) < (:p1\\:\\:TIMESTAMP WITH TIME ZONE, :p2\\:\\:UUID)
+ORDER BY created_at DESC, id DESC
+LIMIT :p3
+"""
+
+
 LIST_DUPLICATES_IN_GROUP = """-- name: list_duplicates_in_group \\:many
 SELECT
     dr.id, dr.group_id, dr.duplicate_page_id, dr.detection_method, dr.similarity_score, dr.confidence_threshold, dr.detected_at, dr.detected_by,
@@ -188,6 +271,34 @@ class ListDuplicatesInGroupRow(pydantic.BaseModel):
     content_hash: str
 
 
+REBUILD_DUPLICATE_GROUP_STATS = """-- name: rebuild_duplicate_group_stats \\:exec
+INSERT INTO duplicate_group_stats (
+    group_id,
+    relationship_count,
+    similarity_sum,
+    scored_relationship_count,
+    first_detected_at,
+    last_detected_at
+)
+SELECT
+    dg.id,
+    COUNT(dr.id),
+    COALESCE(SUM(dr.similarity_score), 0),
+    COUNT(dr.similarity_score),
+    MIN(dr.detected_at),
+    MAX(dr.detected_at)
+FROM duplicate_group dg
+LEFT JOIN duplicate_relationship dr ON dr.group_id = dg.id
+GROUP BY dg.id
+ON CONFLICT (group_id) DO UPDATE SET
+    relationship_count = EXCLUDED.relationship_count,
+    similarity_sum = EXCLUDED.similarity_sum,
+    scored_relationship_count = EXCLUDED.scored_relationship_count,
+    first_detected_at = EXCLUDED.first_detected_at,
+    last_detected_at = EXCLUDED.last_detected_at
+"""
+
+
 REMOVE_DUPLICATE_GROUP = """-- name: remove_duplicate_group \\:exec
 DELETE FROM duplicate_group
 WHERE id = :p1
@@ -234,6 +345,24 @@ class AsyncQuerier:
             detected_by=row[7],
         )
 
+    async def bulk_add_duplicate_relationships(self, *, detected_by: Optional[str], group_ids: List[uuid.UUID], duplicate_page_ids: List[uuid.UUID], detection_methods: List[str], similarity_scores: List[int], confidence_thresholds: List[int]) -> None:
+        await self._conn.execute(sqlalchemy.text(BULK_ADD_DUPLICATE_RELATIONSHIPS), {
+            "p1": detected_by,
+            "p2": group_ids,
+            "p3": duplicate_page_ids,
+            "p4": detection_methods,
+            "p5": similarity_scores,
+            "p6": confidence_thresholds,
+        })
+
+    async def bulk_get_or_create_duplicate_groups(self, *, canonical_page_ids: List[uuid.UUID]) -> AsyncIterator[BulkGetOrCreateDuplicateGroupsRow]:
+        result = await self._conn.stream(sqlalchemy.text(BULK_GET_OR_CREATE_DUPLICATE_GROUPS), {"p1": canonical_page_ids})
+        async for row in result:
+            yield BulkGetOrCreateDuplicateGroupsRow(
+                id=row[0],
+                canonical_page_id=row[1],
+            )
+
     async def count_duplicates_by_method(self) -> AsyncIterator[CountDuplicatesByMethodRow]:
         result = await self._conn.stream(sqlalchemy.text(COUNT_DUPLICATES_BY_METHOD))
         async for row in result:
@@ -254,6 +383,12 @@ class AsyncQuerier:
             updated_at=row[4],
         )
 
+    async def delete_detected_duplicate_relationships(self) -> None:
+        await self._conn.execute(sqlalchemy.text(DELETE_DETECTED_DUPLICATE_RELATIONSHIPS))
+
+    async def delete_empty_duplicate_groups(self) -> None:
+        await self._conn.execute(sqlalchemy.text(DELETE_EMPTY_DUPLICATE_GROUPS))
+
     async def find_duplicate_group_for_page(self, *, duplicate_page_id: uuid.UUID) -> Optional[models.DuplicateGroup]:
         row = (await self._conn.execute(sqlalchemy.text(FIND_DUPLICATE_GROUP_FOR_PAGE), {"p1": duplicate_page_id})).first()
         if row is None:
@@ -405,6 +540,17 @@ class AsyncQuerier:
                 updated_at=row[4],
             )
 
+    async def list_duplicate_groups_after_cursor(self, *, cursor_created_at: datetime.datetime, cursor_id: uuid.UUID, limit_count: int) -> AsyncIterator[models.DuplicateGroup]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_DUPLICATE_GROUPS_AFTER_CURSOR), {"p1": cursor_created_at, "p2": cursor_id, "p3": limit_count})
+        async for row in result:
+            yield models.DuplicateGroup(
+                id=row[0],
+                canonical_page_id=row[1],
+                group_size=row[2],
+                created_at=row[3],
+                updated_at=row[4],
+            )
+
     async def list_duplicates_in_group(self, *, group_id: uuid.UUID) -> AsyncIterator[ListDuplicatesInGroupRow]:
         result = await self._conn.stream(sqlalchemy.text(LIST_DUPLICATES_IN_GROUP), {"p1": group_id})
         async for row in result:
@@ -422,6 +568,9 @@ class AsyncQuerier:
                 content_hash=row[10],
             )
 
+    async def rebuild_duplicate_group_stats(self) -> None:
+        await self._conn.execute(sqlalchemy.text(REBUILD_DUPLICATE_GROUP_STATS))
+
     async def remove_duplicate_group(self, *, id: uuid.UUID) -> None:
         await self._conn.execute(sqlalchemy.text(REMOVE_DUPLICATE_GROUP), {"p1": id})
 
@@ -0,0 +1,126 @@
+# Code generated by sqlc. DO NOT EDIT.
+# versions:
+#   sqlc v1.30.0
+# source: job_checkpoint.sql
+import pydantic
+from typing import Any, AsyncIterator, List
+import uuid
+
+import sqlalchemy
+import sqlalchemy.ext.asyncio
+
+from crawler.db.generated import models
+
+
+BULK_UPSERT_JOB_PAGE_CHECKPOINTS = """-- name: bulk_upsert_job_page_checkpoints \\:exec
+INSERT INTO job_page_checkpoint (job_id, step_name, url_hash, config_hash, url, page)
+SELECT
+    :p1\\:\\:UUID,
+    :p2\\:\\:VARCHAR,
+    checkpoint.url_hash,
+    :p3\\:\\:VARCHAR,
+    checkpoint.url,
+    checkpoint.page\\:\\:JSONB
+FROM unnest(
+    :p4\\:\\:VARCHAR[],
+    :p5\\:\\:TEXT[],
+    :p6\\:\\:TEXT[]
+) AS checkpoint(url_hash, url, page)
+ON CONFLICT (job_id, step_name, url_hash)
+DO UPDATE SET
+    config_hash = EXCLUDED.config_hash,
+    url = EXCLUDED.url,
+    page = EXCLUDED.page,
+    created_at = CURRENT_TIMESTAMP
+"""
+
+
+DELETE_JOB_CHECKPOINTS = """-- name: delete_job_checkpoints \\:exec
+WITH deleted_pages AS (
+    DELETE FROM job_page_checkpoint
+    WHERE job_id = :p1
+)
+DELETE FROM job_step_checkpoint
+WHERE job_id = :p1
+"""
+
+
+LIST_JOB_STEP_CHECKPOINTS = """-- name: list_job_step_checkpoints \\:many
+SELECT job_id, step_name, config_hash, result, created_at FROM job_step_checkpoint
+WHERE job_id = :p1
+ORDER BY created_at ASC
+"""
+
+
+STREAM_JOB_PAGE_CHECKPOINTS = """-- name: stream_job_page_checkpoints \\:many
+SELECT url, page FROM job_page_checkpoint
+WHERE job_id = :p1
+    AND step_name = :p2
+    AND config_hash = :p3
+"""
+
+
+class StreamJobPageCheckpointsRow(pydantic.BaseModel):
+    url: str
+    page: Any
+
+
+UPSERT_JOB_STEP_CHECKPOINT = """-- name: upsert_job_step_checkpoint \\:exec
+INSERT INTO job_step_checkpoint (job_id, step_name, config_hash, result)
+VALUES (
+    :p1,
+    :p2,
+    :p3,
+    :p4\\:\\:JSONB
+)
+ON CONFLICT (job_id, step_name)
+DO UPDATE SET
+    config_hash = EXCLUDED.config_hash,
+    result = EXCLUDED.result,
+    created_at = CURRENT_TIMESTAMP
+"""
+
+
+class AsyncQuerier:
+    def __init__(self, conn: sqlalchemy.ext.asyncio.AsyncConnection):
+        self._conn = conn
+
+    async def bulk_upsert_job_page_checkpoints(self, *, job_id: uuid.UUID, step_name: str, config_hash: str, url_hashes: List[str], urls: List[str], pages: List[str]) -> None:
+        await self._conn.execute(sqlalchemy.text(BULK_UPSERT_JOB_PAGE_CHECKPOINTS), {
+            "p1": job_id,
+            "p2": step_name,
+            "p3": config_hash,
+            "p4": url_hashes,
+            "p5": urls,
+            "p6": pages,
+        })
+
+    async def delete_job_checkpoints(self, *, job_id: uuid.UUID) -> None:
+        await self._conn.execute(sqlalchemy.text(DELETE_JOB_CHECKPOINTS), {"p1": job_id})
+
+    async def list_job_step_checkpoints(self, *, job_id: uuid.UUID) -> AsyncIterator[models.JobStepCheckpoint]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_JOB_STEP_CHECKPOINTS), {"p1": job_id})
+        async for row in result:
+            yield models.JobStepCheckpoint(
+                job_id=row[0],
+                step_name=row[1],
+                config_hash=row[2],
+                result=row[3],
+                created_at=row[4],
+            )
+
+    async def stream_job_page_checkpoints(self, *, job_id: uuid.UUID, step_name: str, config_hash: str) -> AsyncIterator[StreamJobPageCheckpointsRow]:
+        result = await self._conn.stream(sqlalchemy.text(STREAM_JOB_PAGE_CHECKPOINTS), {"p1": job_id, "p2": step_name, "p3": config_hash})
+        async for row in result:
+            yield StreamJobPageCheckpointsRow(
+                url=row[0],
+                page=row[1],
+            )
+
+    async def upsert_job_step_checkpoint(self, *, job_id: uuid.UUID, step_name: str, config_hash: str, result: Any) -> None:
+        await self._conn.execute(sqlalchemy.text(UPSERT_JOB_STEP_CHECKPOINT), {
+            "p1": job_id,
+            "p2": step_name,
+            "p3": config_hash,
+            "p4": result,
+        })
@@ -242,6 +242,15 @@ class DuplicateGroup(pydantic.BaseModel):
     updated_at: datetime.datetime
 
 
+class DuplicateGroupStat(pydantic.BaseModel):
+    group_id: uuid.UUID
+    relationship_count: int
+    similarity_sum: int
+    scored_relationship_count: int
+    first_detected_at: Optional[datetime.datetime]
+    last_detected_at: Optional[datetime.datetime]
+
+
 class DuplicateRelationship(pydantic.BaseModel):
     id: int
     group_id: uuid.UUID
@@ -253,6 +262,24 @@ class DuplicateRelationship(pydantic.BaseModel):
     detected_by: Optional[str]
 
 
+class JobPageCheckpoint(pydantic.BaseModel):
+    job_id: uuid.UUID
+    step_name: str
+    url_hash: str
+    config_hash: str
+    url: str
+    page: Any
+    created_at: datetime.datetime
+
+
+class JobStepCheckpoint(pydantic.BaseModel):
+    job_id: uuid.UUID
+    step_name: str
+    config_hash: str
+    result: Any
+    created_at: datetime.datetime
+
+
 class RetryHistory(pydantic.BaseModel):
     id: int
     job_id: uuid.UUID
@@ -327,3 +354,30 @@ class WebsiteConfigHistory(pydantic.BaseModel):
     # Optional description of why the change was made
     change_reason: Optional[str]
     created_at: datetime.datetime
+
+
+class WebsiteStat(pydantic.BaseModel):
+    website_id: uuid.UUID
+    total_jobs: int
+    completed_jobs: int
+    failed_jobs: int
+    cancelled_jobs: int
+    total_pages: int
+    duplicate_pages: int
+    duplicate_similarity_sum: int
+    scored_duplicate_pages: int
+    updated_at: datetime.datetime
+
+
+class WebsiteStatsDeltum(pydantic.BaseModel):
+    id: int
+    website_id: uuid.UUID
+    total_jobs: int
+    completed_jobs: int
+    failed_jobs: int
+    cancelled_jobs: int
+    total_pages: int
+    duplicate_pages: int
+    duplicate_similarity_sum: int
+    scored_duplicate_pages: int
+    created_at: datetime.datetime
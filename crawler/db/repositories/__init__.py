@@ -15,6 +15,8 @@ Repository classes:
     - RetryPolicyRepository: Retry policy configuration
     - RetryHistoryRepository: Retry attempt tracking
     - DeadLetterQueueRepository: Dead letter queue for permanently failed jobs
+    - JobCheckpointRepository: Durable workflow progress for resuming retried jobs
+    - WebsiteStatsRepository: Incrementally maintained website statistics
 """
 
 from .content_hash import ContentHashRepository
@@ -23,11 +25,13 @@ from .crawl_log import CrawlLogRepository
 from .crawled_page import CrawledPageRepository
 from .dead_letter_queue import DeadLetterQueueRepository
 from .duplicate_group import DuplicateGroupRepository
+from .job_checkpoint import JobCheckpointRepository
 from .retry_history import RetryHistoryRepository
 from .retry_policy import RetryPolicyRepository
 from .scheduled_job import ScheduledJobRepository
 from .website import WebsiteRepository
 from .website_config_history import WebsiteConfigHistoryRepository
+from .website_stats import WebsiteStatsRepository
 
 __all__ = [
     "ContentHashRepository",
@@ -36,9 +40,11 @@ __all__ = [
     "CrawledPageRepository",
     "DeadLetterQueueRepository",
     "DuplicateGroupRepository",
+    "JobCheckpointRepository",
     "RetryHistoryRepository",
     "RetryPolicyRepository",
     "ScheduledJobRepository",
     "WebsiteConfigHistoryRepository",
     "WebsiteRepository",
+    "WebsiteStatsRepository",
 ]
@@ -5,7 +5,12 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from crawler.db.generated import content_hash, models
-from crawler.utils.simhash_helpers import to_signed_int64
+from crawler.utils.simhash_helpers import (
+    MAX_BANDED_DISTANCE,
+    from_signed_int64,
+    simhash_bands,
+    to_signed_int64,
+)
 
 from .base import to_uuid_optional
 
@@ -61,6 +66,34 @@ class ContentHashRepository:
             simhash_fingerprint=to_signed_int64(simhash_fingerprint),
         )
 
+    async def bulk_upsert(
+        self,
+        content_hashes: list[str],
+        first_seen_page_ids: list[UUID],
+        occurrence_counts: list[int],
+        simhash_fingerprints: list[int | None],
+    ) -> None:
+        """Insert or update many content hashes in a single statement.
+
+        The lists are parallel and each content hash must appear once. Existing
+        rows have their occurrence count increased by the given count.
+
+        Args:
+            content_hashes: Content hash strings (SHA256)
+            first_seen_page_ids: ID of the first page with each content
+            occurrence_counts: Number of new pages sharing each content hash
+            simhash_fingerprints: 64-bit Simhash fingerprints (None if unavailable)
+        """
+        signed_fingerprints = [
+            to_signed_int64(fp) if fp is not None else None for fp in simhash_fingerprints
+        ]
+        await self._querier.bulk_upsert_content_hashes(
+            content_hashes=content_hashes,
+            first_seen_page_ids=first_seen_page_ids,
+            occurrence_counts=occurrence_counts,
+            simhash_fingerprints=signed_fingerprints,  # type: ignore[arg-type]
+        )
+
     async def get(self, content_hash_value: str) -> models.ContentHash | None:
         """Get content hash record."""
         return await self._querier.get_content_hash(content_hash=content_hash_value)
@@ -78,18 +111,46 @@ class ContentHashRepository:
             simhash_fingerprint=to_signed_int64(simhash_fingerprint)
         )
 
+    async def list_for_clustering(
+        self, after_hash: str = "", limit: int = 10000
+    ) -> list[content_hash.ListContentHashesForClusteringRow]:
+        """List content hashes that can belong to a duplicate group, in hash order.
+
+        Returns hashes with a Simhash fingerprint or shared by several pages. Pass
+        the last hash of a page as after_hash to get the next one (keyset paging).
+
+        Args:
+            after_hash: Only return hashes greater than this one
+            limit: Maximum number of hashes to return
+
+        Returns:
+            Rows with unsigned Simhash fingerprints
+        """
+        results = []
+        async for row in self._querier.list_content_hashes_for_clustering(
+            after_hash=after_hash, limit_count=limit
+        ):
+            if row.simhash_fingerprint is not None:
+                row.simhash_fingerprint = from_signed_int64(row.simhash_fingerprint)
+            results.append(row)
+        return results
+
     async def find_similar(
         self,
         target_fingerprint: int,
         max_distance: int = 3,
         exclude_hash: str = "",
         limit: int = 10,
-    ) -> list[content_hash.FindSimilarContentRow]:
+    ) -> list[content_hash.FindSimilarContentRow | content_hash.FindSimilarContentByBandsRow]:
         """Find content with similar Simhash fingerprints.
 
         Uses Hamming distance to find near-duplicates. Lower distance means
         more similar content.
 
+        For max_distance <= 3 the lookup goes through the 16-bit band indexes and
+        only verifies candidates sharing a band with the target, so its cost does not
+        grow with the table. Larger distances fall back to a full scan.
+
         Args:
             target_fingerprint: Target Simhash fingerprint to match against
             max_distance: Maximum Hamming distance (default: 3, roughly 95% similar)
@@ -110,13 +171,68 @@ class ContentHashRepository:
             >>> for item in similar:
             ...     print(f"Hash: {item.content_hash}, Distance: {item.hamming_distance}")
         """
+        signed_fingerprint = to_signed_int64(target_fingerprint)
+
         # Collect async generator results into list
-        results = []
+        results: list[
+            content_hash.FindSimilarContentRow | content_hash.FindSimilarContentByBandsRow
+        ] = []
+
+        if max_distance <= MAX_BANDED_DISTANCE:
+            band_0, band_1, band_2, band_3 = simhash_bands(signed_fingerprint)
+            async for banded_row in self._querier.find_similar_content_by_bands(
+                target_fingerprint=signed_fingerprint,
+                band_0=band_0,
+                band_1=band_1,
+                band_2=band_2,
+                band_3=band_3,
+                max_distance=max_distance,
+                exclude_hash=exclude_hash,
+                limit_count=limit,
+            ):
+                results.append(banded_row)
+            return results
+
         async for row in self._querier.find_similar_content(
-            target_fingerprint=to_signed_int64(target_fingerprint),
+            target_fingerprint=signed_fingerprint,
             max_distance=max_distance,
             exclude_hash=exclude_hash,
             limit_count=limit,
         ):
             results.append(row)
         return results
+
+    async def find_similar_batch(
+        self,
+        target_fingerprints: list[int],
+        max_distance: int = MAX_BANDED_DISTANCE,
+    ) -> dict[int, content_hash.FindSimilarContentBatchRow]:
+        """Find the closest stored content for many Simhash fingerprints at once.
+
+        Batch version of find_similar: every target probes the band indexes within
+        a single query, so max_distance must not exceed MAX_BANDED_DISTANCE.
+
+        Args:
+            target_fingerprints: Target Simhash fingerprints to match against
+            max_distance: Maximum Hamming distance (default: 3, roughly 95% similar)
+
+        Returns:
+            Mapping of target fingerprint to its closest match. Targets without a
+            match within max_distance are omitted.
+
+        Raises:
+            ValueError: If max_distance exceeds MAX_BANDED_DISTANCE
+        """
+        if max_distance > MAX_BANDED_DISTANCE:
+            raise ValueError(
+                f"max_distance must be <= {MAX_BANDED_DISTANCE} for batched lookups, "
+                f"got {max_distance}"
+            )
+
+        matches: dict[int, content_hash.FindSimilarContentBatchRow] = {}
+        async for row in self._querier.find_similar_content_batch(
+            target_fingerprints=[to_signed_int64(fp) for fp in target_fingerprints],
+            max_distance=max_distance,
+        ):
+            matches[from_signed_int64(row.target_fingerprint)] = row
+        return matches
@@ -82,6 +82,56 @@ class CrawlLogRepository:
 
         return log
 
+    async def create_many(
+        self,
+        job_ids: list[UUID],
+        website_ids: list[UUID],
+        messages: list[str],
+        log_levels: list[LogLevelEnum],
+        step_names: list[str | None],
+        contexts: list[dict[str, Any] | None],
+        trace_ids: list[UUID | None],
+        created_ats: list[datetime],
+    ) -> list[models.CrawlLog]:
+        """Create many log entries in a single statement.
+
+        The lists are parallel. Entries are inserted in list order, so their IDs
+        increase in the order they were written. Unlike create(), the batch is not
+        published: the caller publishes it once its transaction has committed.
+
+        Args:
+            job_ids: Job ID of each entry
+            website_ids: Website ID of each entry
+            messages: Log messages
+            log_levels: Log level of each entry
+            step_names: Optional step name of each entry
+            contexts: Optional context dict of each entry (serialized to JSON)
+            trace_ids: Optional trace ID of each entry
+            created_ats: Time each entry was written
+
+        Returns:
+            Created CrawlLog models, in list order
+        """
+        # Guard: empty batch
+        if not job_ids:
+            return []
+
+        serialized = [json.dumps(context) if context else None for context in contexts]
+        logs = [
+            log
+            async for log in self._querier.bulk_create_crawl_logs(
+                job_ids=job_ids,
+                website_ids=website_ids,
+                step_names=step_names,  # type: ignore[arg-type]
+                log_levels=[level.value for level in log_levels],
+                messages=messages,
+                contexts=serialized,  # type: ignore[arg-type]
+                trace_ids=trace_ids,  # type: ignore[arg-type]
+                created_ats=created_ats,
+            )
+        ]
+        return logs
+
     async def list_by_job(
         self,
         job_id: str | UUID,
@@ -200,11 +250,12 @@ class CrawlLogRepository:
         search_text: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        count_cap: int | None = None,
     ) -> tuple[list[models.CrawlLog], int]:
         """Get filtered logs for a job with pagination and total count.
 
-        Uses a window function to retrieve both logs and total count in a single query,
-        reducing database round trips and improving performance.
+        A first page shorter than the limit is its own total, so the count query
+        only runs when more logs may follow. Searches use the message trigram index.
 
         Args:
             job_id: Job ID
@@ -214,53 +265,102 @@ class CrawlLogRepository:
             search_text: Optional text search in message (case-insensitive)
             limit: Maximum number of results
             offset: Number of results to skip
+            count_cap: Stop counting at this many logs (None counts them all)
 
         Returns:
             Tuple of (logs list, total count) where:
             - logs: List of CrawlLog models ordered by created_at ASC
-            - total: Total count of logs matching filters (for pagination)
+            - total: Total count of logs matching filters, at most count_cap
 
         Note:
             SQL uses COALESCE and NULL checks, but sqlc generates non-optional types.
-            The total_count is extracted from the first row via window function.
         """
-        rows = [
-            row
-            async for row in self._querier.get_job_logs_filtered(
+        if search_text is None:
+            rows = self._querier.get_job_logs_filtered(
                 job_id=to_uuid(job_id),
                 log_level=log_level,  # type: ignore[arg-type]
                 start_time=start_time,  # type: ignore[arg-type]
                 end_time=end_time,  # type: ignore[arg-type]
-                search_text=search_text,  # type: ignore[arg-type]
+                offset_count=offset,
                 limit_count=limit,
+            )
+        else:
+            rows = self._querier.search_job_logs(
+                job_id=to_uuid(job_id),
+                search_text=search_text,
+                log_level=log_level,  # type: ignore[arg-type]
+                start_time=start_time,  # type: ignore[arg-type]
+                end_time=end_time,  # type: ignore[arg-type]
                 offset_count=offset,
+                limit_count=limit,
             )
-        ]
+        logs = [log async for log in rows]
 
-        # Guard: No results found
-        if not rows:
-            return [], 0
+        # Guard: A short first page holds every matching log
+        if offset == 0 and len(logs) < limit:
+            return logs, len(logs)
 
-        # Extract total count from first row (window function ensures all rows have same total)
-        total_count = rows[0].total_count
+        total = await self.count_job_logs_filtered(
+            job_id=job_id,
+            log_level=log_level,
+            start_time=start_time,
+            end_time=end_time,
+            search_text=search_text,
+            count_cap=count_cap,
+        )
+        return logs, total
 
-        # Convert rows to CrawlLog models (excluding total_count field)
-        logs = [
-            models.CrawlLog(
-                id=row.id,
-                job_id=row.job_id,
-                website_id=row.website_id,
-                step_name=row.step_name,
-                log_level=row.log_level,
-                message=row.message,
-                context=row.context,
-                trace_id=row.trace_id,
-                created_at=row.created_at,
-            )
-            for row in rows
-        ]
+    async def get_job_logs_after_cursor(
+        self,
+        job_id: str | UUID,
+        cursor_created_at: datetime,
+        cursor_id: int,
+        log_level: LogLevelEnum | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        search_text: str | None = None,
+        limit: int = 100,
+    ) -> list[models.CrawlLog]:
+        """Get the filtered logs of a job after a cursor using keyset pagination.
 
-        return logs, total_count
+        Continues the (created_at, id) order of get_job_logs_filtered without an
+        OFFSET scan or count, so deep pages cost the same as the first.
+
+        Args:
+            job_id: Job ID
+            cursor_created_at: created_at of the last log already read
+            cursor_id: ID of the last log already read
+            log_level: Optional log level filter
+            start_time: Optional start timestamp filter
+            end_time: Optional end timestamp filter
+            search_text: Optional text search in message (case-insensitive)
+            limit: Maximum number of results
+
+        Returns:
+            List of CrawlLog models ordered by created_at ASC, id ASC
+        """
+        if search_text is None:
+            rows = self._querier.get_job_logs_after_cursor(
+                job_id=to_uuid(job_id),
+                log_level=log_level,  # type: ignore[arg-type]
+                start_time=start_time,  # type: ignore[arg-type]
+                end_time=end_time,  # type: ignore[arg-type]
+                cursor_created_at=cursor_created_at,
+                cursor_id=cursor_id,
+                limit_count=limit,
+            )
+        else:
+            rows = self._querier.search_job_logs_after_cursor(
+                job_id=to_uuid(job_id),
+                search_text=search_text,
+                log_level=log_level,  # type: ignore[arg-type]
+                start_time=start_time,  # type: ignore[arg-type]
+                end_time=end_time,  # type: ignore[arg-type]
+                cursor_created_at=cursor_created_at,
+                cursor_id=cursor_id,
+                limit_count=limit,
+            )
+        return [log async for log in rows]
 
     async def count_job_logs_filtered(
         self,
@@ -269,12 +369,12 @@ class CrawlLogRepository:
         start_time: datetime | None = None,
         end_time: datetime | None = None,
         search_text: str | None = None,
+        count_cap: int | None = None,
     ) -> int:
         """Count filtered logs for a job.
 
-        .. deprecated::
-            Use get_job_logs_filtered() instead, which returns both logs and count
-            in a single query using a window function for better performance.
+        Counting stops after count_cap matches, bounding the cost of counting a
+        broad search on a large job.
 
         Args:
             job_id: Job ID
@@ -282,18 +382,29 @@ class CrawlLogRepository:
             start_time: Optional start timestamp filter
             end_time: Optional end timestamp filter
             search_text: Optional text search in message (case-insensitive)
+            count_cap: Stop counting at this many logs (None counts them all)
 
         Returns:
-            Total count of logs matching the filters
+            Count of logs matching the filters, at most count_cap
 
         Note:
             SQL uses COALESCE and NULL checks, but sqlc generates non-optional types.
         """
-        count = await self._querier.count_job_logs_filtered(
-            job_id=to_uuid(job_id),
-            log_level=log_level,  # type: ignore[arg-type]
-            start_time=start_time,  # type: ignore[arg-type]
-            end_time=end_time,  # type: ignore[arg-type]
-            search_text=search_text,  # type: ignore[arg-type]
-        )
+        if search_text is None:
+            count = await self._querier.count_job_logs_filtered(
+                job_id=to_uuid(job_id),
+                log_level=log_level,  # type: ignore[arg-type]
+                start_time=start_time,  # type: ignore[arg-type]
+                end_time=end_time,  # type: ignore[arg-type]
+                count_cap=count_cap,  # type: ignore[arg-type]
+            )
+        else:
+            count = await self._querier.count_job_log_search(
+                job_id=to_uuid(job_id),
+                search_text=search_text,
+                log_level=log_level,  # type: ignore[arg-type]
+                start_time=start_time,  # type: ignore[arg-type]
+                end_time=end_time,  # type: ignore[arg-type]
+                count_cap=count_cap,  # type: ignore[arg-type]
+            )
         return count or 0
@@ -1,6 +1,7 @@
 """Crawled page repository using sqlc-generated queries."""
 
 import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -72,6 +73,55 @@ class CrawledPageRepository:
         )
         return await self._querier.create_crawled_page(params)
 
+    async def bulk_upsert(
+        self,
+        website_id: str | UUID,
+        job_id: str | UUID,
+        crawled_at: datetime,
+        urls: list[str],
+        url_hashes: list[str],
+        content_hashes: list[str],
+        titles: list[str | None],
+        extracted_contents: list[str | None],
+        gcs_html_paths: list[str | None] | None = None,
+        metadatas: list[str | None] | None = None,
+    ) -> dict[str, UUID]:
+        """Create or update many crawled pages in a single statement.
+
+        The lists are parallel: element i of each list describes the same page.
+        URL hashes must be unique within one call.
+
+        Args:
+            website_id: Website ID
+            job_id: Job ID
+            crawled_at: Timestamp when the pages were crawled
+            urls: Page URLs
+            url_hashes: URL hashes for deduplication
+            content_hashes: Content hashes for duplicate detection
+            titles: Page titles (None for pages without a title)
+            extracted_contents: Extracted content JSON strings
+            gcs_html_paths: Storage keys of the raw HTML (default: none stored)
+            metadatas: Page metadata JSON strings (default: no metadata)
+
+        Returns:
+            Mapping of URL hash to the ID of the inserted or updated page
+        """
+        page_ids: dict[str, UUID] = {}
+        async for row in self._querier.bulk_upsert_crawled_pages(
+            website_id=to_uuid(website_id),
+            job_id=to_uuid(job_id),
+            crawled_at=crawled_at,
+            urls=urls,
+            url_hashes=url_hashes,
+            content_hashes=content_hashes,
+            titles=titles,  # type: ignore[arg-type]
+            extracted_contents=extracted_contents,  # type: ignore[arg-type]
+            metadatas=metadatas or [None] * len(urls),  # type: ignore[arg-type]
+            gcs_html_paths=gcs_html_paths or [None] * len(urls),  # type: ignore[arg-type]
+        ):
+            page_ids[row.url_hash] = row.id
+        return page_ids
+
     async def get_by_id(self, page_id: str | UUID) -> models.CrawledPage | None:
         """Get page by ID."""
         return await self._querier.get_crawled_page_by_id(id=to_uuid(page_id))
@@ -84,6 +134,10 @@ class CrawledPageRepository:
             website_id=to_uuid(website_id), url_hash=url_hash
         )
 
+    async def get_stats(self, website_id: str | UUID) -> crawled_page.GetPageStatsRow | None:
+        """Get page and duplicate counts for a website from the statistics rollup."""
+        return await self._querier.get_page_stats(website_id=to_uuid(website_id))
+
     async def get_by_content_hash(self, content_hash: str) -> models.CrawledPage | None:
         """Get first page with matching content hash (for duplicate detection).
 
@@ -95,6 +149,61 @@ class CrawledPageRepository:
         """
         return await self._querier.get_page_by_content_hash(content_hash=content_hash)
 
+    async def get_first_by_content_hashes(self, content_hashes: list[str]) -> dict[str, UUID]:
+        """Get the first page ID for each content hash (batch duplicate detection).
+
+        Args:
+            content_hashes: SHA256 hashes of page content
+
+        Returns:
+            Mapping of content hash to the ID of its earliest page. Hashes without
+            any page are omitted.
+        """
+        page_ids: dict[str, UUID] = {}
+        async for row in self._querier.get_first_pages_by_content_hashes(
+            content_hashes=content_hashes
+        ):
+            page_ids[row.content_hash] = row.id
+        return page_ids
+
+    async def get_validators(
+        self, website_id: str | UUID, url_hashes: list[str]
+    ) -> list[crawled_page.GetPageValidatorsByURLHashesRow]:
+        """Get the stored validators of previously crawled URLs (conditional re-crawls).
+
+        Args:
+            website_id: Website ID
+            url_hashes: URL hashes to look up
+
+        Returns:
+            Content hash, ETag and Last-Modified per known URL hash. URL hashes
+            without a page are omitted.
+        """
+        results = []
+        async for row in self._querier.get_page_validators_by_url_hashes(
+            website_id=to_uuid(website_id), url_hashes=url_hashes
+        ):
+            results.append(row)
+        return results
+
+    async def list_ids_by_content_hashes(
+        self, content_hashes: list[str]
+    ) -> list[crawled_page.ListPageIdsByContentHashesRow]:
+        """List the IDs of all pages with any of the given content hashes.
+
+        Args:
+            content_hashes: SHA256 hashes of page content
+
+        Returns:
+            Page IDs with their content hash, earliest crawled first
+        """
+        results = []
+        async for row in self._querier.list_page_ids_by_content_hashes(
+            content_hashes=content_hashes
+        ):
+            results.append(row)
+        return results
+
     async def list_by_job(
         self, job_id: str | UUID, limit: int = 100, offset: int = 0
     ) -> list[models.CrawledPage]:
@@ -106,6 +215,100 @@ class CrawledPageRepository:
             pages.append(page)
         return pages
 
+    async def list_by_job_after(
+        self,
+        job_id: str | UUID,
+        cursor_created_at: datetime | None = None,
+        cursor_id: str | UUID | None = None,
+        limit: int = 100,
+    ) -> list[models.CrawledPage]:
+        """List pages for a job in (created_at, id) order using keyset pagination.
+
+        Args:
+            job_id: Job ID
+            cursor_created_at: created_at of the last page already read (None for the start)
+            cursor_id: ID of the last page already read
+            limit: Maximum number of pages to return
+
+        Returns:
+            Pages after the cursor, oldest first
+        """
+        return [
+            page
+            async for page in self._querier.list_pages_by_job_after_cursor(
+                job_id=to_uuid(job_id),
+                cursor_created_at=cursor_created_at,  # type: ignore[arg-type]
+                cursor_id=to_uuid_optional(cursor_id),  # type: ignore[arg-type]
+                limit_count=limit,
+            )
+        ]
+
+    async def list_by_website_after(
+        self,
+        website_id: str | UUID,
+        cursor_created_at: datetime | None = None,
+        cursor_id: str | UUID | None = None,
+        limit: int = 100,
+    ) -> list[models.CrawledPage]:
+        """List pages for a website in (created_at, id) order using keyset pagination.
+
+        Args:
+            website_id: Website ID
+            cursor_created_at: created_at of the last page already read (None for the start)
+            cursor_id: ID of the last page already read
+            limit: Maximum number of pages to return
+
+        Returns:
+            Pages after the cursor, oldest first
+        """
+        return [
+            page
+            async for page in self._querier.list_pages_by_website_after_cursor(
+                website_id=to_uuid(website_id),
+                cursor_created_at=cursor_created_at,  # type: ignore[arg-type]
+                cursor_id=to_uuid_optional(cursor_id),  # type: ignore[arg-type]
+                limit_count=limit,
+            )
+        ]
+
+    def stream_by_job(self, job_id: str | UUID) -> AsyncIterator[models.CrawledPage]:
+        """Stream every page of a job, oldest first, from a server-side cursor.
+
+        Rows are fetched as the iterator is consumed, so memory use does not grow
+        with the number of pages. The connection must stay open until iteration ends.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Async iterator of pages
+        """
+        return self._querier.list_pages_by_job_after_cursor(
+            job_id=to_uuid(job_id),
+            cursor_created_at=None,  # type: ignore[arg-type]
+            cursor_id=None,  # type: ignore[arg-type]
+            limit_count=None,  # type: ignore[arg-type]
+        )
+
+    def stream_by_website(self, website_id: str | UUID) -> AsyncIterator[models.CrawledPage]:
+        """Stream every page of a website, oldest first, from a server-side cursor.
+
+        Rows are fetched as the iterator is consumed, so memory use does not grow
+        with the number of pages. The connection must stay open until iteration ends.
+
+        Args:
+            website_id: Website ID
+
+        Returns:
+            Async iterator of pages
+        """
+        return self._querier.list_pages_by_website_after_cursor(
+            website_id=to_uuid(website_id),
+            cursor_created_at=None,  # type: ignore[arg-type]
+            cursor_id=None,  # type: ignore[arg-type]
+            limit_count=None,  # type: ignore[arg-type]
+        )
+
     async def mark_as_duplicate(
         self,
         page_id: str | UUID,
@@ -127,3 +330,22 @@ class CrawledPageRepository:
             duplicate_of=to_uuid_optional(duplicate_of),
             similarity_score=similarity_score,
         )
+
+    async def bulk_mark_as_duplicate(
+        self,
+        page_ids: list[UUID],
+        duplicate_of_ids: list[UUID],
+        similarity_scores: list[int],
+    ) -> None:
+        """Mark many pages as duplicates in a single statement.
+
+        Args:
+            page_ids: IDs of the duplicate pages
+            duplicate_of_ids: ID of the original page for each duplicate
+            similarity_scores: Similarity score for each duplicate
+        """
+        await self._querier.bulk_mark_pages_as_duplicate(
+            page_ids=page_ids,
+            duplicate_of_ids=duplicate_of_ids,
+            similarity_scores=similarity_scores,
+        )
@@ -139,6 +139,41 @@ class DeadLetterQueueRepository:
             entries.append(entry)
         return entries
 
+    async def list_entries_after(
+        self,
+        cursor_added_at: datetime,
+        cursor_id: int,
+        error_category: models.ErrorCategoryEnum | None = None,
+        website_id: str | None = None,
+        unresolved_only: bool | None = None,
+        limit: int = 100,
+    ) -> list[models.DeadLetterQueue]:
+        """List DLQ entries older than a cursor using keyset pagination.
+
+        Args:
+            cursor_added_at: added_to_dlq_at of the last entry already read
+            cursor_id: ID of the last entry already read
+            error_category: Optional filter by error category
+            website_id: Optional filter by website
+            unresolved_only: Optional filter by resolved status
+                (True=unresolved, False=resolved, None=all)
+            limit: Maximum number of entries to return
+
+        Returns:
+            DLQ entries after the cursor, newest first
+        """
+        return [
+            entry
+            async for entry in self.querier.list_dlq_entries_after_cursor(
+                dollar_1=error_category,  # type: ignore[arg-type]
+                dollar_2=to_uuid(website_id) if website_id else None,  # type: ignore[arg-type]
+                dollar_3=unresolved_only,  # type: ignore[arg-type]
+                dollar_4=cursor_added_at,
+                dollar_5=cursor_id,
+                limit=limit,
+            )
+        ]
+
     async def count_entries(
         self,
         error_category: models.ErrorCategoryEnum | None = None,
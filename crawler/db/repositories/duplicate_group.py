@@ -1,5 +1,8 @@
 """Repository for duplicate group operations."""
 
+from datetime import datetime
+from uuid import UUID
+
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from crawler.db.generated import duplicate_group as queries
@@ -47,6 +50,22 @@ class DuplicateGroupRepository:
         assert result is not None, "create_duplicate_group should never return None"
         return result
 
+    async def get_or_create_groups(self, canonical_page_ids: list[UUID]) -> dict[UUID, UUID]:
+        """Get the group of each canonical page, creating the missing groups.
+
+        Args:
+            canonical_page_ids: UUIDs of canonical pages
+
+        Returns:
+            Mapping of canonical page ID to group ID
+        """
+        groups: dict[UUID, UUID] = {}
+        async for row in self._querier.bulk_get_or_create_duplicate_groups(
+            canonical_page_ids=canonical_page_ids
+        ):
+            groups[row.canonical_page_id] = row.id
+        return groups
+
     async def get_group(self, group_id: str) -> DuplicateGroup | None:
         """Get a duplicate group by ID.
 
@@ -124,6 +143,57 @@ class DuplicateGroupRepository:
         assert result is not None, "add_duplicate_relationship should never return None"
         return result
 
+    async def add_duplicates_bulk(
+        self,
+        group_ids: list[UUID],
+        duplicate_page_ids: list[UUID],
+        detection_methods: list[str],
+        similarity_scores: list[int | None],
+        confidence_thresholds: list[int | None],
+        detected_by: str | None = None,
+    ) -> None:
+        """Add many pages as duplicates in a single statement.
+
+        The lists are parallel. Pages that already belong to a group are skipped,
+        so manual assignments win over detected ones.
+
+        Args:
+            group_ids: UUID of the group of each page
+            duplicate_page_ids: UUIDs of the duplicate pages
+            detection_methods: Method used for each page (see add_duplicate)
+            similarity_scores: Similarity percentage (0-100) for each page
+            confidence_thresholds: Threshold used for each page
+            detected_by: Identifier of the detector
+
+        Raises:
+            ValueError: If a detection_method is invalid
+        """
+        valid_methods = {"exact_hash", "fuzzy_match", "url_match", "manual"}
+        invalid = set(detection_methods) - valid_methods
+        if invalid:
+            raise ValueError(
+                f"Invalid detection_method '{sorted(invalid)[0]}'. "
+                f"Must be one of: {', '.join(sorted(valid_methods))}"
+            )
+
+        await self._querier.bulk_add_duplicate_relationships(
+            detected_by=detected_by,
+            group_ids=group_ids,
+            duplicate_page_ids=duplicate_page_ids,
+            detection_methods=detection_methods,
+            similarity_scores=similarity_scores,  # type: ignore[arg-type]
+            confidence_thresholds=confidence_thresholds,  # type: ignore[arg-type]
+        )
+
+    async def remove_detected_groups(self) -> None:
+        """Remove hash and fingerprint detected duplicates before a rebuild.
+
+        Deletes 'exact_hash' and 'fuzzy_match' relationships, then every group
+        left empty. Manual and URL matches and their groups are kept.
+        """
+        await self._querier.delete_detected_duplicate_relationships()
+        await self._querier.delete_empty_duplicate_groups()
+
     async def get_relationship(self, relationship_id: int) -> DuplicateRelationship | None:
         """Get a specific duplicate relationship.
 
@@ -202,6 +272,26 @@ class DuplicateGroupRepository:
             results.append(row)
         return results
 
+    async def list_groups_after(
+        self, cursor_created_at: datetime, cursor_id: str | UUID, limit: int = 50
+    ) -> list[DuplicateGroup]:
+        """List duplicate groups older than a cursor using keyset pagination.
+
+        Args:
+            cursor_created_at: created_at of the last group already read
+            cursor_id: ID of the last group already read
+            limit: Maximum number of groups to return
+
+        Returns:
+            Groups after the cursor, newest first
+        """
+        return [
+            row
+            async for row in self._querier.list_duplicate_groups_after_cursor(
+                cursor_created_at=cursor_created_at, cursor_id=to_uuid(cursor_id), limit_count=limit
+            )
+        ]
+
     async def get_group_stats(self, group_id: str) -> GetDuplicateGroupStatsRow | None:
         """Get statistics for a duplicate group.
 
@@ -213,6 +303,13 @@ class DuplicateGroupRepository:
         """
         return await self._querier.get_duplicate_group_stats(id=to_uuid(group_id))
 
+    async def rebuild_group_stats(self) -> None:
+        """Recompute the per-group statistics from duplicate relationships.
+
+        Statistics are kept current by a database trigger; this repairs or backfills them.
+        """
+        await self._querier.rebuild_duplicate_group_stats()
+
     async def remove_relationship(self, relationship_id: int) -> None:
         """Remove a duplicate relationship.
 
@@ -0,0 +1,125 @@
+"""Job checkpoint repository using sqlc-generated queries."""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from crawler.db.generated import job_checkpoint, models
+from crawler.utils.url import hash_url
+
+from .base import to_uuid
+
+
+def _decode_json(value: Any) -> Any:
+    """Decode a JSONB column the driver returned as text."""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+class JobCheckpointRepository:
+    """Repository for the durable progress of job workflows.
+
+    Step checkpoints hold the output of completed steps. Page checkpoints hold the
+    pages a scrape step already scraped. Both are keyed by a hash of the step
+    configuration, so progress made with an older configuration is not reused.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        """Initialize repository.
+
+        Args:
+            connection: SQLAlchemy async connection.
+        """
+        self.conn = connection
+        self._querier = job_checkpoint.AsyncQuerier(connection)
+
+    async def save_step(
+        self, job_id: str | UUID, step_name: str, config_hash: str, result: dict[str, Any]
+    ) -> None:
+        """Record the output of a completed step, replacing an earlier one.
+
+        Args:
+            job_id: Job ID
+            step_name: Step name
+            config_hash: Hash of the step configuration
+            result: JSON-serializable step output (values that are not are stringified)
+        """
+        await self._querier.upsert_job_step_checkpoint(
+            job_id=to_uuid(job_id),
+            step_name=step_name,
+            config_hash=config_hash,
+            result=json.dumps(result, default=str),
+        )
+
+    async def list_steps(self, job_id: str | UUID) -> list[models.JobStepCheckpoint]:
+        """List the step checkpoints of a job, oldest first.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Step checkpoints with decoded results
+        """
+        checkpoints = []
+        async for checkpoint in self._querier.list_job_step_checkpoints(job_id=to_uuid(job_id)):
+            checkpoint.result = _decode_json(checkpoint.result)
+            checkpoints.append(checkpoint)
+        return checkpoints
+
+    async def save_pages(
+        self,
+        job_id: str | UUID,
+        step_name: str,
+        config_hash: str,
+        pages: list[dict[str, Any]],
+    ) -> None:
+        """Record a batch of scraped pages of a step in a single statement.
+
+        Args:
+            job_id: Job ID
+            step_name: Step name
+            config_hash: Hash of the step configuration
+            pages: Page records with a _url field. A URL given twice keeps its last page.
+        """
+        by_hash = {hash_url(page["_url"], normalize=False): page for page in pages}
+        if not by_hash:
+            return
+
+        await self._querier.bulk_upsert_job_page_checkpoints(
+            job_id=to_uuid(job_id),
+            step_name=step_name,
+            config_hash=config_hash,
+            url_hashes=list(by_hash),
+            urls=[page["_url"] for page in by_hash.values()],
+            pages=[json.dumps(page, default=str) for page in by_hash.values()],
+        )
+
+    async def stream_pages(
+        self, job_id: str | UUID, step_name: str, config_hash: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the pages a step scraped with the given configuration.
+
+        Must be consumed inside a transaction (server-side cursor).
+
+        Args:
+            job_id: Job ID
+            step_name: Step name
+            config_hash: Hash of the step configuration
+
+        Yields:
+            Page records
+        """
+        async for row in self._querier.stream_job_page_checkpoints(
+            job_id=to_uuid(job_id), step_name=step_name, config_hash=config_hash
+        ):
+            yield _decode_json(row.page)
+
+    async def delete(self, job_id: str | UUID) -> None:
+        """Delete all step and page checkpoints of a job.
+
+        Args:
+            job_id: Job ID
+        """
+        await self._querier.delete_job_checkpoints(job_id=to_uuid(job_id))
@@ -0,0 +1,55 @@
+"""Repository for website statistics rollups."""
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from crawler.db.generated import website_stats as queries
+from crawler.db.generated.website_stats import FoldWebsiteStatsDeltasRow
+
+
+class WebsiteStatsRepository:
+    """Repository for the website_stats rollup and its pending deltas.
+
+    Triggers on crawl_job and crawled_page append changes to website_stats_delta.
+    Statistics queries add pending deltas to the folded counters, so folding only
+    keeps the delta table small and never changes what readers see.
+    """
+
+    def __init__(self, conn: AsyncConnection):
+        """Initialize repository with database connection.
+
+        Args:
+            conn: SQLAlchemy async connection
+        """
+        self.conn = conn
+        self._querier = queries.AsyncQuerier(conn)
+
+    async def fold_deltas(self, batch_size: int) -> FoldWebsiteStatsDeltasRow:
+        """Fold the oldest pending deltas into website_stats.
+
+        Args:
+            batch_size: Maximum number of deltas to fold
+
+        Returns:
+            Number of deltas folded and websites updated
+        """
+        result = await self._querier.fold_website_stats_deltas(batch_size=batch_size)
+        if result is None:
+            return FoldWebsiteStatsDeltasRow(deltas_folded=0, websites_updated=0)
+        return result
+
+    async def count_pending_deltas(self) -> int:
+        """Count deltas waiting to be folded.
+
+        Returns:
+            Number of pending deltas
+        """
+        result = await self._querier.count_website_stats_deltas()
+        return result or 0
+
+    async def rebuild(self) -> None:
+        """Recompute website_stats from crawl jobs and crawled pages.
+
+        Pending deltas are discarded in the same statement, as the recomputed
+        counters already include them.
+        """
+        await self._querier.rebuild_website_stats()
@@ -7,13 +7,22 @@ Supports configurable pool size, context management, health checks, and graceful
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncIterator, Collection
 from contextlib import asynccontextmanager, suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Literal
-
-from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+from urllib.parse import urlparse
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Frame,
+    Page,
+    Playwright,
+    async_playwright,
+)
 
 from config import Settings
 from crawler.core.browser_config import (
@@ -24,15 +33,19 @@ from crawler.core.browser_config import (
 )
 from crawler.core.logging import get_logger
 from crawler.core.metrics import (
+    browser_context_acquire_seconds,
+    browser_contexts_recycled_total,
     browser_crash_recoveries_total,
     browser_crashes_total,
     browser_pool_contexts_available,
+    browser_pool_contexts_warm,
     browser_pool_healthy,
     browser_pool_queue_size,
     browser_pool_queue_wait_seconds,
     browser_pool_size,
     browser_sessions_active,
 )
+from crawler.services.resource_policy import StaticAssetCache
 
 logger = get_logger(__name__)
 
@@ -55,6 +68,23 @@ class BrowserCrashError(Exception):
         self.browser_type = browser_type
 
 
+def origin_of(url: str) -> str | None:
+    """Get the origin of a URL, as used to partition browser storage.
+
+    Args:
+        url: Frame URL
+
+    Returns:
+        Origin such as "https://example.com:8443", or None for URLs without
+        web storage (about:blank, data:, ...)
+    """
+    parts = urlparse(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return None
+    port = f":{parts.port}" if parts.port else ""
+    return f"{parts.scheme}://{parts.hostname}{port}"
+
+
 @dataclass
 class ContextMetadata:
     """Metadata for tracking browser context usage."""
@@ -62,6 +92,12 @@ class ContextMetadata:
     context: BrowserContext
     created_at: datetime
     last_used_at: datetime
+    use_count: int = 0
+    generation: int = 0  # Pool recycle generation the context was created in
+    # Origins whose documents were loaded in the context since its last reset
+    origins: set[str] = field(default_factory=set)
+    closed: bool = False  # The context was closed (or its browser disconnected)
+    crashed: bool = False  # A page of the context crashed
 
 
 @dataclass
@@ -79,11 +115,15 @@ class BrowserInstance:
     last_recovery_attempt: datetime | None = None
     crash_timestamp: datetime | None = None  # Track when browser first crashed
     context_metadata: dict[str, ContextMetadata] = None  # type: ignore[assignment]  # Map context id -> metadata
+    # Reset contexts kept open for reuse (warm), most recently released last
+    idle_contexts: list[ContextMetadata] = None  # type: ignore[assignment]
 
     def __post_init__(self) -> None:
-        """Initialize context metadata dict if not provided."""
+        """Initialize context metadata dict and idle context list if not provided."""
         if self.context_metadata is None:
             self.context_metadata = {}  # Always initialize in __post_init__
+        if self.idle_contexts is None:
+            self.idle_contexts = []
 
     def can_create_context(self) -> bool:
         """Check if browser can create a new context.
@@ -120,6 +160,9 @@ class BrowserPool:
     Features:
     - Configurable pool size (number of browser instances)
     - Context management (multiple contexts per browser)
+    - Warm context reuse: released contexts are reset and kept open for the next
+      acquisition, and recycled after a number of uses or under memory pressure
+    - Least-loaded placement of new contexts across browsers
     - Health checks for browser instances
     - Graceful shutdown with resource cleanup
     - Prometheus metrics integration
@@ -147,6 +190,12 @@ class BrowserPool:
         self.default_browser_type = settings.browser_default_type
         self.max_recovery_attempts = settings.browser_max_recovery_attempts
         self.recovery_backoff_base = settings.browser_recovery_backoff_base
+        self.warm_contexts_per_browser = min(
+            settings.browser_warm_contexts_per_browser, self.max_contexts_per_browser
+        )
+        self.context_max_uses = settings.browser_context_max_uses
+        # Static responses shared by every context (see ResourcePolicy.cache_static)
+        self.static_asset_cache = StaticAssetCache(settings.browser_static_cache_max_bytes)
 
         # Pool state
         self._playwright: Playwright | None = None
@@ -156,6 +205,8 @@ class BrowserPool:
         self._initialized = False
         self._shutting_down = False
         self._health_check_task: asyncio.Task[None] | None = None
+        # Bumped to retire every context created before it (see close_idle_contexts)
+        self._context_generation = 0
 
     async def initialize(self) -> None:
         """Initialize the browser pool by launching browser instances.
@@ -198,6 +249,10 @@ class BrowserPool:
                     browser_type=self.default_browser_type,
                 )
 
+            # Pre-create contexts so the first acquisitions skip context setup
+            for instance in self._browsers:
+                await self._warm_browser(instance)
+
             # Start health check background task
             self._health_check_task = asyncio.create_task(self._health_check_loop())
 
@@ -208,6 +263,7 @@ class BrowserPool:
             browser_pool_healthy.set(len(self._browsers))
             # Use actual browser count for consistency
             browser_pool_contexts_available.set(len(self._browsers) * self.max_contexts_per_browser)
+            browser_pool_contexts_warm.set(sum(len(b.idle_contexts) for b in self._browsers))
 
             logger.info("browser_pool_initialized", total_browsers=len(self._browsers))
 
@@ -264,6 +320,113 @@ class BrowserPool:
             logger.error("browser_launch_error", browser_type=browser_type, error=str(e))
             raise RuntimeError(f"Failed to launch {browser_type} browser: {e}") from e
 
+    async def _new_context(self, browser_instance: BrowserInstance) -> ContextMetadata:
+        """Create a stealth-configured context on a browser.
+
+        Args:
+            browser_instance: Browser to create the context on.
+
+        Returns:
+            Metadata of the new context, tracking the origins it visits and
+            whether it closes or crashes.
+        """
+        context = await browser_instance.browser.new_context(
+            user_agent=STEALTH_USER_AGENT,
+            viewport=STEALTH_VIEWPORT,
+        )
+        now = datetime.now(UTC)
+        metadata = ContextMetadata(
+            context=context,
+            created_at=now,
+            last_used_at=now,
+            generation=self._context_generation,
+        )
+        self._watch_context(metadata)
+        return metadata
+
+    def _watch_context(self, metadata: ContextMetadata) -> None:
+        """Follow a context's events to keep its metadata current.
+
+        Every page of the context reports the origins its frames navigate to, so
+        their storage can be cleared before the context is reused.
+
+        Args:
+            metadata: Metadata of a new context.
+        """
+
+        def on_frame_navigated(frame: Frame) -> None:
+            origin = origin_of(frame.url)
+            if origin:
+                metadata.origins.add(origin)
+
+        def on_crash(_page: Page) -> None:
+            metadata.crashed = True
+
+        def on_page(page: Page) -> None:
+            page.on("framenavigated", on_frame_navigated)
+            page.on("crash", on_crash)
+
+        def on_close(_context: BrowserContext) -> None:
+            metadata.closed = True
+
+        metadata.context.on("page", on_page)
+        metadata.context.on("close", on_close)
+
+    async def _warm_browser(self, browser_instance: BrowserInstance) -> None:
+        """Fill a browser's idle contexts up to warm_contexts_per_browser.
+
+        Warming is best effort: a failure leaves the browser with fewer warm
+        contexts, and acquisitions create contexts on demand instead.
+
+        Args:
+            browser_instance: Browser to warm.
+        """
+        while len(browser_instance.idle_contexts) < self.warm_contexts_per_browser:
+            try:
+                metadata = await self._new_context(browser_instance)
+            except Exception as e:
+                logger.warning("context_warm_error", error=str(e))
+                return
+
+            browser_instance.idle_contexts.append(metadata)
+
+    def _recycle_reason(
+        self,
+        browser_instance: BrowserInstance,
+        metadata: ContextMetadata,
+        released_cleanly: bool,
+        reset: bool = True,
+    ) -> str | None:
+        """Decide whether a released context must be closed instead of reused.
+
+        Args:
+            browser_instance: Browser the context belongs to.
+            metadata: Metadata of the released context.
+            released_cleanly: False if the context's user raised or was cancelled.
+            reset: False if the context's state could not be fully reset
+                (see _cleanup_context).
+
+        Returns:
+            Reason label for the recycle metric, or None if the context can be reused.
+        """
+        if not released_cleanly:
+            return "error"
+        if metadata.closed:
+            return "closed"
+        if metadata.crashed:
+            return "crashed"
+        if not reset:
+            return "reset_failed"
+        if self._shutting_down or not browser_instance.is_healthy:
+            return "browser_unavailable"
+        if browser_instance not in self._browsers:
+            return "browser_unavailable"
+        if metadata.generation < self._context_generation:
+            return "memory_pressure"
+        if metadata.use_count >= self.context_max_uses:
+            return "max_uses"
+        return None
+
     async def _remove_and_replace_browser(self, crashed_instance: BrowserInstance) -> None:
         """Remove a crashed browser and replace it with a new one.
 
@@ -474,6 +637,11 @@ class BrowserPool:
         """Acquire a browser context from the pool.
 
         This is a context manager that automatically releases the context when done.
+        The least-loaded browser serves the request, reusing one of its warm contexts
+        when it has one. On release the context is reset (cookies, storage of every
+        origin it visited, pages, permissions, routes) and kept for reuse until it
+        reaches context_max_uses. A context that could not be fully reset, or that
+        closed or crashed, is closed instead.
 
         Args:
             timeout: Optional timeout in seconds for acquiring a context.
@@ -502,8 +670,10 @@ class BrowserPool:
         timeout = timeout or self.context_timeout
         browser_instance: BrowserInstance | None = None
         context: BrowserContext | None = None
+        metadata: ContextMetadata | None = None
         semaphore_acquired = False
         context_created = False  # Track if context was successfully created
+        released_cleanly = False  # Set once the caller's block exits without error
         queue_start_time = datetime.now(UTC)
 
         try:
@@ -546,6 +716,8 @@ class BrowserPool:
                 logger.error("context_acquire_timeout", timeout=timeout)
                 raise TimeoutError(f"Failed to acquire browser context within {timeout}s") from None
 
+            acquire_start = time.perf_counter()
+
             # Get a browser instance with capacity
             browser_instance = await self._get_available_browser()
 
@@ -553,60 +725,73 @@ class BrowserPool:
             if browser_instance is None:
                 raise RuntimeError("No healthy browser instances available")
 
-            # Create context with stealth - handle potential browser crash during creation
-            try:
-                context = await browser_instance.browser.new_context(
-                    user_agent=STEALTH_USER_AGENT,
-                    viewport=STEALTH_VIEWPORT,
-                )
-            except Exception as e:
-                # Check if this is a browser crash
-                # First check browser connection status (most reliable)
-                is_crash = False
+            # Take a warm context if the browser has one
+            async with self._lock:
+                if browser_instance.idle_contexts:
+                    metadata = browser_instance.idle_contexts.pop()
+                    context = metadata.context
+
+            if context is None:
+                # Create context with stealth - handle potential browser crash during creation
                 try:
-                    if not browser_instance.browser.is_connected():
-                        is_crash = True
-                except Exception:
-                    pass  # If we can't check, fall back to keyword matching
-
-                # Fall back to keyword matching if connection check didn't detect crash
-                if not is_crash:
-                    error_msg = str(e).lower()
-                    crash_keywords = [
-                        "connection",
-                        "closed",
-                        "disconnected",
-                        "target closed",
-                        "browser closed",
-                    ]
-                    is_crash = any(keyword in error_msg for keyword in crash_keywords)
-
-                if is_crash:
-                    browser_idx = (
-                        self._browsers.index(browser_instance)
-                        if browser_instance in self._browsers
-                        else None
-                    )
-                    logger.error(
-                        "browser_crash_during_context_creation",
-                        browser_index=browser_idx,
-                        error=str(e),
-                    )
+                    metadata = await self._new_context(browser_instance)
+                    context = metadata.context
+                except Exception as e:
+                    # Check if this is a browser crash
+                    # First check browser connection status (most reliable)
+                    is_crash = False
+                    try:
+                        if not browser_instance.browser.is_connected():
+                            is_crash = True
+                    except Exception:
+                        pass  # If we can't check, fall back to keyword matching
+
+                    # Fall back to keyword matching if connection check didn't detect crash
+                    if not is_crash:
+                        error_msg = str(e).lower()
+                        crash_keywords = [
+                            "connection",
+                            "closed",
+                            "disconnected",
+                            "target closed",
+                            "browser closed",
+                        ]
+                        is_crash = any(keyword in error_msg for keyword in crash_keywords)
+
+                    if is_crash:
+                        browser_idx = (
+                            self._browsers.index(browser_instance)
+                            if browser_instance in self._browsers
+                            else None
+                        )
+                        logger.error(
+                            "browser_crash_during_context_creation",
+                            browser_index=browser_idx,
+                            error=str(e),
+                        )
 
-                    # Mark browser as unhealthy and attempt recovery
-                    async with self._lock:
-                        browser_instance.is_healthy = False
-                        with suppress(BrowserCrashError):
-                            await self._remove_and_replace_browser(browser_instance)
+                        # Mark browser as unhealthy and attempt recovery
+                        async with self._lock:
+                            browser_instance.is_healthy = False
+                            with suppress(BrowserCrashError):
+                                await self._remove_and_replace_browser(browser_instance)
+
+                        # Re-raise as BrowserCrashError
+                        raise BrowserCrashError(
+                            "Browser crashed during context creation",
+                            browser_type=browser_instance.browser_type,
+                        ) from e
+                    else:
+                        # Not a crash, just a transient error
+                        raise
+
+                source = "created"
+            else:
+                source = "reused"
 
-                    # Re-raise as BrowserCrashError
-                    raise BrowserCrashError(
-                        "Browser crashed during context creation",
-                        browser_type=browser_instance.browser_type,
-                    ) from e
-                else:
-                    # Not a crash, just a transient error
-                    raise
+            browser_context_acquire_seconds.labels(source=source).observe(
+                time.perf_counter() - acquire_start
+            )
 
             # Mark context as successfully created and update metrics
             # IMPORTANT: Only update counters AFTER context creation succeeds
@@ -615,44 +800,59 @@ class BrowserPool:
                 context_created = True  # Set flag only after increment succeeds
 
                 # Track context metadata for idle detection
-                now = datetime.now(UTC)
+                # Type narrowing: warm and new contexts both come with metadata
+                assert metadata is not None
+                metadata.use_count += 1
+                metadata.last_used_at = datetime.now(UTC)
                 context_id = str(id(context))  # Use object id as unique identifier (as string)
-                browser_instance.context_metadata[context_id] = ContextMetadata(
-                    context=context,
-                    created_at=now,
-                    last_used_at=now,
-                )
+                browser_instance.context_metadata[context_id] = metadata
 
-                total_contexts = sum(b.active_contexts for b in self._browsers)
-                browser_sessions_active.set(total_contexts)
-                # Use actual browser count, not initial pool_size
-                current_capacity = len(self._browsers) * self.max_contexts_per_browser
-                # Clamp to non-negative (can temporarily go negative under degradation)
-                available_contexts = max(0, current_capacity - total_contexts)
-                browser_pool_contexts_available.set(available_contexts)
+                self._update_context_metrics()
 
             logger.debug(
                 "context_acquired",
                 browser_index=self._browsers.index(browser_instance),
                 active_contexts=browser_instance.active_contexts,
+                source=source,
+                use_count=metadata.use_count,
             )
 
             yield context
+            released_cleanly = True
 
         except Exception as e:
             logger.error("context_acquire_error", error=str(e))
             raise
         finally:
-            # Clean and release context (only if it was created)
+            # Reset the context, then keep it warm or close it (only if it was created)
+            reuse = False
             if context is not None:
-                # Clean context state before closing
-                await self._cleanup_context(context)
+                # Clean context state before reuse or closing
+                reset = await self._cleanup_context(
+                    context,
+                    origins=metadata.origins if metadata is not None else (),
+                    browser_type=(
+                        browser_instance.browser_type
+                        if browser_instance is not None
+                        else self.default_browser_type
+                    ),
+                )
 
-                # Close the context
-                try:
-                    await context.close()
-                except Exception as e:
-                    logger.debug("context_close_error", error=str(e))
+                recycle_reason = (
+                    self._recycle_reason(browser_instance, metadata, released_cleanly, reset)
+                    if browser_instance is not None and metadata is not None and context_created
+                    else "error"
+                )
+                reuse = recycle_reason is None
+                if reuse and metadata is not None:
+                    metadata.origins.clear()
+
+                if not reuse:
+                    browser_contexts_recycled_total.labels(reason=recycle_reason).inc()
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.debug("context_close_error", error=str(e))
 
             # Update metrics - ONLY decrement if we successfully incremented
             if context_created and browser_instance is not None:
@@ -664,13 +864,10 @@ class BrowserPool:
                         context_id = str(id(context))
                         browser_instance.context_metadata.pop(context_id, None)
 
-                    total_contexts = sum(b.active_contexts for b in self._browsers)
-                    browser_sessions_active.set(total_contexts)
-                    # Use actual browser count, not initial pool_size
-                    # Clamp to non-negative (can temporarily go negative under degradation)
-                    current_capacity = len(self._browsers) * self.max_contexts_per_browser
-                    available_contexts = max(0, current_capacity - total_contexts)
-                    browser_pool_contexts_available.set(available_contexts)
+                    if reuse and metadata is not None:
+                        browser_instance.idle_contexts.append(metadata)
+
+                    self._update_context_metrics()
 
             # Release semaphore only if it was acquired
             if semaphore_acquired:
@@ -687,30 +884,69 @@ class BrowserPool:
             logger.debug(
                 "context_released",
                 browser_index=browser_index,
+                reused=reuse,
             )
 
-    async def _cleanup_context(self, context: BrowserContext) -> None:
+    def _update_context_metrics(self) -> None:
+        """Update active, available and warm context gauges.
+
+        Note:
+            This method should be called while holding the _lock.
+        """
+        total_contexts = sum(b.active_contexts for b in self._browsers)
+        browser_sessions_active.set(total_contexts)
+        # Use actual browser count, not initial pool_size
+        current_capacity = len(self._browsers) * self.max_contexts_per_browser
+        # Clamp to non-negative (can temporarily go negative under degradation)
+        available_contexts = max(0, current_capacity - total_contexts)
+        browser_pool_contexts_available.set(available_contexts)
+        browser_pool_contexts_warm.set(sum(len(b.idle_contexts) for b in self._browsers))
+
+    async def _cleanup_context(
+        self,
+        context: BrowserContext,
+        origins: Collection[str] = (),
+        browser_type: BrowserType = "chromium",
+    ) -> bool:
         """Clean context state before returning to pool or closing.
 
-        Clears cookies, storage, and closes all pages except about:blank to ensure
-        clean state for next use or proper disposal.
+        Clears cookies, granted permissions and request routes, closes all pages
+        and leaves a single about:blank page, then clears all storage of the
+        origins the context visited (see _clear_origin_storage). Pages are usually
+        closed by their user before release, so storage cannot be cleared from
+        the pages themselves.
 
         Args:
             context: Browser context to clean
+            origins: Origins whose documents were loaded in the context
+            browser_type: Type of the browser the context belongs to
+
+        Returns:
+            True if the context was fully reset and may be reused
 
         Note:
             All cleanup operations are wrapped in try/except to ensure partial
             failures don't prevent the context from being closed.
         """
+        reset = True
         try:
             # Clear cookies
             try:
                 await context.clear_cookies()
                 logger.debug("context_cookies_cleared")
             except Exception as e:
+                reset = False
                 logger.debug("context_clear_cookies_error", error=str(e))
 
-            # Clear storage (localStorage, sessionStorage, etc.)
+            # Drop permissions and request routes a previous user added
+            try:
+                await context.clear_permissions()
+                await context.unroute_all(behavior="ignoreErrors")
+            except Exception as e:
+                reset = False
+                logger.debug("context_clear_overrides_error", error=str(e))
+
+            # Clear storage of pages still open (localStorage, sessionStorage)
             try:
                 # Close all pages first
                 pages = context.pages
@@ -730,11 +966,13 @@ class BrowserPool:
                     try:
                         await page.close()
                     except Exception as e:
+                        reset = False
                         logger.debug("page_close_error_during_cleanup", error=str(e))
 
                 logger.debug("context_storage_cleared", pages_closed=len(pages))
 
             except Exception as e:
+                reset = False
                 logger.debug("context_clear_storage_error", error=str(e))
 
             # Create a clean about:blank page if context is still open
@@ -744,23 +982,75 @@ class BrowserPool:
                     await context.new_page()
                     logger.debug("context_reset_to_blank")
             except Exception as e:
+                reset = False
                 logger.debug("context_reset_error", error=str(e))
 
+            if reset:
+                reset = await self._clear_origin_storage(context, origins, browser_type)
+
         except Exception as e:
             # Catch-all for any unexpected errors during cleanup
+            reset = False
             logger.warning("context_cleanup_failed", error=str(e))
 
+        return reset
+
+    async def _clear_origin_storage(
+        self, context: BrowserContext, origins: Collection[str], browser_type: BrowserType
+    ) -> bool:
+        """Clear all storage of the origins a context visited.
+
+        Uses the DevTools protocol's Storage.clearDataForOrigin, which also clears
+        IndexedDB, service workers and CacheStorage. Only Chromium exposes the
+        protocol, so contexts of other browsers cannot be cleared once they have
+        loaded a page.
+
+        Args:
+            context: Browser context with at least one open page
+            origins: Origins whose documents were loaded in the context
+            browser_type: Type of the browser the context belongs to
+
+        Returns:
+            True if every origin was cleared
+        """
+        # Guard: nothing was stored
+        if not origins:
+            return True
+
+        # Guard: no way to reach the storage of closed pages
+        if browser_type != "chromium":
+            logger.debug("context_origin_storage_not_clearable", browser_type=browser_type)
+            return False
+
+        try:
+            session = await context.new_cdp_session(context.pages[0])
+            try:
+                for origin in origins:
+                    await session.send(
+                        "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+                    )
+            finally:
+                await session.detach()
+        except Exception as e:
+            logger.debug("context_clear_origin_storage_error", origins=len(origins), error=str(e))
+            return False
+
+        logger.debug("context_origin_storage_cleared", origins=len(origins))
+        return True
+
     async def _get_available_browser(self) -> BrowserInstance | None:
-        """Get a browser instance with available context capacity.
+        """Get the least-loaded browser instance with available context capacity.
+
+        Spreading contexts evenly keeps any one browser process from holding most
+        of the pages. Among equally loaded browsers, one with a warm context wins.
 
         Returns:
             BrowserInstance with capacity, or None if all are at capacity.
         """
         async with self._lock:
-            # Try to find a healthy browser with capacity
-            for browser_instance in self._browsers:
-                if browser_instance.can_create_context():
-                    return browser_instance
+            candidates = [b for b in self._browsers if b.can_create_context()]
+            if candidates:
+                return min(candidates, key=lambda b: (b.active_contexts, not b.idle_contexts))
 
             # No browsers with capacity
             logger.warning(
@@ -1021,8 +1311,9 @@ class BrowserPool:
                     continue
 
                 try:
-                    # Close old browser
+                    # Close old browser (its warm contexts close with it)
                     await browser_instance.browser.close()
+                    browser_instance.idle_contexts.clear()
 
                     # Launch new browser
                     new_browser = await self._launch_browser(browser_instance.browser_type)
@@ -1048,10 +1339,16 @@ class BrowserPool:
                     )
                     continue
 
+            if restarted_count > 0:
+                self._update_context_metrics()
+
         return restarted_count
 
     async def close_idle_contexts(self, min_idle_seconds: float) -> int:
-        """Close browser contexts that have been idle for specified duration.
+        """Close warm browser contexts that have been idle for specified duration.
+
+        Contexts in use when this runs have grown during the memory pressure that
+        triggers it, so they are closed on release instead of returning to the pool.
 
         Args:
             min_idle_seconds: Minimum idle time in seconds before closing context
@@ -1071,43 +1368,43 @@ class BrowserPool:
         now = datetime.now(UTC)
 
         async with self._lock:
+            self._context_generation += 1
+
             for browser_instance in self._browsers:
-                # Get list of idle contexts for this browser
+                # Split warm contexts into idle-long-enough and recently used
                 idle_contexts = [
-                    (context_id, metadata)
-                    for context_id, metadata in browser_instance.context_metadata.items()
+                    metadata
+                    for metadata in browser_instance.idle_contexts
                     if (now - metadata.last_used_at).total_seconds() >= min_idle_seconds
                 ]
+                browser_instance.idle_contexts = [
+                    metadata
+                    for metadata in browser_instance.idle_contexts
+                    if metadata not in idle_contexts
+                ]
 
                 # Close each idle context
-                for context_id, metadata in idle_contexts:
+                for metadata in idle_contexts:
+                    browser_contexts_recycled_total.labels(reason="memory_pressure").inc()
                     try:
                         await metadata.context.close()
-                        browser_instance.active_contexts -= 1
-                        browser_instance.context_metadata.pop(context_id)
                         closed_count += 1
 
                         logger.info(
                             "idle_context_closed",
-                            context_id=context_id,
                             idle_seconds=(now - metadata.last_used_at).total_seconds(),
+                            use_count=metadata.use_count,
                         )
 
                     except Exception as e:
                         logger.error(
                             "idle_context_close_failed",
-                            context_id=context_id,
                             error=str(e),
                         )
                         continue
 
             # Update metrics after closing contexts
-            if closed_count > 0:
-                total_contexts = sum(b.active_contexts for b in self._browsers)
-                browser_sessions_active.set(total_contexts)
-                current_capacity = len(self._browsers) * self.max_contexts_per_browser
-                available_contexts = max(0, current_capacity - total_contexts)
-                browser_pool_contexts_available.set(available_contexts)
+            self._update_context_metrics()
 
         return closed_count
 
@@ -1151,8 +1448,10 @@ class BrowserPool:
         browser_pool_size.set(0)
         browser_pool_healthy.set(0)
         browser_pool_contexts_available.set(0)
+        browser_pool_contexts_warm.set(0)
         browser_pool_queue_size.set(0)
 
+        self.static_asset_cache.clear()
         self._initialized = False
         self._shutting_down = False
 
@@ -1178,9 +1477,11 @@ class BrowserPool:
                 "pool_size": int,
                 "total_browsers": int,
                 "total_contexts": int,
+                "warm_contexts": int,
                 "max_contexts": int,
                 "initialized": bool,
                 "shutting_down": bool,
+                "static_cache": {"entries": int, "bytes_saved": int, ...},
             }
         """
         total_contexts = sum(b.active_contexts for b in self._browsers)
@@ -1191,7 +1492,9 @@ class BrowserPool:
             "pool_size": self.pool_size,  # Original configured size
             "total_browsers": len(self._browsers),  # Actual current browser count
             "total_contexts": total_contexts,
+            "warm_contexts": sum(len(b.idle_contexts) for b in self._browsers),
             "max_contexts": max_contexts,
             "initialized": self._initialized,
             "shutting_down": self._shutting_down,
+            "static_cache": self.static_asset_cache.get_stats(),
         }
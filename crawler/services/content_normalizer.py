@@ -4,20 +4,234 @@ This service extracts and normalizes main content from HTML pages, removing
 dynamic elements like timestamps, ads, navigation, and other boilerplate that
 would cause false hash mismatches for otherwise identical content.
 
+Pages are parsed with lxml and cleaned in a single traversal: boilerplate, ad
+containers and comments are skipped while the text is collected, and the main
+content candidates are located on the way. Output is identical to the earlier
+BeautifulSoup implementation; scripts/benchmark_content_normalizer.py checks
+this against a fixture corpus.
+
 The normalized content can then be hashed (e.g., with Simhash) for reliable
 duplicate detection and content similarity comparison.
 """
 
+from __future__ import annotations
+
 import re
+from dataclasses import dataclass, field
 from typing import ClassVar
 
-from bs4 import BeautifulSoup, Comment
-from bs4.element import Tag
+from lxml import etree
 
 from crawler.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Tags whose text BeautifulSoup's get_text() ignores (templates, ruby annotations)
+_HIDDEN_TEXT_TAGS = frozenset({"template", "rt", "rp"})
+
+# Tags kept as separate lines when preserving structure
+_PARAGRAPH_TAGS = frozenset({"p", "h1", "h2", "h3", "h4", "h5", "h6", "li"})
+
+# Main content containers in order of preference
+_MAIN_CONTENT_KINDS = ("main", "article", "div_class", "div_id", "body")
+
+# Class or ID of a div holding the main content
+_MAIN_CONTENT_PATTERN = re.compile(r"content|main|article|post|entry", re.IGNORECASE)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_LINE_WHITESPACE_PATTERN = re.compile(r"[ \t]+")
+
+
+@dataclass(slots=True)
+class _Span:
+    """Position of an element within the collected strings of a page.
+
+    Attributes:
+        order: Index of the element in document order (start tags seen before it)
+        start: Index of the element's first string
+        end: Index after the element's last string
+    """
+
+    order: int
+    start: int
+    end: int = 0
+
+    def contains(self, other: _Span) -> bool:
+        """Check if other is the span of a descendant element."""
+        return other.order > self.order and self.start <= other.start and other.end <= self.end
+
+
+@dataclass
+class _PageText:
+    """Text of a cleaned page and where candidate elements sit within it.
+
+    The text of an element is strings[span.start:span.end].
+
+    Attributes:
+        strings: Stripped, non-empty text strings in document order
+        containers: Span of the first main content candidate of each kind
+        paragraphs: Spans of paragraph, heading and list item elements in document order
+    """
+
+    strings: list[str] = field(default_factory=list)
+    containers: dict[str, _Span] = field(default_factory=dict)
+    paragraphs: list[_Span] = field(default_factory=list)
+
+
+class _TextCollector:
+    """lxml parser target that cleans a page while it is being parsed.
+
+    Receives the same parse events as BeautifulSoup's lxml builder and splits text
+    into the same strings (one per run of character data between two markup
+    events), so the collected text matches what get_text() returned after the old
+    clean-up passes. No tree is built: boilerplate and ad subtrees are skipped as
+    their start tags arrive, and comments only end the current string.
+    """
+
+    def __init__(self, boilerplate_tags: set[str], ad_pattern: re.Pattern[str]):
+        """Initialize collector.
+
+        Args:
+            boilerplate_tags: Tags dropped together with their content
+            ad_pattern: Pattern matching the class or ID of ad containers
+        """
+        self.boilerplate_tags = boilerplate_tags
+        self.ad_pattern = ad_pattern
+        self.page = _PageText()
+
+        # Open elements: (tag, spans to close on end tag)
+        self._stack: list[tuple[str, list[_Span]]] = []
+        self._order = 0
+        # Depth of the outermost open removed element, or None
+        self._removed_depth: int | None = None
+        # Number of open elements whose text is ignored
+        self._hidden_depth = 0
+        self._data: list[str] = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        """Handle a start tag."""
+        self._flush()
+
+        spans: list[_Span] = []
+        if self._removed_depth is None:
+            if tag in self.boilerplate_tags or self._is_ad(attrib):
+                self._removed_depth = len(self._stack)
+            else:
+                spans = self._open_spans(tag, attrib)
+
+        if tag in _HIDDEN_TEXT_TAGS:
+            self._hidden_depth += 1
+        self._stack.append((tag, spans))
+
+    def end(self, tag: str) -> None:
+        """Handle an end tag."""
+        self._flush()
+
+        # Guard: end tag without a matching start tag
+        if not self._stack:
+            return
+
+        tag, spans = self._stack.pop()
+        for span in spans:
+            span.end = len(self.page.strings)
+        if tag in _HIDDEN_TEXT_TAGS:
+            self._hidden_depth -= 1
+        if self._removed_depth == len(self._stack):
+            self._removed_depth = None
+
+    def data(self, data: str) -> None:
+        """Handle character data."""
+        self._data.append(data)
+
+    def comment(self, text: str) -> None:
+        """Handle a comment."""
+        self._flush()
+
+    def pi(self, target: str, data: str, /) -> None:
+        """Handle a processing instruction."""
+        self._flush()
+
+    def doctype(
+        self, root_tag: str | None, public_id: str | None, system_id: str | None, /
+    ) -> None:
+        """Handle a doctype declaration."""
+        self._flush()
+
+    def start_ns(self, prefix: str, uri: str, /) -> None:
+        """Handle a namespace declaration (the HTML parser sends none)."""
+
+    def end_ns(self, prefix: str, /) -> None:
+        """Handle the end of a namespace scope (the HTML parser sends none)."""
+
+    def close(self) -> _PageText:
+        """Finish parsing and return the collected text."""
+        self._flush()
+        return self.page
+
+    def _flush(self) -> None:
+        """End the current string and keep it if it is visible text."""
+        # Guard: no pending data
+        if not self._data:
+            return
+
+        text = "".join(self._data).strip()
+        self._data = []
+        if text and self._removed_depth is None and not self._hidden_depth:
+            self.page.strings.append(text)
+
+    def _is_ad(self, attrib: dict[str, str]) -> bool:
+        """Check if an element's class or ID matches an ad-related pattern."""
+        classes = attrib.get("class")
+        if classes and self.ad_pattern.search(classes):
+            return True
+
+        element_id = attrib.get("id")
+        return bool(element_id and self.ad_pattern.search(element_id))
+
+    def _open_spans(self, tag: str, attrib: dict[str, str]) -> list[_Span]:
+        """Open spans for a main content candidate or paragraph element.
+
+        Args:
+            tag: Element tag
+            attrib: Element attributes
+
+        Returns:
+            Spans to close on the element's end tag
+        """
+        order = self._order
+        self._order += 1
+        position = len(self.page.strings)
+        spans = []
+
+        kind = self._main_content_kind(tag, attrib)
+        if kind is not None and kind not in self.page.containers:
+            span = _Span(order, position)
+            self.page.containers[kind] = span
+            spans.append(span)
+
+        if tag in _PARAGRAPH_TAGS:
+            span = _Span(order, position)
+            self.page.paragraphs.append(span)
+            spans.append(span)
+
+        return spans
+
+    def _main_content_kind(self, tag: str, attrib: dict[str, str]) -> str | None:
+        """Classify an element as a main content candidate (see _MAIN_CONTENT_KINDS)."""
+        if tag in ("main", "article", "body"):
+            return tag
+        if tag != "div":
+            return None
+
+        classes = attrib.get("class")
+        if classes and _MAIN_CONTENT_PATTERN.search(classes):
+            return "div_class"
+
+        element_id = attrib.get("id")
+        if element_id and _MAIN_CONTENT_PATTERN.search(element_id):
+            return "div_id"
+        return None
+
 
 class ContentNormalizer:
     """Service for normalizing HTML content before hashing.
@@ -97,16 +311,18 @@ class ContentNormalizer:
     ]
 
     # Compiled regex patterns (done at class level for performance)
-    _compiled_ad_patterns: ClassVar[list[re.Pattern[str]]] = []
+    _compiled_ad_pattern: ClassVar[re.Pattern[str] | None] = None
     _compiled_timestamp_patterns: ClassVar[list[re.Pattern[str]]] = []
 
     def __init__(self) -> None:
         """Initialize content normalizer with compiled regex patterns."""
-        # Compile patterns once at initialization
-        if not ContentNormalizer._compiled_ad_patterns:
-            ContentNormalizer._compiled_ad_patterns = [
-                re.compile(pattern, re.IGNORECASE) for pattern in self.AD_PATTERNS
-            ]
+        # Compile patterns once; ad patterns are combined into one alternation so
+        # each class or ID is scanned once
+        if ContentNormalizer._compiled_ad_pattern is None:
+            ContentNormalizer._compiled_ad_pattern = re.compile(
+                "|".join(f"(?:{pattern})" for pattern in self.AD_PATTERNS), re.IGNORECASE
+            )
+        self._ad_pattern: re.Pattern[str] = ContentNormalizer._compiled_ad_pattern
 
         if not ContentNormalizer._compiled_timestamp_patterns:
             ContentNormalizer._compiled_timestamp_patterns = [
@@ -115,7 +331,7 @@ class ContentNormalizer:
 
         logger.debug(
             "content_normalizer_initialized",
-            ad_patterns=len(self._compiled_ad_patterns),
+            ad_patterns=len(self.AD_PATTERNS),
             timestamp_patterns=len(self._compiled_timestamp_patterns),
         )
 
@@ -150,21 +366,17 @@ class ContentNormalizer:
             raise ValueError("HTML content cannot be empty")
 
         try:
-            # Parse HTML
-            soup = self._parse_html(html)
-
-            # Remove unwanted elements
-            self._remove_boilerplate(soup)
-            self._remove_ads_and_tracking(soup)
-            self._remove_comments(soup)
+            # Parse HTML, dropping boilerplate, ads and comments in the same pass
+            page = self._parse_html(html)
 
             # Extract main content if requested
-            content: BeautifulSoup | Tag | None = soup
+            source = "full_document"
+            span = self._document_span(page)
             if extract_main_only:
-                content = self._extract_main_content(soup)
+                source, span = self._find_main_content(page)
 
             # Get text content
-            text = self._extract_text(content, preserve_structure)
+            text = self._extract_text(page, span, preserve_structure)
 
             # Remove dynamic elements from text
             if remove_timestamps:
@@ -177,6 +389,7 @@ class ContentNormalizer:
                 "content_normalized",
                 original_size=len(html),
                 normalized_size=len(text),
+                main_content=source,
             )
 
             return text
@@ -185,168 +398,91 @@ class ContentNormalizer:
             logger.error("content_normalization_error", error=str(e))
             raise ValueError(f"Failed to normalize content: {e}") from e
 
-    def _parse_html(self, html: str | bytes) -> BeautifulSoup:
-        """Parse HTML into BeautifulSoup object.
+    def _parse_html(self, html: str | bytes) -> _PageText:
+        """Parse HTML and collect the text of the cleaned page.
+
+        Uses the same lxml feed parser as BeautifulSoup's "lxml" builder.
 
         Args:
             html: HTML content as string or bytes
 
         Returns:
-            BeautifulSoup object
+            Collected text of the page
         """
         if isinstance(html, bytes):
             html = html.decode("utf-8", errors="replace")
 
-        return BeautifulSoup(html, "lxml")
+        # Guard: lxml cannot parse a leading byte order mark in a string
+        html = html.removeprefix("\N{BYTE ORDER MARK}")
 
-    def _remove_boilerplate(self, soup: BeautifulSoup) -> None:
-        """Remove boilerplate elements like navigation, headers, footers.
+        try:
+            return self._feed(html, encoding=None)
+        except (etree.ParserError, UnicodeDecodeError, LookupError):
+            # Some strings are rejected by lxml; parse them as UTF-8 bytes instead
+            return self._feed(html.encode("utf-8"), encoding="utf-8")
 
-        Modifies soup in-place.
+    def _feed(self, html: str | bytes, encoding: str | None) -> _PageText:
+        """Run the lxml HTML parser over a document with a text collector target.
 
         Args:
-            soup: BeautifulSoup object to clean
-        """
-        for tag_name in self.BOILERPLATE_TAGS:
-            for element in soup.find_all(tag_name):
-                element.decompose()
-
-        logger.debug("boilerplate_removed", tags=list(self.BOILERPLATE_TAGS))
-
-    def _remove_ads_and_tracking(self, soup: BeautifulSoup) -> None:
-        """Remove elements with ad-related classes or IDs.
+            html: HTML content
+            encoding: Encoding of bytes content
 
-        Modifies soup in-place.
-
-        Args:
-            soup: BeautifulSoup object to clean
+        Returns:
+            Collected text of the page
         """
-        # Collect elements to remove (don't modify while iterating)
-        elements_to_remove = []
-
-        for element in soup.find_all(True):  # Find all tags
-            # Guard: Skip if element has no attrs
-            if not hasattr(element, "attrs") or element.attrs is None:
-                continue
+        collector = _TextCollector(self.BOILERPLATE_TAGS, self._ad_pattern)
+        parser = etree.HTMLParser(target=collector, recover=True, encoding=encoding)
+        parser.feed(html)
+        # Closing the parser closes the target, which flushes the last string
+        parser.close()
+        return collector.page
 
-            # Check class attribute
-            if element.has_attr("class"):
-                classes = " ".join(element["class"])
-                if self._matches_ad_pattern(classes):
-                    elements_to_remove.append(element)
-                    continue
+    def _find_main_content(self, page: _PageText) -> tuple[str, _Span]:
+        """Find the main content area of a page.
 
-            # Check id attribute
-            if element.has_attr("id"):
-                element_id = element.get("id", "")
-                if isinstance(element_id, str) and self._matches_ad_pattern(element_id):
-                    elements_to_remove.append(element)
-
-        # Remove collected elements
-        for element in elements_to_remove:
-            element.decompose()
-
-        if elements_to_remove:
-            logger.debug("ads_removed", count=len(elements_to_remove))
-
-    def _matches_ad_pattern(self, text: str) -> bool:
-        """Check if text matches any ad-related pattern.
+        Prefers semantic HTML5 tags, then divs with a content-like class or ID.
+        Falls back to body or the full document if no main content is found.
 
         Args:
-            text: Text to check (class name or ID)
+            page: Collected text of the page
 
         Returns:
-            True if text matches ad pattern
-        """
-        return any(pattern.search(text) for pattern in self._compiled_ad_patterns)
-
-    def _remove_comments(self, soup: BeautifulSoup) -> None:
-        """Remove HTML comments.
-
-        Modifies soup in-place.
-
-        Args:
-            soup: BeautifulSoup object to clean
+            Tuple of (candidate kind, span of its text)
         """
-        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-        for comment in comments:
-            comment.extract()
+        for kind in _MAIN_CONTENT_KINDS:
+            span = page.containers.get(kind)
+            if span is not None:
+                return kind, span
 
-        if comments:
-            logger.debug("comments_removed", count=len(comments))
+        return "full_document", self._document_span(page)
 
-    def _extract_main_content(self, soup: BeautifulSoup) -> BeautifulSoup | Tag | None:
-        """Extract main content area from page.
+    def _document_span(self, page: _PageText) -> _Span:
+        """Get the span covering the whole page."""
+        return _Span(order=-1, start=0, end=len(page.strings))
 
-        Looks for semantic HTML5 tags or common content containers.
-        Falls back to body or full soup if no main content found.
+    def _extract_text(self, page: _PageText, span: _Span, preserve_structure: bool) -> str:
+        """Extract the text of an element of the page.
 
         Args:
-            soup: BeautifulSoup object
-
-        Returns:
-            BeautifulSoup object or Tag containing main content
-        """
-        # Try semantic HTML5 tags first
-        main_candidates = ["main", "article"]
-        for tag_name in main_candidates:
-            element = soup.find(tag_name)
-            if element:
-                logger.debug("main_content_found", tag=tag_name)
-                return element
-
-        # Try common content class/ID patterns
-        content_class_pattern = re.compile(r"content|main|article|post|entry", re.IGNORECASE)
-        content_id_pattern = re.compile(r"content|main|article|post|entry", re.IGNORECASE)
-
-        # Try class pattern
-        element = soup.find("div", class_=content_class_pattern)
-        if element:
-            logger.debug("main_content_found", pattern="class")
-            return element
-
-        # Try id pattern
-        element = soup.find("div", id=content_id_pattern)
-        if element:
-            logger.debug("main_content_found", pattern="id")
-            return element
-
-        # Fallback to body or full soup
-        body = soup.find("body")
-        if body:
-            logger.debug("main_content_fallback", tag="body")
-            return body
-
-        logger.debug("main_content_fallback", tag="full_document")
-        return soup
-
-    def _extract_text(self, soup: BeautifulSoup | Tag | None, preserve_structure: bool) -> str:
-        """Extract text content from HTML.
-
-        Args:
-            soup: BeautifulSoup object, Tag, or None
+            page: Collected text of the page
+            span: Span of the element to extract
             preserve_structure: If True, keep paragraph breaks
 
         Returns:
-            Extracted text (empty string if soup is None)
+            Extracted text
         """
-        # Guard: None soup
-        if soup is None:
-            return ""
-
         if preserve_structure:
-            # Keep paragraph structure
-            paragraphs = []
-            for element in soup.find_all(["p", "h1", "h2", "h3", "h4", "h5", "h6", "li"]):
-                text = element.get_text(strip=True)
-                if text:
-                    paragraphs.append(text)
-
-            return "\n".join(paragraphs) if paragraphs else ""
+            # Keep paragraph structure (descendant paragraphs in document order)
+            paragraphs = [
+                "".join(page.strings[paragraph.start : paragraph.end])
+                for paragraph in page.paragraphs
+                if paragraph.start < paragraph.end and span.contains(paragraph)
+            ]
+            return "\n".join(paragraphs)
 
         # Single text block
-        text = soup.get_text(separator=" ", strip=True)
-        return text if text else ""
+        return " ".join(page.strings[span.start : span.end])
 
     def _remove_timestamps(self, text: str) -> str:
         """Remove timestamps and dynamic date references from text.
@@ -379,14 +515,14 @@ class ContentNormalizer:
             normalized_lines = []
             for line in lines:
                 # Collapse multiple spaces/tabs on each line
-                line = re.sub(r"[ \t]+", " ", line)
+                line = _LINE_WHITESPACE_PATTERN.sub(" ", line)
                 line = line.strip()
                 if line:  # Only keep non-empty lines
                     normalized_lines.append(line.lower())
             return "\n".join(normalized_lines)
 
         # Normalize whitespace (multiple spaces/tabs/newlines to single space)
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_PATTERN.sub(" ", text)
 
         # Remove leading/trailing whitespace
         text = text.strip()
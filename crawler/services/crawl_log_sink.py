@@ -0,0 +1,307 @@
+"""Buffered, batched sink for crawl log entries.
+
+Crawl services write log entries into a bounded in-memory ring buffer instead of
+inserting each one as it happens. A single background task flushes the buffer
+whenever a batch fills up or the flush interval passes: one multi-row INSERT per
+batch, one Redis pipeline for the reconnection buffers of the batch, and the NATS
+messages of the batch published back to back.
+
+When entries arrive faster than the database accepts them, the buffer fills up
+and the drop policy decides which entries are lost; writers never wait on the
+database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from crawler.core import metrics
+from crawler.core.logging import get_logger
+from crawler.db.generated.models import LogLevelEnum
+from crawler.db.repositories import CrawlLogRepository
+from crawler.db.repositories.base import to_uuid, to_uuid_optional
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractAsyncContextManager
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+    from crawler.services.log_publisher import LogPublisher
+
+logger = get_logger(__name__)
+
+__all__ = ["CrawlLogEntry", "CrawlLogSink", "LogDropPolicy"]
+
+
+class LogDropPolicy(str, Enum):
+    """Entry dropped when a log is written to a full buffer."""
+
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest buffered entry (keep recent logs)
+    DROP_NEWEST = "drop_newest"  # Reject the entry being written (keep early logs)
+
+
+@dataclass
+class CrawlLogEntry:
+    """Crawl log entry waiting in the sink buffer."""
+
+    job_id: UUID
+    website_id: UUID
+    message: str
+    log_level: LogLevelEnum = LogLevelEnum.INFO
+    step_name: str | None = None
+    context: dict[str, Any] | None = None
+    trace_id: UUID | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+class CrawlLogSink:
+    """Per-process buffer that writes crawl logs to the database in batches.
+
+    write() is synchronous and never blocks: it appends to the ring buffer and
+    wakes the flush task once a batch is ready. Each flush opens its own
+    connection from connection_factory and commits independently of the job's
+    transaction, so logs of failed jobs are kept.
+
+    Usage:
+        sink = CrawlLogSink(engine.begin, log_publisher=publisher)
+        await sink.start()
+        sink.write(job_id, website_id, "Crawl started")
+        await sink.flush()  # at job end
+        await sink.close()  # at shutdown
+    """
+
+    DEFAULT_MAX_BUFFER_SIZE = 10000
+    DEFAULT_BATCH_SIZE = 500
+    DEFAULT_FLUSH_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], AbstractAsyncContextManager[AsyncConnection]],
+        log_publisher: LogPublisher | None = None,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        drop_policy: LogDropPolicy = LogDropPolicy.DROP_OLDEST,
+    ):
+        """Initialize crawl log sink.
+
+        Args:
+            connection_factory: Returns a context manager yielding a connection in a
+                transaction that commits on exit (e.g. AsyncEngine.begin)
+            log_publisher: Optional publisher for Redis buffering and NATS streaming
+            max_buffer_size: Entries buffered before the drop policy applies
+            batch_size: Maximum entries per INSERT; a full batch triggers a flush
+            flush_interval: Seconds between flushes of a partial batch
+            drop_policy: Entry dropped when the buffer is full
+        """
+        self.connection_factory = connection_factory
+        self.log_publisher = log_publisher
+        self.max_buffer_size = max_buffer_size
+        self.batch_size = min(batch_size, max_buffer_size)
+        self.flush_interval = flush_interval
+        self.drop_policy = LogDropPolicy(drop_policy)
+
+        self.entries_flushed = 0
+        self.entries_dropped = 0
+
+        self._buffer: deque[CrawlLogEntry] = deque()
+        self._batch_ready = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background flush task is running.
+
+        Returns:
+            True if started and the flush task has not finished
+        """
+        return self._flush_task is not None and not self._flush_task.done()
+
+    @property
+    def pending(self) -> int:
+        """Number of entries waiting to be flushed."""
+        return len(self._buffer)
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        # Guard: already running
+        if self.is_running:
+            logger.warning("crawl_log_sink_already_running")
+            return
+
+        self._closed = False
+        self._flush_task = asyncio.create_task(self._run())
+        logger.info(
+            "crawl_log_sink_started",
+            max_buffer_size=self.max_buffer_size,
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+            drop_policy=self.drop_policy.value,
+        )
+
+    def write(
+        self,
+        job_id: str | UUID,
+        website_id: str | UUID,
+        message: str,
+        log_level: LogLevelEnum = LogLevelEnum.INFO,
+        step_name: str | None = None,
+        context: dict[str, Any] | None = None,
+        trace_id: str | UUID | None = None,
+    ) -> bool:
+        """Buffer a log entry for the next flush (non-blocking).
+
+        Args:
+            job_id: Job ID
+            website_id: Website ID
+            message: Log message
+            log_level: Log level enum (defaults to INFO)
+            step_name: Optional step name
+            context: Optional context dict
+            trace_id: Optional trace ID for distributed tracing
+
+        Returns:
+            True if the entry was buffered, False if it was dropped
+        """
+        # Guard: sink closed - nothing would flush the entry
+        if self._closed:
+            self._drop(1, "closed")
+            return False
+
+        if len(self._buffer) >= self.max_buffer_size:
+            # Guard: keep the buffered entries and reject the new one
+            if self.drop_policy == LogDropPolicy.DROP_NEWEST:
+                self._drop(1, "buffer_full")
+                return False
+            self._buffer.popleft()
+            self._drop(1, "buffer_full")
+
+        self._buffer.append(
+            CrawlLogEntry(
+                job_id=to_uuid(job_id),
+                website_id=to_uuid(website_id),
+                message=message,
+                log_level=log_level,
+                step_name=step_name,
+                context=context,
+                trace_id=to_uuid_optional(trace_id),
+            )
+        )
+        metrics.crawl_log_sink_enqueued_total.inc()
+        metrics.crawl_log_sink_buffer_size.set(len(self._buffer))
+
+        if len(self._buffer) >= self.batch_size:
+            self._batch_ready.set()
+        return True
+
+    async def flush(self) -> int:
+        """Write every buffered entry now (e.g. at job end).
+
+        Returns:
+            Number of entries written to the database
+        """
+        flushed = 0
+        async with self._flush_lock:
+            while self._buffer:
+                flushed += await self._flush_batch()
+        return flushed
+
+    async def close(self) -> None:
+        """Stop the background task and flush the remaining entries (at shutdown)."""
+        self._closed = True
+
+        # Wake the flush task so it writes what is buffered and exits
+        if self._flush_task is not None:
+            self._batch_ready.set()
+            await self._flush_task
+            self._flush_task = None
+
+        await self.flush()
+        logger.info(
+            "crawl_log_sink_closed",
+            entries_flushed=self.entries_flushed,
+            entries_dropped=self.entries_dropped,
+        )
+
+    async def _run(self) -> None:
+        """Background task flushing a batch when it fills up or the interval passes."""
+        while not self._closed:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+
+            await self.flush()
+
+    async def _flush_batch(self) -> int:
+        """Write up to one batch of buffered entries and publish them.
+
+        Entries are published only once their INSERT has committed, so live
+        listeners never see logs that end up rolled back.
+
+        Must be called with the flush lock held.
+
+        Returns:
+            Number of entries written to the database
+        """
+        batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+        if len(self._buffer) < self.batch_size and not self._closed:
+            self._batch_ready.clear()
+        metrics.crawl_log_sink_buffer_size.set(len(self._buffer))
+
+        started = time.perf_counter()
+        try:
+            async with self.connection_factory() as conn:
+                logs = await CrawlLogRepository(conn).create_many(
+                    job_ids=[entry.job_id for entry in batch],
+                    website_ids=[entry.website_id for entry in batch],
+                    messages=[entry.message for entry in batch],
+                    log_levels=[entry.log_level for entry in batch],
+                    step_names=[entry.step_name for entry in batch],
+                    contexts=[entry.context for entry in batch],
+                    trace_ids=[entry.trace_id for entry in batch],
+                    created_ats=[entry.created_at for entry in batch],
+                )
+        except Exception as e:
+            # Don't let logging errors crash the crawl
+            self._drop(len(batch), "flush_failed")
+            logger.warning("crawl_log_sink_flush_failed", entries=len(batch), error=str(e))
+            return 0
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.crawl_log_sink_flush_duration_seconds.observe(elapsed)
+            # Batches mix the logs of several jobs, so they carry no step type or host
+            metrics.crawl_stage_duration_seconds.labels(
+                stage="log_write", step_type="", host=""
+            ).observe(elapsed)
+
+        if self.log_publisher:
+            try:
+                await self.log_publisher.publish_logs_batch(logs)
+            except Exception as e:
+                # The batch is saved; live listeners catch up from the database
+                logger.warning("crawl_log_sink_publish_failed", entries=len(logs), error=str(e))
+
+        self.entries_flushed += len(logs)
+        metrics.crawl_log_sink_flushed_total.inc(len(logs))
+        logger.debug("crawl_log_sink_flushed", entries=len(logs), pending=len(self._buffer))
+        return len(logs)
+
+    def _drop(self, count: int, reason: str) -> None:
+        """Record dropped entries.
+
+        Args:
+            count: Number of entries dropped
+            reason: Drop reason metric label
+        """
+        self.entries_dropped += count
+        metrics.crawl_log_sink_dropped_total.labels(reason=reason).inc(count)
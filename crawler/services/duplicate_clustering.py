@@ -0,0 +1,258 @@
+"""Offline rebuild of duplicate groups from stored content hashes.
+
+Streams the content hashes with their Simhash fingerprints, clusters near-duplicate
+fingerprints with the banded search in crawler.utils.simhash, and replaces the
+detected duplicate groups with one group per cluster. The earliest crawled page
+of a cluster is its canonical page; every other page becomes an 'exact_hash' or
+'fuzzy_match' duplicate of it.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from crawler.core.logging import get_logger
+from crawler.db.repositories import (
+    ContentHashRepository,
+    CrawledPageRepository,
+    DuplicateGroupRepository,
+)
+from crawler.services.result_persistence import FUZZY_MAX_DISTANCE, SIMHASH_BITS
+from crawler.utils.simhash import cluster_near_duplicates
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+    from crawler.db.generated.content_hash import ListContentHashesForClusteringRow
+
+logger = get_logger(__name__)
+
+# Identifier stored in duplicate_relationship.detected_by
+DETECTED_BY = "duplicate_group_rebuild"
+
+# Content hashes read per keyset page, and per page lookup when writing groups
+CLUSTERING_BATCH_SIZE = 10000
+
+
+class DuplicateClusteringService:
+    """Service rebuilding duplicate groups from content hash fingerprints."""
+
+    def __init__(self, conn: AsyncConnection, batch_size: int = CLUSTERING_BATCH_SIZE):
+        """Initialize duplicate clustering service.
+
+        Args:
+            conn: Database connection
+            batch_size: Content hashes read or resolved to pages per query
+        """
+        self.conn = conn
+        self.batch_size = batch_size
+        self.content_hash_repo = ContentHashRepository(conn)
+        self.page_repo = CrawledPageRepository(conn)
+        self.duplicate_repo = DuplicateGroupRepository(conn)
+
+    async def rebuild_groups(self, max_distance: int = FUZZY_MAX_DISTANCE) -> dict[str, int]:
+        """Replace detected duplicate groups with groups built from content hashes.
+
+        Runs on the caller's connection; wrap it in a transaction so readers never
+        see the groups half rebuilt.
+
+        The content hash table is read twice in keyset pages. The first pass keeps
+        only the fingerprints, which are clustered. The second pass writes the
+        groups of hashes outside any fuzzy cluster page by page and keeps only the
+        hashes of fuzzy clusters until the end.
+
+        Args:
+            max_distance: Maximum Hamming distance between near-duplicate fingerprints
+
+        Returns:
+            Dictionary with rebuild statistics (content_hashes, clusters, groups,
+            exact_duplicates, fuzzy_duplicates)
+        """
+        cluster_of = self._build_clusters(await self._load_fingerprints(), max_distance)
+
+        logger.info(
+            "duplicate_clusters_built",
+            fuzzy_clusters=len(set(cluster_of.values())),
+            max_distance=max_distance,
+        )
+
+        await self.duplicate_repo.remove_detected_groups()
+
+        stats = {
+            "content_hashes": 0,
+            "clusters": 0,
+            "groups": 0,
+            "exact_duplicates": 0,
+            "fuzzy_duplicates": 0,
+        }
+
+        # Hashes outside fuzzy clusters can only have exact duplicates: write them now
+        fuzzy_clusters: defaultdict[int, list[str]] = defaultdict(list)
+        fuzzy_fingerprints: dict[str, int] = {}
+        async for rows in self._iter_content_hashes():
+            single_clusters: list[list[str]] = []
+            for row in rows:
+                fingerprint = row.simhash_fingerprint
+                if fingerprint is not None and fingerprint in cluster_of:
+                    fuzzy_clusters[cluster_of[fingerprint]].append(row.content_hash)
+                    fuzzy_fingerprints[row.content_hash] = fingerprint
+                else:
+                    single_clusters.append([row.content_hash])
+
+            stats["content_hashes"] += len(rows)
+            stats["clusters"] += len(single_clusters)
+            if single_clusters:
+                await self._write_groups(single_clusters, fuzzy_fingerprints, stats)
+
+        # Resolve fuzzy clusters to pages and write groups a batch of hashes at a time
+        stats["clusters"] += len(fuzzy_clusters)
+        batch: list[list[str]] = []
+        batch_hashes = 0
+        for cluster in fuzzy_clusters.values():
+            batch.append(cluster)
+            batch_hashes += len(cluster)
+            if batch_hashes >= self.batch_size:
+                await self._write_groups(batch, fuzzy_fingerprints, stats)
+                batch = []
+                batch_hashes = 0
+        if batch:
+            await self._write_groups(batch, fuzzy_fingerprints, stats)
+
+        logger.info("duplicate_groups_rebuilt", **stats)
+        return stats
+
+    async def _iter_content_hashes(
+        self,
+    ) -> AsyncIterator[list[ListContentHashesForClusteringRow]]:
+        """Yield candidate content hashes with their fingerprints, a keyset page at a time.
+
+        Yields:
+            Rows of hashes with a fingerprint or shared by several pages, in hash order
+        """
+        after_hash = ""
+        while True:
+            rows = await self.content_hash_repo.list_for_clustering(
+                after_hash=after_hash, limit=self.batch_size
+            )
+            if rows:
+                yield rows
+
+            if len(rows) < self.batch_size:
+                return
+            after_hash = rows[-1].content_hash
+
+    async def _load_fingerprints(self) -> array[int]:
+        """Load the fingerprints of all candidate content hashes.
+
+        Returns:
+            Unsigned fingerprints, once per content hash that has one
+        """
+        fingerprints: array[int] = array("Q")
+        async for rows in self._iter_content_hashes():
+            fingerprints.extend(
+                row.simhash_fingerprint for row in rows if row.simhash_fingerprint is not None
+            )
+        return fingerprints
+
+    def _build_clusters(self, fingerprints: array[int], max_distance: int) -> dict[int, int]:
+        """Cluster near-duplicate fingerprints.
+
+        Hashes whose fingerprint is in no cluster become single-hash clusters,
+        since their pages can still be exact duplicates of each other.
+
+        Args:
+            fingerprints: Unsigned fingerprints, once per content hash
+            max_distance: Maximum Hamming distance between near-duplicates
+
+        Returns:
+            Mapping of fingerprint to cluster index, for fingerprints shared by
+            several content hashes or near another fingerprint
+        """
+        fuzzy_clusters = cluster_near_duplicates(
+            fingerprints, threshold=max_distance, hash_bits=SIMHASH_BITS
+        )
+        return {
+            fingerprints[position]: index
+            for index, cluster in enumerate(fuzzy_clusters)
+            for position in cluster
+        }
+
+    async def _write_groups(
+        self,
+        clusters: list[list[str]],
+        fingerprints: dict[str, int],
+        stats: dict[str, int],
+    ) -> None:
+        """Create the duplicate groups of a batch of clusters.
+
+        Args:
+            clusters: Clusters of content hashes
+            fingerprints: Mapping of content hash to fingerprint, for hashes of
+                fuzzy clusters
+            stats: Rebuild statistics, updated in place
+        """
+        cluster_of = {value: index for index, cluster in enumerate(clusters) for value in cluster}
+        rows = await self.page_repo.list_ids_by_content_hashes(list(cluster_of))
+
+        # Pages of each cluster, earliest crawled first
+        pages: defaultdict[int, list[tuple[UUID, str]]] = defaultdict(list)
+        for row in rows:
+            pages[cluster_of[row.content_hash]].append((row.id, row.content_hash))
+
+        # Guard: clusters with a single page have no duplicates
+        cluster_pages = [members for members in pages.values() if len(members) > 1]
+        if not cluster_pages:
+            return
+
+        groups = await self.duplicate_repo.get_or_create_groups(
+            [members[0][0] for members in cluster_pages]
+        )
+
+        group_ids: list[UUID] = []
+        page_ids: list[UUID] = []
+        methods: list[str] = []
+        scores: list[int | None] = []
+        distances: list[int | None] = []
+        for (canonical_id, canonical_hash), *duplicates in cluster_pages:
+            canonical_fp = fingerprints.get(canonical_hash)
+            for page_id, content_hash in duplicates:
+                if content_hash == canonical_hash:
+                    methods.append("exact_hash")
+                    scores.append(None)
+                    distances.append(None)
+                    stats["exact_duplicates"] += 1
+                else:
+                    # Different hashes only share a cluster through their fingerprints
+                    fingerprint = fingerprints.get(content_hash)
+                    if canonical_fp is None or fingerprint is None:
+                        logger.warning(
+                            "duplicate_fingerprint_missing",
+                            content_hash=content_hash,
+                            canonical_hash=canonical_hash,
+                        )
+                        continue
+
+                    # Members joined through a chain of close fingerprints may be
+                    # farther than max_distance from the canonical page
+                    distance = (canonical_fp ^ fingerprint).bit_count()
+                    methods.append("fuzzy_match")
+                    scores.append(max(0, int((1 - distance / SIMHASH_BITS) * 100)))
+                    distances.append(distance)
+                    stats["fuzzy_duplicates"] += 1
+                group_ids.append(groups[canonical_id])
+                page_ids.append(page_id)
+
+        await self.duplicate_repo.add_duplicates_bulk(
+            group_ids=group_ids,
+            duplicate_page_ids=page_ids,
+            detection_methods=methods,
+            similarity_scores=scores,
+            confidence_thresholds=distances,
+            detected_by=DETECTED_BY,
+        )
+        stats["groups"] += len(cluster_pages)
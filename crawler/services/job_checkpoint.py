@@ -0,0 +1,304 @@
+"""Durable progress of a job's workflow across retry attempts.
+
+A failed job is retried from scratch by the retry handler, and everything the
+job wrote in its own transaction is rolled back. JobCheckpoint records progress
+outside that transaction instead: the output of each completed step, and each
+page a scrape step scraped. The next attempt restores completed steps without
+running them and only scrapes the URLs that are left.
+
+Scraped pages are checkpointed without their raw content: only the URL, the
+extracted fields, the content hash and, when object storage is configured, the
+storage key of the uploaded HTML. Checkpoints are deleted once the job finishes.
+
+Checkpoints are keyed by a hash of the step configuration, so a job whose
+workflow changed between attempts does not resume from stale progress.
+Checkpoints are best effort: storage errors are logged and the job carries on
+as if nothing had been recorded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from crawler.core.logging import get_logger
+from crawler.db.repositories import JobCheckpointRepository
+from crawler.services.result_persistence import hash_content
+from crawler.services.step_execution_context import StepResult
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from contextlib import AbstractAsyncContextManager
+
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+    from crawler.services.step_executors.scrape_executor import PageSink
+    from crawler.services.storage import StorageService
+
+logger = get_logger(__name__)
+
+
+def config_hash(step_config: dict[str, Any]) -> str:
+    """Hash a step configuration to tell whether recorded progress still applies.
+
+    Args:
+        step_config: Step configuration
+
+    Returns:
+        Hex SHA-256 of the configuration in canonical JSON form
+    """
+    canonical = json.dumps(step_config, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class JobCheckpoint:
+    """Records and restores the progress of one job's workflow.
+
+    Each write opens its own connection from connection_factory and commits
+    independently of the job's transaction, so progress survives a failed
+    attempt. Scraped pages are buffered and written batch_size at a time.
+
+    Usage:
+        checkpoint = JobCheckpoint(engine.begin, job_id)
+        await checkpoint.load()
+        result = checkpoint.get_step(step_config)  # None if not completed before
+        record = checkpoint.page_recorder(step_config)
+        await record(page)
+        await checkpoint.flush()
+        await checkpoint.clear()  # once the job is finished for good
+    """
+
+    DEFAULT_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], AbstractAsyncContextManager[AsyncConnection]],
+        job_id: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        storage: StorageService | None = None,
+    ):
+        """Initialize job checkpoint.
+
+        Args:
+            connection_factory: Returns a context manager yielding a connection in a
+                transaction that commits on exit (e.g. AsyncEngine.begin)
+            job_id: Job ID
+            batch_size: Scraped pages buffered before they are written
+            storage: Optional object storage; when set, the raw HTML of scraped
+                pages is uploaded and its key checkpointed in place of the content
+        """
+        self.connection_factory = connection_factory
+        self.job_id = job_id
+        self.batch_size = batch_size
+        self.storage = storage
+
+        self._steps: dict[str, tuple[str, dict[str, Any]]] = {}
+        # (step name, step config hash, page record, raw HTML to upload)
+        self._pending: list[tuple[str, str, dict[str, Any], str | None]] = []
+        self._flush_lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        """Load the step checkpoints recorded by earlier attempts."""
+        try:
+            async with self.connection_factory() as conn:
+                checkpoints = await JobCheckpointRepository(conn).list_steps(self.job_id)
+        except Exception as e:
+            logger.warning("job_checkpoint_load_failed", job_id=self.job_id, error=str(e))
+            return
+
+        self._steps = {
+            checkpoint.step_name: (checkpoint.config_hash, checkpoint.result)
+            for checkpoint in checkpoints
+        }
+        if self._steps:
+            logger.info(
+                "job_checkpoint_loaded", job_id=self.job_id, completed_steps=list(self._steps)
+            )
+
+    def get_step(self, step_config: dict[str, Any]) -> StepResult | None:
+        """Get the result an earlier attempt recorded for a step.
+
+        Args:
+            step_config: Step configuration
+
+        Returns:
+            Restored step result (metadata["resumed"] is True), or None if the step
+            did not complete with this configuration before
+        """
+        step_name = step_config["name"]
+        checkpoint = self._steps.get(step_name)
+
+        # Guard: not completed, or completed with another configuration
+        if checkpoint is None or checkpoint[0] != config_hash(step_config):
+            return None
+
+        result = checkpoint[1]
+        return StepResult(
+            step_name=step_name,
+            status_code=result.get("status_code"),
+            extracted_data=result.get("extracted_data") or {},
+            metadata={**(result.get("metadata") or {}), "resumed": True},
+        )
+
+    async def save_step(self, step_config: dict[str, Any], result: StepResult) -> None:
+        """Record the result of a completed step.
+
+        Content is left out; later steps and result persistence only read the
+        extracted data.
+
+        Args:
+            step_config: Step configuration
+            result: Successful step result
+        """
+        step_hash = config_hash(step_config)
+        payload = {
+            "status_code": result.status_code,
+            "extracted_data": result.extracted_data,
+            "metadata": result.metadata,
+        }
+        try:
+            async with self.connection_factory() as conn:
+                await JobCheckpointRepository(conn).save_step(
+                    self.job_id, result.step_name, step_hash, payload
+                )
+        except Exception as e:
+            logger.warning(
+                "job_checkpoint_save_failed",
+                job_id=self.job_id,
+                step_name=result.step_name,
+                error=str(e),
+            )
+            return
+
+        self._steps[result.step_name] = (step_hash, payload)
+
+    async def iter_pages(self, step_config: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Stream the pages earlier attempts scraped for a step.
+
+        A failure while reading ends the stream early; the pages that were not read
+        are scraped again.
+
+        Args:
+            step_config: Scrape step configuration
+
+        Yields:
+            Page records (_url, _content_hash, _html_path and extracted fields)
+        """
+        step_name = step_config["name"]
+        try:
+            async with self.connection_factory() as conn:
+                async for page in JobCheckpointRepository(conn).stream_pages(
+                    self.job_id, step_name, config_hash(step_config)
+                ):
+                    yield page
+        except Exception as e:
+            logger.warning(
+                "job_checkpoint_read_failed",
+                job_id=self.job_id,
+                step_name=step_name,
+                error=str(e),
+            )
+
+    def page_recorder(self, step_config: dict[str, Any]) -> PageSink:
+        """Get a page sink recording the pages a scrape step scrapes.
+
+        Args:
+            step_config: Scrape step configuration
+
+        Returns:
+            Coroutine buffering each page and writing full batches
+        """
+        step_name = step_config["name"]
+        step_hash = config_hash(step_config)
+
+        async def record(page: dict[str, Any]) -> None:
+            self._pending.append((step_name, step_hash, *self._strip_content(page)))
+            if len(self._pending) >= self.batch_size:
+                await self.flush()
+
+        return record
+
+    async def flush(self) -> None:
+        """Write the buffered pages."""
+        async with self._flush_lock:
+            # Guard: another flush already wrote the buffer
+            if not self._pending:
+                return
+
+            pending, self._pending = self._pending, []
+            await self._store_html(pending)
+            batches: dict[tuple[str, str], list[dict[str, Any]]] = {}
+            for step_name, step_hash, page, _html in pending:
+                batches.setdefault((step_name, step_hash), []).append(page)
+
+            try:
+                async with self.connection_factory() as conn:
+                    repo = JobCheckpointRepository(conn)
+                    for (step_name, step_hash), pages in batches.items():
+                        await repo.save_pages(self.job_id, step_name, step_hash, pages)
+            except Exception as e:
+                logger.warning(
+                    "job_checkpoint_save_failed",
+                    job_id=self.job_id,
+                    pages=len(pending),
+                    error=str(e),
+                )
+
+    def _strip_content(self, page: dict[str, Any]) -> tuple[dict[str, Any], str | None]:
+        """Replace a page's raw content with its hash.
+
+        Args:
+            page: Scraped page data
+
+        Returns:
+            Page record to checkpoint, and the raw HTML to upload to storage (None
+            if storage is not configured or the content is not HTML)
+        """
+        content = page.get("_content")
+        record = {key: value for key, value in page.items() if key != "_content"}
+        if content is not None:
+            record["_content_hash"] = hash_content(content)
+
+        html = content if self.storage and isinstance(content, str) and content else None
+        return record, html
+
+    async def _store_html(self, pending: list[tuple[str, str, dict[str, Any], str | None]]) -> None:
+        """Upload the raw HTML of buffered pages and note the keys in their records.
+
+        Uploads run concurrently. A failed upload is logged and leaves the page
+        without a stored HTML path.
+
+        Args:
+            pending: Buffered pages with their raw HTML
+        """
+        # Guard: no storage configured
+        if self.storage is None:
+            return
+
+        uploads = [(page, html) for _name, _hash, page, html in pending if html]
+        results = await asyncio.gather(
+            *(self.storage.store_html(html, page["_content_hash"]) for page, html in uploads),
+            return_exceptions=True,
+        )
+        for (page, _html), result in zip(uploads, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "job_checkpoint_html_store_failed",
+                    job_id=self.job_id,
+                    url=page.get("_url"),
+                    error=str(result),
+                )
+                continue
+            page["_html_path"] = result
+
+    async def clear(self) -> None:
+        """Delete the job's checkpoints once it will not be retried."""
+        self._pending = []
+        self._steps = {}
+        try:
+            async with self.connection_factory() as conn:
+                await JobCheckpointRepository(conn).delete(self.job_id)
+        except Exception as e:
+            logger.warning("job_checkpoint_clear_failed", job_id=self.job_id, error=str(e))
@@ -3,17 +3,23 @@
 This module provides in-memory rate limiting for controlling request rates
 within a single job execution. Unlike the Redis-based RateLimiter which is
 global across all jobs, this limiter enforces limits locally for the current
-workflow execution.
+workflow execution. An optional HostRateLimiter additionally paces each host
+across every job and worker.
 """
 
+from __future__ import annotations
+
 import asyncio
 import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from crawler.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from crawler.services.redis_cache import HostRateLimiter
+
 logger = get_logger(__name__)
 
 
@@ -24,6 +30,9 @@ class LocalRateLimiter:
     1. requests_per_second: Limits the rate of requests using token bucket algorithm
     2. concurrent_pages: Limits concurrent requests using asyncio.Semaphore
 
+    With a host_limiter, acquire(url) also waits for a cluster-wide slot for the
+    URL's host at the same requests_per_second and burst.
+
     Example:
         >>> limiter = LocalRateLimiter(requests_per_second=2.0, concurrent_pages=5)
         >>> async with limiter.acquire():
@@ -36,6 +45,7 @@ class LocalRateLimiter:
         requests_per_second: float = 2.0,
         concurrent_pages: int = 5,
         burst: int = 10,
+        host_limiter: HostRateLimiter | None = None,
     ):
         """Initialize local rate limiter.
 
@@ -43,10 +53,12 @@ class LocalRateLimiter:
             requests_per_second: Maximum requests per second (0.1-100)
             concurrent_pages: Maximum concurrent requests (1-50)
             burst: Maximum burst requests (1-100)
+            host_limiter: Optional cluster-wide per-host limiter
         """
         self.requests_per_second = max(0.1, min(100.0, requests_per_second))
         self.concurrent_pages = max(1, min(50, concurrent_pages))
         self.burst = max(1, min(100, burst))
+        self.host_limiter = host_limiter
 
         # Semaphore for concurrent requests
         self._semaphore = asyncio.Semaphore(self.concurrent_pages)
@@ -62,6 +74,7 @@ class LocalRateLimiter:
             requests_per_second=self.requests_per_second,
             concurrent_pages=self.concurrent_pages,
             burst=self.burst,
+            host_limited=host_limiter is not None,
         )
 
     async def _refill_tokens(self) -> None:
@@ -104,9 +117,13 @@ class LocalRateLimiter:
             # Loop back to re-acquire lock and check tokens again
 
     @asynccontextmanager
-    async def acquire(self) -> AsyncIterator[None]:
+    async def acquire(self, url: str | None = None) -> AsyncIterator[None]:
         """Acquire rate limit (both token and semaphore).
 
+        Args:
+            url: URL about to be requested. Required for per-host pacing across
+                the cluster; without it only the local limits apply.
+
         Yields:
             None (context manager)
 
@@ -120,6 +137,9 @@ class LocalRateLimiter:
             # Acquire token (limits rate)
             # If cancelled here, finally block ensures semaphore release
             await self._acquire_token()
+            # Pace the host across all jobs and workers if configured
+            if url and self.host_limiter:
+                await self.host_limiter.acquire(url, self.requests_per_second, self.burst)
             yield
         finally:
             # Always release semaphore on any exit path:
@@ -130,11 +150,16 @@ class LocalRateLimiter:
             self._semaphore.release()
 
     @classmethod
-    def from_config(cls, rate_limit_config: dict[str, Any] | None) -> LocalRateLimiter:
+    def from_config(
+        cls,
+        rate_limit_config: dict[str, Any] | None,
+        host_limiter: HostRateLimiter | None = None,
+    ) -> LocalRateLimiter:
         """Create rate limiter from GlobalConfig.rate_limit dict.
 
         Args:
             rate_limit_config: GlobalConfig.rate_limit dictionary or None
+            host_limiter: Optional cluster-wide per-host limiter
 
         Returns:
             LocalRateLimiter instance with configured limits
@@ -145,10 +170,11 @@ class LocalRateLimiter:
         """
         if not rate_limit_config or not isinstance(rate_limit_config, dict):
             # No config - use defaults
-            return cls()
+            return cls(host_limiter=host_limiter)
 
         return cls(
             requests_per_second=rate_limit_config.get("requests_per_second", 2.0),
             concurrent_pages=rate_limit_config.get("concurrent_pages", 5),
             burst=rate_limit_config.get("burst", 10),
+            host_limiter=host_limiter,
         )
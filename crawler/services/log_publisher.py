@@ -125,21 +125,61 @@ class LogPublisher:
     async def publish_logs_batch(self, logs: list[CrawlLog]) -> None:
         """Publish multiple logs in batch.
 
-        More efficient than calling publish_log() multiple times.
+        Buffers the whole batch in Redis with one pipeline, then publishes the
+        NATS messages back to back, so a batch costs one Redis round trip instead
+        of one per log.
 
         Args:
             logs: List of CrawlLog entries to publish
         """
+        # Guard: empty batch
+        if not logs:
+            return
+
+        # Import here to avoid circular dependency
+        from crawler.api.websocket_models import WebSocketLogMessage
+
+        messages = [WebSocketLogMessage.from_crawl_log(log) for log in logs]
+
+        # Buffer logs in Redis for reconnection support
+        if self.log_buffer:
+            try:
+                await self.log_buffer.add_logs(
+                    [
+                        (str(log.job_id), log.id, message.model_dump())
+                        for log, message in zip(logs, messages, strict=True)
+                    ]
+                )
+            except Exception as e:
+                logger.warning("log_buffer_batch_failed", logs=len(logs), error=str(e))
+
         # Guard: NATS not enabled
         if not self.is_enabled:
             return
 
-        # Guard: empty batch
-        if not logs:
+        # Guard: NATS client not available
+        if not self.nats_client:
             return
 
-        for log in logs:
-            await self.publish_log(log)
+        published = 0
+        for log, message in zip(logs, messages, strict=True):
+            try:
+                await self.nats_client.publish(
+                    subject=f"logs.{log.job_id}",
+                    payload=message.model_dump_json().encode("utf-8"),
+                )
+                published += 1
+            except Exception as e:
+                # Don't fail the batch if NATS publishing fails
+                # Logs are still in the database and can be retrieved
+                logger.warning(
+                    "log_publish_failed",
+                    job_id=str(log.job_id),
+                    log_id=log.id,
+                    error=str(e),
+                )
+
+        logger.debug("log_batch_published_to_nats", logs=len(logs), published=published)
 
     def disable(self) -> None:
         """Disable log publishing.
@@ -126,7 +126,7 @@ class NATSQueueService:
             deliver_policy=DeliverPolicy.ALL,  # Deliver all available messages
             ack_wait=300,  # 5 minutes to process before redelivery
             max_deliver=3,  # Max 3 delivery attempts
-            max_ack_pending=10,  # Max 10 unacked messages per consumer
+            max_ack_pending=self.settings.nats_max_ack_pending,  # Bounds in-flight jobs
         )
 
         try:
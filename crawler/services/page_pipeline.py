@@ -0,0 +1,187 @@
+"""Streaming persistence pipeline for scraped pages.
+
+Scrape steps hand each page to the pipeline as soon as it is extracted. A single
+consumer task drains the pipeline in batches, hashing, deduplicating and writing
+the pages through ResultPersistenceService. The queue between the two is bounded,
+so a scrape that outpaces the database waits instead of buffering the whole job
+in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from crawler.core import metrics
+from crawler.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from crawler.services.result_persistence import ResultPersistenceService
+
+logger = get_logger(__name__)
+
+__all__ = ["PagePersistencePipeline"]
+
+
+class PagePersistencePipeline:
+    """Bounded producer/consumer pipeline that persists pages while scraping runs.
+
+    Stages:
+    1. fetch + extract: ScrapeExecutor calls submit() for every scraped page
+    2. normalize/hash + persist: a background task writes pages in batches
+
+    submit() blocks while max_pending pages are waiting, which throttles the
+    scrape to the speed of persistence. Peak memory is bounded by max_pending
+    plus the batch being written, regardless of how many URLs the job has.
+
+    Usage:
+        pipeline = PagePersistencePipeline(persistence, job_id, website_id)
+        await pipeline.start()
+        await pipeline.submit(page_data)  # waits while the pipeline is full
+        stats = await pipeline.stop()  # flushes remaining pages
+    """
+
+    # Maximum pages written per persistence call
+    DEFAULT_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        persistence_service: ResultPersistenceService,
+        job_id: str,
+        website_id: str,
+        max_pending: int = 200,
+        batch_size: int | None = None,
+    ):
+        """Initialize page persistence pipeline.
+
+        Args:
+            persistence_service: Service used to write page batches
+            job_id: Job ID the pages belong to
+            website_id: Website ID the pages belong to
+            max_pending: Pages buffered before submit() waits (default: 200)
+            batch_size: Maximum pages per write (default: 100)
+        """
+        self.persistence_service = persistence_service
+        self.job_id = job_id
+        self.website_id = website_id
+        self.max_pending = max_pending
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+
+        self.pages_saved = 0
+        self.pages_failed = 0
+
+        # None is the end-of-stream marker put by stop()
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=max_pending)
+        self._consumer_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the pipeline accepts pages.
+
+        Returns:
+            True if started and the consumer task has not finished
+        """
+        return self._consumer_task is not None and not self._consumer_task.done()
+
+    async def start(self) -> None:
+        """Start the background persistence task."""
+        # Guard: already running
+        if self.is_running:
+            logger.warning("page_pipeline_already_running", job_id=self.job_id)
+            return
+
+        self._consumer_task = asyncio.create_task(self._consume())
+        logger.info(
+            "page_pipeline_started",
+            job_id=self.job_id,
+            max_pending=self.max_pending,
+            batch_size=self.batch_size,
+        )
+
+    async def submit(self, page_data: dict[str, Any]) -> None:
+        """Queue a scraped page for persistence, waiting while the pipeline is full.
+
+        Args:
+            page_data: Page data with _url, _content and extracted fields
+
+        Raises:
+            RuntimeError: If the pipeline is not running
+        """
+        if not self.is_running:
+            raise RuntimeError("Page pipeline is not running")
+
+        await self._queue.put(page_data)
+
+    async def stop(self) -> dict[str, int]:
+        """Persist the remaining pages and stop the background task.
+
+        Returns:
+            Dictionary with persistence statistics (pages_saved, pages_failed)
+        """
+        if self._consumer_task is not None:
+            if not self._consumer_task.done():
+                await self._queue.put(None)
+            await self._consumer_task
+            self._consumer_task = None
+
+        logger.info(
+            "page_pipeline_stopped",
+            job_id=self.job_id,
+            pages_saved=self.pages_saved,
+            pages_failed=self.pages_failed,
+        )
+        return {"pages_saved": self.pages_saved, "pages_failed": self.pages_failed}
+
+    async def _consume(self) -> None:
+        """Background task that writes queued pages in batches until stopped."""
+        # Only scrape steps stream pages; label this task's stage timings accordingly
+        metrics.current_step_type.set("scrape")
+        finished = False
+
+        while not finished:
+            page = await self._queue.get()
+            if page is None:
+                break
+
+            # Take whatever else is already waiting, up to one batch
+            batch = [page]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                next_page = self._queue.get_nowait()
+                if next_page is None:
+                    finished = True
+                    break
+                batch.append(next_page)
+
+            await self._persist_batch(batch)
+
+    async def _persist_batch(self, batch: list[dict[str, Any]]) -> None:
+        """Write one batch of pages and update statistics.
+
+        Args:
+            batch: Page data dictionaries with _url field
+        """
+        try:
+            saved, failed = await self.persistence_service.persist_pages(
+                job_id=self.job_id,
+                website_id=self.website_id,
+                pages=batch,
+            )
+        except Exception as e:
+            saved, failed = 0, len(batch)
+            logger.error(
+                "page_pipeline_batch_failed",
+                job_id=self.job_id,
+                page_count=len(batch),
+                error=str(e),
+                exc_info=True,
+            )
+
+        self.pages_saved += saved
+        self.pages_failed += failed
+        logger.debug(
+            "page_pipeline_batch_persisted",
+            job_id=self.job_id,
+            pages_saved=saved,
+            pages_failed=failed,
+            pending=self._queue.qsize(),
+        )
@@ -0,0 +1,74 @@
+"""Validators for incremental recrawls of previously crawled pages.
+
+When a known URL is crawled again, its stored ETag and Last-Modified values are sent
+back as If-None-Match and If-Modified-Since. The page counts as unchanged if the
+server answers 304 Not Modified, or if the body hashes to the stored content hash.
+Extraction and persistence are then skipped for that page.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+__all__ = [
+    "UNCHANGED_CONTENT_HASH",
+    "UNCHANGED_NOT_MODIFIED",
+    "VALIDATOR_FIELDS",
+    "PageValidators",
+    "ValidatorLookup",
+]
+
+# Reasons a page counts as unchanged (ExecutionResult.metadata["unchanged"])
+UNCHANGED_NOT_MODIFIED = "not_modified"
+UNCHANGED_CONTENT_HASH = "content_hash"
+
+# Response validators kept with a page: ExecutionResult.metadata keys, saved in
+# crawled_page.metadata under the same names and carried in page data as _<name>
+VALIDATOR_FIELDS = ("etag", "last_modified")
+
+
+@dataclass(frozen=True)
+class PageValidators:
+    """Validators saved with the last crawled version of a page.
+
+    Attributes:
+        content_hash: SHA256 hash of the raw content saved for the page
+        etag: ETag response header of the saved version, if any
+        last_modified: Last-Modified response header of the saved version, if any
+    """
+
+    content_hash: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the request headers that make the fetch conditional.
+
+        Returns:
+            If-None-Match and If-Modified-Since headers for the stored validators
+        """
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def matches_content(self, content: str) -> bool:
+        """Check if content is identical to the saved version.
+
+        Content is hashed as ResultPersistenceService hashes string content.
+
+        Args:
+            content: Raw response body
+
+        Returns:
+            True if the content hash equals the stored one
+        """
+        return hashlib.sha256(content.encode("utf-8")).hexdigest() == self.content_hash
+
+
+# Looks up the stored validators of URLs. URLs never crawled before are omitted.
+ValidatorLookup = Callable[[list[str]], Awaitable[dict[str, PageValidators]]]
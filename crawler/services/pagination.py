@@ -4,9 +4,14 @@ This service orchestrates pagination detection and URL generation for crawl jobs
 It integrates the pagination utilities with the crawl configuration system.
 """
 
-from collections.abc import AsyncIterator, Awaitable, Callable
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from itertools import islice
+from typing import Any
 
 from crawler.api.generated import PaginationConfig
+from crawler.core import metrics
 from crawler.core.logging import get_logger
 from crawler.utils.pagination import (
     PaginationPatternDetector,
@@ -42,6 +47,7 @@ class PaginationService:
     DEFAULT_START_PAGE = 1
     DEFAULT_MIN_CONTENT_LENGTH = 100
     DEFAULT_MAX_EMPTY_RESPONSES = 2
+    DEFAULT_PREFETCH_WINDOW = 1
 
     def __init__(self) -> None:
         """Initialize pagination service."""
@@ -146,14 +152,21 @@ class PaginationService:
         self,
         seed_url: str,
         config: PaginationConfig,
-        fetch_fn: Callable[[str], Awaitable[tuple[int, bytes]]],
-    ) -> AsyncIterator[tuple[str, int, bytes]]:
+        fetch_fn: Callable[[str], Coroutine[Any, Any, tuple[int, bytes]]],
+    ) -> AsyncGenerator[tuple[str, int, bytes]]:
         """Generate pagination URLs with live stop detection.
 
         This is an advanced method for sequential crawling with real-time
         stop condition detection. It yields (url, status_code, content) tuples
         and automatically stops when end conditions are met.
 
+        With config.prefetch_window > 1 the next pages are fetched concurrently
+        while earlier ones are processed. Pages are still checked and yielded in
+        order; once a stop condition fires, fetches still in flight are cancelled
+        and pages already fetched past the stop are discarded. Host politeness
+        stays with fetch_fn (e.g. a per-host rate limiter acquired before each
+        request).
+
         Args:
             seed_url: The seed URL to start from
             config: Pagination configuration
@@ -209,47 +222,62 @@ class PaginationService:
             max_pages=config.max_pages,
         )
 
-        # Crawl each URL with stop detection
-        for i, url in enumerate(urls, 1):
-            try:
-                status_code, content = await fetch_fn(url)
+        window = max(config.prefetch_window or self.DEFAULT_PREFETCH_WINDOW, 1)
+        upcoming = iter(urls)
+        in_flight: deque[asyncio.Task[tuple[int, bytes]]] = deque()
+
+        try:
+            # Crawl each URL with stop detection
+            for i, url in enumerate(urls, 1):
+                try:
+                    if window > 1:
+                        # Keep up to `window` fetches running, this page's included
+                        for next_url in islice(upcoming, window - len(in_flight)):
+                            in_flight.append(asyncio.create_task(fetch_fn(next_url)))
+                        status_code, content = await in_flight.popleft()
+                    else:
+                        status_code, content = await fetch_fn(url)
+
+                    # Check stop conditions
+                    stop_result: StopCondition = stop_detector.check_response(
+                        status_code=status_code, content=content, url=url
+                    )
 
-                # Check stop conditions
-                stop_result: StopCondition = stop_detector.check_response(
-                    status_code=status_code, content=content, url=url
-                )
+                    if stop_result.should_stop:
+                        logger.info(
+                            "pagination_stopped",
+                            url=url,
+                            reason=stop_result.reason,
+                            pages_crawled=i,
+                            total_planned=len(urls),
+                            prefetched_discarded=len(in_flight),
+                        )
+                        return
+
+                    # Yield successful page
+                    yield url, status_code, content
+
+                    logger.debug(
+                        "pagination_page_crawled",
+                        url=url,
+                        page_number=i,
+                        status_code=status_code,
+                        content_size=len(content),
+                    )
 
-                if stop_result.should_stop:
-                    logger.info(
-                        "pagination_stopped",
+                except Exception as e:
+                    logger.error(
+                        "pagination_fetch_error",
                         url=url,
-                        reason=stop_result.reason,
-                        pages_crawled=i,
-                        total_planned=len(urls),
+                        page_number=i,
+                        error=str(e),
                     )
-                    return
-
-                # Yield successful page
-                yield url, status_code, content
-
-                logger.debug(
-                    "pagination_page_crawled",
-                    url=url,
-                    page_number=i,
-                    status_code=status_code,
-                    content_size=len(content),
-                )
-
-            except Exception as e:
-                logger.error(
-                    "pagination_fetch_error",
-                    url=url,
-                    page_number=i,
-                    error=str(e),
-                )
-                # Continue to next page on error (configurable behavior)
-                # Could also stop here depending on requirements
-                continue
+                    # Continue to next page on error (configurable behavior)
+                    # Could also stop here depending on requirements
+                    continue
+        finally:
+            # Guard: never leave overshoot requests running once iteration ends
+            await self._cancel_prefetched(in_flight)
 
         logger.info(
             "pagination_crawl_completed",
@@ -257,6 +285,26 @@ class PaginationService:
             total_pages_crawled=len(urls),
         )
 
+    @staticmethod
+    async def _cancel_prefetched(in_flight: deque[asyncio.Task[tuple[int, bytes]]]) -> None:
+        """Cancel prefetched page fetches that will never be yielded.
+
+        Fetches that already completed are discarded; the rest are cancelled and
+        awaited so no request outlives the pagination crawl.
+
+        Args:
+            in_flight: Prefetch tasks, oldest first
+        """
+        # Guard: nothing prefetched (window of 1 or all pages consumed)
+        if not in_flight:
+            return
+
+        metrics.pagination_prefetch_discarded_total.inc(len(in_flight))
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        in_flight.clear()
+
     def should_use_selector_based_pagination(self, seed_url: str, config: PaginationConfig) -> bool:
         """Determine if selector-based pagination should be used.
 
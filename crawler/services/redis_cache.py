@@ -2,21 +2,27 @@
 
 Provides specialized Redis data structures for:
 - URL deduplication
-- Job cancellation flags
+- Job cancellation flags and cancellation events pushed to workers
 - Rate limiting
+- Cluster-wide per-host request pacing
 - Browser pool status tracking
 - Job progress caching
 - WebSocket authentication tokens
 """
 
+import asyncio
 import builtins
+import contextlib
 import json
 import secrets
+import time
 from typing import Any, cast
+from urllib.parse import urlparse
 
 import redis.asyncio as redis
 
 from config import Settings
+from crawler.core import metrics
 from crawler.core.logging import get_logger
 from crawler.utils import hash_url
 
@@ -85,14 +91,35 @@ class URLDeduplicationCache:
         """
         try:
             key = self._make_key(url_hash)
-            value: str | None = await self.redis.get(key)
+            value: str | bytes | None = await self.redis.get(key)
             if value:
-                return cast(dict[str, Any], json.loads(value))
+                return self._decode(value)
             return None
         except Exception as e:
             logger.error("url_dedup_get_error", url_hash=url_hash, error=str(e))
             return None
 
+    @staticmethod
+    def _decode(value: str | bytes) -> dict[str, Any]:
+        """Decode a cached value written by set() or set_batch().
+
+        Args:
+            value: JSON object from set(), or bare job ID from set_batch().
+
+        Returns:
+            Associated data dict.
+        """
+        try:
+            data = json.loads(value)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            return cast(dict[str, Any], data)
+
+        # Compact set_batch() payload: the job ID alone
+        job_id = value.decode("utf-8") if isinstance(value, bytes) else value
+        return {"job_id": job_id}
+
     async def exists(self, url_hash: str) -> bool:
         """Check if URL hash exists in cache.
 
@@ -205,6 +232,44 @@ class URLDeduplicationCache:
             logger.error("url_dedup_delete_url_error", url=url, error=str(e))
             return False
 
+    async def set_batch(self, entries: dict[str, str], ttl: int | None = None) -> int:
+        """Mark many URL hashes as seen in one pipelined round trip.
+
+        Each key is written with SET NX EX, so a hash that is already cached keeps
+        its original value and expiry. Values are compact strings (typically the
+        job ID) rather than JSON objects, which keeps Redis memory low on sites
+        with millions of URLs; get() returns them as {"job_id": value}.
+
+        Args:
+            entries: Mapping of URL hash to compact value.
+            ttl: Time to live in seconds. Defaults to settings.url_dedup_ttl (24 hours).
+
+        Returns:
+            Number of hashes newly written.
+        """
+        if not entries:
+            return 0
+
+        try:
+            ttl = ttl or self.settings.url_dedup_ttl
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for url_hash, value in entries.items():
+                    await pipe.set(self._make_key(url_hash), value, ex=ttl, nx=True)
+                results = await pipe.execute()
+
+            written = sum(1 for result in results if result)
+            logger.debug(
+                "url_dedup_batch_set",
+                hash_count=len(entries),
+                written_count=written,
+                ttl=ttl,
+            )
+            return written
+
+        except Exception as e:
+            logger.error("url_dedup_batch_set_error", hash_count=len(entries), error=str(e))
+            return 0
+
     async def exists_batch(self, url_hashes: list[str]) -> builtins.set[str]:
         """Check if multiple URL hashes exist in cache (batch operation).
 
@@ -255,7 +320,8 @@ class JobCancellationFlag:
     """Redis-based job cancellation flags.
 
     Provides fast in-memory flags for checking if a job should be cancelled.
-    Workers can poll these flags during execution.
+    Setting a flag also publishes the job ID on a pub/sub channel, so workers
+    listening through a JobCancellationRegistry learn about it without polling.
     """
 
     def __init__(self, redis_client: redis.Redis, settings: Settings) -> None:
@@ -268,6 +334,7 @@ class JobCancellationFlag:
         self.settings = settings
         self.redis = redis_client
         self.key_prefix = "job:cancel:"
+        self.channel = "job:cancel"
 
     def _make_key(self, job_id: str) -> str:
         """Create Redis key for job cancellation.
@@ -295,11 +362,17 @@ class JobCancellationFlag:
             data = {"cancelled": True, "reason": reason}
             await self.redis.setex(key, self.settings.redis_ttl, json.dumps(data))
             logger.info("job_cancellation_set", job_id=job_id, reason=reason)
-            return True
         except Exception as e:
             logger.error("job_cancellation_set_error", job_id=job_id, error=str(e))
             return False
 
+        # The flag is what counts; a worker that misses the push still finds it
+        try:
+            await self.redis.publish(self.channel, job_id)
+        except Exception as e:
+            logger.warning("job_cancellation_publish_error", job_id=job_id, error=str(e))
+        return True
+
     async def is_cancelled(self, job_id: str) -> bool:
         """Check if job is marked for cancellation.
 
@@ -357,6 +430,123 @@ class JobCancellationFlag:
             return False
 
 
+class JobCancellationRegistry:
+    """In-process registry of cancel events for the jobs a worker is running.
+
+    Subscribes to the cancellation channel of JobCancellationFlag and sets the
+    event of a registered job as soon as its cancellation is published, so
+    running jobs check an in-memory event instead of polling Redis. Flags are
+    read when a job is registered and after every (re)subscription, so a
+    cancellation published while the listener was disconnected is not lost.
+    """
+
+    # Seconds to wait before resubscribing after the connection is lost
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, cancellation_flag: JobCancellationFlag) -> None:
+        """Initialize job cancellation registry.
+
+        Args:
+            cancellation_flag: Cancellation flags whose channel is listened to.
+        """
+        self.cancellation_flag = cancellation_flag
+        self._events: dict[str, asyncio.Event] = {}
+        self._listener: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start listening for published cancellations."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+            logger.info("job_cancellation_registry_started")
+
+    async def stop(self) -> None:
+        """Stop listening for published cancellations."""
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
+        logger.info("job_cancellation_registry_stopped")
+
+    async def register(self, job_id: str) -> asyncio.Event:
+        """Register a job and get the event set when it is cancelled.
+
+        Args:
+            job_id: Job UUID.
+
+        Returns:
+            Cancel event of the job, already set if the job's flag is set.
+        """
+        event = self._events.setdefault(job_id, asyncio.Event())
+        if await self.cancellation_flag.is_cancelled(job_id):
+            event.set()
+        return event
+
+    def unregister(self, job_id: str) -> None:
+        """Stop tracking a job once it finished.
+
+        Args:
+            job_id: Job UUID.
+        """
+        self._events.pop(job_id, None)
+
+    def get_event(self, job_id: str) -> asyncio.Event | None:
+        """Get the cancel event of a registered job.
+
+        Args:
+            job_id: Job UUID.
+
+        Returns:
+            Cancel event, or None if the job is not registered.
+        """
+        return self._events.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Set the cancel event of a registered job.
+
+        Args:
+            job_id: Job UUID.
+
+        Returns:
+            True if the job runs in this process, False otherwise.
+        """
+        event = self._events.get(job_id)
+        if event is None:
+            return False
+        if not event.is_set():
+            event.set()
+            logger.info("job_cancellation_received", job_id=job_id)
+        return True
+
+    async def _listen(self) -> None:
+        """Forward published cancellations to registered jobs, resubscribing on errors."""
+        while True:
+            pubsub = self.cancellation_flag.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.cancellation_flag.channel)
+                await self._sync_flags()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    job_id = message["data"]
+                    self.cancel(job_id.decode() if isinstance(job_id, bytes) else str(job_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("job_cancellation_listener_error", error=str(e))
+            finally:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()  # type: ignore[attr-defined]
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def _sync_flags(self) -> None:
+        """Set the events of registered jobs whose flag was set while not subscribed."""
+        for job_id in list(self._events):
+            if await self.cancellation_flag.is_cancelled(job_id):
+                self.cancel(job_id)
+
+
 class RateLimiter:
     """Redis-based rate limiter using sliding window.
 
@@ -463,6 +653,167 @@ class RateLimiter:
             return False
 
 
+class HostRateLimiter:
+    """Cluster-wide per-host request pacing backed by Redis.
+
+    Implements the generic cell rate algorithm (GCRA): each host key stores its
+    theoretical arrival time (TAT), and one atomic Lua call grants up to a lease of
+    request slots at once. Every worker shares the same TAT, so concurrent jobs and
+    worker pods hitting a host together stay within its requests_per_second.
+
+    Granted slots are leased locally and spent without further round trips. A
+    lease expires after the time its slots represent, so an idle worker never
+    hoards budget for a later burst. Hosts with an expired lease and no request
+    in progress are forgotten, so crawling many hosts does not grow memory. If
+    Redis is unavailable, requests proceed and only the per-job LocalRateLimiter
+    applies.
+    """
+
+    # Seconds between sweeps for expired leases
+    PRUNE_INTERVAL = 60.0
+
+    # KEYS[1] = host key
+    # ARGV = emission interval (ms), burst, slots requested
+    # Returns {slots granted, ms to wait before retrying (as string)}
+    GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local granted = math.min(requested, math.floor((now + burst * interval - tat) / interval))
+if granted <= 0 then
+    return {0, tostring(tat + interval - now - burst * interval)}
+end
+tat = tat + granted * interval
+redis.call('SET', KEYS[1], tostring(tat), 'PX', math.ceil(tat - now) + 1000)
+return {granted, '0'}
+"""
+
+    def __init__(self, redis_client: redis.Redis, settings: Settings) -> None:
+        """Initialize host rate limiter.
+
+        Args:
+            redis_client: Redis client from connection pool.
+            settings: Application settings.
+        """
+        self.settings = settings
+        self.redis = redis_client
+        self.key_prefix = "politeness:host:"
+        self.lease_size = max(1, settings.host_rate_limit_lease_size)
+        self._script = redis_client.register_script(self.GCRA_SCRIPT)
+        # host -> (leased slots, monotonic expiry)
+        self._leases: dict[str, tuple[int, float]] = {}
+        # host -> lock and number of requests holding or waiting for it
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: dict[str, int] = {}
+        self._next_prune = 0.0
+
+    def _make_key(self, host: str) -> str:
+        """Create Redis key for a host's theoretical arrival time.
+
+        Args:
+            host: Lowercase host name.
+
+        Returns:
+            Redis key string.
+        """
+        return f"{self.key_prefix}{host}"
+
+    async def acquire(
+        self,
+        url: str,
+        requests_per_second: float | None = None,
+        burst: int | None = None,
+    ) -> float:
+        """Wait until a request to the URL's host is allowed cluster-wide.
+
+        Args:
+            url: URL about to be requested.
+            requests_per_second: Host request rate (default: settings).
+            burst: Requests allowed back to back (default: settings).
+
+        Returns:
+            Seconds spent waiting.
+        """
+        host = (urlparse(url).hostname or "").lower()
+
+        # Guard: nothing to pace without a host
+        if not host:
+            return 0.0
+
+        rate = requests_per_second or self.settings.host_requests_per_second
+        burst = burst or self.settings.host_rate_limit_burst
+        interval = 1.0 / rate
+        lease_size = min(self.lease_size, burst)
+
+        started = time.monotonic()
+        self._prune_leases(started)
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        self._lock_users[host] = self._lock_users.get(host, 0) + 1
+        try:
+            async with lock:
+                while True:
+                    # Spend a leased slot without a round trip
+                    slots, expires_at = self._leases.get(host, (0, 0.0))
+                    if slots > 0 and time.monotonic() < expires_at:
+                        self._leases[host] = (slots - 1, expires_at)
+                        break
+
+                    try:
+                        granted, retry_ms = await self._script(
+                            keys=[self._make_key(host)],
+                            args=[interval * 1000, burst, lease_size],
+                        )
+                    except Exception as e:
+                        logger.warning("host_rate_limit_unavailable", host=host, error=str(e))
+                        break
+
+                    if int(granted) > 0:
+                        self._leases[host] = (
+                            int(granted) - 1,
+                            time.monotonic() + int(granted) * interval,
+                        )
+                        break
+
+                    await asyncio.sleep(max(float(retry_ms), 1.0) / 1000)
+        finally:
+            # Drop the lock once no request holds or waits for it
+            self._lock_users[host] -= 1
+            if not self._lock_users[host]:
+                del self._lock_users[host]
+                del self._locks[host]
+
+        waited = time.monotonic() - started
+        metrics.host_rate_limit_wait_seconds.observe(waited)
+        if waited >= interval:
+            logger.debug("host_rate_limit_waited", host=host, wait_seconds=round(waited, 3))
+        return waited
+
+    def _prune_leases(self, now: float) -> None:
+        """Forget expired leases of hosts no request is using, at most once per interval.
+
+        Args:
+            now: Current monotonic time.
+        """
+        # Guard: swept recently
+        if now < self._next_prune:
+            return
+
+        self._next_prune = now + self.PRUNE_INTERVAL
+        expired = [
+            host
+            for host, (_, expires_at) in self._leases.items()
+            if expires_at <= now and host not in self._lock_users
+        ]
+        for host in expired:
+            del self._leases[host]
+
+
 class BrowserPoolStatus:
     """Redis-based browser pool status tracking.
 
@@ -692,6 +1043,43 @@ class LogBuffer:
             logger.error("log_buffer_add_error", job_id=job_id, log_id=log_id, error=str(e))
             return False
 
+    async def add_logs(self, entries: list[tuple[str, int, dict[str, Any]]]) -> bool:
+        """Add a batch of logs to the buffers of their jobs in one pipeline.
+
+        Each job's buffer is trimmed and its expiry reset once per batch instead
+        of once per log.
+
+        Args:
+            entries: (job_id, log_id, log_data) tuples, as passed to add_log().
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        # Guard: empty batch
+        if not entries:
+            return True
+
+        # Sorted set members of each job, scored by log ID
+        members: dict[str, dict[str | bytes, float]] = {}
+        for job_id, log_id, log_data in entries:
+            members.setdefault(job_id, {})[json.dumps(log_data)] = log_id
+
+        try:
+            async with self.redis.pipeline() as pipe:
+                for job_id, mapping in members.items():
+                    key = self._make_key(job_id)
+                    await pipe.zadd(key, mapping)
+                    await pipe.zremrangebyrank(key, 0, -self.max_buffer_size - 1)
+                    await pipe.expire(key, self.buffer_ttl)
+                await pipe.execute()
+
+            logger.debug("log_buffer_batch_added", jobs=len(members), logs=len(entries))
+            return True
+
+        except Exception as e:
+            logger.error("log_buffer_batch_add_error", logs=len(entries), error=str(e))
+            return False
+
     async def get_logs_after_id(self, job_id: str, after_log_id: int) -> list[dict[str, Any]]:
         """Get buffered logs after a specific log ID using sorted set range query.
 
@@ -11,6 +11,7 @@ browser contexts, etc.) when a crawl job is cancelled. It implements:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
@@ -165,6 +166,23 @@ class BrowserResourceManager(ResourceManager):
         self.contexts = contexts or []
         self._closing = False
 
+    def add(self, context: Any) -> None:
+        """Track a browser context or page while it is open.
+
+        Args:
+            context: Browser context or page
+        """
+        self.contexts.append(context)
+
+    def discard(self, context: Any) -> None:
+        """Stop tracking a browser context or page once it is closed.
+
+        Args:
+            context: Browser context or page
+        """
+        with contextlib.suppress(ValueError):
+            self.contexts.remove(context)
+
     async def close_gracefully(self, timeout_seconds: float = 5.0) -> bool:
         """Close all browser contexts gracefully.
 
@@ -202,7 +220,7 @@ class BrowserResourceManager(ResourceManager):
         try:
             logger.warning("browser_resource_force_close", count=len(self.contexts))
             # Force close all contexts without waiting
-            for ctx in self.contexts:
+            for ctx in list(self.contexts):
                 try:
                     await self._close_context(ctx)
                 except Exception as e:
@@ -0,0 +1,345 @@
+"""Request interception for browser steps.
+
+Browser steps only read the rendered HTML, so images, fonts, media and
+third-party trackers are downloaded for nothing. A ResourcePolicy routes each
+page request through Playwright and aborts the ones the step does not need.
+A StaticAssetCache shared by the browser pool serves repeated stylesheets and
+scripts to every context without going back to the network.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from crawler.core.logging import get_logger
+from crawler.core.metrics import browser_bytes_saved_total, browser_requests_blocked_total
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Route
+
+logger = get_logger(__name__)
+
+# Resource types blocked when a policy does not list its own
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Resource types whose responses are the same for every page and safe to share
+CACHEABLE_RESOURCE_TYPES = frozenset({"stylesheet", "script", "font", "image"})
+
+# Cache-Control directives that forbid serving a stored response to another context
+UNSHAREABLE_DIRECTIVES = frozenset({"no-store", "no-cache", "private"})
+
+# Request headers that carry credentials; such responses may be user specific
+CREDENTIAL_HEADERS = ("cookie", "authorization")
+
+# Second-level labels under country TLDs that registries sell names beneath
+# (example.go.id, example.co.uk), so the site is the last three labels
+SECOND_LEVEL_LABELS = frozenset(
+    {"ac", "biz", "co", "com", "edu", "go", "gov", "mil", "my", "net", "or", "org", "sch", "web"}
+)
+
+
+def site_of(url: str) -> str:
+    """Get the registrable site of a URL, used to tell first from third parties.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Lowercase site such as "example.com" or "example.go.id", or "" if the URL has no host
+    """
+    host = (urlparse(url).hostname or "").rstrip(".")
+    labels = host.split(".")
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_LABELS:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def freshness_lifetime(headers: dict[str, str]) -> float | None:
+    """Get how long a response may be served from a shared cache.
+
+    s-maxage takes precedence over max-age, which takes precedence over Expires
+    (relative to the Date header). The Age header is subtracted.
+
+    Args:
+        headers: Response headers (lowercase names)
+
+    Returns:
+        Seconds the response stays fresh, or None if it must not be shared or
+        declares no explicit lifetime
+    """
+    directives: dict[str, str] = {}
+    for directive in headers.get("cache-control", "").lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name] = value.strip('"')
+    if UNSHAREABLE_DIRECTIVES & directives.keys():
+        return None
+
+    # Vary: * never matches, and Vary: Cookie is different for every user
+    vary = {field.strip().lower() for field in headers.get("vary", "").split(",")}
+    if "*" in vary or "cookie" in vary or "set-cookie" in headers:
+        return None
+
+    lifetime: float
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                lifetime = int(directives[name])
+            except ValueError:
+                return None
+            break
+    else:
+        if "expires" not in headers:
+            return None
+        try:
+            expires = parsedate_to_datetime(headers["expires"])
+            date = (
+                parsedate_to_datetime(headers["date"]) if "date" in headers else datetime.now(UTC)
+            )
+            lifetime = (expires - date).total_seconds()
+        except (TypeError, ValueError):
+            # Invalid dates mean the response is already expired
+            return None
+
+    try:
+        age = float(headers.get("age", 0))
+    except ValueError:
+        age = 0.0
+    return lifetime - age
+
+
+class StaticAssetCache:
+    """In-memory LRU cache of static responses shared across browser contexts.
+
+    Contexts are isolated, so each one would otherwise download the same
+    stylesheets and scripts again. Only successful GET responses that the
+    server allows a shared cache to store, with an explicit lifetime (see
+    freshness_lifetime), are cached, bounded by total body size. Entries are
+    dropped once they expire.
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initialize static asset cache.
+
+        Args:
+            max_bytes: Maximum total size of cached bodies (0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        # A single entry may use at most a tenth of the cache
+        self.max_entry_bytes = max_bytes // 10
+        # url -> (expires at on the monotonic clock, status, headers, body)
+        self._entries: OrderedDict[str, tuple[float, int, dict[str, str], bytes]] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def get(self, url: str) -> tuple[int, dict[str, str], bytes] | None:
+        """Get a cached response and record the hit or miss.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Tuple of (status, headers, body), or None if not cached or stale
+        """
+        entry = self._entries.get(url)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._entries[url]
+            self._size -= len(entry[3])
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        _expires_at, status, headers, body = entry
+        self._entries.move_to_end(url)
+        self.hits += 1
+        self.bytes_saved += len(body)
+        browser_bytes_saved_total.inc(len(body))
+        return status, headers, body
+
+    def put(self, url: str, status: int, headers: dict[str, str], body: bytes) -> None:
+        """Cache a response if it is storable, evicting least recently used entries.
+
+        Args:
+            url: Request URL
+            status: Response status code
+            headers: Response headers (lowercase names)
+            body: Response body
+        """
+        # Guard: only complete responses that fit
+        if status != 200 or len(body) > self.max_entry_bytes:
+            return
+
+        # Guard: only shareable responses that stay fresh for a while
+        lifetime = freshness_lifetime(headers)
+        if lifetime is None or lifetime <= 0:
+            return
+
+        previous = self._entries.pop(url, None)
+        if previous is not None:
+            self._size -= len(previous[3])
+
+        self._entries[url] = (time.monotonic() + lifetime, status, headers, body)
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, (_, _, _, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+        self._size = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with entries, size_bytes, hits, misses and bytes_saved
+        """
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """Which subresource requests a browser step lets through.
+
+    Navigation requests are never blocked, so redirects and the page itself
+    always load.
+
+    Attributes:
+        block_resource_types: Playwright resource types to abort (image, font, ...)
+        block_url_patterns: Glob patterns matched against the full request URL
+        block_third_party: Abort requests to sites other than the step URL's site
+        cache_static: Serve cacheable static assets from the shared cache
+    """
+
+    block_resource_types: frozenset[str] = DEFAULT_BLOCKED_RESOURCE_TYPES
+    block_url_patterns: tuple[str, ...] = ()
+    block_third_party: bool = False
+    cache_static: bool = True
+
+    @classmethod
+    def from_config(cls, policy_config: dict[str, Any] | None) -> ResourcePolicy | None:
+        """Create policy from a step's resource_policy dict.
+
+        Args:
+            policy_config: StepConfig.resource_policy dictionary or None
+
+        Returns:
+            ResourcePolicy, or None if the step does not intercept requests
+
+        Example:
+            >>> config = {"block_resource_types": ["image"], "block_third_party": True}
+            >>> policy = ResourcePolicy.from_config(config)
+        """
+        if policy_config is None or not isinstance(policy_config, dict):
+            return None
+
+        return cls(
+            block_resource_types=frozenset(
+                policy_config.get("block_resource_types", DEFAULT_BLOCKED_RESOURCE_TYPES)
+            ),
+            block_url_patterns=tuple(policy_config.get("block_url_patterns", ())),
+            block_third_party=policy_config.get("block_third_party", False),
+            cache_static=policy_config.get("cache_static", True),
+        )
+
+    def block_reason(
+        self, url: str, resource_type: str, is_navigation: bool, page_site: str
+    ) -> str | None:
+        """Decide whether a request is blocked.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type of the request
+            is_navigation: Whether the request navigates a frame
+            page_site: Site of the step URL (see site_of)
+
+        Returns:
+            Reason label for the blocked metric, or None to let the request through
+        """
+        if is_navigation:
+            return None
+        if resource_type in self.block_resource_types:
+            return "resource_type"
+        if any(fnmatch.fnmatchcase(url, pattern) for pattern in self.block_url_patterns):
+            return "url_pattern"
+        if self.block_third_party and site_of(url) != page_site:
+            return "third_party"
+        return None
+
+    async def apply(self, page: Page, url: str, cache: StaticAssetCache | None = None) -> None:
+        """Route every request of a page through this policy.
+
+        The route is installed on the page, so it goes away when the page closes
+        and never leaks into the next user of a reused context.
+
+        Args:
+            page: Page about to navigate
+            url: Step URL the page navigates to, defining the first party
+            cache: Shared static asset cache (ignored if cache_static is False)
+        """
+        page_site = site_of(url)
+        static_cache = cache if self.cache_static and cache and cache.max_bytes > 0 else None
+
+        async def handle(route: Route) -> None:
+            request = route.request
+            reason = self.block_reason(
+                request.url, request.resource_type, request.is_navigation_request(), page_site
+            )
+            if reason is not None:
+                browser_requests_blocked_total.labels(reason=reason).inc()
+                await route.abort("blockedbyclient")
+                return
+
+            # Guard: only shareable static GETs go through the cache
+            if (
+                static_cache is None
+                or request.method != "GET"
+                or request.resource_type not in CACHEABLE_RESOURCE_TYPES
+            ):
+                await route.continue_()
+                return
+
+            # Guard: credentialed requests may get user-specific responses
+            # (all_headers includes the cookies the browser attaches)
+            request_headers = await request.all_headers()
+            if any(name in request_headers for name in CREDENTIAL_HEADERS):
+                await route.continue_()
+                return
+
+            cached = static_cache.get(request.url)
+            if cached is not None:
+                status, headers, body = cached
+                await route.fulfill(status=status, headers=headers, body=body)
+                return
+
+            try:
+                response = await route.fetch()
+                body = await response.body()
+            except Exception as e:
+                # Let the browser make the request itself and report its own error
+                logger.debug("static_asset_fetch_failed", url=request.url, error=str(e))
+                with contextlib.suppress(Exception):
+                    await route.continue_()
+                return
+
+            static_cache.put(request.url, response.status, response.headers, body)
+            await route.fulfill(response=response, body=body)
+
+        await page.route("**/*", handle)
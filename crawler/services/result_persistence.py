@@ -6,40 +6,113 @@ after successful workflow execution.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from crawler.core import metrics
 from crawler.core.logging import get_logger
 from crawler.db.repositories import ContentHashRepository, CrawledPageRepository
 from crawler.services.content_normalizer import ContentNormalizer
-from crawler.utils.simhash import Simhash
+from crawler.services.page_validators import VALIDATOR_FIELDS, PageValidators
+from crawler.utils.simhash import fingerprint_many
+from crawler.utils.simhash_helpers import MAX_BANDED_DISTANCE, simhash_bands
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from sqlalchemy.ext.asyncio import AsyncConnection
 
     from crawler.services.step_execution_context import StepExecutionContext
+    from crawler.services.storage import StorageService
 
 logger = get_logger(__name__)
 
 # Simhash uses 64-bit fingerprints
 SIMHASH_BITS = 64
 
+# Hamming distance treated as a fuzzy duplicate (approx 95% similarity)
+FUZZY_MAX_DISTANCE = MAX_BANDED_DISTANCE
+
+# Pages written per bulk statement; bounds parameter array size and the work
+# redone page by page when a chunk fails
+BULK_CHUNK_SIZE = 500
+
+
+def hash_content(content: str | dict[str, Any] | None) -> str:
+    """Generate SHA256 hash of page content, as stored in crawled_page.content_hash.
+
+    Args:
+        content: Content to hash (HTML string or JSON dict)
+
+    Returns:
+        Hex digest of SHA256 hash
+    """
+    if content is None:
+        # Use empty string hash for None content
+        content_str = ""
+    elif isinstance(content, dict):
+        # For dict content, serialize to JSON
+        content_str = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    else:
+        # For string content, use as-is
+        content_str = str(content)
+
+    return hashlib.sha256(content_str.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _PreparedPage:
+    """Page data with hashes and fingerprint computed, ready to be written.
+
+    Attributes:
+        url: Page URL
+        url_hash: SHA256 hash of the URL
+        content_hash: SHA256 hash of the raw content
+        simhash_fingerprint: 64-bit Simhash of the normalized content, if any
+        title: Page title, if extracted
+        extracted_json: Extracted fields serialized to JSON
+        field_count: Number of extracted fields
+        metadata: Response validators (ETag, Last-Modified), if any
+        html: Raw HTML to upload to object storage, if any
+        html_path: Storage key of HTML uploaded before the page reached persistence
+    """
+
+    url: str
+    url_hash: str
+    content_hash: str
+    simhash_fingerprint: int | None
+    title: str | None
+    extracted_json: str
+    field_count: int
+    metadata: dict[str, str] | None = None
+    html: str | None = None
+    html_path: str | None = None
+
 
 class ResultPersistenceService:
     """Service for persisting crawl results to database."""
 
-    def __init__(self, conn: AsyncConnection):
+    def __init__(self, conn: AsyncConnection, storage: StorageService | None = None):
         """Initialize result persistence service.
 
         Args:
             conn: Database connection
+            storage: Optional object storage for raw HTML. When set, each page's HTML
+                is uploaded under its content hash and the key saved as gcs_html_path.
         """
         self.conn = conn
+        self.storage = storage
         self.page_repo = CrawledPageRepository(conn)
         self.content_hash_repo = ContentHashRepository(conn)
         self.normalizer = ContentNormalizer()
+        # Serializes use of the connection between page writes and validator lookups,
+        # which run concurrently while pages are streamed
+        self._conn_lock = asyncio.Lock()
 
     async def persist_workflow_results(
         self,
@@ -73,6 +146,11 @@ class ResultPersistenceService:
                 logger.debug("persist_skipping_failed_step", step_name=step_name)
                 continue
 
+            # Guard: skip steps whose pages were persisted while scraping
+            if step_result.metadata.get("streamed"):
+                logger.debug("persist_skipping_streamed_step", step_name=step_name)
+                continue
+
             # Extract pages from step result
             try:
                 pages = self._extract_pages_from_step(step_name, step_result.extracted_data)
@@ -87,23 +165,11 @@ class ResultPersistenceService:
                     page_count=len(pages),
                 )
 
-                # Save each page
-                for page_data in pages:
-                    try:
-                        await self._save_page(
-                            job_id=job_id,
-                            website_id=website_id,
-                            page_data=page_data,
-                        )
-                        pages_saved += 1
-                    except Exception as e:
-                        pages_failed += 1
-                        logger.error(
-                            "persist_page_failed",
-                            url=page_data.get("_url", "unknown"),
-                            error=str(e),
-                            exc_info=True,
-                        )
+                saved, failed = await self.persist_pages(
+                    job_id=job_id, website_id=website_id, pages=pages
+                )
+                pages_saved += saved
+                pages_failed += failed
 
             except Exception as e:
                 logger.error(
@@ -123,6 +189,312 @@ class ResultPersistenceService:
 
         return {"pages_saved": pages_saved, "pages_failed": pages_failed}
 
+    async def persist_pages(
+        self,
+        job_id: str,
+        website_id: str,
+        pages: list[dict[str, Any]],
+    ) -> tuple[int, int]:
+        """Persist scraped pages in bulk chunks.
+
+        Args:
+            job_id: Job ID
+            website_id: Website ID
+            pages: Page data dictionaries with _url field
+
+        Returns:
+            Tuple of (pages_saved, pages_failed)
+        """
+        pages_saved = 0
+        pages_failed = 0
+
+        for start in range(0, len(pages), BULK_CHUNK_SIZE):
+            chunk = pages[start : start + BULK_CHUNK_SIZE]
+            async with self._conn_lock:
+                with metrics.observe_stage("persist", *(page.get("_url") for page in chunk)):
+                    saved, failed = await self._persist_chunk(
+                        job_id=job_id, website_id=website_id, pages=chunk
+                    )
+            pages_saved += saved
+            pages_failed += failed
+
+        return pages_saved, pages_failed
+
+    async def get_page_validators(
+        self, website_id: str, urls: list[str]
+    ) -> dict[str, PageValidators]:
+        """Look up the validators saved with earlier crawls of URLs.
+
+        Args:
+            website_id: Website ID
+            urls: URLs about to be crawled
+
+        Returns:
+            Validators per URL. URLs never saved for the website are omitted.
+        """
+        url_hashes = {self._hash_url(url): url for url in urls}
+        validators: dict[str, PageValidators] = {}
+
+        hashes = list(url_hashes)
+        for start in range(0, len(hashes), BULK_CHUNK_SIZE):
+            async with self._conn_lock:
+                rows = await self.page_repo.get_validators(
+                    website_id, hashes[start : start + BULK_CHUNK_SIZE]
+                )
+            for row in rows:
+                validators[url_hashes[row.url_hash]] = PageValidators(
+                    content_hash=row.content_hash,
+                    etag=row.etag,
+                    last_modified=row.last_modified,
+                )
+
+        logger.debug(
+            "page_validators_loaded",
+            website_id=website_id,
+            url_count=len(url_hashes),
+            known_urls=len(validators),
+        )
+        return validators
+
+    async def _persist_chunk(
+        self,
+        job_id: str,
+        website_id: str,
+        pages: list[dict[str, Any]],
+    ) -> tuple[int, int]:
+        """Persist a chunk of pages, falling back to page-by-page saves on failure.
+
+        The bulk write runs in a savepoint so a failed chunk leaves the transaction
+        usable. Each page is then retried in its own savepoint, so one bad page only
+        loses itself.
+
+        Args:
+            job_id: Job ID
+            website_id: Website ID
+            pages: Page data dictionaries with _url field
+
+        Returns:
+            Tuple of (pages_saved, pages_failed)
+        """
+        try:
+            async with self.conn.begin_nested():
+                await self._save_pages_bulk(job_id=job_id, website_id=website_id, pages=pages)
+            return len(pages), 0
+        except Exception as e:
+            logger.warning(
+                "persist_bulk_chunk_failed",
+                page_count=len(pages),
+                error=str(e),
+            )
+
+        pages_saved = 0
+        pages_failed = 0
+        for page_data in pages:
+            try:
+                async with self.conn.begin_nested():
+                    await self._save_page(
+                        job_id=job_id,
+                        website_id=website_id,
+                        page_data=page_data,
+                    )
+                pages_saved += 1
+            except Exception as e:
+                pages_failed += 1
+                logger.error(
+                    "persist_page_failed",
+                    url=page_data.get("_url", "unknown"),
+                    error=str(e),
+                    exc_info=True,
+                )
+
+        return pages_saved, pages_failed
+
+    async def _save_pages_bulk(
+        self,
+        job_id: str,
+        website_id: str,
+        pages: list[dict[str, Any]],
+    ) -> None:
+        """Save a chunk of pages with set-based duplicate detection.
+
+        Produces the same rows as calling _save_page for each page in order, using
+        a fixed number of statements per chunk instead of several per page.
+
+        Args:
+            job_id: Job ID
+            website_id: Website ID
+            pages: Page data dictionaries with _url field
+        """
+        # Later pages with the same URL overwrite earlier ones, as sequential upserts would
+        by_url_hash: dict[str, _PreparedPage] = {}
+        for prepared in self._prepare_pages(pages):
+            if prepared:
+                by_url_hash[prepared.url_hash] = prepared
+        prepared_pages = list(by_url_hash.values())
+
+        if not prepared_pages:
+            return
+
+        with metrics.observe_stage("dedup_lookup", *(page.url for page in prepared_pages)):
+            # Step 1: Exact duplicates already in the database
+            content_hashes = list(dict.fromkeys(page.content_hash for page in prepared_pages))
+            first_page_ids = await self.page_repo.get_first_by_content_hashes(content_hashes)
+
+            # Step 1.5: Fuzzy duplicates already in the database, for pages without exact match
+            fingerprints = list(
+                dict.fromkeys(
+                    page.simhash_fingerprint
+                    for page in prepared_pages
+                    if page.simhash_fingerprint is not None
+                    and page.content_hash not in first_page_ids
+                )
+            )
+            fuzzy_matches = (
+                await self.content_hash_repo.find_similar_batch(
+                    target_fingerprints=fingerprints,
+                    max_distance=FUZZY_MAX_DISTANCE,
+                )
+                if fingerprints
+                else {}
+            )
+            fuzzy_hashes = [
+                match.content_hash
+                for match in fuzzy_matches.values()
+                if match.content_hash not in first_page_ids
+            ]
+            if fuzzy_hashes:
+                first_page_ids.update(
+                    await self.page_repo.get_first_by_content_hashes(
+                        list(dict.fromkeys(fuzzy_hashes))
+                    )
+                )
+
+        # Step 2: Upload raw HTML before the rows that reference it
+        html_paths = await self._store_html(prepared_pages)
+
+        # Step 3: Save all pages (ON CONFLICT handles same URL gracefully)
+        page_ids = await self.page_repo.bulk_upsert(
+            website_id=website_id,
+            job_id=job_id,
+            crawled_at=datetime.now(UTC),
+            urls=[page.url for page in prepared_pages],
+            url_hashes=[page.url_hash for page in prepared_pages],
+            content_hashes=[page.content_hash for page in prepared_pages],
+            titles=[page.title for page in prepared_pages],
+            extracted_contents=[page.extracted_json for page in prepared_pages],
+            gcs_html_paths=[
+                html_paths.get(page.content_hash, page.html_path) for page in prepared_pages
+            ],
+            metadatas=[
+                json.dumps(page.metadata) if page.metadata else None for page in prepared_pages
+            ],
+        )
+
+        # Step 4: Resolve duplicates, including against earlier pages of this chunk
+        duplicate_page_ids: list[UUID] = []
+        duplicate_of_ids: list[UUID] = []
+        similarity_scores: list[int] = []
+        chunk_pages_by_hash: dict[str, UUID] = {}
+        chunk_bands: dict[tuple[int, int], list[tuple[int, UUID]]] = defaultdict(list)
+
+        for page in prepared_pages:
+            page_id = page_ids[page.url_hash]
+            duplicate_of: UUID | None = None
+            similarity_score = 100  # Exact match
+
+            if page.content_hash in first_page_ids:
+                duplicate_of = first_page_ids[page.content_hash]
+            elif page.content_hash in chunk_pages_by_hash:
+                duplicate_of = chunk_pages_by_hash[page.content_hash]
+            elif page.simhash_fingerprint is not None:
+                fuzzy = self._closest_fuzzy_match(
+                    page.simhash_fingerprint, fuzzy_matches, first_page_ids, chunk_bands
+                )
+                if fuzzy:
+                    duplicate_of, distance = fuzzy
+                    similarity_score = self._similarity_score(distance)
+
+            # A re-crawled URL can match its own earlier version
+            if duplicate_of is not None and duplicate_of != page_id:
+                duplicate_page_ids.append(page_id)
+                duplicate_of_ids.append(duplicate_of)
+                similarity_scores.append(similarity_score)
+                logger.debug(
+                    "page_duplicate_detected",
+                    url=page.url,
+                    duplicate_of=str(duplicate_of),
+                    similarity_score=similarity_score,
+                )
+
+            chunk_pages_by_hash.setdefault(page.content_hash, page_id)
+            if page.simhash_fingerprint is not None:
+                for band in enumerate(simhash_bands(page.simhash_fingerprint)):
+                    chunk_bands[band].append((page.simhash_fingerprint, page_id))
+
+        # Step 5: Upsert content hashes with Simhash fingerprints
+        occurrence_counts: dict[str, int] = defaultdict(int)
+        hash_fingerprints: dict[str, int | None] = {}
+        for page in prepared_pages:
+            occurrence_counts[page.content_hash] += 1
+            if hash_fingerprints.get(page.content_hash) is None:
+                hash_fingerprints[page.content_hash] = page.simhash_fingerprint
+
+        await self.content_hash_repo.bulk_upsert(
+            content_hashes=list(occurrence_counts),
+            first_seen_page_ids=[chunk_pages_by_hash[value] for value in occurrence_counts],
+            occurrence_counts=list(occurrence_counts.values()),
+            simhash_fingerprints=[hash_fingerprints[value] for value in occurrence_counts],
+        )
+
+        # Step 6: Mark duplicates
+        if duplicate_page_ids:
+            await self.page_repo.bulk_mark_as_duplicate(
+                page_ids=duplicate_page_ids,
+                duplicate_of_ids=duplicate_of_ids,
+                similarity_scores=similarity_scores,
+            )
+
+        logger.info(
+            "persist_chunk_saved",
+            page_count=len(prepared_pages),
+            duplicate_count=len(duplicate_page_ids),
+        )
+
+    def _closest_fuzzy_match(
+        self,
+        fingerprint: int,
+        db_matches: dict[int, Any],
+        first_page_ids: dict[str, UUID],
+        chunk_bands: dict[tuple[int, int], list[tuple[int, UUID]]],
+    ) -> tuple[UUID, int] | None:
+        """Find the closest near-duplicate page for a fingerprint.
+
+        Considers the database match from find_similar_batch and earlier pages of
+        the current chunk, which are not visible to that query yet.
+
+        Args:
+            fingerprint: Simhash fingerprint of the page
+            db_matches: Closest database match per fingerprint
+            first_page_ids: Page ID per known content hash
+            chunk_bands: Earlier chunk pages indexed by (band number, band value)
+
+        Returns:
+            Tuple of (page ID, Hamming distance), or None if nothing is close enough
+        """
+        best: tuple[UUID, int] | None = None
+
+        db_match = db_matches.get(fingerprint)
+        if db_match and db_match.content_hash in first_page_ids:
+            best = (first_page_ids[db_match.content_hash], int(db_match.hamming_distance))
+
+        for band in enumerate(simhash_bands(fingerprint)):
+            for candidate, page_id in chunk_bands.get(band, ()):
+                distance = (fingerprint ^ candidate).bit_count()
+                if distance <= FUZZY_MAX_DISTANCE and (best is None or distance < best[1]):
+                    best = (page_id, distance)
+
+        return best
+
     def _extract_pages_from_step(
         self, step_name: str, extracted_data: dict[str, Any] | None
     ) -> list[dict[str, Any]]:
@@ -176,39 +548,13 @@ class ResultPersistenceService:
             website_id: Website ID
             page_data: Page data with _url and extracted fields
         """
-        # Extract URL and content
-        url = page_data.get("_url")
-        content = page_data.get("_content")
-
-        if not url:
-            logger.warning("save_page_missing_url", page_data_keys=list(page_data.keys()))
+        page = self._prepare_pages([page_data])[0]
+        if not page:
             return
 
-        # Remove internal fields before storing
-        extracted_data = {k: v for k, v in page_data.items() if not k.startswith("_")}
-
-        # Generate hashes
-        url_hash = self._hash_url(url)
-        content_hash = self._hash_content(content)
-
-        # Generate Simhash fingerprint if content is available
-        simhash_fingerprint = None
-        if content:
-            try:
-                # Normalize content for hashing
-                normalized_content = self.normalizer.normalize_for_hash(content)
-                if normalized_content:
-                    # Generate fingerprint
-                    simhash = Simhash(normalized_content)
-                    simhash_fingerprint = simhash.fingerprint
-            except Exception as e:
-                logger.warning("simhash_generation_failed", url=url, error=str(e))
-
-        # Extract title if present
-        title = extracted_data.get("title")
-
-        # Serialize extracted data to JSON string
-        extracted_json = json.dumps(extracted_data, ensure_ascii=False)
+        url = page.url
+        content_hash = page.content_hash
+        simhash_fingerprint = page.simhash_fingerprint
 
         # Step 1: Check if content is duplicate (by content_hash)
         duplicate_of = None
@@ -232,7 +578,7 @@ class ResultPersistenceService:
             # Find similar content within Hamming distance of 3 (approx 95% similarity)
             similar_content = await self.content_hash_repo.find_similar(
                 target_fingerprint=simhash_fingerprint,
-                max_distance=3,
+                max_distance=FUZZY_MAX_DISTANCE,
                 limit=1,
             )
 
@@ -248,12 +594,8 @@ class ResultPersistenceService:
                 if similar_page:
                     duplicate_of = str(similar_page.id)
 
-                    # Calculate similarity score: (1 - distance/SIMHASH_BITS) * 100
-                    # distance is Hamming distance between 64-bit fingerprints
                     distance = match.hamming_distance
-                    raw_score = (1 - distance / SIMHASH_BITS) * 100
-                    # Clamp score to [0, 100] to guard against unexpected distances
-                    similarity_score = max(0, min(100, int(raw_score)))
+                    similarity_score = self._similarity_score(distance)
 
                     logger.info(
                         "page_duplicate_detected_fuzzy",
@@ -263,18 +605,19 @@ class ResultPersistenceService:
                         similarity_score=similarity_score,
                     )
 
-        # Step 2: Save to database (ON CONFLICT handles same URL gracefully)
+        # Step 2: Upload raw HTML, then save to database (ON CONFLICT handles same URL)
+        html_paths = await self._store_html([page])
         saved_page = await self.page_repo.create(
             website_id=website_id,
             job_id=job_id,
             url=url,
-            url_hash=url_hash,
+            url_hash=page.url_hash,
             content_hash=content_hash,
             crawled_at=datetime.now(UTC),
-            title=str(title) if title else None,
-            extracted_content=extracted_json,
-            metadata=None,  # Can be extended later
-            gcs_html_path=None,  # Can be extended for GCS storage
+            title=page.title,
+            extracted_content=page.extracted_json,
+            metadata=page.metadata,
+            gcs_html_path=html_paths.get(content_hash, page.html_path),
             gcs_documents=None,
         )
 
@@ -311,7 +654,147 @@ class ResultPersistenceService:
                 similarity_score=similarity_score,
             )
         else:
-            logger.debug("page_saved", url=url, extracted_fields=len(extracted_data))
+            logger.debug("page_saved", url=url, extracted_fields=page.field_count)
+
+    def _prepare_pages(self, pages: list[dict[str, Any]]) -> list[_PreparedPage | None]:
+        """Compute hashes, fingerprints and serialized fields for pages.
+
+        Content is normalized page by page and the normalized texts are
+        fingerprinted in one batch.
+
+        Args:
+            pages: Page data dictionaries with _url and extracted fields
+
+        Returns:
+            Prepared pages in input order, None for pages without a URL
+        """
+        # Normalize content for hashing, for pages with a URL and content
+        normalized: dict[int, str] = {}
+        for index, page_data in enumerate(pages):
+            url = page_data.get("_url")
+            content = page_data.get("_content")
+            if not url or not content:
+                continue
+            try:
+                with metrics.observe_stage("normalize", url):
+                    normalized_content = self.normalizer.normalize_for_hash(content)
+            except Exception as e:
+                logger.warning("simhash_generation_failed", url=url, error=str(e))
+                continue
+            if normalized_content:
+                normalized[index] = normalized_content
+
+        # Generate Simhash fingerprints (None for content without tokens)
+        with metrics.observe_stage("simhash", *(pages[index].get("_url") for index in normalized)):
+            fingerprints = dict(
+                zip(normalized, fingerprint_many(normalized.values(), SIMHASH_BITS), strict=True)
+            )
+
+        return [
+            self._prepare_page(page_data, fingerprints.get(index))
+            for index, page_data in enumerate(pages)
+        ]
+
+    def _prepare_page(
+        self, page_data: dict[str, Any], simhash_fingerprint: int | None
+    ) -> _PreparedPage | None:
+        """Compute hashes and serialized fields for a page.
+
+        Args:
+            page_data: Page data with _url and extracted fields
+            simhash_fingerprint: Simhash of the page's normalized content, if any
+
+        Returns:
+            Prepared page, or None if the page has no URL
+        """
+        # Extract URL and content
+        url = page_data.get("_url")
+        content = page_data.get("_content")
+
+        if not url:
+            logger.warning("save_page_missing_url", page_data_keys=list(page_data.keys()))
+            return None
+
+        # Remove internal fields before storing
+        extracted_data = {k: v for k, v in page_data.items() if not k.startswith("_")}
+
+        # Extract title if present
+        title = extracted_data.get("title")
+
+        # Keep response validators for the next conditional re-crawl
+        page_metadata = {
+            key: str(value) for key in VALIDATOR_FIELDS if (value := page_data.get(f"_{key}"))
+        }
+
+        return _PreparedPage(
+            url=url,
+            url_hash=self._hash_url(url),
+            # Checkpointed pages carry the hash of the content dropped from them
+            content_hash=(
+                page_data["_content_hash"]
+                if content is None and page_data.get("_content_hash")
+                else self._hash_content(content)
+            ),
+            simhash_fingerprint=simhash_fingerprint,
+            title=str(title) if title else None,
+            # Serialize extracted data to JSON string
+            extracted_json=json.dumps(extracted_data, ensure_ascii=False),
+            field_count=len(extracted_data),
+            metadata=page_metadata or None,
+            html=content if self.storage and isinstance(content, str) and content else None,
+            html_path=page_data.get("_html_path"),
+        )
+
+    async def _store_html(self, pages: list[_PreparedPage]) -> dict[str, str]:
+        """Upload the raw HTML of pages to object storage, once per content hash.
+
+        Uploads run concurrently. A failed upload is logged and leaves the page
+        without a stored HTML path instead of failing the page.
+
+        Args:
+            pages: Prepared pages
+
+        Returns:
+            Mapping of content hash to storage key for the uploaded HTML
+        """
+        # Guard: no storage configured
+        if self.storage is None:
+            return {}
+
+        html_by_hash = {page.content_hash: page.html for page in pages if page.html}
+        if not html_by_hash:
+            return {}
+
+        content_hashes = list(html_by_hash)
+        results = await asyncio.gather(
+            *(self.storage.store_html(html_by_hash[value], value) for value in content_hashes),
+            return_exceptions=True,
+        )
+
+        html_paths: dict[str, str] = {}
+        for content_hash, result in zip(content_hashes, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "page_html_store_failed",
+                    content_hash=content_hash,
+                    error=str(result),
+                )
+                continue
+            html_paths[content_hash] = result
+        return html_paths
+
+    def _similarity_score(self, distance: float) -> int:
+        """Convert a Hamming distance between fingerprints into a similarity score.
+
+        Args:
+            distance: Hamming distance between 64-bit fingerprints
+
+        Returns:
+            Score from 0 to 100: (1 - distance/SIMHASH_BITS) * 100
+        """
+        raw_score = (1 - distance / SIMHASH_BITS) * 100
+        # Clamp score to [0, 100] to guard against unexpected distances
+        return max(0, min(100, int(raw_score)))
 
     def _hash_url(self, url: str) -> str:
         """Generate SHA256 hash of URL for deduplication.
@@ -333,14 +816,4 @@ class ResultPersistenceService:
         Returns:
             Hex digest of SHA256 hash
         """
-        if content is None:
-            # Use empty string hash for None content
-            content_str = ""
-        elif isinstance(content, dict):
-            # For dict content, serialize to JSON
-            content_str = json.dumps(content, sort_keys=True, ensure_ascii=False)
-        else:
-            # For string content, use as-is
-            content_str = str(content)
-
-        return hashlib.sha256(content_str.encode("utf-8")).hexdigest()
+        return hash_content(content)
@@ -10,6 +10,7 @@ This service orchestrates the complete seed URL crawling workflow:
 """
 
 import asyncio
+from contextlib import aclosing
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any
@@ -22,12 +23,18 @@ from crawler.core.logging import get_logger
 from crawler.db.generated.models import LogLevelEnum
 from crawler.services.html_parser import HTMLParserService
 from crawler.services.pagination import PaginationService
-from crawler.services.redis_cache import JobCancellationFlag, URLDeduplicationCache
+from crawler.services.redis_cache import (
+    HostRateLimiter,
+    JobCancellationFlag,
+    URLDeduplicationCache,
+)
 from crawler.services.resource_cleanup import CleanupCoordinator, HTTPResourceManager
 from crawler.services.url_extractor import ExtractedURL, URLExtractorService
+from crawler.utils.bloom_filter import BloomFilter
 
 if TYPE_CHECKING:
     from crawler.db.repositories import CrawlJobRepository, CrawlLogRepository
+    from crawler.services.crawl_log_sink import CrawlLogSink
 
 logger = get_logger(__name__)
 
@@ -101,6 +108,10 @@ class SeedURLCrawlerConfig:
     # Optional: crawler.services.redis_cache.URLDeduplicationCache for caching
     dedup_cache: URLDeduplicationCache | None = None
 
+    # Optional: Bloom filter of URL hashes this job already saw, shared by its crawls.
+    # If None and dedup_cache is set, each crawl uses its own filter.
+    url_prefilter: BloomFilter | None = None
+
     # Optional: Maximum pages to crawl (overrides pagination config)
     max_pages: int | None = None
 
@@ -110,6 +121,13 @@ class SeedURLCrawlerConfig:
     # Optional: crawler.services.redis_cache.JobCancellationFlag for cancellation checks
     cancellation_flag: JobCancellationFlag | None = None
 
+    # Optional: cancel event from crawler.services.redis_cache.JobCancellationRegistry.
+    # Checked in memory instead of polling cancellation_flag.
+    cancel_event: asyncio.Event | None = None
+
+    # Optional: crawler.services.redis_cache.HostRateLimiter for cluster-wide host pacing
+    host_limiter: HostRateLimiter | None = None
+
     # Optional: CleanupCoordinator for resource cleanup on cancellation
     cleanup_coordinator: CleanupCoordinator | None = None
 
@@ -119,6 +137,9 @@ class SeedURLCrawlerConfig:
     # Optional: CrawlLogRepository for writing crawl logs
     crawl_log_repo: CrawlLogRepository | None = None
 
+    # Optional: CrawlLogSink for batched crawl logs (preferred over crawl_log_repo)
+    log_sink: CrawlLogSink | None = None
+
     # Optional: Website ID for log entries
     website_id: str | None = None
 
@@ -147,6 +168,9 @@ class SeedURLCrawler:
         ...     print(f"Extracted {result.total_urls_extracted} URLs")
     """
 
+    # URLs remembered per crawl when the config has no url_prefilter (about 350 KiB)
+    URL_PREFILTER_CAPACITY = 100_000
+
     def __init__(self) -> None:
         """Initialize seed URL crawler."""
         self.pagination_service = PaginationService()
@@ -165,8 +189,9 @@ class SeedURLCrawler:
         """Write a crawl log entry if logging is configured (non-blocking).
 
         Uses guard pattern to exit early if logging is not configured.
-        Logs are written asynchronously in the background to avoid blocking
-        the crawl execution.
+        Entries go to the log sink when one is configured, which writes them in
+        batches. Otherwise each log is written in its own background task to avoid
+        blocking the crawl execution.
 
         Args:
             config: Crawler configuration
@@ -175,8 +200,8 @@ class SeedURLCrawler:
             step_name: Optional step name
             context: Optional context data
         """
-        # Guard: no log repository configured
-        if not config.crawl_log_repo:
+        # Guard: no log sink or repository configured
+        if not config.log_sink and not config.crawl_log_repo:
             return
 
         # Guard: no job_id
@@ -187,6 +212,18 @@ class SeedURLCrawler:
         if not config.website_id:
             return
 
+        # Buffer in the sink - it applies its own drop policy when full
+        if config.log_sink:
+            config.log_sink.write(
+                job_id=config.job_id,
+                website_id=config.website_id,
+                message=message,
+                log_level=log_level,
+                step_name=step_name,
+                context=context,
+            )
+            return
+
         # Create background task for non-blocking log write
         async def write_log_task() -> None:
             try:
@@ -237,16 +274,21 @@ class SeedURLCrawler:
         Returns:
             CrawlResult with CANCELLED outcome if job is cancelled, None otherwise
         """
-        # Guard: no cancellation flag configured
-        if not config.cancellation_flag:
+        # Guard: no cancellation flag or event configured
+        if not config.cancellation_flag and config.cancel_event is None:
             return None
 
         # Guard: no job_id to check
         if not config.job_id:
             return None
 
-        # Check if job is cancelled
-        is_cancelled = await config.cancellation_flag.is_cancelled(config.job_id)
+        # Check if job is cancelled (pushed events need no Redis round trip)
+        if config.cancel_event is not None:
+            is_cancelled = config.cancel_event.is_set()
+        else:
+            is_cancelled = await config.cancellation_flag.is_cancelled(  # type: ignore[union-attr]
+                config.job_id
+            )
         if not is_cancelled:
             return None
 
@@ -382,6 +424,8 @@ class SeedURLCrawler:
             # Step 4: Fetch seed URL (handle 404 immediately)
             try:
                 logger.info("fetching_seed_url", seed_url=seed_url)
+                if config.host_limiter:
+                    await config.host_limiter.acquire(seed_url)
                 # Use tracked request for proper resource management
                 async with http_resource_manager.tracked_request():
                     response = await http_client.get(seed_url)
@@ -574,9 +618,13 @@ class SeedURLCrawler:
         """
         # Initialize services for URL extraction
         html_parser = HTMLParserService()
+        seen_filter = config.url_prefilter
+        if seen_filter is None and config.dedup_cache:
+            seen_filter = BloomFilter(capacity=self.URL_PREFILTER_CAPACITY)
         url_extractor = URLExtractorService(
             html_parser=html_parser,
             dedup_cache=config.dedup_cache,
+            seen_filter=seen_filter,
         )
 
         all_extracted_urls: list[ExtractedURL] = []
@@ -599,6 +647,8 @@ class SeedURLCrawler:
                 httpx.RequestError: Network/request errors are propagated to
                     PaginationService which handles them appropriately
             """
+            if config.host_limiter:
+                await config.host_limiter.acquire(url)
             async with http_resource_manager.tracked_request():
                 response = await http_client.get(url)
             return response.status_code, response.content
@@ -675,86 +725,86 @@ class SeedURLCrawler:
                     warnings=warnings,
                 )
 
-            # Now crawl remaining pagination pages
-            async for (
-                url,
-                _status_code,
-                content,
-            ) in self.pagination_service.generate_with_stop_detection(
+            # Now crawl remaining pagination pages; aclosing() cancels prefetched
+            # requests as soon as the loop exits early (e.g. job cancellation)
+            pages = self.pagination_service.generate_with_stop_detection(
                 seed_url=seed_url,
                 config=pagination_config,
                 fetch_fn=fetch_page,
-            ):
-                # Skip seed URL (already processed)
-                if url == seed_url:
-                    continue
-
-                # Guard: check for cancellation before processing each page
-                cancellation_result = await self._check_cancellation(
-                    config=config,
-                    seed_url=seed_url,
-                    pages_crawled=pages_crawled,
-                    extracted_urls=all_extracted_urls,
-                    warnings=warnings,
-                )
-                if cancellation_result:
-                    return cancellation_result
-
-                # Extract URLs from this page
-                try:
-                    page_urls = await self._extract_urls_from_content(
-                        url_extractor=url_extractor,
-                        html_content=content,
-                        base_url=url,
-                        detail_selector=detail_selector,
-                        job_id=config.job_id,
-                        container_selector=container_selector,
-                    )
-                    all_extracted_urls.extend(page_urls)
-                    pages_crawled += 1
-
-                    logger.info(
-                        "pagination_page_processed",
-                        url=url,
-                        page_number=pages_crawled,
-                        urls_count=len(page_urls),
-                        total_urls=len(all_extracted_urls),
-                    )
-
-                    # Write log: pagination page processed
-                    self._write_log(
-                        config,
-                        (
-                            f"Processed page {pages_crawled}: "
-                            f"extracted {len(page_urls)} URLs (total: {len(all_extracted_urls)})"
-                        ),
-                        log_level=LogLevelEnum.INFO,
-                        step_name="extract_urls",
-                        context={
-                            "page_url": url,
-                            "page_number": pages_crawled,
-                            "urls_count": len(page_urls),
-                            "total_urls": len(all_extracted_urls),
-                        },
-                    )
-
-                except Exception as e:
-                    logger.error(
-                        "pagination_page_extraction_failed",
-                        url=url,
-                        error=str(e),
-                        exc_info=True,
-                    )
-                    warnings.append(f"Failed to extract URLs from page {url}: {e}")
-
-                    # Write log: pagination page extraction failed
-                    self._write_log(
-                        config,
-                        f"Failed to extract URLs from page {pages_crawled + 1}: {e!s}",
-                        log_level=LogLevelEnum.WARNING,
-                        step_name="extract_urls",
-                        context={"page_url": url, "error": str(e)},
+            )
+            async with aclosing(pages):
+                async for url, _status_code, content in pages:
+                    # Skip seed URL (already processed)
+                    if url == seed_url:
+                        continue
+
+                    # Guard: check for cancellation before processing each page
+                    cancellation_result = await self._check_cancellation(
+                        config=config,
+                        seed_url=seed_url,
+                        pages_crawled=pages_crawled,
+                        extracted_urls=all_extracted_urls,
+                        warnings=warnings,
                     )
+                    if cancellation_result:
+                        return cancellation_result
+
+                    # Extract URLs from this page
+                    try:
+                        page_urls = await self._extract_urls_from_content(
+                            url_extractor=url_extractor,
+                            html_content=content,
+                            base_url=url,
+                            detail_selector=detail_selector,
+                            job_id=config.job_id,
+                            container_selector=container_selector,
+                        )
+                        all_extracted_urls.extend(page_urls)
+                        pages_crawled += 1
+
+                        logger.info(
+                            "pagination_page_processed",
+                            url=url,
+                            page_number=pages_crawled,
+                            urls_count=len(page_urls),
+                            total_urls=len(all_extracted_urls),
+                        )
+
+                        # Write log: pagination page processed
+                        self._write_log(
+                            config,
+                            (
+                                f"Processed page {pages_crawled}: "
+                                f"extracted {len(page_urls)} URLs "
+                                f"(total: {len(all_extracted_urls)})"
+                            ),
+                            log_level=LogLevelEnum.INFO,
+                            step_name="extract_urls",
+                            context={
+                                "page_url": url,
+                                "page_number": pages_crawled,
+                                "urls_count": len(page_urls),
+                                "total_urls": len(all_extracted_urls),
+                            },
+                        )
+
+                    except Exception as e:
+                        logger.error(
+                            "pagination_page_extraction_failed",
+                            url=url,
+                            error=str(e),
+                            exc_info=True,
+                        )
+                        warnings.append(f"Failed to extract URLs from page {url}: {e}")
+
+                        # Write log: pagination page extraction failed
+                        self._write_log(
+                            config,
+                            f"Failed to extract URLs from page {pages_crawled + 1}: {e!s}",
+                            log_level=LogLevelEnum.WARNING,
+                            step_name="extract_urls",
+                            context={"page_url": url, "error": str(e)},
+                        )
 
             # Check if pagination selector was configured but no additional pages found
             if (
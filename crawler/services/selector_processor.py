@@ -2,17 +2,69 @@
 
 This module provides unified data extraction from various content types using
 selectors (CSS, XPath) for HTML and JSON path for API responses.
+
+HTML selectors are compiled once into an ExtractionPlan (cached per selector
+configuration), and every document is parsed at most once per engine no matter
+how many fields are extracted from it.
 """
 
 from __future__ import annotations
 
+import json
+import re
+from dataclasses import dataclass, field
 from typing import Any
 
+from lxml import etree
+
 from crawler.core.logging import get_logger
 from crawler.services.html_parser import HTMLParserService
 
 logger = get_logger(__name__)
 
+# Selectors built only from type/class/id/attribute-equality parts joined by
+# descendant combinators. These yield identical matches on the selectolax and
+# BeautifulSoup trees, so they can take the fast path.
+_PLAIN_CSS_PATTERN = re.compile(r"^[A-Za-z0-9_\-.#*\s\[\]=\"']+$")
+
+
+@dataclass
+class CompiledSelector:
+    """A single HTML field selector, compiled for repeated evaluation.
+
+    Attributes:
+        field_name: Output field name
+        selector: Original CSS selector or XPath expression
+        attribute: Attribute to extract (None extracts text)
+        result_type: "single" or "array"
+        engine: "xpath", "fast_css" (selectolax) or "css" (BeautifulSoup)
+        xpath: Pre-compiled XPath (None if not XPath or if compilation failed)
+        error: Configuration error, reported instead of a value at evaluation time
+    """
+
+    field_name: str
+    selector: str = ""
+    attribute: str | None = None
+    result_type: str = "single"
+    engine: str = "css"
+    xpath: etree.XPath | None = None
+    error: str | None = None
+
+
+@dataclass
+class ExtractionPlan:
+    """Compiled set of HTML field selectors for one selector configuration.
+
+    Attributes:
+        fields: Compiled selectors in configuration order
+    """
+
+    fields: list[CompiledSelector] = field(default_factory=list)
+
+    def uses_engine(self, engine: str) -> bool:
+        """Check whether any valid field needs the given engine's parse tree."""
+        return any(f.engine == engine and f.error is None for f in self.fields)
+
 
 class SelectorProcessor:
     """Processes selectors to extract data from HTML and JSON content.
@@ -23,6 +75,9 @@ class SelectorProcessor:
     - JSON path queries for API responses
     """
 
+    # Maximum number of distinct selector configurations to keep compiled
+    MAX_CACHED_PLANS = 256
+
     def __init__(self, html_parser: HTMLParserService | None = None):
         """Initialize selector processor.
 
@@ -30,6 +85,7 @@ class SelectorProcessor:
             html_parser: HTML parser service instance. If None, creates a new one.
         """
         self.html_parser = html_parser or HTMLParserService()
+        self._plan_cache: dict[str, ExtractionPlan] = {}
 
     def process_selectors(
         self,
@@ -57,26 +113,21 @@ class SelectorProcessor:
         if not selectors:
             return {}
 
-        # Determine content type
-        is_json = isinstance(content, dict)
+        # HTML: evaluate the compiled plan against a single parse of the document
+        if not isinstance(content, dict):
+            return self._evaluate_plan(content, self.compile_plan(selectors), selectors)
+
         extracted_data = {}
 
         for field_name, selector_config in selectors.items():
             try:
-                if is_json:
-                    # Type narrowing: content is dict at this point
-                    assert isinstance(content, dict)
-                    value = self._extract_from_json(content, selector_config)
-                else:
-                    # Type narrowing: content is str at this point
-                    assert isinstance(content, str)
-                    value = self._extract_from_html(content, selector_config)
+                value = self._extract_from_json(content, selector_config)
 
                 extracted_data[field_name] = value
                 logger.debug(
                     "selector_processed",
                     field=field_name,
-                    content_type="json" if is_json else "html",
+                    content_type="json",
                     has_value=value is not None,
                 )
             except Exception as e:
@@ -90,22 +141,58 @@ class SelectorProcessor:
 
         return extracted_data
 
-    def _extract_from_html(
+    def compile_plan(self, selectors: dict[str, Any]) -> ExtractionPlan:
+        """Compile HTML selectors into a reusable extraction plan.
+
+        Plans are cached by selector configuration, so repeated calls with the same
+        scrape config (the common case across a job's detail pages) are free.
+
+        Args:
+            selectors: Dictionary of field_name -> selector configuration
+
+        Returns:
+            Compiled ExtractionPlan
+        """
+        cache_key = json.dumps(selectors, sort_keys=True, default=repr)
+        plan = self._plan_cache.get(cache_key)
+        if plan is not None:
+            return plan
+
+        plan = ExtractionPlan()
+        for field_name, selector_config in selectors.items():
+            try:
+                plan.fields.append(self._compile_html_selector(field_name, selector_config))
+            except ValueError as e:
+                plan.fields.append(CompiledSelector(field_name=field_name, error=str(e)))
+
+        # Evict the oldest plan once the cache is full
+        if len(self._plan_cache) >= self.MAX_CACHED_PLANS:
+            self._plan_cache.pop(next(iter(self._plan_cache)))
+        self._plan_cache[cache_key] = plan
+
+        logger.debug(
+            "extraction_plan_compiled",
+            fields=len(plan.fields),
+            engines=sorted({f.engine for f in plan.fields if f.error is None}),
+        )
+        return plan
+
+    def _compile_html_selector(
         self,
-        content: str,
+        field_name: str,
         selector_config: str | dict[str, Any],
-    ) -> str | list[str] | None:
-        """Extract data from HTML content using selector.
+    ) -> CompiledSelector:
+        """Compile a single HTML selector configuration.
 
         Args:
-            content: HTML content string
+            field_name: Output field name
             selector_config: Selector configuration (string or dict)
 
         Returns:
-            Extracted value(s) or None
+            CompiledSelector for the field
 
         Raises:
-            ValueError: If selector is invalid
+            ValueError: If selector configuration is invalid
         """
         # Parse selector config
         if isinstance(selector_config, str):
@@ -123,18 +210,143 @@ class SelectorProcessor:
         else:
             raise ValueError(f"Invalid selector configuration: {type(selector_config).__name__}")
 
-        # Auto-detect selector type (XPath vs CSS)
-        selector_type = self._detect_selector_type(selector)
-
-        # Extract data using HTML parser
-        return self.html_parser.extract_data(
-            content=content,
+        compiled = CompiledSelector(
+            field_name=field_name,
             selector=selector,
             attribute=attribute,
-            selector_type=selector_type,
             result_type=result_type,
         )
 
+        # Auto-detect selector type (XPath vs CSS)
+        if self._detect_selector_type(selector) == "xpath":
+            compiled.engine = "xpath"
+            try:
+                compiled.xpath = etree.XPath(selector)
+            except etree.XPathSyntaxError as e:
+                # Invalid XPath yields no matches, same as HTMLParserService.apply_xpath
+                logger.error("xpath_compile_error", xpath=selector, error=str(e))
+        elif _PLAIN_CSS_PATTERN.match(selector):
+            compiled.engine = "fast_css"
+
+        return compiled
+
+    def _evaluate_plan(
+        self,
+        content: str,
+        plan: ExtractionPlan,
+        selectors: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Evaluate a compiled plan against HTML content.
+
+        Each parse tree (lxml, selectolax, BeautifulSoup) is built at most once,
+        and only if some field in the plan needs it.
+
+        Args:
+            content: HTML content string
+            plan: Compiled extraction plan
+            selectors: Original selector configuration (for error reporting)
+
+        Returns:
+            Dictionary of field_name -> extracted value(s)
+        """
+        trees: dict[str, Any] = {}
+        extracted_data: dict[str, Any] = {}
+
+        for compiled in plan.fields:
+            try:
+                if compiled.error is not None:
+                    raise ValueError(compiled.error)
+                value = self._evaluate_selector(content, compiled, trees)
+
+                extracted_data[compiled.field_name] = value
+                logger.debug(
+                    "selector_processed",
+                    field=compiled.field_name,
+                    content_type="html",
+                    has_value=value is not None,
+                )
+            except Exception as e:
+                logger.error(
+                    "selector_processing_error",
+                    field=compiled.field_name,
+                    selector=selectors.get(compiled.field_name),
+                    error=str(e),
+                )
+                extracted_data[compiled.field_name] = None
+
+        return extracted_data
+
+    def _evaluate_selector(
+        self,
+        content: str,
+        compiled: CompiledSelector,
+        trees: dict[str, Any],
+    ) -> str | list[str] | None:
+        """Evaluate one compiled selector, parsing the content on first use per engine.
+
+        Args:
+            content: HTML content string
+            compiled: Compiled selector
+            trees: Parse trees already built for this document, keyed by engine
+
+        Returns:
+            - If result_type="single": First match as string, or None if no match
+            - If result_type="array": List of all matches (empty list if no matches)
+
+        Raises:
+            ValueError: If content cannot be parsed
+        """
+        select_all = compiled.result_type == "array"
+
+        if compiled.engine not in trees:
+            if compiled.engine == "xpath":
+                trees["xpath"] = self.html_parser.parse_html_raw(content)
+            elif compiled.engine == "fast_css":
+                trees["fast_css"] = self.html_parser.parse_html_fast(content)
+            else:
+                trees["css"] = self.html_parser.parse_html(content)
+        tree = trees[compiled.engine]
+
+        if compiled.engine == "xpath":
+            results = (
+                self.html_parser.apply_xpath(tree, compiled.xpath, compiled.attribute)
+                if compiled.xpath is not None
+                else []
+            )
+        elif compiled.engine == "fast_css":
+            results = self.html_parser.apply_fast_css_selector(
+                tree, compiled.selector, compiled.attribute, select_all=select_all
+            )
+        else:
+            results = self.html_parser.apply_css_selector(
+                tree, compiled.selector, compiled.attribute, select_all=select_all
+            )
+
+        # Return based on result_type
+        if compiled.result_type == "single":
+            return results[0] if results else None
+        return results
+
+    def _extract_from_html(
+        self,
+        content: str,
+        selector_config: str | dict[str, Any],
+    ) -> str | list[str] | None:
+        """Extract data from HTML content using selector.
+
+        Args:
+            content: HTML content string
+            selector_config: Selector configuration (string or dict)
+
+        Returns:
+            Extracted value(s) or None
+
+        Raises:
+            ValueError: If selector is invalid
+        """
+        compiled = self._compile_html_selector("value", selector_config)
+        return self._evaluate_selector(content, compiled, {})
+
     def _extract_from_json(
         self,
         content: dict[str, Any],
@@ -0,0 +1,113 @@
+"""Bounded channel streaming URL batches between pipelined workflow steps.
+
+A crawl step sends the URLs found on each page as one batch; the scrape step that
+reads the crawl step's URLs receives the batches while the crawl is still running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+
+from crawler.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Default number of batches queued before the producing step waits
+DEFAULT_MAX_BATCHES = 32
+
+
+class URLChannel:
+    """Bounded channel of URL batches with one producer and one consumer.
+
+    send() waits while max_batches batches are queued, so a slow consumer pauses
+    the producer instead of letting URLs pile up in memory. close() ends the stream
+    from either side: the consumer still receives queued batches, and batches sent
+    after close are dropped.
+
+    Example:
+        >>> channel = URLChannel(max_batches=8)
+        >>> await channel.send(["https://example.com/a", "https://example.com/b"])
+        True
+        >>> await channel.close()
+        >>> [batch async for batch in channel]
+        [['https://example.com/a', 'https://example.com/b']]
+    """
+
+    def __init__(self, max_batches: int = DEFAULT_MAX_BATCHES):
+        """Initialize URL channel.
+
+        Args:
+            max_batches: Batches queued before send() waits
+
+        Raises:
+            ValueError: If max_batches is not positive
+        """
+        if max_batches < 1:
+            raise ValueError(f"max_batches must be positive, got {max_batches}")
+
+        self.max_batches = max_batches
+        self.batches_sent = 0
+        self.urls_sent = 0
+        self._batches: deque[list[str]] = deque()
+        self._closed = False
+        self._changed = asyncio.Condition()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the stream has ended."""
+        return self._closed
+
+    async def send(self, urls: list[str]) -> bool:
+        """Queue a batch of URLs, waiting while the channel is full.
+
+        Args:
+            urls: URLs to hand to the consumer
+
+        Returns:
+            True if the batch was queued, False if the channel is closed
+        """
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: self._closed or len(self._batches) < self.max_batches
+            )
+
+            # Guard: consumer stopped reading or producer already finished
+            if self._closed:
+                logger.debug("url_channel_batch_dropped", urls=len(urls))
+                return False
+
+            self._batches.append(urls)
+            self.batches_sent += 1
+            self.urls_sent += len(urls)
+            self._changed.notify_all()
+            return True
+
+    async def receive(self) -> list[str] | None:
+        """Take the next batch, waiting until one is sent or the channel closes.
+
+        Returns:
+            Next batch of URLs, or None once the channel is closed and drained
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._closed or bool(self._batches))
+
+            # Guard: closed and drained
+            if not self._batches:
+                return None
+
+            batch = self._batches.popleft()
+            self._changed.notify_all()
+            return batch
+
+    async def close(self) -> None:
+        """End the stream and wake any waiting sender or receiver."""
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    async def __aiter__(self) -> AsyncIterator[list[str]]:
+        """Iterate over batches until the channel is closed and drained."""
+        while (batch := await self.receive()) is not None:
+            yield batch
@@ -9,9 +9,11 @@ from typing import Any
 
 import httpx
 
+from crawler.core import metrics
 from crawler.core.logging import get_logger
 from crawler.services.executor_retry import execute_with_retry
 from crawler.services.local_rate_limiter import LocalRateLimiter
+from crawler.services.resource_cleanup import HTTPResourceManager
 from crawler.services.selector_processor import SelectorProcessor
 from crawler.services.step_executors.base import BaseStepExecutor, ExecutionResult
 
@@ -130,7 +132,18 @@ class APIExecutor(BaseStepExecutor):
 
             # Apply rate limiting if configured
             if self.rate_limiter:
-                async with self.rate_limiter.acquire():
+                async with self.rate_limiter.acquire(url):
+                    with metrics.observe_stage("fetch", url):
+                        response = await client.request(
+                            method=method,
+                            url=url,
+                            headers=headers,
+                            timeout=timeout,
+                            follow_redirects=True,
+                            **extra_kwargs,
+                        )
+            else:
+                with metrics.observe_stage("fetch", url):
                     response = await client.request(
                         method=method,
                         url=url,
@@ -139,15 +152,6 @@ class APIExecutor(BaseStepExecutor):
                         follow_redirects=True,
                         **extra_kwargs,
                     )
-            else:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    timeout=timeout,
-                    follow_redirects=True,
-                    **extra_kwargs,
-                )
 
             # Check status
             if not 200 <= response.status_code < 300:
@@ -172,7 +176,8 @@ class APIExecutor(BaseStepExecutor):
             # Extract data using JSON path selectors
             extracted_data = {}
             if selectors:
-                extracted_data = self.selector_processor.process_selectors(json_data, selectors)
+                with metrics.observe_stage("extract", url):
+                    extracted_data = self.selector_processor.process_selectors(json_data, selectors)
 
             logger.info(
                 "api_request_completed",
@@ -221,6 +226,17 @@ class APIExecutor(BaseStepExecutor):
             )
         return self._client
 
+    def get_resource_manager(self) -> HTTPResourceManager | None:
+        """Get a resource manager for the client, so cancellation can close it.
+
+        Returns:
+            Manager of the client this executor created, or None if it has not
+            created one or was given its client
+        """
+        if self._client is None or not self._owns_client:
+            return None
+        return HTTPResourceManager(self._client)
+
     async def cleanup(self) -> None:
         """Clean up HTTP client resources."""
         if self._client is not None and self._owns_client:
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from crawler.core import metrics
 from crawler.core.browser_config import (
     CHROMIUM_IGNORE_DEFAULT_ARGS,
     CHROMIUM_STEALTH_ARGS,
@@ -17,6 +18,8 @@ from crawler.core.logging import get_logger
 from crawler.services.browser_pool import BrowserPool
 from crawler.services.executor_retry import execute_with_retry
 from crawler.services.local_rate_limiter import LocalRateLimiter
+from crawler.services.resource_cleanup import BrowserResourceManager
+from crawler.services.resource_policy import ResourcePolicy
 from crawler.services.selector_processor import SelectorProcessor
 from crawler.services.step_executors.base import BaseStepExecutor, ExecutionResult
 
@@ -32,6 +35,13 @@ class BrowserExecutor(BaseStepExecutor):
 
     The executor automatically uses the pool if available, falling back to
     per-request browsers if the pool is not initialized.
+
+    A step's resource_policy config aborts subresource requests the step does
+    not need (images, fonts, trackers, ...). In pool mode, static assets that
+    do load are shared across contexts through the pool's static asset cache.
+
+    Open pages are tracked in open_pages, so a cancelled job can close them
+    through a CleanupCoordinator.
     """
 
     def __init__(
@@ -50,6 +60,7 @@ class BrowserExecutor(BaseStepExecutor):
         self.selector_processor = selector_processor or SelectorProcessor()
         self.browser_pool = browser_pool
         self.rate_limiter = rate_limiter
+        self.open_pages = BrowserResourceManager()
 
     def _extract_browser_timeouts(self, step_config: dict[str, Any]) -> tuple[int, int]:
         """Extract page_load and selector_wait timeouts from config.
@@ -149,6 +160,7 @@ class BrowserExecutor(BaseStepExecutor):
             # Backward compatibility: support old "wait_for" key, fallback to "wait_until"
             wait_for = step_config.get("wait_for") or step_config.get("wait_until", "load")
             selector_wait = step_config.get("selector_wait")
+            resource_policy = ResourcePolicy.from_config(step_config.get("resource_policy"))
 
             logger.info(
                 "browser_request_starting_with_pool",
@@ -156,6 +168,7 @@ class BrowserExecutor(BaseStepExecutor):
                 page_load_timeout_ms=page_load_timeout_ms,
                 selector_wait_timeout_ms=selector_wait_timeout_ms,
                 rate_limited=self.rate_limiter is not None,
+                resource_policy=resource_policy is not None,
             )
 
             # Acquire context from pool
@@ -165,19 +178,24 @@ class BrowserExecutor(BaseStepExecutor):
             async with self.browser_pool.acquire_context() as context:
                 page = None
                 try:
-                    # Create page
+                    # Create page and intercept its requests per the step's policy
                     page = await context.new_page()
+                    self.open_pages.add(page)
+                    if resource_policy:
+                        await resource_policy.apply(page, url, self.browser_pool.static_asset_cache)
 
                     # Navigate to URL (with rate limiting if configured)
                     if self.rate_limiter:
-                        async with self.rate_limiter.acquire():
+                        async with self.rate_limiter.acquire(url):
+                            with metrics.observe_stage("fetch", url):
+                                response = await page.goto(
+                                    url, timeout=page_load_timeout_ms, wait_until=wait_for
+                                )
+                    else:
+                        with metrics.observe_stage("fetch", url):
                             response = await page.goto(
                                 url, timeout=page_load_timeout_ms, wait_until=wait_for
                             )
-                    else:
-                        response = await page.goto(
-                            url, timeout=page_load_timeout_ms, wait_until=wait_for
-                        )
 
                     # Check response status
                     status_code = response.status if response else None
@@ -209,9 +227,10 @@ class BrowserExecutor(BaseStepExecutor):
                     # Extract data using selectors
                     extracted_data = {}
                     if selectors:
-                        extracted_data = self.selector_processor.process_selectors(
-                            content, selectors
-                        )
+                        with metrics.observe_stage("extract", url):
+                            extracted_data = self.selector_processor.process_selectors(
+                                content, selectors
+                            )
 
                     logger.info(
                         "browser_request_completed_with_pool",
@@ -232,6 +251,7 @@ class BrowserExecutor(BaseStepExecutor):
                 finally:
                     # Guard cleanup: close page if it was created
                     if page is not None:
+                        self.open_pages.discard(page)
                         try:
                             await page.close()
                         except Exception as e:
@@ -279,6 +299,7 @@ class BrowserExecutor(BaseStepExecutor):
             wait_for = step_config.get("wait_for") or step_config.get("wait_until", "load")
             selector_wait = step_config.get("selector_wait")
             browser_type = step_config.get("browser_type", "chromium")
+            resource_policy = ResourcePolicy.from_config(step_config.get("resource_policy"))
 
             logger.info(
                 "browser_request_starting_per_request",
@@ -287,6 +308,7 @@ class BrowserExecutor(BaseStepExecutor):
                 page_load_timeout_ms=page_load_timeout_ms,
                 selector_wait_timeout_ms=selector_wait_timeout_ms,
                 rate_limited=self.rate_limiter is not None,
+                resource_policy=resource_policy is not None,
             )
 
             # Launch browser
@@ -317,17 +339,23 @@ class BrowserExecutor(BaseStepExecutor):
                         viewport=STEALTH_VIEWPORT,
                     )
                     page = await context.new_page()
+                    self.open_pages.add(page)
+                    if resource_policy:
+                        # No cache: the context and its browser close after this page
+                        await resource_policy.apply(page, url)
 
                     # Navigate to URL (with rate limiting if configured)
                     if self.rate_limiter:
-                        async with self.rate_limiter.acquire():
+                        async with self.rate_limiter.acquire(url):
+                            with metrics.observe_stage("fetch", url):
+                                response = await page.goto(
+                                    url, timeout=page_load_timeout_ms, wait_until=wait_for
+                                )
+                    else:
+                        with metrics.observe_stage("fetch", url):
                             response = await page.goto(
                                 url, timeout=page_load_timeout_ms, wait_until=wait_for
                             )
-                    else:
-                        response = await page.goto(
-                            url, timeout=page_load_timeout_ms, wait_until=wait_for
-                        )
 
                     # Check response status
                     status_code = response.status if response else None
@@ -359,9 +387,10 @@ class BrowserExecutor(BaseStepExecutor):
                     # Extract data using selectors
                     extracted_data = {}
                     if selectors:
-                        extracted_data = self.selector_processor.process_selectors(
-                            content, selectors
-                        )
+                        with metrics.observe_stage("extract", url):
+                            extracted_data = self.selector_processor.process_selectors(
+                                content, selectors
+                            )
 
                     logger.info(
                         "browser_request_completed",
@@ -384,6 +413,7 @@ class BrowserExecutor(BaseStepExecutor):
                     # Wrap each close in try/except to prevent secondary errors from masking
                     # the original exception
                     if page is not None:
+                        self.open_pages.discard(page)
                         try:
                             await page.close()
                         except Exception as e:
@@ -1,13 +1,17 @@
 """Crawl step executor for retrieving lists of URLs with pagination support.
 
 This executor handles crawl steps that retrieve URLs from one or more pages.
-It integrates pagination, URL extraction, and deduplication.
+It integrates pagination, URL extraction, and deduplication. Several seed URLs
+(e.g. every category of a site) are crawled concurrently under a per-host cap.
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 from crawler.api.generated import PaginationConfig
 from crawler.core.logging import get_logger
@@ -20,16 +24,42 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Receives the URLs first found on each crawled page
+UrlSink = Callable[[list[str]], Awaitable[object]]
+
+
+@dataclass
+class SeedCrawlResult:
+    """Pages and URLs crawled from one seed URL.
+
+    Attributes:
+        seed_url: Seed URL the pages were generated from
+        total_pages: Pages planned for the seed (after pagination)
+        pages_crawled: Pages fetched successfully
+        pages_failed: Pages that failed
+        urls: URLs extracted from the seed's pages, in page order
+        errors: Error message per failed page
+    """
+
+    seed_url: str
+    total_pages: int = 0
+    pages_crawled: int = 0
+    pages_failed: int = 0
+    urls: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
 
 class CrawlExecutor(BaseStepExecutor):
     """Executor for crawl steps that retrieve URLs from pages.
 
     This executor:
-    1. Generates pagination URLs (if pagination is enabled)
-    2. Fetches each page using the appropriate method (HTTP/API/Browser)
-    3. Extracts URLs from each page using selectors
-    4. Deduplicates and aggregates URLs
-    5. Returns metadata about the crawl operation
+    1. Generates pagination URLs for each seed (if pagination is enabled)
+    2. Crawls up to max_in_flight seeds at once, each page by page, with at most
+       max_in_flight_per_host pages of one host fetched at once
+    3. Fetches each page using the appropriate method (HTTP/API/Browser)
+    4. Extracts URLs from each page using selectors
+    5. Deduplicates URLs across all seeds and aggregates them in seed order
+    6. Returns metadata about the crawl operation, per seed and in total
 
     Example:
         >>> executor = CrawlExecutor(
@@ -47,6 +77,12 @@ class CrawlExecutor(BaseStepExecutor):
         >>> print(result.extracted_data["urls"])  # List of extracted URLs
     """
 
+    # Default maximum number of seeds crawled at once
+    DEFAULT_MAX_IN_FLIGHT = 10
+
+    # Default maximum number of pages of the same host fetched at once
+    DEFAULT_MAX_IN_FLIGHT_PER_HOST = 4
+
     def __init__(
         self,
         http_executor: HTTPExecutor,
@@ -54,6 +90,8 @@ class CrawlExecutor(BaseStepExecutor):
         browser_executor: BrowserExecutor,
         selector_processor: SelectorProcessor | None = None,
         pagination_service: PaginationService | None = None,
+        max_in_flight: int | None = None,
+        max_in_flight_per_host: int | None = None,
     ):
         """Initialize crawl executor.
 
@@ -63,115 +101,111 @@ class CrawlExecutor(BaseStepExecutor):
             browser_executor: Browser executor for browser method
             selector_processor: Selector processor for data extraction
             pagination_service: Pagination service for URL generation
+            max_in_flight: Maximum seeds crawled at once (default: 10)
+            max_in_flight_per_host: Maximum pages of one host fetched at once (default: 4)
         """
         self.http_executor = http_executor
         self.api_executor = api_executor
         self.browser_executor = browser_executor
         self.selector_processor = selector_processor or SelectorProcessor()
         self.pagination_service = pagination_service or PaginationService()
+        self.max_in_flight = max_in_flight or self.DEFAULT_MAX_IN_FLIGHT
+        self.max_in_flight_per_host = max_in_flight_per_host or self.DEFAULT_MAX_IN_FLIGHT_PER_HOST
 
     async def execute(
         self,
         url: str | list[str],
         step_config: dict[str, Any],
         selectors: dict[str, Any] | None = None,
+        url_sink: UrlSink | None = None,
     ) -> ExecutionResult:
         """Execute crawl step to retrieve URLs.
 
         Args:
-            url: Seed URL to start crawling from (if list, only first URL is used)
+            url: Seed URL, or list of seed URLs crawled concurrently
             step_config: Configuration (method, pagination, timeout, etc.)
             selectors: Selectors for URL extraction (typically targets anchor tags)
+            url_sink: Optional coroutine receiving each page's new URLs as soon as
+                the page is crawled, so a dependent step can start on them. URLs are
+                deduplicated across seeds, and the crawl waits while the sink applies
+                backpressure.
 
         Returns:
             ExecutionResult with extracted URLs and metadata
 
         The extracted_data will contain:
-        - urls: List of extracted URLs (deduplicated)
-        - total_urls: Total number of URLs found
-        - pages_crawled: Number of pages successfully crawled
-        - pages_failed: Number of pages that failed
+        - urls: List of extracted URLs (deduplicated across seeds, in seed order)
+        - _crawl_metadata: total_urls, pages_crawled, pages_failed, duplicate_urls
+          and per-seed statistics under "seeds"
 
         Note:
-            CrawlExecutor is designed for single-seed crawling with pagination.
-            If a list of URLs is provided, only the first URL will be used as
-            the seed. For batch processing of multiple URLs, use ScrapeExecutor.
+            Pagination applies to every seed. Seeds share the executor's rate
+            limiter and the per-host cap (rate_limit.max_in_flight_per_host), so
+            seeds of one site do not multiply the load on it.
         """
+        seed_urls = [url] if isinstance(url, str) else list(dict.fromkeys(url))
+        seed_url = seed_urls[0] if seed_urls else None
+
         try:
-            # Guard: Handle list of URLs (use only first)
-            if isinstance(url, list):
-                if not url:
-                    return self._create_error_result(
-                        "Crawl execution error: received empty list of URLs"
-                    )
-                if len(url) > 1:
-                    logger.warning(
-                        "crawl_multiple_seeds",
-                        seed_url=url[0],
-                        total_seeds=len(url),
-                        message=(
-                            "CrawlExecutor received multiple URLs but only uses first as seed. "
-                            "Use ScrapeExecutor for batch processing."
-                        ),
-                    )
-                url = url[0]
+            # Guard: no seeds to crawl
+            if not seed_urls:
+                return self._create_error_result(
+                    "Crawl execution error: received empty list of URLs"
+                )
 
             # Step 1: Get method-specific executor
             method = step_config.get("method", "http").lower()
             executor = self._get_method_executor(method)
 
-            # Step 2: Generate pagination URLs
-            pagination_urls = self._generate_pagination_urls(url, step_config)
+            # Step 2: Resolve concurrency limits (step rate_limit overrides executor defaults)
+            rate_limit = step_config.get("rate_limit") or {}
+            max_in_flight = rate_limit.get("max_in_flight") or self.max_in_flight
+            max_in_flight_per_host = (
+                rate_limit.get("max_in_flight_per_host") or self.max_in_flight_per_host
+            )
+
             logger.info(
                 "crawl_starting",
-                seed_url=url,
-                total_pages=len(pagination_urls),
+                seed_url=seed_url,
+                total_seeds=len(seed_urls),
+                max_in_flight=max_in_flight,
+                max_in_flight_per_host=max_in_flight_per_host,
                 method=method,
             )
 
-            # Step 3: Crawl each page and extract URLs
-            all_urls: list[str] = []
-            pages_crawled = 0
-            pages_failed = 0
-            errors: list[str] = []
+            # Step 3: Crawl seeds concurrently, each page by page
+            seed_results = await self._crawl_seeds(
+                executor,
+                seed_urls,
+                step_config,
+                selectors,
+                url_sink,
+                max_in_flight=min(max_in_flight, len(seed_urls)),
+                max_in_flight_per_host=max_in_flight_per_host,
+            )
 
-            for idx, page_url in enumerate(pagination_urls):
-                logger.debug(
-                    "crawling_page",
-                    page_index=idx,
-                    total_pages=len(pagination_urls),
-                    page_url=page_url,
+            # Step 4: Deduplicate URLs across seeds, in seed order
+            unique_urls: dict[str, None] = {}  # Insertion-ordered set
+            seed_stats: list[dict[str, Any]] = []
+            for seed_result in seed_results:
+                new_urls = [u for u in dict.fromkeys(seed_result.urls) if u not in unique_urls]
+                unique_urls.update(dict.fromkeys(new_urls))
+                seed_stats.append(
+                    {
+                        "seed_url": seed_result.seed_url,
+                        "pages_crawled": seed_result.pages_crawled,
+                        "pages_failed": seed_result.pages_failed,
+                        "urls_found": len(seed_result.urls),
+                        "new_urls": len(new_urls),
+                    }
                 )
 
-                # Execute page fetch
-                page_result = await executor.execute(page_url, step_config, selectors)
-
-                if page_result.success:
-                    pages_crawled += 1
-
-                    # Extract URLs from page (convert relative to absolute using page_url as base)
-                    page_urls = self._extract_urls_from_result(page_result, base_url=page_url)
-                    all_urls.extend(page_urls)
-
-                    logger.debug(
-                        "page_crawled",
-                        page_index=idx,
-                        page_url=page_url,
-                        urls_found=len(page_urls),
-                    )
-                else:
-                    pages_failed += 1
-                    error_msg = f"Page {idx} ({page_url}): {page_result.error}"
-                    errors.append(error_msg)
-                    logger.warning(
-                        "page_crawl_failed",
-                        page_index=idx,
-                        page_url=page_url,
-                        error=page_result.error,
-                    )
-
-            # Step 4: Deduplicate URLs
-            unique_urls = list(dict.fromkeys(all_urls))  # Preserve order while deduplicating
+            total_urls_found = sum(len(result.urls) for result in seed_results)
+            total_pages = sum(result.total_pages for result in seed_results)
+            pages_crawled = sum(result.pages_crawled for result in seed_results)
+            pages_failed = sum(result.pages_failed for result in seed_results)
+            errors = [error for result in seed_results for error in result.errors]
+            duplicate_urls = total_urls_found - len(unique_urls)
 
             # Step 5: Build extracted_data with selector field names AND crawl metadata
             # We need to preserve the original selector field names for data passing
@@ -183,14 +217,15 @@ class CrawlExecutor(BaseStepExecutor):
                 # Reconstruct the extracted data with original field names
                 # For crawl steps, we typically have one main field with URLs
                 for field_name in selectors:
-                    extracted_data[field_name] = unique_urls
+                    extracted_data[field_name] = list(unique_urls)
 
             # Always add standard crawl metadata fields
             extracted_data["_crawl_metadata"] = {
                 "total_urls": len(unique_urls),
                 "pages_crawled": pages_crawled,
                 "pages_failed": pages_failed,
-                "duplicate_urls": len(all_urls) - len(unique_urls),
+                "duplicate_urls": duplicate_urls,
+                "seeds": seed_stats,
             }
 
             # Step 6: Check if ALL pages failed (complete failure)
@@ -198,12 +233,13 @@ class CrawlExecutor(BaseStepExecutor):
                 error_summary = "; ".join(errors) if errors else "All pages failed"
                 logger.error(
                     "crawl_failed_all_pages",
-                    seed_url=url,
+                    seed_url=seed_url,
+                    total_seeds=len(seed_urls),
                     pages_failed=pages_failed,
                 )
                 return self._create_error_result(
                     f"All pages failed: {error_summary}",
-                    seed_url=url,
+                    seed_url=seed_url,
                     pages_failed=pages_failed,
                 )
 
@@ -211,16 +247,17 @@ class CrawlExecutor(BaseStepExecutor):
             if len(unique_urls) == 0:
                 logger.info(
                     "crawl_completed_no_urls",
-                    seed_url=url,
+                    seed_url=seed_url,
                     pages_crawled=pages_crawled,
                     pages_failed=pages_failed,
                 )
 
             logger.info(
                 "crawl_completed",
-                seed_url=url,
+                seed_url=seed_url,
+                total_seeds=len(seed_urls),
                 total_urls=len(unique_urls),
-                duplicate_urls=len(all_urls) - len(unique_urls),
+                duplicate_urls=duplicate_urls,
                 pages_crawled=pages_crawled,
                 pages_failed=pages_failed,
             )
@@ -229,25 +266,160 @@ class CrawlExecutor(BaseStepExecutor):
             return self._create_success_result(
                 content="",  # Don't store raw HTML content for crawl steps
                 extracted_data=extracted_data,
-                seed_url=url,
+                seed_url=seed_url,
+                total_seeds=len(seed_urls),
                 pagination_enabled=step_config.get("pagination", {}).get("enabled", False),
-                total_pages=len(pagination_urls),
-                duplicate_urls=len(all_urls) - len(unique_urls),
+                total_pages=total_pages,
+                duplicate_urls=duplicate_urls,
                 errors=errors if errors else None,
             )
 
         except Exception as e:
             logger.error(
                 "crawl_execution_error",
-                seed_url=url,
+                seed_url=seed_url,
                 error=str(e),
                 exc_info=True,
             )
             return self._create_error_result(
                 f"Crawl execution error: {e}",
-                seed_url=url,
+                seed_url=seed_url,
             )
 
+    async def _crawl_seeds(
+        self,
+        executor: HTTPExecutor | APIExecutor | BrowserExecutor,
+        seed_urls: list[str],
+        step_config: dict[str, Any],
+        selectors: dict[str, Any] | None,
+        url_sink: UrlSink | None,
+        max_in_flight: int,
+        max_in_flight_per_host: int,
+    ) -> list[SeedCrawlResult]:
+        """Crawl seeds concurrently through a fixed number of seed workers.
+
+        Each worker takes the next seed as soon as its current one is done, so one
+        long category does not hold up the others.
+
+        Args:
+            executor: Method-specific executor
+            seed_urls: Seeds to crawl
+            step_config: Configuration (method, pagination, timeout, etc.)
+            selectors: Selectors for URL extraction
+            url_sink: Optional coroutine receiving new URLs as pages are crawled
+            max_in_flight: Maximum seeds crawled at once
+            max_in_flight_per_host: Maximum pages of one host fetched at once
+
+        Returns:
+            Crawl result for each seed, in the order of seed_urls
+        """
+        results: list[SeedCrawlResult] = [SeedCrawlResult(seed_url=u) for u in seed_urls]
+        host_slots: dict[str, asyncio.Semaphore] = {}
+        streamed_urls: set[str] = set()
+        # Pages already taken by a seed (e.g. a url_template shared by all seeds)
+        claimed_pages: set[str] = set()
+        # Shared by all workers: each seed is taken exactly once
+        pending = iter(results)
+
+        def host_slot(page_url: str) -> asyncio.Semaphore:
+            """Get the semaphore capping concurrent pages of a URL's host."""
+            host = urlsplit(page_url).hostname or ""
+            if host not in host_slots:
+                host_slots[host] = asyncio.Semaphore(max_in_flight_per_host)
+            return host_slots[host]
+
+        async def stream(page_urls: list[str]) -> None:
+            """Hand URLs not seen on any earlier page to the sink."""
+            # Guard: nobody consumes URLs while crawling
+            if url_sink is None:
+                return
+
+            new_urls = [u for u in dict.fromkeys(page_urls) if u not in streamed_urls]
+            if new_urls:
+                streamed_urls.update(new_urls)
+                await url_sink(new_urls)
+
+        async def crawl_worker() -> None:
+            for seed_result in pending:
+                await self._crawl_seed(
+                    executor, seed_result, step_config, selectors, host_slot, stream, claimed_pages
+                )
+
+        await asyncio.gather(*(crawl_worker() for _ in range(max_in_flight)))
+        return results
+
+    async def _crawl_seed(
+        self,
+        executor: HTTPExecutor | APIExecutor | BrowserExecutor,
+        seed_result: SeedCrawlResult,
+        step_config: dict[str, Any],
+        selectors: dict[str, Any] | None,
+        host_slot: Callable[[str], asyncio.Semaphore],
+        stream: Callable[[list[str]], Awaitable[None]],
+        claimed_pages: set[str],
+    ) -> None:
+        """Crawl the pages of one seed in order, skipping pages another seed took.
+
+        Args:
+            executor: Method-specific executor
+            seed_result: Result of the seed to crawl (updated in place)
+            step_config: Configuration (method, pagination, timeout, etc.)
+            selectors: Selectors for URL extraction
+            host_slot: Returns the per-host semaphore for a page URL
+            stream: Coroutine handing a page's URLs to the URL sink
+            claimed_pages: Page URLs already taken by any seed of this crawl
+        """
+        pagination_urls = [
+            page_url
+            for page_url in self._generate_pagination_urls(seed_result.seed_url, step_config)
+            if page_url not in claimed_pages
+        ]
+        claimed_pages.update(pagination_urls)
+        seed_result.total_pages = len(pagination_urls)
+
+        for idx, page_url in enumerate(pagination_urls):
+            logger.debug(
+                "crawling_page",
+                seed_url=seed_result.seed_url,
+                page_index=idx,
+                total_pages=len(pagination_urls),
+                page_url=page_url,
+            )
+
+            # Execute page fetch (a raising page fails alone, not the other seeds)
+            try:
+                async with host_slot(page_url):
+                    page_result = await executor.execute(page_url, step_config, selectors)
+            except Exception as e:
+                page_result = ExecutionResult(success=False, error=str(e))
+
+            if page_result.success:
+                seed_result.pages_crawled += 1
+
+                # Extract URLs from page (convert relative to absolute using page_url as base)
+                page_urls = self._extract_urls_from_result(page_result, base_url=page_url)
+                seed_result.urls.extend(page_urls)
+
+                logger.debug(
+                    "page_crawled",
+                    page_index=idx,
+                    page_url=page_url,
+                    urls_found=len(page_urls),
+                )
+
+                # Hand over URLs not seen on earlier pages of any seed
+                await stream(page_urls)
+            else:
+                seed_result.pages_failed += 1
+                error_msg = f"Page {idx} ({page_url}): {page_result.error}"
+                seed_result.errors.append(error_msg)
+                logger.warning(
+                    "page_crawl_failed",
+                    page_index=idx,
+                    page_url=page_url,
+                    error=page_result.error,
+                )
+
     def _get_method_executor(self, method: str) -> HTTPExecutor | APIExecutor | BrowserExecutor:
         """Get executor for specified method.
 
@@ -5,18 +5,27 @@ Handles HTTP/HTTPS requests without browser automation.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from crawler.core import metrics
 from crawler.core.logging import get_logger
 from crawler.services.executor_retry import execute_with_retry
 from crawler.services.local_rate_limiter import LocalRateLimiter
+from crawler.services.page_validators import UNCHANGED_CONTENT_HASH, UNCHANGED_NOT_MODIFIED
+from crawler.services.resource_cleanup import HTTPResourceManager
 from crawler.services.selector_processor import SelectorProcessor
 from crawler.services.step_executors.base import BaseStepExecutor, ExecutionResult
 
+if TYPE_CHECKING:
+    from crawler.services.page_validators import PageValidators
+
 logger = get_logger(__name__)
 
+# Methods that may carry If-None-Match / If-Modified-Since (RFC 9110 section 13)
+CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
+
 
 class HTTPExecutor(BaseStepExecutor):
     """Executor for HTTP method steps using httpx client."""
@@ -44,6 +53,7 @@ class HTTPExecutor(BaseStepExecutor):
         url: str,
         step_config: dict[str, Any],
         selectors: dict[str, Any] | None = None,
+        validators: PageValidators | None = None,
     ) -> ExecutionResult:
         """Execute HTTP request and extract data with retry logic.
 
@@ -51,15 +61,19 @@ class HTTPExecutor(BaseStepExecutor):
             url: Target URL
             step_config: Configuration (timeout, headers, retry, etc.)
             selectors: Selectors for data extraction
+            validators: Validators saved with the last crawl of url. When set, the
+                request is conditional, and a 304 response or a body identical to the
+                saved one returns an unchanged result without extracting data.
 
         Returns:
-            ExecutionResult with response content and extracted data
+            ExecutionResult with response content and extracted data. Unchanged pages
+            have no content and metadata["unchanged"] set to the reason.
         """
         # Extract retry config and wrap execution with retry logic
         retry_config = step_config.get("retry", {})
 
         return await execute_with_retry(
-            func=lambda: self._execute_once(url, step_config, selectors),
+            func=lambda: self._execute_once(url, step_config, selectors, validators),
             retry_config=retry_config,
             operation_name="http_request",
             url=url,
@@ -70,6 +84,7 @@ class HTTPExecutor(BaseStepExecutor):
         url: str,
         step_config: dict[str, Any],
         selectors: dict[str, Any] | None = None,
+        validators: PageValidators | None = None,
     ) -> ExecutionResult:
         """Execute HTTP request once (no retry logic - called by execute_with_retry).
 
@@ -77,6 +92,7 @@ class HTTPExecutor(BaseStepExecutor):
             url: Target URL
             step_config: Configuration (timeout, headers, etc.)
             selectors: Selectors for data extraction
+            validators: Validators saved with the last crawl of url, if any
 
         Returns:
             ExecutionResult with response content and extracted data
@@ -99,6 +115,10 @@ class HTTPExecutor(BaseStepExecutor):
             headers = dict(step_config.get("headers", {}))
             method = step_config.get("http_method", "GET").upper()
 
+            # Make the request conditional on the saved version (step headers win)
+            if validators and method in CONDITIONAL_METHODS:
+                headers = {**validators.conditional_headers(), **headers}
+
             # Make HTTP request (with rate limiting if configured)
             logger.info(
                 "http_request_starting",
@@ -106,6 +126,7 @@ class HTTPExecutor(BaseStepExecutor):
                 method=method,
                 timeout=timeout,
                 rate_limited=self.rate_limiter is not None,
+                conditional=validators is not None,
             )
 
             # Extract additional request kwargs from step_config
@@ -126,7 +147,18 @@ class HTTPExecutor(BaseStepExecutor):
 
             # Apply rate limiting if configured
             if self.rate_limiter:
-                async with self.rate_limiter.acquire():
+                async with self.rate_limiter.acquire(url):
+                    with metrics.observe_stage("fetch", url):
+                        response = await client.request(
+                            method=method,
+                            url=url,
+                            headers=headers,
+                            timeout=timeout,
+                            follow_redirects=True,
+                            **extra_kwargs,
+                        )
+            else:
+                with metrics.observe_stage("fetch", url):
                     response = await client.request(
                         method=method,
                         url=url,
@@ -135,19 +167,16 @@ class HTTPExecutor(BaseStepExecutor):
                         follow_redirects=True,
                         **extra_kwargs,
                     )
-            else:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    timeout=timeout,
-                    follow_redirects=True,
-                    **extra_kwargs,
-                )
 
             # Get descriptive status message (e.g., "200 OK", "404 Not Found")
             status_name = response.reason_phrase or "Unknown"
 
+            # Guard: server confirmed the saved version is current
+            if validators and response.status_code == 304:
+                return self._create_unchanged_result(
+                    url, response, UNCHANGED_NOT_MODIFIED, status_name
+                )
+
             # Check status
             if not 200 <= response.status_code < 300:
                 # Log error - classification handled by executor_retry.py
@@ -168,10 +197,17 @@ class HTTPExecutor(BaseStepExecutor):
             # Get content
             content = response.text
 
+            # Guard: body identical to the saved version, nothing to extract
+            if validators and validators.matches_content(content):
+                return self._create_unchanged_result(
+                    url, response, UNCHANGED_CONTENT_HASH, status_name
+                )
+
             # Extract data using selectors
             extracted_data = {}
             if selectors:
-                extracted_data = self.selector_processor.process_selectors(content, selectors)
+                with metrics.observe_stage("extract", url):
+                    extracted_data = self.selector_processor.process_selectors(content, selectors)
 
             logger.info(
                 "http_request_completed",
@@ -189,6 +225,8 @@ class HTTPExecutor(BaseStepExecutor):
                 status_name=status_name,
                 content_length=len(content),
                 headers=dict(response.headers),
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
             )
 
         except httpx.TimeoutException as e:
@@ -230,6 +268,36 @@ class HTTPExecutor(BaseStepExecutor):
                 url=url,
             )
 
+    def _create_unchanged_result(
+        self, url: str, response: httpx.Response, reason: str, status_name: str
+    ) -> ExecutionResult:
+        """Create the result for a page that did not change since the last crawl.
+
+        Args:
+            url: Target URL
+            response: Response to the conditional request
+            reason: Why the page is unchanged (UNCHANGED_NOT_MODIFIED or
+                UNCHANGED_CONTENT_HASH)
+            status_name: Descriptive status message
+
+        Returns:
+            Successful ExecutionResult without content or extracted data
+        """
+        metrics.pages_unchanged_total.labels(reason=reason).inc()
+        logger.info(
+            "http_request_unchanged",
+            url=url,
+            status_code=response.status_code,
+            reason=reason,
+        )
+        return self._create_success_result(
+            content="",
+            extracted_data={},
+            status_code=response.status_code,
+            status_name=status_name,
+            unchanged=reason,
+        )
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create httpx client.
 
@@ -246,6 +314,17 @@ class HTTPExecutor(BaseStepExecutor):
             )
         return self._client
 
+    def get_resource_manager(self) -> HTTPResourceManager | None:
+        """Get a resource manager for the client, so cancellation can close it.
+
+        Returns:
+            Manager of the client this executor created, or None if it has not
+            created one or was given its client
+        """
+        if self._client is None or not self._owns_client:
+            return None
+        return HTTPResourceManager(self._client)
+
     async def cleanup(self) -> None:
         """Clean up HTTP client resources."""
         if self._client is not None and self._owns_client:
@@ -1,33 +1,53 @@
 """Scrape step executor for extracting content from detail pages.
 
 This executor handles scrape steps that extract content from multiple URLs.
-It processes URLs in batches for efficiency and handles partial failures gracefully.
+It keeps a sliding window of URLs in flight, capped per job and per host, and
+handles partial failures gracefully. Pages that did not change since their last
+crawl can be skipped through conditional requests, and pages an earlier attempt
+of the job already scraped can be replayed instead of scraped again.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any
+import heapq
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import urlsplit
 
 from crawler.core.logging import get_logger
+from crawler.services.page_validators import VALIDATOR_FIELDS
 from crawler.services.selector_processor import SelectorProcessor
 from crawler.services.step_executors.base import BaseStepExecutor, ExecutionResult
 
 if TYPE_CHECKING:
+    from crawler.services.page_validators import PageValidators, ValidatorLookup
     from crawler.services.step_executors import APIExecutor, BrowserExecutor, HTTPExecutor
 
 logger = get_logger(__name__)
 
+# Receives each successfully scraped page (_url, _content and extracted fields)
+PageSink = Callable[[dict[str, Any]], Awaitable[None]]
+
 
 class ScrapeExecutor(BaseStepExecutor):
     """Executor for scrape steps that extract content from detail pages.
 
     This executor:
     1. Accepts URLs from previous steps
-    2. Processes URLs in batches of 100 for efficiency
+    2. Keeps up to max_in_flight URLs running (at most max_in_flight_per_host per
+       host) and starts the next URL as soon as one finishes
     3. Extracts content using configured selectors
     4. Handles partial failures (continues with successful extractions)
-    5. Returns structured extracted data and documents
+    5. Returns structured extracted data and documents, or streams each page to a
+       page sink as soon as it is scraped
+    6. Optionally takes more URLs from a stream of batches while it runs, so it
+       can start on a crawl step's URLs before the crawl finishes
+    7. Optionally re-crawls known URLs with conditional HTTP requests and skips
+       pages that did not change since they were saved
+    8. Optionally resumes from the pages an earlier attempt scraped, scraping only
+       the URLs that are left, and records each new page as it is scraped
 
     Example:
         >>> executor = ScrapeExecutor(
@@ -42,8 +62,14 @@ class ScrapeExecutor(BaseStepExecutor):
         >>> print(result.extracted_data)  # {"title": "...", "content": "..."}
     """
 
-    # Default batch size for processing URLs
-    DEFAULT_BATCH_SIZE = 100
+    # Default maximum number of URLs scraped at once
+    DEFAULT_MAX_IN_FLIGHT = 100
+
+    # Default maximum number of URLs of the same host scraped at once
+    DEFAULT_MAX_IN_FLIGHT_PER_HOST = 10
+
+    # URLs whose saved validators are looked up together
+    VALIDATOR_LOOKUP_BATCH_SIZE = 500
 
     def __init__(
         self,
@@ -51,7 +77,8 @@ class ScrapeExecutor(BaseStepExecutor):
         api_executor: APIExecutor,
         browser_executor: BrowserExecutor,
         selector_processor: SelectorProcessor | None = None,
-        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        max_in_flight_per_host: int | None = None,
     ):
         """Initialize scrape executor.
 
@@ -60,19 +87,26 @@ class ScrapeExecutor(BaseStepExecutor):
             api_executor: API executor for API method
             browser_executor: Browser executor for browser method
             selector_processor: Selector processor for data extraction
-            batch_size: Number of URLs to process in each batch (default: 100)
+            max_in_flight: Maximum URLs scraped at once (default: 100)
+            max_in_flight_per_host: Maximum URLs of one host scraped at once (default: 10)
         """
         self.http_executor = http_executor
         self.api_executor = api_executor
         self.browser_executor = browser_executor
         self.selector_processor = selector_processor or SelectorProcessor()
-        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self.max_in_flight = max_in_flight or self.DEFAULT_MAX_IN_FLIGHT
+        self.max_in_flight_per_host = max_in_flight_per_host or self.DEFAULT_MAX_IN_FLIGHT_PER_HOST
 
     async def execute(
         self,
         url: str | list[str],
         step_config: dict[str, Any],
         selectors: dict[str, Any] | None = None,
+        page_sink: PageSink | None = None,
+        url_batches: AsyncIterator[list[str]] | None = None,
+        validator_lookup: ValidatorLookup | None = None,
+        resumed_pages: AsyncIterator[dict[str, Any]] | None = None,
+        page_checkpoint: PageSink | None = None,
     ) -> ExecutionResult:
         """Execute scrape step to extract content from URLs.
 
@@ -80,6 +114,23 @@ class ScrapeExecutor(BaseStepExecutor):
             url: Single URL or list of URLs to scrape
             step_config: Configuration (method, timeout, headers, etc.)
             selectors: Selectors for content extraction
+            page_sink: Optional coroutine receiving each scraped page. When set, pages
+                are handed over as they complete instead of being collected, and the
+                scrape waits while the sink applies backpressure.
+            url_batches: Optional stream of further URLs to scrape after url. The
+                scrape ends once the stream ends and every URL is done. A new batch is
+                only taken while fewer than max_in_flight URLs are waiting, so a slow
+                scrape backs up into the producer of the stream.
+            validator_lookup: Optional lookup of the validators saved with earlier
+                crawls of the URLs (http method only). Known URLs are fetched with
+                conditional requests, and unchanged pages are neither returned nor
+                handed to the page sink.
+            resumed_pages: Optional stream of the pages an earlier attempt of the job
+                scraped. They are handed to the page sink (or collected) before the
+                scrape starts, and their URLs are not scraped again.
+            page_checkpoint: Optional coroutine recording each page scraped in this
+                attempt, so a later attempt can resume from it. Unchanged pages are
+                not recorded.
 
         Returns:
             ExecutionResult with extracted content and metadata
@@ -89,14 +140,43 @@ class ScrapeExecutor(BaseStepExecutor):
 
         For multiple URLs:
         - extracted_data: {"items": [{"title": "...", "content": "..."}, ...]}
+
+        With a page sink:
+        - extracted_data: {} and metadata["streamed"] is True
+
+        metadata["unchanged_urls"] and metadata["changed_urls"] split the successful
+        URLs by whether the page changed since its last crawl. Resumed pages count as
+        successful and changed, and metadata["resumed_urls"] counts them.
         """
         try:
-            # Step 1: Normalize URL input to list
-            urls = [url] if isinstance(url, str) else url
-            total_urls = len(urls)
+            # Step 1: Normalize URL input to list (streamed URLs are appended to it)
+            urls = [url] if isinstance(url, str) else list(url)
+
+            # Replay the pages of an earlier attempt and leave their URLs out
+            resumed_data: list[dict[str, Any]] = []
+            resumed_urls: set[str] = set()
+            if resumed_pages is not None:
+                async for page in resumed_pages:
+                    resumed_urls.add(page["_url"])
+                    if page_sink is not None:
+                        await page_sink(page)
+                    else:
+                        resumed_data.append(page)
+
+            if resumed_urls:
+                urls = [page_url for page_url in urls if page_url not in resumed_urls]
+                if url_batches is not None:
+                    url_batches = self._skip_urls(url_batches, resumed_urls)
+                logger.info(
+                    "scrape_resumed",
+                    resumed_urls=len(resumed_urls),
+                    remaining_urls=len(urls),
+                )
+
+            total_urls = len(urls) + len(resumed_urls)
 
             # Guard: no URLs to process
-            if total_urls == 0:
+            if total_urls == 0 and url_batches is None:
                 logger.warning("scrape_no_urls", step_config=step_config)
                 return self._create_success_result(
                     content="",
@@ -110,99 +190,104 @@ class ScrapeExecutor(BaseStepExecutor):
             method = step_config.get("method", "http").lower()
             executor = self._get_method_executor(method)
 
+            # Conditional requests need the HTTP executor
+            if validator_lookup is not None and method != "http":
+                logger.debug("scrape_conditional_requests_unsupported", method=method)
+                validator_lookup = None
+
+            # Step 3: Resolve concurrency limits (step rate_limit overrides executor defaults)
+            rate_limit = step_config.get("rate_limit") or {}
+            max_in_flight = rate_limit.get("max_in_flight") or self.max_in_flight
+            max_in_flight_per_host = (
+                rate_limit.get("max_in_flight_per_host") or self.max_in_flight_per_host
+            )
+
             logger.info(
                 "scrape_starting",
                 total_urls=total_urls,
-                batch_size=self.batch_size,
+                resumed_urls=len(resumed_urls),
+                max_in_flight=max_in_flight,
+                max_in_flight_per_host=max_in_flight_per_host,
                 method=method,
+                streaming=page_sink is not None,
+                streamed_input=url_batches is not None,
+                conditional=validator_lookup is not None,
             )
 
-            # Step 3: Process URLs in batches
-            all_extracted_data: list[dict[str, Any]] = []
-            failed_urls = 0
-            errors: list[str] = []
-
-            for batch_start in range(0, total_urls, self.batch_size):
-                batch_end = min(batch_start + self.batch_size, total_urls)
-                batch_urls = urls[batch_start:batch_end]
-                batch_num = (batch_start // self.batch_size) + 1
-                total_batches = (total_urls + self.batch_size - 1) // self.batch_size
+            # Step 4: Scrape URLs through a sliding window
+            results = await self._scrape_urls(
+                executor,
+                urls,
+                step_config,
+                selectors,
+                page_sink,
+                max_in_flight=max_in_flight,
+                max_in_flight_per_host=max_in_flight_per_host,
+                url_batches=url_batches,
+                validator_lookup=validator_lookup,
+                page_checkpoint=page_checkpoint,
+            )
+            total_urls = len(urls) + len(resumed_urls)
 
-                logger.info(
-                    "scrape_batch_starting",
-                    batch_num=batch_num,
-                    total_batches=total_batches,
-                    batch_size=len(batch_urls),
+            # Guard: the URL stream ended without URLs
+            if total_urls == 0:
+                logger.warning("scrape_no_urls", step_config=step_config)
+                return self._create_success_result(
+                    content="",
+                    extracted_data={},
+                    total_urls=0,
+                    successful_urls=0,
+                    failed_urls=0,
                 )
 
-                # Process all URLs in the batch concurrently using asyncio.gather
-                tasks = [
-                    executor.execute(batch_url, step_config, selectors) for batch_url in batch_urls
-                ]
-
-                # Execute all tasks concurrently
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process results
-                for idx, result_or_exception in enumerate(batch_results):
-                    global_idx = batch_start + idx
-                    batch_url = batch_urls[idx]
-
-                    # Handle exceptions from gather
-                    if isinstance(result_or_exception, Exception):
-                        failed_urls += 1
-                        error_msg = f"URL {global_idx} ({batch_url}): {result_or_exception}"
-                        errors.append(error_msg)
-                        logger.warning(
-                            "url_scraped_failed",
-                            url_index=global_idx,
-                            url=batch_url,
-                            error=str(result_or_exception),
-                        )
-                        continue
-
-                    # Type narrowing: after exception check, must be ExecutionResult
-                    assert isinstance(result_or_exception, ExecutionResult)
-                    result = result_or_exception
-
-                    if result.success:
-                        # Include URL with extracted data for later persistence
-                        page_data = {
-                            "_url": batch_url,  # Store URL for database persistence
-                            "_content": result.content,  # Store raw content if available
-                            **result.extracted_data,  # Merge extracted fields
-                        }
-                        all_extracted_data.append(page_data)
-                        logger.debug(
-                            "url_scraped_success",
-                            url_index=global_idx,
-                            url=batch_url,
-                            fields=len(result.extracted_data),
-                        )
-                    else:
-                        failed_urls += 1
-                        error_msg = f"URL {global_idx} ({batch_url}): {result.error}"
-                        errors.append(error_msg)
-                        logger.warning(
-                            "url_scraped_failed",
-                            url_index=global_idx,
-                            url=batch_url,
-                            error=result.error,
-                        )
-
-                # Count successes directly from batch results
-                successful_in_batch = sum(
-                    1 for r in batch_results if isinstance(r, ExecutionResult) and r.success
-                )
-                logger.info(
-                    "scrape_batch_completed",
-                    batch_num=batch_num,
-                    successful_in_batch=successful_in_batch,
-                    failed_in_batch=len(batch_urls) - successful_in_batch,
-                )
+            all_extracted_data = resumed_data
+            successful_urls = len(resumed_urls)
+            unchanged_urls = 0
+            failed_urls = 0
+            errors: list[str] = []
 
-            # Step 4: Calculate results
-            successful_urls = len(all_extracted_data)
+            for idx, result_or_exception in enumerate(results):
+                page_url = urls[idx]
+
+                # Handle exceptions raised while scraping the URL
+                if isinstance(result_or_exception, Exception):
+                    failed_urls += 1
+                    error_msg = f"URL {idx} ({page_url}): {result_or_exception}"
+                    errors.append(error_msg)
+                    logger.warning(
+                        "url_scraped_failed",
+                        url_index=idx,
+                        url=page_url,
+                        error=str(result_or_exception),
+                    )
+                    continue
+
+                result = result_or_exception
+
+                if result.success:
+                    successful_urls += 1
+                    if result.metadata.get("unchanged"):
+                        # Saved version is current, nothing to return or persist
+                        unchanged_urls += 1
+                    elif page_sink is None:
+                        # Streamed pages were already handed to the page sink
+                        all_extracted_data.append(self._build_page_data(page_url, result))
+                    logger.debug(
+                        "url_scraped_success",
+                        url_index=idx,
+                        url=page_url,
+                        fields=len(result.extracted_data),
+                    )
+                else:
+                    failed_urls += 1
+                    error_msg = f"URL {idx} ({page_url}): {result.error}"
+                    errors.append(error_msg)
+                    logger.warning(
+                        "url_scraped_failed",
+                        url_index=idx,
+                        url=page_url,
+                        error=result.error,
+                    )
 
             # Step 5: Check for complete failure
             if successful_urls == 0:
@@ -222,7 +307,10 @@ class ScrapeExecutor(BaseStepExecutor):
                 )
 
             # Step 6: Structure output based on URL count
-            if len(urls) == 1:
+            if page_sink is not None:
+                # Pages live in the sink, not in the step result
+                extracted_data = {}
+            elif total_urls == 1:
                 # Single URL: return extracted data directly
                 extracted_data = all_extracted_data[0] if all_extracted_data else {}
             else:
@@ -234,8 +322,8 @@ class ScrapeExecutor(BaseStepExecutor):
                 "scrape_completed",
                 total_urls=total_urls,
                 successful_urls=successful_urls,
+                unchanged_urls=unchanged_urls,
                 failed_urls=failed_urls,
-                batches_processed=total_batches,
             )
 
             # Return success result with metadata
@@ -244,8 +332,12 @@ class ScrapeExecutor(BaseStepExecutor):
                 extracted_data=extracted_data,
                 total_urls=total_urls,
                 successful_urls=successful_urls,
+                unchanged_urls=unchanged_urls,
+                changed_urls=successful_urls - unchanged_urls,
                 failed_urls=failed_urls,
+                resumed_urls=len(resumed_urls),
                 errors=errors if errors else None,
+                streamed=page_sink is not None,
             )
 
         except Exception as e:
@@ -258,6 +350,274 @@ class ScrapeExecutor(BaseStepExecutor):
                 f"Scrape execution error: {e}",
             )
 
+    async def _scrape_urls(
+        self,
+        executor: HTTPExecutor | APIExecutor | BrowserExecutor,
+        urls: list[str],
+        step_config: dict[str, Any],
+        selectors: dict[str, Any] | None,
+        page_sink: PageSink | None,
+        max_in_flight: int,
+        max_in_flight_per_host: int,
+        url_batches: AsyncIterator[list[str]] | None = None,
+        validator_lookup: ValidatorLookup | None = None,
+        page_checkpoint: PageSink | None = None,
+    ) -> list[ExecutionResult | Exception]:
+        """Scrape URLs concurrently through a per-job and per-host sliding window.
+
+        A new URL starts as soon as any running one finishes, so one slow page only
+        holds its own slot instead of stalling a whole batch. Hosts take turns in
+        URL order, and a host at its cap is skipped until one of its URLs finishes.
+
+        Args:
+            executor: Method-specific executor
+            urls: URLs to scrape. URLs received from url_batches are appended.
+            step_config: Configuration (method, timeout, headers, etc.)
+            selectors: Selectors for content extraction
+            page_sink: Optional coroutine receiving each scraped page
+            max_in_flight: Maximum URLs scraped at once
+            max_in_flight_per_host: Maximum URLs of one host scraped at once
+            url_batches: Optional stream of further URLs, read until it ends
+            validator_lookup: Optional lookup of saved validators. URLs are looked up
+                in batches as they are queued, ahead of being scraped.
+            page_checkpoint: Optional coroutine recording each scraped page
+
+        Returns:
+            Result or raised exception for each URL, in the order of urls
+        """
+        results: list[ExecutionResult | Exception | None] = []
+
+        # Pending URL indexes per host, and a heap of hosts that may start a URL,
+        # keyed by the index of their next URL so work starts in URL order
+        pending_by_host: dict[str, deque[int]] = {}
+        ready_hosts: list[tuple[int, str]] = []
+
+        in_flight_by_host: dict[str, int] = {}
+        running: dict[asyncio.Task[ExecutionResult], tuple[int, str]] = {}
+        started = 0
+
+        # Validator lookup covering each URL, started when the URL is queued
+        lookups: list[asyncio.Task[dict[str, PageValidators]]] = []
+
+        def enqueue(start: int) -> None:
+            """Queue urls[start:] behind their hosts."""
+            for idx in range(start, len(urls)):
+                host = self._get_host(urls[idx])
+                pending = pending_by_host.setdefault(host, deque())
+                # A host becomes ready with its first queued URL unless it is capped
+                if not pending and in_flight_by_host.get(host, 0) < max_in_flight_per_host:
+                    heapq.heappush(ready_hosts, (idx, host))
+                pending.append(idx)
+            results.extend([None] * (len(urls) - len(results)))
+
+            # Guard: not re-crawling conditionally
+            if validator_lookup is None:
+                return
+            for chunk_start in range(start, len(urls), self.VALIDATOR_LOOKUP_BATCH_SIZE):
+                chunk = urls[chunk_start : chunk_start + self.VALIDATOR_LOOKUP_BATCH_SIZE]
+                lookup = asyncio.create_task(self._lookup_validators(validator_lookup, chunk))
+                lookups.extend([lookup] * len(chunk))
+
+        enqueue(0)
+        batches = aiter(url_batches) if url_batches is not None else None
+        receiving: asyncio.Future[list[str] | None] | None = None
+
+        try:
+            while ready_hosts or running or batches is not None:
+                # Fill free slots from hosts below their cap
+                while ready_hosts and len(running) < max_in_flight:
+                    _, host = heapq.heappop(ready_hosts)
+                    pending = pending_by_host[host]
+                    idx = pending.popleft()
+                    task = asyncio.create_task(
+                        self._scrape_url(
+                            executor,
+                            urls[idx],
+                            step_config,
+                            selectors,
+                            page_sink,
+                            lookups[idx] if lookups else None,
+                            page_checkpoint,
+                        )
+                    )
+                    running[task] = (idx, host)
+                    in_flight_by_host[host] = in_flight_by_host.get(host, 0) + 1
+                    started += 1
+
+                    # Host stays ready only while it has URLs left and a free slot
+                    if pending and in_flight_by_host[host] < max_in_flight_per_host:
+                        heapq.heappush(ready_hosts, (pending[0], host))
+
+                # Take the next batch only while the window is short of queued URLs
+                if (
+                    batches is not None
+                    and receiving is None
+                    and len(urls) - started < max_in_flight
+                ):
+                    receiving = asyncio.ensure_future(anext(batches, None))
+
+                waiting: set[asyncio.Future[Any]] = set(running)
+                if receiving is not None:
+                    waiting.add(receiving)
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+                if receiving is not None and receiving in done:
+                    done.discard(receiving)
+                    batch = receiving.result()
+                    receiving = None
+                    if batch is None:
+                        batches = None
+                    else:
+                        start = len(urls)
+                        urls.extend(batch)
+                        enqueue(start)
+
+                for finished in done:
+                    # Only scrape tasks are left in done once the batch future is taken out
+                    task = cast("asyncio.Task[ExecutionResult]", finished)
+                    idx, host = running.pop(task)
+                    exception = task.exception()
+                    results[idx] = exception if isinstance(exception, Exception) else task.result()
+
+                    # A host that was at its cap becomes ready again
+                    was_capped = in_flight_by_host[host] >= max_in_flight_per_host
+                    in_flight_by_host[host] -= 1
+                    pending = pending_by_host[host]
+                    if pending and was_capped:
+                        heapq.heappush(ready_hosts, (pending[0], host))
+        finally:
+            # Cancel remaining work if the step itself is cancelled or fails
+            if receiving is not None:
+                receiving.cancel()
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for lookup in set(lookups):
+                lookup.cancel()
+
+        return [result for result in results if result is not None]
+
+    async def _scrape_url(
+        self,
+        executor: HTTPExecutor | APIExecutor | BrowserExecutor,
+        url: str,
+        step_config: dict[str, Any],
+        selectors: dict[str, Any] | None,
+        page_sink: PageSink | None,
+        lookup: asyncio.Task[dict[str, PageValidators]] | None = None,
+        page_checkpoint: PageSink | None = None,
+    ) -> ExecutionResult:
+        """Scrape one URL and hand the page to the sink if streaming.
+
+        Args:
+            executor: Method-specific executor
+            url: URL to scrape
+            step_config: Configuration (method, timeout, headers, etc.)
+            selectors: Selectors for content extraction
+            page_sink: Optional coroutine receiving the scraped page
+            lookup: Optional validator lookup covering url (HTTP executor only)
+            page_checkpoint: Optional coroutine recording the scraped page
+
+        Returns:
+            ExecutionResult from the executor. When streaming, successful results are
+            returned without content or extracted data so the batch does not keep them.
+        """
+        validators = (await lookup).get(url) if lookup is not None else None
+        if validators is not None:
+            result = await executor.execute(  # type: ignore[call-arg]
+                url, step_config, selectors, validators=validators
+            )
+        else:
+            result = await executor.execute(url, step_config, selectors)
+
+        # Guard: nothing to record or stream, or page unchanged since last crawl
+        if not result.success or result.metadata.get("unchanged"):
+            return result
+
+        if page_checkpoint is not None:
+            await page_checkpoint(self._build_page_data(url, result))
+
+        # Guard: not streaming - the page is collected from the result
+        if page_sink is None:
+            return result
+
+        await page_sink(self._build_page_data(url, result))
+        return ExecutionResult(success=True, status_code=result.status_code)
+
+    def _build_page_data(self, url: str, result: ExecutionResult) -> dict[str, Any]:
+        """Build the page record consumed by result persistence.
+
+        Args:
+            url: Scraped URL
+            result: Successful execution result for the URL
+
+        Returns:
+            Page data with _url, _content, extracted fields and the response
+            validators (_etag, _last_modified) if any
+        """
+        page_data = {
+            "_url": url,  # Store URL for database persistence
+            "_content": result.content,  # Store raw content if available
+            **result.extracted_data,  # Merge extracted fields
+        }
+
+        # Response validators for the next conditional re-crawl
+        for key in VALIDATOR_FIELDS:
+            if result.metadata.get(key):
+                page_data[f"_{key}"] = result.metadata[key]
+
+        return page_data
+
+    @staticmethod
+    async def _skip_urls(
+        url_batches: AsyncIterator[list[str]], skipped: set[str]
+    ) -> AsyncIterator[list[str]]:
+        """Stream URL batches without the URLs that are already done.
+
+        Args:
+            url_batches: Stream of URL batches
+            skipped: URLs to leave out
+
+        Yields:
+            Batches without skipped URLs (batches left empty are dropped)
+        """
+        async for batch in url_batches:
+            remaining = [url for url in batch if url not in skipped]
+            if remaining:
+                yield remaining
+
+    @staticmethod
+    async def _lookup_validators(
+        validator_lookup: ValidatorLookup, urls: list[str]
+    ) -> dict[str, PageValidators]:
+        """Look up saved validators, treating a failed lookup as no known URLs.
+
+        Args:
+            validator_lookup: Lookup of saved validators
+            urls: URLs to look up
+
+        Returns:
+            Validators per known URL (empty if the lookup failed)
+        """
+        try:
+            return await validator_lookup(urls)
+        except Exception as e:
+            logger.warning("page_validator_lookup_failed", url_count=len(urls), error=str(e))
+            return {}
+
+    @staticmethod
+    def _get_host(url: str) -> str:
+        """Get the host a URL counts against for the per-host limit.
+
+        Args:
+            url: URL to scrape
+
+        Returns:
+            Lowercase hostname, or an empty string if the URL has none
+        """
+        return urlsplit(url).hostname or ""
+
     def _get_method_executor(self, method: str) -> HTTPExecutor | APIExecutor | BrowserExecutor:
         """Get executor for specified method.
 
@@ -8,13 +8,18 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import AsyncIterator, Coroutine
 from typing import TYPE_CHECKING, Any
 
+from crawler.core import metrics
 from crawler.core.logging import get_logger
+from crawler.db.generated.models import LogLevelEnum
 from crawler.services.condition_evaluator import ConditionEvaluator
 from crawler.services.dependency_validator import DependencyValidator
 from crawler.services.local_rate_limiter import LocalRateLimiter
+from crawler.services.resource_cleanup import CleanupCoordinator
 from crawler.services.selector_processor import SelectorProcessor
+from crawler.services.step_channel import DEFAULT_MAX_BATCHES, URLChannel
 from crawler.services.step_execution_context import StepExecutionContext, StepResult
 from crawler.services.step_executors import (
     APIExecutor,
@@ -28,7 +33,12 @@ from crawler.services.step_validator import StepValidationError, StepValidator
 from crawler.services.variable_resolver import VariableResolver
 
 if TYPE_CHECKING:
-    from crawler.services.redis_cache import JobCancellationFlag
+    from crawler.services.crawl_log_sink import CrawlLogSink
+    from crawler.services.job_checkpoint import JobCheckpoint
+    from crawler.services.page_validators import ValidatorLookup
+    from crawler.services.redis_cache import HostRateLimiter, JobCancellationFlag
+    from crawler.services.step_executors.crawl_executor import UrlSink
+    from crawler.services.step_executors.scrape_executor import PageSink
 
 logger = get_logger(__name__)
 
@@ -39,13 +49,22 @@ class StepOrchestrator:
     The orchestrator:
     1. Validates dependencies and detects cycles
     2. Determines execution order
-    3. Executes steps sequentially
+    3. Executes steps sequentially, or pipelines a scrape step with the crawl step
+       feeding it so scraping starts while the crawl is still running
     4. Resolves input dependencies and variables
     5. Passes data between steps
     6. Handles step skipping based on conditions
     7. Tracks results in execution context
+    8. Optionally checkpoints progress, so a retried job restores the steps an
+       earlier attempt completed and only scrapes the URLs that are left
+    9. Optionally stops the running step the moment a cancel event is set,
+       closing its in-flight requests and browser pages
+    10. Optionally writes the progress of each step to the job's crawl log
     """
 
+    # Seconds given to closing in-flight requests and pages on cancellation
+    CANCEL_CLEANUP_TIMEOUT = 1.0
+
     def __init__(
         self,
         job_id: str,
@@ -54,6 +73,14 @@ class StepOrchestrator:
         steps: list[dict[str, Any]],
         global_config: dict[str, Any] | None = None,
         cancellation_flag: JobCancellationFlag | None = None,
+        page_sink: PageSink | None = None,
+        host_limiter: HostRateLimiter | None = None,
+        pipeline_steps: bool = False,
+        pipeline_max_batches: int = DEFAULT_MAX_BATCHES,
+        validator_lookup: ValidatorLookup | None = None,
+        checkpoint: JobCheckpoint | None = None,
+        cancel_event: asyncio.Event | None = None,
+        log_sink: CrawlLogSink | None = None,
     ):
         """Initialize step orchestrator.
 
@@ -64,6 +91,25 @@ class StepOrchestrator:
             steps: List of step configurations
             global_config: Global configuration (timeout, headers, etc.)
             cancellation_flag: Optional cancellation flag for mid-execution cancellation
+            page_sink: Optional coroutine receiving scraped pages as they complete. Used
+                for scrape steps whose output no other step reads.
+            host_limiter: Optional cluster-wide per-host limiter shared with other
+                jobs and workers
+            pipeline_steps: Run a scrape step alongside the crawl step whose URLs it
+                reads, streaming the URLs through a bounded channel
+            pipeline_max_batches: URL batches (one per crawled page) queued between
+                pipelined steps before the crawl waits
+            validator_lookup: Optional lookup of the validators saved with earlier
+                crawls of the website's pages. Used to re-crawl pages conditionally in
+                scrape steps whose output no other step reads.
+            checkpoint: Optional durable progress of the job. Steps completed by an
+                earlier attempt are restored instead of executed, and scrape steps
+                resume from the pages already scraped.
+            cancel_event: Optional event set when the job is cancelled (see
+                JobCancellationRegistry). Replaces polling the cancellation flag, and
+                interrupts the running step instead of waiting for it to finish.
+            log_sink: Optional sink batching crawl log entries; step starts, skips,
+                completions and failures are written to the job's crawl log
         """
         self.job_id = job_id
         self.website_id = website_id
@@ -71,6 +117,13 @@ class StepOrchestrator:
         self.steps = steps
         self.global_config = global_config or {}
         self.cancellation_flag = cancellation_flag
+        self.page_sink = page_sink
+        self.pipeline_steps = pipeline_steps
+        self.pipeline_max_batches = pipeline_max_batches
+        self.validator_lookup = validator_lookup
+        self.checkpoint = checkpoint
+        self.cancel_event = cancel_event
+        self.log_sink = log_sink
 
         # Initialize context
         self.context = StepExecutionContext(
@@ -90,7 +143,7 @@ class StepOrchestrator:
         # (2 req/s, 5 concurrent, burst 10). To disable rate limiting,
         # set explicit high values in rate_limit config
         rate_limit_config = self.global_config.get("rate_limit", {})
-        self.rate_limiter = LocalRateLimiter.from_config(rate_limit_config)
+        self.rate_limiter = LocalRateLimiter.from_config(rate_limit_config, host_limiter)
 
         # Initialize executors (reuse clients for efficiency)
         # Pass rate_limiter to control request rates
@@ -118,6 +171,7 @@ class StepOrchestrator:
 
         # Execution order (determined by dependency validation)
         self.execution_order: list[str] = []
+        self.dependency_validator: DependencyValidator | None = None
 
     async def execute_workflow(self) -> StepExecutionContext:
         """Execute the complete workflow.
@@ -137,6 +191,7 @@ class StepOrchestrator:
             )
             validator = DependencyValidator(self.steps)
             self.execution_order = validator.validate()
+            self.dependency_validator = validator
 
             logger.info(
                 "dependency_validation_complete",
@@ -144,8 +199,17 @@ class StepOrchestrator:
                 execution_order=self.execution_order,
             )
 
+            # Load the progress of earlier attempts of the job
+            if self.checkpoint:
+                await self.checkpoint.load()
+
             # Step 2: Execute steps in order
+            pipelined_steps: set[str] = set()
             for step_name in self.execution_order:
+                # Guard: already executed alongside the step feeding it
+                if step_name in pipelined_steps:
+                    continue
+
                 # Check for cancellation between steps
                 if await self._check_cancellation():
                     logger.info(
@@ -163,8 +227,29 @@ class StepOrchestrator:
                     logger.error("step_not_found", step_name=step_name)
                     continue
 
-                # Execute step
-                await self._execute_step(step_config)
+                # Guard: completed by an earlier attempt of the job
+                if self._restore_step(step_config):
+                    continue
+
+                # Execute step, together with its consumer if the two can be pipelined
+                consumer_config = self._get_pipeline_consumer(step_config)
+                if consumer_config:
+                    pipelined_steps.add(consumer_config["name"])
+                    await self._run_until_cancelled(
+                        self._execute_pipeline(step_config, consumer_config)
+                    )
+                else:
+                    await self._run_until_cancelled(self._execute_step(step_config))
+
+                # Guard: cancellation noticed while a step was running
+                if self.context.metadata.get("cancelled"):
+                    logger.info(
+                        "workflow_cancelled",
+                        job_id=self.job_id,
+                        completed_steps=len(self.context.step_results),
+                        total_steps=len(self.steps),
+                    )
+                    return self.context
 
             logger.info(
                 "workflow_completed",
@@ -179,20 +264,85 @@ class StepOrchestrator:
             # Clean up resources
             await self._cleanup()
 
-    async def _execute_step(self, step_config: dict[str, Any]) -> None:
+    async def _run_until_cancelled(self, execution: Coroutine[Any, Any, None]) -> None:
+        """Run a step until it finishes or the cancel event is set.
+
+        On cancellation the step is cancelled mid-flight and its in-flight requests
+        and browser pages are closed through a CleanupCoordinator. The step leaves
+        no result, and the workflow is marked cancelled.
+
+        Args:
+            execution: Coroutine executing the step (or pipelined steps)
+        """
+        # Guard: no cancel event - cancellation is only checked between steps
+        if self.cancel_event is None:
+            await execution
+            return
+
+        step = asyncio.create_task(execution)
+        cancelled = asyncio.create_task(self.cancel_event.wait())
+        try:
+            await asyncio.wait({step, cancelled}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            cancelled.cancel()
+            if not step.done():
+                step.cancel()
+
+        # Guard: the step finished first (re-raise anything it raised)
+        if step.done():
+            step.result()
+            return
+
+        self.context.metadata["cancelled"] = True
+        cleanup_metadata = await self._close_in_flight()
+        await asyncio.gather(step, return_exceptions=True)
+        logger.info(
+            "step_interrupted_by_cancellation",
+            job_id=self.job_id,
+            cleanup_duration_seconds=cleanup_metadata["cleanup_duration_seconds"],
+        )
+
+    async def _close_in_flight(self) -> dict[str, Any]:
+        """Close the HTTP clients and browser pages of the executors.
+
+        Returns:
+            Cleanup metadata from the CleanupCoordinator
+        """
+        coordinator = CleanupCoordinator(graceful_timeout=self.CANCEL_CLEANUP_TIMEOUT)
+        for executor in (self.http_executor, self.api_executor):
+            resource = executor.get_resource_manager()
+            if resource is not None:
+                coordinator.register_resource(resource)
+        coordinator.register_resource(self.browser_executor.open_pages)
+        return await coordinator.cleanup_all(self.job_id, reason="Job cancellation requested")
+
+    async def _execute_step(
+        self,
+        step_config: dict[str, Any],
+        url_sink: UrlSink | None = None,
+        url_batches: AsyncIterator[list[str]] | None = None,
+        input_timeout: int = 0,
+    ) -> None:
         """Execute a single step with timeout enforcement.
 
         Args:
             step_config: Step configuration
+            url_sink: Optional sink receiving URLs as a crawl step finds them
+            url_batches: Optional stream of input URLs replacing URL resolution from
+                the execution context (scrape steps pipelined with their crawl step)
+            input_timeout: Seconds added to the step timeout for waiting on streamed
+                input, so a pipelined step gets no less time than when run alone
         """
         step_name = step_config["name"]
 
         try:
             logger.info("step_starting", job_id=self.job_id, step_name=step_name)
+            self._write_log("Step started", step_name=step_name)
 
             # Step 1: Check if step should be skipped
             if self._should_skip_step(step_config):
                 logger.info("step_skipped", step_name=step_name)
+                self._write_log("Step skipped", step_name=step_name)
                 self.context.add_result(
                     StepResult(
                         step_name=step_name,
@@ -201,42 +351,54 @@ class StepOrchestrator:
                 )
                 return
 
-            # Step 2: Resolve input URL(s)
-            urls = self._resolve_step_urls(step_config)
-            if not urls:
-                logger.warning("step_no_urls", step_name=step_name)
-                self.context.add_result(
-                    StepResult(
+            # Step 2: Resolve input URL(s); streamed URLs arrive during execution
+            step_type = step_config.get("type", "").lower()
+            urls: str | list[str] = []
+            if url_batches is None:
+                urls = self._resolve_step_urls(step_config)
+                if not urls:
+                    logger.warning("step_no_urls", step_name=step_name)
+                    self._write_log(
+                        "Step has no URLs to process",
+                        log_level=LogLevelEnum.WARNING,
                         step_name=step_name,
-                        error="No URLs to process",
                     )
-                )
-                return
+                    self.context.add_result(
+                        StepResult(
+                            step_name=step_name,
+                            error="No URLs to process",
+                        )
+                    )
+                    return
 
-            # Step 3: Validate input before execution
-            step_type = step_config.get("type", "").lower()
-            try:
-                self.step_validator.validate_input(
-                    step_name=step_name,
-                    step_type=step_type,
-                    input_data=urls,
-                    strict=True,  # Fail fast on invalid input
-                )
-            except StepValidationError as e:
-                logger.error(
-                    "step_input_validation_failed",
-                    step_name=step_name,
-                    errors=e.errors,
-                )
-                self.context.add_result(
-                    StepResult(
+                # Step 3: Validate input before execution
+                try:
+                    self.step_validator.validate_input(
                         step_name=step_name,
-                        error=f"Input validation failed: {e}",
-                        exception=e,  # Preserve original exception for retry classification
-                        metadata={"validation_errors": e.errors},
+                        step_type=step_type,
+                        input_data=urls,
+                        strict=True,  # Fail fast on invalid input
                     )
-                )
-                return
+                except StepValidationError as e:
+                    logger.error(
+                        "step_input_validation_failed",
+                        step_name=step_name,
+                        errors=e.errors,
+                    )
+                    self._write_log(
+                        f"Step input validation failed: {e}",
+                        log_level=LogLevelEnum.ERROR,
+                        step_name=step_name,
+                    )
+                    self.context.add_result(
+                        StepResult(
+                            step_name=step_name,
+                            error=f"Input validation failed: {e}",
+                            exception=e,  # Preserve original exception for retry classification
+                            metadata={"validation_errors": e.errors},
+                        )
+                    )
+                    return
 
             # Step 4: Get executor and merged config
             executor = self._get_executor(step_config)
@@ -244,14 +406,35 @@ class StepOrchestrator:
             selectors = step_config.get("selectors", {})
 
             # Step 5: Get timeout from config based on executor type
-            timeout_seconds = self._get_timeout_for_executor(executor, merged_config)
+            timeout_seconds = (
+                self._get_timeout_for_executor(executor, merged_config) + input_timeout
+            )
+
+            # Scrape steps checkpoint page by page instead of as a whole
+            page_checkpoint = self.checkpoint if isinstance(executor, ScrapeExecutor) else None
 
             # Step 6: Execute step with timeout enforcement and timing
+            step_type_token = metrics.current_step_type.set(step_type)
             start_time = time.time()
             try:
                 # Wrap execution with asyncio.wait_for for timeout enforcement
                 result = await asyncio.wait_for(
-                    self._execute_with_executor(executor, urls, merged_config, selectors),
+                    self._execute_with_executor(
+                        executor,
+                        urls,
+                        merged_config,
+                        selectors,
+                        page_sink=self._get_page_sink(step_name, executor),
+                        url_sink=url_sink,
+                        url_batches=url_batches,
+                        validator_lookup=self._get_validator_lookup(step_name, executor),
+                        resumed_pages=(
+                            page_checkpoint.iter_pages(step_config) if page_checkpoint else None
+                        ),
+                        page_checkpoint=(
+                            page_checkpoint.page_recorder(step_config) if page_checkpoint else None
+                        ),
+                    ),
                     timeout=timeout_seconds,
                 )
                 execution_time = time.time() - start_time
@@ -272,6 +455,11 @@ class StepOrchestrator:
                     execution_time_seconds=round(execution_time, 3),
                     job_id=self.job_id,
                 )
+                self._write_log(
+                    f"Step timed out after {timeout_seconds}s",
+                    log_level=LogLevelEnum.ERROR,
+                    step_name=step_name,
+                )
                 self.context.add_result(
                     StepResult(
                         step_name=step_name,
@@ -286,6 +474,16 @@ class StepOrchestrator:
                 )
                 return
 
+            finally:
+                metrics.current_step_type.reset(step_type_token)
+                # Pages scraped before a failure or timeout are kept for the retry
+                if page_checkpoint:
+                    await page_checkpoint.flush()
+
+            # Guard: a pipelined step fails where it would have failed to start alone
+            if url_batches is not None:
+                self._check_streamed_input(step_config, result)
+
             # Step 6: Validate output after execution
             try:
                 self.step_validator.validate_output(
@@ -318,6 +516,10 @@ class StepOrchestrator:
             )
             self.context.add_result(step_result)
 
+            # Record the completed step for later attempts of the job
+            if step_result.success and self.checkpoint and not page_checkpoint:
+                await self.checkpoint.save_step(step_config, step_result)
+
             if step_result.success:
                 logger.info(
                     "step_completed",
@@ -328,6 +530,17 @@ class StepOrchestrator:
                     execution_time_seconds=step_result.metadata.get("execution_time_seconds"),
                     timeout_configured=step_result.metadata.get("timeout_configured"),
                 )
+                self._write_log(
+                    "Step completed",
+                    step_name=step_name,
+                    context={
+                        "total_urls": step_result.metadata.get("total_urls", 0),
+                        "successful_urls": step_result.metadata.get("successful_urls", 0),
+                        "execution_time_seconds": step_result.metadata.get(
+                            "execution_time_seconds"
+                        ),
+                    },
+                )
             else:
                 logger.error(
                     "step_failed",
@@ -336,6 +549,12 @@ class StepOrchestrator:
                     failed_urls=step_result.metadata.get("failed_urls", 0),
                     execution_time_seconds=step_result.metadata.get("execution_time_seconds"),
                 )
+                self._write_log(
+                    f"Step failed: {step_result.error}",
+                    log_level=LogLevelEnum.ERROR,
+                    step_name=step_name,
+                    context={"failed_urls": step_result.metadata.get("failed_urls", 0)},
+                )
 
         except Exception as e:
             logger.error(
@@ -344,6 +563,11 @@ class StepOrchestrator:
                 error=str(e),
                 exc_info=True,
             )
+            self._write_log(
+                f"Step execution error: {e}",
+                log_level=LogLevelEnum.ERROR,
+                step_name=step_name,
+            )
             self.context.add_result(
                 StepResult(
                     step_name=step_name,
@@ -357,6 +581,12 @@ class StepOrchestrator:
         urls: str | list[str],
         merged_config: dict[str, Any],
         selectors: dict[str, Any],
+        page_sink: PageSink | None = None,
+        url_sink: UrlSink | None = None,
+        url_batches: AsyncIterator[list[str]] | None = None,
+        validator_lookup: ValidatorLookup | None = None,
+        resumed_pages: AsyncIterator[dict[str, Any]] | None = None,
+        page_checkpoint: PageSink | None = None,
     ) -> ExecutionResult:
         """Execute step with the appropriate executor.
 
@@ -365,15 +595,34 @@ class StepOrchestrator:
             urls: URL(s) to process
             merged_config: Merged configuration
             selectors: Selectors for data extraction
+            page_sink: Optional sink for streaming scraped pages (scrape steps only)
+            url_sink: Optional sink for streaming crawled URLs (crawl steps only)
+            url_batches: Optional stream of further input URLs (scrape steps only)
+            validator_lookup: Optional lookup of saved page validators (scrape steps
+                only)
+            resumed_pages: Optional stream of pages scraped by an earlier attempt
+                (scrape steps only)
+            page_checkpoint: Optional sink recording scraped pages (scrape steps only)
 
         Returns:
             ExecutionResult from executor
         """
         # ScrapeExecutor and CrawlExecutor can handle str | list[str]
         # Base executors (HTTP, API, Browser) require iteration
-        if isinstance(executor, (ScrapeExecutor, CrawlExecutor)):
+        if isinstance(executor, ScrapeExecutor):
+            return await executor.execute(
+                urls,
+                merged_config,
+                selectors,
+                page_sink=page_sink,
+                url_batches=url_batches,
+                validator_lookup=validator_lookup,
+                resumed_pages=resumed_pages,
+                page_checkpoint=page_checkpoint,
+            )
+        elif isinstance(executor, CrawlExecutor):
             # Executors that handle str | list[str]: pass URLs as-is
-            return await executor.execute(urls, merged_config, selectors)
+            return await executor.execute(urls, merged_config, selectors, url_sink=url_sink)
         else:
             # Base executors (HTTP, API, Browser): iterate over URLs
             urls_list = [urls] if isinstance(urls, str) else urls
@@ -386,6 +635,284 @@ class StepOrchestrator:
             # Aggregate ExecutionResults into a single ExecutionResult
             return self._aggregate_execution_results(all_results)
 
+    def _restore_step(self, step_config: dict[str, Any]) -> bool:
+        """Restore the result of a step completed by an earlier attempt of the job.
+
+        Scrape steps are never restored as a whole; they resume page by page when
+        executed.
+
+        Args:
+            step_config: Step configuration
+
+        Returns:
+            True if the step was restored and must not be executed
+        """
+        # Guard: no checkpoint, or a scrape step
+        if self.checkpoint is None or step_config.get("type", "").lower() == "scrape":
+            return False
+
+        step_result = self.checkpoint.get_step(step_config)
+        if step_result is None:
+            return False
+
+        self.context.add_result(step_result)
+        logger.info("step_restored", job_id=self.job_id, step_name=step_config["name"])
+        self._write_log("Step restored from an earlier attempt", step_name=step_config["name"])
+        return True
+
+    def _write_log(
+        self,
+        message: str,
+        log_level: LogLevelEnum = LogLevelEnum.INFO,
+        step_name: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> None:
+        """Write a crawl log entry for the job if a log sink is configured (non-blocking).
+
+        Args:
+            message: Log message
+            log_level: Log level (default: INFO)
+            step_name: Optional step name
+            context: Optional context data
+        """
+        # Guard: no log sink configured
+        if self.log_sink is None:
+            return
+
+        self.log_sink.write(
+            job_id=self.job_id,
+            website_id=self.website_id,
+            message=message,
+            log_level=log_level,
+            step_name=step_name,
+            context=context,
+        )
+
+    def _get_page_sink(
+        self,
+        step_name: str,
+        executor: HTTPExecutor | BrowserExecutor | APIExecutor | CrawlExecutor | ScrapeExecutor,
+    ) -> PageSink | None:
+        """Get the page sink for a step if its pages can be streamed.
+
+        Only scrape steps stream, and only when no other step reads their output,
+        since streamed pages are not kept in the execution context.
+
+        Args:
+            step_name: Name of the step
+            executor: Executor that will run the step
+
+        Returns:
+            Page sink to stream pages to, or None to collect them in the result
+        """
+        # Guard: streaming not configured or not a scrape step
+        if self.page_sink is None or not isinstance(executor, ScrapeExecutor):
+            return None
+
+        # Guard: dependencies unknown (workflow not validated)
+        if self.dependency_validator is None:
+            return None
+
+        dependents = self.dependency_validator.get_dependents(step_name)
+        if dependents:
+            logger.info(
+                "scrape_streaming_disabled_for_step",
+                step_name=step_name,
+                dependents=dependents,
+            )
+            return None
+
+        return self.page_sink
+
+    def _get_validator_lookup(
+        self,
+        step_name: str,
+        executor: HTTPExecutor | BrowserExecutor | APIExecutor | CrawlExecutor | ScrapeExecutor,
+    ) -> ValidatorLookup | None:
+        """Get the validator lookup for a step if it may skip unchanged pages.
+
+        Unchanged pages are left out of the step result, so only scrape steps whose
+        output no other step reads re-crawl conditionally.
+
+        Args:
+            step_name: Name of the step
+            executor: Executor that will run the step
+
+        Returns:
+            Validator lookup, or None to fetch and extract every page
+        """
+        # Guard: conditional re-crawls not configured or not a scrape step
+        if self.validator_lookup is None or not isinstance(executor, ScrapeExecutor):
+            return None
+
+        # Guard: dependencies unknown (workflow not validated)
+        if self.dependency_validator is None:
+            return None
+
+        dependents = self.dependency_validator.get_dependents(step_name)
+        if dependents:
+            logger.info(
+                "conditional_recrawl_disabled_for_step",
+                step_name=step_name,
+                dependents=dependents,
+            )
+            return None
+
+        return self.validator_lookup
+
+    def _get_pipeline_consumer(self, step_config: dict[str, Any]) -> dict[str, Any] | None:
+        """Get the scrape step that can run alongside a crawl step.
+
+        A scrape step is pipelined with a crawl step when it reads one of the crawl
+        step's URL fields and depends on nothing else. Steps with skip_if or
+        run_only_if conditions wait for the crawl to finish, since their conditions
+        may read its result.
+
+        Args:
+            step_config: Configuration of the step about to run
+
+        Returns:
+            Configuration of the scrape step to pipeline, or None to run sequentially
+        """
+        # Guard: pipelining disabled or dependencies unknown (workflow not validated)
+        if not self.pipeline_steps or self.dependency_validator is None:
+            return None
+
+        # Guard: only crawl steps stream URLs
+        if step_config.get("type", "").lower() != "crawl":
+            return None
+
+        step_name = step_config["name"]
+        url_fields = set(step_config.get("selectors") or {})
+
+        for dependent in self.dependency_validator.get_dependents(step_name):
+            dependent_config = self._get_step_config(dependent)
+            if not dependent_config or dependent_config.get("type", "").lower() != "scrape":
+                continue
+
+            input_from = dependent_config.get("input_from") or ""
+            dependency_step, _, field_path = input_from.partition(".")
+            if dependency_step != step_name or field_path not in url_fields:
+                continue
+            if dependent_config.get("skip_if") or dependent_config.get("run_only_if"):
+                continue
+            if self.dependency_validator.get_dependencies(dependent) != [step_name]:
+                continue
+
+            return dependent_config
+
+        return None
+
+    async def _execute_pipeline(
+        self, producer_config: dict[str, Any], consumer_config: dict[str, Any]
+    ) -> None:
+        """Execute a crawl step and the scrape step reading its URLs concurrently.
+
+        The crawl step sends the new URLs of each crawled page into a bounded channel
+        and the scrape step scrapes them as they arrive. Both steps keep their own
+        timeout and result; the scrape step's timeout also covers the crawl it
+        waits on.
+
+        Args:
+            producer_config: Crawl step configuration
+            consumer_config: Scrape step configuration
+        """
+        producer_name = producer_config["name"]
+        consumer_name = consumer_config["name"]
+        channel = URLChannel(max_batches=self.pipeline_max_batches)
+        input_timeout = self._get_timeout_for_executor(
+            self.crawl_executor, self._merge_config(producer_config)
+        )
+
+        logger.info(
+            "step_pipeline_starting",
+            job_id=self.job_id,
+            producer_step=producer_name,
+            consumer_step=consumer_name,
+            max_batches=self.pipeline_max_batches,
+        )
+
+        async def produce() -> None:
+            try:
+                await self._execute_step(producer_config, url_sink=channel.send)
+            finally:
+                # Guard: end the stream even if the crawl fails or times out
+                await channel.close()
+
+        producer = asyncio.create_task(produce())
+        try:
+            await self._execute_step(
+                consumer_config,
+                url_batches=self._receive_batches(channel),
+                input_timeout=input_timeout,
+            )
+        except asyncio.CancelledError:
+            producer.cancel()
+            raise
+        finally:
+            # Guard: nobody reads anymore, so URLs the crawl still finds are dropped
+            await channel.close()
+            if self.context.metadata.get("cancelled"):
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+        logger.info(
+            "step_pipeline_completed",
+            job_id=self.job_id,
+            producer_step=producer_name,
+            consumer_step=consumer_name,
+            batches_streamed=channel.batches_sent,
+            urls_streamed=channel.urls_sent,
+        )
+
+    async def _receive_batches(self, channel: URLChannel) -> AsyncIterator[list[str]]:
+        """Stream URL batches from a channel until it closes or the job is cancelled.
+
+        Args:
+            channel: Channel fed by the producing step
+
+        Yields:
+            Batches of URLs in the order they were sent
+        """
+        async for batch in channel:
+            # Guard: cancelled while streaming - stop taking new URLs
+            if await self._check_cancellation():
+                logger.info("step_pipeline_cancelled", job_id=self.job_id)
+                self.context.metadata["cancelled"] = True
+                return
+            yield batch
+
+    def _check_streamed_input(self, step_config: dict[str, Any], result: ExecutionResult) -> None:
+        """Fail a pipelined step whose input would have stopped it from running alone.
+
+        Run sequentially, the step would not start if the step feeding it failed or
+        found no URLs. A pipelined step only learns this once its stream ends, so the
+        same failure is applied to its result afterwards.
+
+        Args:
+            step_config: Configuration of the pipelined step
+            result: Execution result of the pipelined step (updated in place)
+        """
+        # Guard: cancelled mid-stream - the workflow stops here anyway
+        if self.context.metadata.get("cancelled"):
+            return
+
+        step_name = step_config["name"]
+        dependency_step = step_config["input_from"].split(".")[0]
+        dependency_result = self.context.get_result(dependency_step)
+
+        if dependency_result and dependency_result.success:
+            # Guard: the step already failed on its own, or had URLs to work on
+            if result.error or result.metadata.get("total_urls"):
+                return
+            error = "No URLs to process"
+        else:
+            error = f"Step '{step_name}' depends on '{dependency_step}' which failed"
+
+        logger.warning("pipelined_step_input_failed", step_name=step_name, error=error)
+        result.success = False
+        result.error = error
+
     def _should_skip_step(self, step_config: dict[str, Any]) -> bool:
         """Check if step should be skipped based on conditions.
 
@@ -790,7 +1317,12 @@ class StepOrchestrator:
             True if workflow is cancelled, False otherwise
 
         Uses guard pattern to return early when cancellation is not configured.
+        A cancel event is checked in memory instead of polling the flag.
         """
+        # Guard: cancellations are pushed to the cancel event
+        if self.cancel_event is not None:
+            return self.cancel_event.is_set()
+
         # Guard: no cancellation flag configured
         if not self.cancellation_flag:
             return False
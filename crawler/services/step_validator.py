@@ -43,30 +43,31 @@ class CrawlStepInput(BaseModel):
 
     Crawl steps expect either:
     - A single string URL (seed URL)
-    - A list containing a single URL (first URL is used as seed)
+    - A list of seed URLs (crawled concurrently)
     """
 
-    url: str | list[str] = Field(..., description="Seed URL or list with seed URL")
+    url: str | list[str] = Field(..., description="Seed URL or list of seed URLs")
 
     @field_validator("url")
     @classmethod
     def validate_url_not_empty(cls, v: str | list[str]) -> str | list[str]:
-        """Validate URL is not empty."""
+        """Validate URLs are not empty."""
         if isinstance(v, str):
             if not v.strip():
                 raise ValueError("URL cannot be empty string")
         elif isinstance(v, list):
             if len(v) == 0:
                 raise ValueError("URL list cannot be empty")
-            if not isinstance(v[0], str):
-                raise ValueError("First URL in list must be a string")
-            if not v[0].strip():
-                raise ValueError("First URL in list cannot be empty string")
+            for i, url in enumerate(v):
+                if not isinstance(url, str):
+                    raise ValueError(f"URL at index {i} must be a string, got {type(url).__name__}")
+                if not url.strip():
+                    raise ValueError(f"URL at index {i} cannot be empty string")
         return v
 
     @property
     def seed_url(self) -> str:
-        """Get the seed URL from input."""
+        """Get the first seed URL from input."""
         if isinstance(self.url, str):
             return self.url
         return self.url[0]
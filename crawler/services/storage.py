@@ -1,67 +1,415 @@
-"""Google Cloud Storage service."""
+"""Object storage for raw HTML and documents.
 
+StorageService talks to a StorageBackend, which hides the blocking client
+libraries behind async methods:
+
+- GCSStorageBackend runs google-cloud-storage calls on a bounded thread pool that
+  shares one HTTP connection pool, so uploads never block the event loop and many
+  pages can be uploaded at once.
+- LocalStorageBackend stores objects as files under a directory. It stands in for
+  a bucket in development and tests.
+
+Raw HTML is stored under content-addressed keys derived from the page's content
+hash, so identical bodies are uploaded once no matter how many URLs serve them.
+"""
+
+from __future__ import annotations
+
+import asyncio
 import base64
+import gzip
+import hashlib
 import json
-from typing import cast
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
 
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
 from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
 
 from config import Settings
 from crawler.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+
+# Key suffix and Content-Encoding for each supported compression
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+CONTENT_ENCODINGS = {"none": None, "gzip": "gzip", "zstd": "zstd"}
+
+# Content-addressed keys remembered as stored before the set is reset
+KNOWN_KEYS_LIMIT = 100_000
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    """Compress data with the given algorithm.
+
+    Args:
+        data: Raw bytes
+        compression: One of none, gzip or zstd
+
+    Returns:
+        Compressed bytes
+
+    Raises:
+        ValueError: If the compression is not supported
+    """
+    if compression == "none":
+        return data
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if compression == "zstd":
+        from compression import zstd
+
+        return zstd.compress(data)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def decompress(data: bytes, key: str) -> bytes:
+    """Decompress data according to the suffix of its storage key.
+
+    Args:
+        data: Stored bytes
+        key: Storage key the bytes were read from
+
+    Returns:
+        Decompressed bytes
+    """
+    if key.endswith(COMPRESSION_SUFFIXES["gzip"]):
+        return gzip.decompress(data)
+    if key.endswith(COMPRESSION_SUFFIXES["zstd"]):
+        from compression import zstd
+
+        return zstd.decompress(data)
+    return data
+
+
+class StorageBackend(ABC):
+    """Async interface to an object store."""
+
+    @abstractmethod
+    async def upload(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str,
+        content_encoding: str | None = None,
+    ) -> None:
+        """Store bytes under a key, replacing any existing object."""
+
+    @abstractmethod
+    async def download(self, key: str) -> bytes:
+        """Read the bytes stored under a key."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Check if an object is stored under a key."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete the object stored under a key."""
+
+    @abstractmethod
+    async def list_keys(self, prefix: str | None = None) -> list[str]:
+        """List keys, optionally only those starting with a prefix."""
+
+    async def close(self) -> None:  # noqa: B027 - optional hook
+        """Release resources held by the backend."""
+
+
+class GCSStorageBackend(StorageBackend):
+    """Google Cloud Storage backend running client calls on a bounded thread pool."""
+
+    def __init__(self, client: Any, bucket_name: str, max_concurrency: int = 16):
+        """Initialize GCS backend.
+
+        Args:
+            client: google.cloud.storage.Client
+            bucket_name: Bucket holding the objects
+            max_concurrency: Maximum concurrent requests (threads and pooled connections)
+        """
+        self.client = client
+        self.bucket_name = bucket_name
+        self.bucket = client.bucket(bucket_name)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="gcs-storage"
+        )
+
+    async def _run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a blocking client call on the backend's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+
+    async def upload(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str,
+        content_encoding: str | None = None,
+    ) -> None:
+        """Store bytes under a key, replacing any existing object."""
+        blob = self.bucket.blob(key)
+        blob.content_encoding = content_encoding
+        await self._run(blob.upload_from_string, data, content_type=content_type)
+
+    async def download(self, key: str) -> bytes:
+        """Read the bytes stored under a key.
+
+        Stored bytes are returned as is; GCS must not transcode compressed objects.
+        """
+        blob = self.bucket.blob(key)
+        data: bytes = await self._run(blob.download_as_bytes, raw_download=True)
+        return data
+
+    async def exists(self, key: str) -> bool:
+        """Check if an object is stored under a key."""
+        found: bool = await self._run(self.bucket.blob(key).exists)
+        return found
+
+    async def delete(self, key: str) -> None:
+        """Delete the object stored under a key."""
+        await self._run(self.bucket.blob(key).delete)
+
+    async def list_keys(self, prefix: str | None = None) -> list[str]:
+        """List keys, optionally only those starting with a prefix."""
+
+        def _list() -> list[str]:
+            return [blob.name for blob in self.client.list_blobs(self.bucket_name, prefix=prefix)]
+
+        return await self._run(_list)
+
+    async def close(self) -> None:
+        """Wait for running requests and stop the thread pool."""
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+
+class LocalStorageBackend(StorageBackend):
+    """Filesystem backend storing each object as a file under a root directory."""
+
+    def __init__(self, root_dir: str | Path):
+        """Initialize local backend.
+
+        Args:
+            root_dir: Directory holding the objects (created on first upload)
+        """
+        self.root_dir = Path(root_dir)
+
+    def _path(self, key: str) -> Path:
+        """Resolve a key to a file path inside the root directory.
+
+        Raises:
+            ValueError: If the key points outside the root directory
+        """
+        root = self.root_dir.resolve()
+        path = (root / key).resolve()
+        if not path.is_relative_to(root):
+            raise ValueError(f"Storage key escapes the storage root: {key}")
+        return path
+
+    async def upload(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str,
+        content_encoding: str | None = None,
+    ) -> None:
+        """Store bytes under a key, replacing any existing object.
+
+        Content type and encoding are not recorded; the key suffix identifies both.
+        """
+        path = self._path(key)
+
+        def _write() -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so readers never see a partial object
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".upload-")
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(data)
+                Path(tmp_name).replace(path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+        await asyncio.to_thread(_write)
+
+    async def download(self, key: str) -> bytes:
+        """Read the bytes stored under a key."""
+        return await asyncio.to_thread(self._path(key).read_bytes)
+
+    async def exists(self, key: str) -> bool:
+        """Check if an object is stored under a key."""
+        return await asyncio.to_thread(self._path(key).is_file)
+
+    async def delete(self, key: str) -> None:
+        """Delete the object stored under a key."""
+        await asyncio.to_thread(self._path(key).unlink)
+
+    async def list_keys(self, prefix: str | None = None) -> list[str]:
+        """List keys, optionally only those starting with a prefix."""
+
+        def _list() -> list[str]:
+            if not self.root_dir.is_dir():
+                return []
+            keys = (
+                path.relative_to(self.root_dir).as_posix()
+                for path in self.root_dir.rglob("*")
+                if path.is_file() and not path.name.startswith(".upload-")
+            )
+            return sorted(key for key in keys if not prefix or key.startswith(prefix))
+
+        return await asyncio.to_thread(_list)
+
+
+def create_gcs_client(settings: Settings) -> Any:
+    """Create a GCS client from settings.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        google.cloud.storage.Client whose connection pool fits storage_max_concurrency
+    """
+    # Decode base64 credentials and create temporary credentials
+    if settings.google_application_credentials_base64:
+        try:
+            # Decode base64 credentials
+            credentials_json = base64.b64decode(
+                settings.google_application_credentials_base64
+            ).decode("utf-8")
+            credentials_dict = json.loads(credentials_json)
+
+            # Create credentials from dict
+            credentials = service_account.Credentials.from_service_account_info(
+                credentials_dict, scopes=storage.Client.SCOPE
+            )
+            project = credentials_dict.get("project_id")
+            logger.info("gcs_initialized", bucket=settings.gcs_bucket_name)
+        except Exception as e:
+            logger.error("gcs_initialization_error", error=str(e))
+            raise
+    else:
+        # Fall back to default credentials (for local development)
+        credentials, project = google.auth.default(scopes=storage.Client.SCOPE)
+        logger.warning("using_default_gcs_credentials")
+
+    # The default pool keeps 10 connections; size it to the thread pool so
+    # concurrent uploads reuse connections instead of reconnecting
+    session = AuthorizedSession(credentials)
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=settings.storage_max_concurrency,
+            pool_maxsize=settings.storage_max_concurrency,
+        ),
+    )
+
+    # Without a project the client infers one from the environment
+    client_kwargs = {"project": project} if project else {}
+    return storage.Client(credentials=credentials, _http=session, **client_kwargs)
+
+
+def create_storage_backend(settings: Settings) -> StorageBackend:
+    """Create the storage backend selected by settings.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Configured storage backend
+    """
+    if settings.storage_backend == "local":
+        logger.info("local_storage_initialized", root_dir=settings.storage_local_path)
+        return LocalStorageBackend(settings.storage_local_path)
+
+    return GCSStorageBackend(
+        create_gcs_client(settings),
+        bucket_name=settings.gcs_bucket_name,
+        max_concurrency=settings.storage_max_concurrency,
+    )
+
 
 class StorageService:
-    """GCS storage service for raw HTML and documents."""
+    """Storage service for raw HTML and documents."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        backend: StorageBackend | None = None,
+    ) -> None:
         """Initialize storage service with injected settings.
 
         Args:
             settings: Application settings
+            backend: Storage backend (default: created from settings)
         """
         self.bucket_name = settings.gcs_bucket_name
+        self.compression = settings.storage_compression
+        self.backend = backend or create_storage_backend(settings)
 
-        # Decode base64 credentials and create temporary credentials
-        if settings.google_application_credentials_base64:
-            try:
-                # Decode base64 credentials
-                credentials_json = base64.b64decode(
-                    settings.google_application_credentials_base64
-                ).decode("utf-8")
-                credentials_dict = json.loads(credentials_json)
-
-                # Create credentials from dict
-                credentials = service_account.Credentials.from_service_account_info(
-                    credentials_dict
-                )
-
-                # Initialize client with credentials
-                self.client = storage.Client(
-                    credentials=credentials, project=credentials_dict.get("project_id")
-                )
-                logger.info("gcs_initialized", bucket=self.bucket_name)
-            except Exception as e:
-                logger.error("gcs_initialization_error", error=str(e))
-                raise
-        else:
-            # Fall back to default credentials (for local development)
-            self.client = storage.Client()
-            logger.warning("using_default_gcs_credentials")
+        # Content-addressed keys known to be stored, to skip existence checks
+        self._known_keys: set[str] = set()
+
+    def html_key(self, content_hash: str) -> str:
+        """Build the content-addressed key for an HTML body.
+
+        Args:
+            content_hash: SHA256 hash of the HTML
+
+        Returns:
+            Key like html/ab/abcd....html.gz (first two hex digits spread the keys)
+        """
+        suffix = COMPRESSION_SUFFIXES[self.compression]
+        return f"html/{content_hash[:2]}/{content_hash}.html{suffix}"
+
+    async def store_html(self, content: str, content_hash: str) -> str:
+        """Store an HTML body under its content hash, skipping bodies already stored.
+
+        Args:
+            content: Raw HTML
+            content_hash: SHA256 hash of the HTML
+
+        Returns:
+            Storage key of the HTML
+        """
+        key = self.html_key(content_hash)
 
-        self.bucket = self.client.bucket(self.bucket_name)
+        # Guard: identical body already stored
+        if key in self._known_keys:
+            return key
+        if await self.backend.exists(key):
+            self._remember_key(key)
+            logger.debug("html_upload_skipped_existing", blob_name=key)
+            return key
+
+        try:
+            await self._upload_compressed(key, content)
+        except Exception as e:
+            logger.error("html_upload_error", content_hash=content_hash, error=str(e))
+            raise
+
+        self._remember_key(key)
+        logger.debug("html_uploaded", blob_name=key)
+        return key
 
     async def upload_html(self, url: str, content: str, task_id: str) -> str:
-        """Upload raw HTML to GCS."""
+        """Upload raw HTML under the task that fetched it."""
         try:
             # Create blob path: tasks/{task_id}/{url_hash}.html
-            blob_name = f"tasks/{task_id}/{hash(url)}.html"
-            blob = self.bucket.blob(blob_name)
+            url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+            suffix = COMPRESSION_SUFFIXES[self.compression]
+            blob_name = f"tasks/{task_id}/{url_hash}.html{suffix}"
 
-            # Upload content
-            blob.upload_from_string(content, content_type="text/html")
+            await self._upload_compressed(blob_name, content)
 
             logger.info("html_uploaded", url=url, task_id=task_id, blob_name=blob_name)
 
@@ -71,10 +419,10 @@ class StorageService:
             raise
 
     async def download_html(self, blob_name: str) -> str:
-        """Download HTML from GCS."""
+        """Download HTML, decompressing it if it was stored compressed."""
         try:
-            blob = self.bucket.blob(blob_name)
-            content = cast(str, blob.download_as_text())
+            data = await self.backend.download(blob_name)
+            content = decompress(data, blob_name).decode("utf-8")
 
             logger.info("html_downloaded", blob_name=blob_name)
             return content
@@ -83,10 +431,10 @@ class StorageService:
             raise
 
     async def delete_html(self, blob_name: str) -> bool:
-        """Delete HTML from GCS."""
+        """Delete HTML from storage."""
         try:
-            blob = self.bucket.blob(blob_name)
-            blob.delete()
+            await self.backend.delete(blob_name)
+            self._known_keys.discard(blob_name)
 
             logger.info("html_deleted", blob_name=blob_name)
             return True
@@ -97,8 +445,35 @@ class StorageService:
     async def list_blobs(self, prefix: str | None = None) -> list[str]:
         """List blobs with optional prefix filter."""
         try:
-            blobs = self.client.list_blobs(self.bucket_name, prefix=prefix)
-            return [blob.name for blob in blobs]
+            return await self.backend.list_keys(prefix)
         except Exception as e:
             logger.error("list_blobs_error", prefix=prefix, error=str(e))
             return []
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        await self.backend.close()
+
+    async def _upload_compressed(self, key: str, content: str) -> None:
+        """Compress HTML off the event loop and upload it.
+
+        Args:
+            key: Storage key
+            content: Raw HTML
+        """
+        data = content.encode("utf-8")
+        if self.compression != "none":
+            data = await asyncio.to_thread(compress, data, self.compression)
+
+        await self.backend.upload(
+            key,
+            data,
+            content_type="text/html; charset=utf-8",
+            content_encoding=CONTENT_ENCODINGS[self.compression],
+        )
+
+    def _remember_key(self, key: str) -> None:
+        """Record a stored content-addressed key, resetting the set when it is full."""
+        if len(self._known_keys) >= KNOWN_KEYS_LIMIT:
+            self._known_keys.clear()
+        self._known_keys.add(key)
@@ -9,6 +9,7 @@ from crawler.api.generated import SelectorConfig, SelectorTypeEnum
 from crawler.core.logging import get_logger
 from crawler.services.html_parser import HTMLParserService
 from crawler.services.redis_cache import URLDeduplicationCache
+from crawler.utils.bloom_filter import BloomFilter
 from crawler.utils.url import hash_url, normalize_url
 
 logger = get_logger(__name__)
@@ -35,21 +36,26 @@ class URLExtractorService:
     - Handle relative URLs correctly
     - Handle URLs in data attributes
     - Deduplicate URLs within crawl session
+    - Skip Redis for URLs this process already saw (optional Bloom pre-filter)
     """
 
     def __init__(
         self,
         html_parser: HTMLParserService,
         dedup_cache: URLDeduplicationCache | None = None,
+        seen_filter: BloomFilter | None = None,
     ) -> None:
         """Initialize URL extractor service.
 
         Args:
             html_parser: HTML parser service for selector application
             dedup_cache: Optional URL deduplication cache (for crawl-level dedup)
+            seen_filter: Optional per-job Bloom filter of URL hashes already seen.
+                Hashes it contains are treated as duplicates without a Redis lookup.
         """
         self.html_parser = html_parser
         self.dedup_cache = dedup_cache
+        self.seen_filter = seen_filter
 
     async def extract_urls(
         self,
@@ -237,15 +243,27 @@ class URLExtractorService:
 
         logger.debug("urls_extracted_before_dedup", count=len(url_info_list))
 
-        # Batch check for duplicates in cache if deduplication is enabled
+        # Batch check for duplicates if deduplication is enabled
         cached_duplicates: set[str] = set()
-        if deduplicate and self.dedup_cache and url_info_list:
-            # Extract all URL hashes for batch check
-            url_hashes_to_check = [url_hash for _, _, _, url_hash, _ in url_info_list]
-            cached_duplicates = await self.dedup_cache.exists_batch(url_hashes_to_check)
+        if deduplicate and url_info_list:
+            url_hashes = [url_hash for _, _, _, url_hash, _ in url_info_list]
+
+            # Hashes this process already saw never reach Redis
+            if self.seen_filter is not None:
+                cached_duplicates = {
+                    url_hash for url_hash in url_hashes if url_hash in self.seen_filter
+                }
+
+            url_hashes_to_check = [
+                url_hash for url_hash in url_hashes if url_hash not in cached_duplicates
+            ]
+            if self.dedup_cache and url_hashes_to_check:
+                cached_duplicates.update(await self.dedup_cache.exists_batch(url_hashes_to_check))
+
             logger.debug(
                 "url_batch_dedup_check",
-                total_urls=len(url_hashes_to_check),
+                total_urls=len(url_hashes),
+                checked_in_cache=len(url_hashes_to_check) if self.dedup_cache else 0,
                 cached_duplicates=len(cached_duplicates),
             )
 
@@ -267,16 +285,17 @@ class URLExtractorService:
             )
             extracted_urls.append(extracted)
 
-            # Store in deduplication cache if available
-            if deduplicate and self.dedup_cache and job_id:
-                await self.dedup_cache.set(
-                    url_hash,
-                    {
-                        "url": normalized,
-                        "job_id": job_id,
-                        "extracted_from": base_url,
-                    },
-                )
+        if deduplicate:
+            new_hashes = [extracted.url_hash for extracted in extracted_urls]
+
+            # Store new URLs in deduplication cache in one round trip
+            if self.dedup_cache and job_id and new_hashes:
+                await self.dedup_cache.set_batch(dict.fromkeys(new_hashes, job_id))
+
+            # Remember every hash seen, including Redis hits, for later pages
+            if self.seen_filter is not None:
+                for url_hash in [*new_hashes, *cached_duplicates]:
+                    self.seen_filter.add(url_hash)
 
         logger.info(
             "urls_extracted",
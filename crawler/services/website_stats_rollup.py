@@ -0,0 +1,110 @@
+"""Background task folding statistics deltas into website_stats.
+
+Triggers on crawl_job and crawled_page append signed changes to website_stats_delta
+instead of updating one counter row per website, so concurrent job transactions never
+wait on each other. Statistics queries add pending deltas to the folded counters;
+folding them periodically keeps that read small.
+"""
+
+import asyncio
+import contextlib
+
+from crawler.core import metrics
+from crawler.core.logging import get_logger
+from crawler.db.repositories import WebsiteStatsRepository
+from crawler.db.session import get_db
+
+logger = get_logger(__name__)
+
+_rollup_task: asyncio.Task | None = None
+
+
+async def fold_website_stats(batch_size: int) -> int:
+    """Fold all pending statistics deltas, one transaction per batch.
+
+    Args:
+        batch_size: Maximum deltas folded per transaction
+
+    Returns:
+        Number of deltas folded
+    """
+    total_folded = 0
+
+    while True:
+        async for session in get_db():
+            conn = await session.connection()
+            result = await WebsiteStatsRepository(conn).fold_deltas(batch_size)
+            break
+
+        total_folded += result.deltas_folded
+        metrics.website_stats_deltas_folded_total.inc(result.deltas_folded)
+
+        # Guard: a partial batch means the backlog is drained
+        if result.deltas_folded < batch_size:
+            break
+
+    async for session in get_db():
+        conn = await session.connection()
+        pending = await WebsiteStatsRepository(conn).count_pending_deltas()
+        metrics.website_stats_deltas_pending.set(pending)
+        break
+
+    if total_folded:
+        logger.debug("website_stats_folded", deltas_folded=total_folded)
+    return total_folded
+
+
+async def website_stats_rollup_loop(interval_seconds: int = 30, batch_size: int = 10000) -> None:
+    """Background loop to periodically fold statistics deltas.
+
+    Args:
+        interval_seconds: Fold interval in seconds (default: 30)
+        batch_size: Maximum deltas folded per transaction (default: 10000)
+    """
+    logger.info(
+        "website_stats_rollup_started", interval_seconds=interval_seconds, batch_size=batch_size
+    )
+
+    while True:
+        try:
+            await fold_website_stats(batch_size)
+            await asyncio.sleep(interval_seconds)
+        except asyncio.CancelledError:
+            logger.info("website_stats_rollup_cancelled")
+            break
+        except Exception as e:
+            logger.error("website_stats_rollup_error", error=str(e), exc_info=True)
+            await asyncio.sleep(interval_seconds)  # Continue after error
+
+
+async def start_website_stats_rollup(interval_seconds: int = 30, batch_size: int = 10000) -> None:
+    """Start the statistics rollup background task.
+
+    Args:
+        interval_seconds: Fold interval in seconds (default: 30)
+        batch_size: Maximum deltas folded per transaction (default: 10000)
+    """
+    global _rollup_task
+
+    if _rollup_task is not None and not _rollup_task.done():
+        logger.warning("website_stats_rollup_already_running")
+        return
+
+    _rollup_task = asyncio.create_task(website_stats_rollup_loop(interval_seconds, batch_size))
+    logger.info("website_stats_rollup_task_created")
+
+
+async def stop_website_stats_rollup() -> None:
+    """Stop the statistics rollup background task."""
+    global _rollup_task
+
+    if _rollup_task is None:
+        logger.warning("website_stats_rollup_not_running")
+        return
+
+    _rollup_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _rollup_task
+
+    _rollup_task = None
+    logger.info("website_stats_rollup_stopped")
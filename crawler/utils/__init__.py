@@ -1,5 +1,7 @@
 """Utilities package."""
 
+from crawler.utils.bloom_filter import BloomFilter
+from crawler.utils.cursor import decode_cursor, encode_cursor
 from crawler.utils.pagination import (
     PaginationPattern,
     PaginationPatternDetector,
@@ -11,7 +13,15 @@ from crawler.utils.pagination import (
     StopCondition,
     TemplatePattern,
 )
-from crawler.utils.simhash import Simhash, compare_texts, find_near_duplicates
+from crawler.utils.simhash import (
+    Simhash,
+    cluster_near_duplicates,
+    compare_texts,
+    find_near_duplicates,
+    fingerprint_features,
+    fingerprint_many,
+    near_duplicate_pairs,
+)
 from crawler.utils.simhash_helpers import from_signed_int64, to_signed_int64
 from crawler.utils.url import (
     are_urls_equivalent,
@@ -21,6 +31,8 @@ from crawler.utils.url import (
 )
 
 __all__ = [
+    # Deduplication utilities
+    "BloomFilter",
     # Pagination utilities
     "PaginationPattern",
     "PaginationPatternDetector",
@@ -34,10 +46,17 @@ __all__ = [
     "StopCondition",
     "TemplatePattern",
     "are_urls_equivalent",
+    "cluster_near_duplicates",
     "compare_texts",
+    # Cursor pagination utilities
+    "decode_cursor",
+    "encode_cursor",
     "find_near_duplicates",
+    "fingerprint_features",
+    "fingerprint_many",
     "from_signed_int64",
     "hash_url",
+    "near_duplicate_pairs",
     "normalize_and_hash",
     # URL utilities
     "normalize_url",
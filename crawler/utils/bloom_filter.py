@@ -0,0 +1,105 @@
+"""In-memory Bloom filter for hex digests.
+
+Used as a per-job pre-filter in front of the Redis URL deduplication cache: URL
+hashes already seen by this process are skipped without a Redis round trip.
+
+A Bloom filter never misses a key it contains, but may claim to contain a key it
+never saw (a false positive). The filter is sized for a capacity and a false
+positive rate; once capacity keys were added it stops accepting new ones, so the
+false positive rate never rises above the configured one.
+"""
+
+import math
+
+# Defaults sized for one large job: 1M URLs at one false positive per million
+# costs about 3.4 MiB
+DEFAULT_CAPACITY = 1_000_000
+DEFAULT_ERROR_RATE = 1e-6
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter keyed by hex digests (e.g. SHA-256 URL hashes).
+
+    Keys must already be uniformly distributed hex strings of at least 32
+    characters; their first 128 bits drive double hashing, so no further hashing
+    is needed.
+
+    Example:
+        >>> seen = BloomFilter(capacity=1000)
+        >>> seen.add(hash_url("https://example.com/a"))
+        True
+        >>> hash_url("https://example.com/a") in seen
+        True
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate: float = DEFAULT_ERROR_RATE):
+        """Initialize Bloom filter.
+
+        Args:
+            capacity: Number of keys the filter accepts
+            error_rate: False positive rate at capacity (0 < error_rate < 1)
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_count = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self._bits = bytearray((self.bit_count + 7) // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of distinct keys added (keys already present are not counted)."""
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a key may have been added (false positives possible)."""
+        return all(self._bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(key))
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the filter reached capacity and no longer accepts keys."""
+        return self._count >= self.capacity
+
+    def add(self, key: str) -> bool:
+        """Add a key to the filter.
+
+        Args:
+            key: Hex digest
+
+        Returns:
+            True if the key is in the filter, False if the filter is full
+        """
+        indexes = self._indexes(key)
+
+        # Guard: key already present - re-adding it uses no capacity
+        if all(self._bits[index >> 3] & (1 << (index & 7)) for index in indexes):
+            return True
+
+        # Guard: adding past capacity would raise the false positive rate
+        if self.is_full:
+            return False
+
+        for index in indexes:
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self._count += 1
+        return True
+
+    def _indexes(self, key: str) -> list[int]:
+        """Bit positions of a key (Kirsch-Mitzenmacher double hashing).
+
+        Args:
+            key: Hex digest
+
+        Returns:
+            hash_count bit positions
+        """
+        first = int(key[:16], 16)
+        second = int(key[16:32], 16) | 1
+        return [(first + i * second) % self.bit_count for i in range(self.hash_count)]
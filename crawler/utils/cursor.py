@@ -0,0 +1,54 @@
+"""Opaque cursors for keyset pagination.
+
+A cursor records the (timestamp, id) sort key of the last row of a page. The next
+page is read with a `(created_at, id) > cursor` seek, which stays cheap however
+deep the client pages, unlike OFFSET which reads and discards every skipped row.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+
+
+def encode_cursor(timestamp: datetime, row_id: int | str | UUID) -> str:
+    """Encode a row's sort key as an opaque, URL-safe cursor.
+
+    Args:
+        timestamp: Sort timestamp of the row (e.g. created_at)
+        row_id: Primary key of the row, breaking ties between equal timestamps
+
+    Returns:
+        URL-safe base64 cursor string
+
+    Example:
+        >>> cursor = encode_cursor(datetime(2026, 1, 1, tzinfo=UTC), 42)
+        >>> decode_cursor(cursor)
+        (datetime.datetime(2026, 1, 1, 0, 0, tzinfo=datetime.timezone.utc), 42)
+    """
+    key = row_id if isinstance(row_id, int) else str(row_id)
+    payload = json.dumps([timestamp.isoformat(), key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int | str]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page's next_cursor
+
+    Returns:
+        Tuple of (timestamp, row_id); integer ids are returned as int, others as str
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(row_id, int | str) or isinstance(row_id, bool):
+            raise ValueError("unexpected id type")
+        return datetime.fromisoformat(timestamp), row_id
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
@@ -11,6 +11,18 @@ Algorithm:
 4. Convert vector to final fingerprint (positive -> 1, negative -> 0)
 5. Use Hamming distance to compare fingerprints
 
+Tokens are hashed with MD5, so fingerprints match the ones already stored. The
+bit vector is accumulated on packed integers (one 32-bit lane per bit) rather
+than bit by bit, and repeated tokens are counted once with their weight.
+fingerprint_many() fingerprints a batch of texts and fingerprint_features()
+accepts weighted features such as shingles.
+
+Near-duplicate search avoids comparing every pair: fingerprints are split into
+threshold + 1 bands, and by the pigeonhole principle two fingerprints within
+the threshold agree on at least one band, so only fingerprints sharing a band
+value are compared. cluster_near_duplicates() joins the matching pairs into
+groups with union-find.
+
 References:
 - Charikar, M. S. (2002). Similarity estimation techniques from rounding algorithms.
 - https://en.wikipedia.org/wiki/SimHash
@@ -18,7 +30,166 @@ References:
 
 import hashlib
 import re
-from collections.abc import Iterable
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
+
+# Characters replaced by spaces before splitting text into words
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+# Token hashes are MD5 digests, so fingerprints wider than this have constant high bits
+_TOKEN_HASH_BITS = 128
+
+# Bit vectors are accumulated as big integers with one fixed-width lane per bit, so
+# adding a token's weighted bits to all counters is a single integer addition
+_LANE_BITS = 32
+_LANE_MASK = (1 << _LANE_BITS) - 1
+_BYTE_STRIDE = 8 * _LANE_BITS
+
+# Lanes holding the bits of each byte value: bit i of the byte sets lane i to 1
+_BYTE_LANES = tuple(
+    sum(1 << (_LANE_BITS * bit) for bit in range(8) if value >> bit & 1) for value in range(256)
+)
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase text, replace punctuation with spaces and split it into words."""
+    return _PUNCTUATION_PATTERN.sub(" ", text.lower()).split()
+
+
+def _shingles(tokens: list[str], shingle_size: int) -> list[str]:
+    """Group consecutive tokens into overlapping shingles of shingle_size words.
+
+    Texts shorter than one shingle become a single shingle of all their tokens.
+    """
+    if shingle_size == 1 or not tokens:
+        return tokens
+
+    if len(tokens) <= shingle_size:
+        return [" ".join(tokens)]
+
+    return [
+        " ".join(tokens[start : start + shingle_size])
+        for start in range(len(tokens) - shingle_size + 1)
+    ]
+
+
+@lru_cache(maxsize=65536)
+def _feature_hash(feature: str) -> int:
+    """Hash a feature to the integer value of its MD5 digest.
+
+    Cached because the same words recur across pages; MD5 is kept so fingerprints
+    stay identical to the ones already stored.
+    """
+    return int.from_bytes(hashlib.md5(feature.encode("utf-8")).digest(), "big")
+
+
+def _spread_bits(value: int, byte_count: int) -> int:
+    """Move bit i of value into lane i of a packed counter integer.
+
+    Args:
+        value: Integer whose low byte_count bytes are spread
+        byte_count: Number of bytes to spread
+
+    Returns:
+        Packed integer with a 0 or 1 in each lane
+    """
+    spread = 0
+    shift = 0
+    for _ in range(byte_count):
+        spread |= _BYTE_LANES[value & 0xFF] << shift
+        value >>= 8
+        shift += _BYTE_STRIDE
+    return spread
+
+
+def fingerprint_features(features: Mapping[str, int], hash_bits: int = 64) -> int:
+    """Generate a Simhash fingerprint from weighted features.
+
+    Each feature adds its weight to the counter of every bit set in its hash and
+    subtracts it from every other counter; bits with a positive counter are set.
+
+    Args:
+        features: Mapping of feature (word or shingle) to positive integer weight
+        hash_bits: Number of bits in fingerprint (default: 64)
+
+    Returns:
+        Fingerprint as an unsigned integer of hash_bits bits
+
+    Raises:
+        ValueError: If hash_bits is not positive, features is empty, or a weight
+            is not positive
+
+    Example:
+        >>> fingerprint_features({"quick": 1, "fox": 1}) == Simhash("quick fox").fingerprint
+        True
+    """
+    if hash_bits <= 0:
+        raise ValueError(f"hash_bits must be positive, got {hash_bits}")
+
+    if not features:
+        raise ValueError("No tokens extracted from text")
+
+    mask = (1 << hash_bits) - 1
+    byte_count = (min(hash_bits, _TOKEN_HASH_BITS) + 7) // 8
+
+    # Packed per-bit counts of the weight of features having the bit set
+    ones = 0
+    total = 0
+    for feature, weight in features.items():
+        if weight <= 0:
+            raise ValueError(f"Feature weights must be positive, got {weight} for {feature!r}")
+        ones += _spread_bits(_feature_hash(feature) & mask, byte_count) * weight
+        total += weight
+
+    # Guard: lanes would overflow into each other
+    if total > _LANE_MASK:
+        raise ValueError(f"Total feature weight must not exceed {_LANE_MASK}, got {total}")
+
+    # Bit i is set when set bits outweigh unset bits: ones_i - (total - ones_i) > 0
+    fingerprint = 0
+    for i in range(min(hash_bits, _TOKEN_HASH_BITS)):
+        if 2 * (ones >> (_LANE_BITS * i) & _LANE_MASK) > total:
+            fingerprint |= 1 << i
+
+    return fingerprint
+
+
+def fingerprint_many(
+    texts: Iterable[str], hash_bits: int = 64, shingle_size: int = 1
+) -> list[int | None]:
+    """Generate Simhash fingerprints for a batch of texts.
+
+    Produces the same fingerprints as Simhash(text).fingerprint. Feature hashes
+    are shared across the batch, so words repeated between texts are hashed once.
+
+    Args:
+        texts: Iterable of text strings
+        hash_bits: Number of bits in fingerprint (default: 64)
+        shingle_size: Number of consecutive words per feature (default: 1)
+
+    Returns:
+        Fingerprints in input order; None for texts without any tokens
+
+    Raises:
+        ValueError: If hash_bits or shingle_size is not positive
+
+    Example:
+        >>> fingerprint_many(["The quick brown fox", "!!!"])[1] is None
+        True
+    """
+    if hash_bits <= 0:
+        raise ValueError(f"hash_bits must be positive, got {hash_bits}")
+
+    if shingle_size <= 0:
+        raise ValueError(f"shingle_size must be positive, got {shingle_size}")
+
+    fingerprints: list[int | None] = []
+    for text in texts:
+        features = Counter(_shingles(_tokenize(text), shingle_size))
+        fingerprints.append(fingerprint_features(features, hash_bits) if features else None)
+
+    return fingerprints
 
 
 class Simhash:
@@ -37,23 +208,29 @@ class Simhash:
         95.3125
     """
 
-    def __init__(self, text: str, hash_bits: int = 64) -> None:
+    def __init__(self, text: str, hash_bits: int = 64, shingle_size: int = 1) -> None:
         """Initialize Simhash with text content.
 
         Args:
             text: Text content to hash
             hash_bits: Number of bits in fingerprint (default: 64)
+            shingle_size: Number of consecutive words per feature (default: 1,
+                single words as in stored fingerprints)
 
         Raises:
-            ValueError: If hash_bits is not positive or text is empty
+            ValueError: If hash_bits or shingle_size is not positive or text is empty
         """
         if hash_bits <= 0:
             raise ValueError(f"hash_bits must be positive, got {hash_bits}")
 
+        if shingle_size <= 0:
+            raise ValueError(f"shingle_size must be positive, got {shingle_size}")
+
         if not text or not text.strip():
             raise ValueError("text must be non-empty")
 
         self.hash_bits = hash_bits
+        self.shingle_size = shingle_size
         self.fingerprint = self._generate_fingerprint(text)
 
     def _tokenize(self, text: str) -> list[str]:
@@ -68,82 +245,27 @@ class Simhash:
         Returns:
             List of normalized word tokens
         """
-        # Convert to lowercase
-        text = text.lower()
-
-        # Replace punctuation and special characters with spaces
-        text = re.sub(r"[^\w\s]", " ", text)
-
-        # Split on whitespace and filter empty strings
-        tokens = [token for token in text.split() if token]
-
-        return tokens
-
-    def _hash_token(self, token: str) -> int:
-        """Generate hash for a token.
-
-        Uses MD5 hash and converts to integer. MD5 is fast and provides
-        good distribution for Simhash purposes.
-
-        Args:
-            token: Token to hash
-
-        Returns:
-            Integer hash value
-        """
-        # Generate MD5 hash
-        hash_digest = hashlib.md5(token.encode("utf-8")).hexdigest()
-
-        # Convert hex to integer and truncate to hash_bits
-        hash_int = int(hash_digest, 16)
-
-        # Mask to hash_bits length
-        mask = (1 << self.hash_bits) - 1
-        return hash_int & mask
+        return _tokenize(text)
 
     def _generate_fingerprint(self, text: str) -> int:
         """Generate Simhash fingerprint from text.
 
         Algorithm:
-        1. Tokenize text
-        2. For each token, compute hash
-        3. For each bit in hash, increment or decrement vector position
-        4. Convert vector to binary fingerprint
+        1. Tokenize text and group tokens into shingles
+        2. Count occurrences of each feature
+        3. Accumulate weighted feature hash bits (see fingerprint_features)
 
         Args:
             text: Text to fingerprint
 
         Returns:
             64-bit integer fingerprint
-        """
-        # Initialize vector with zeros
-        vector = [0] * self.hash_bits
-
-        # Get tokens
-        tokens = self._tokenize(text)
-
-        if not tokens:
-            raise ValueError("No tokens extracted from text")
 
-        # Process each token
-        for token in tokens:
-            token_hash = self._hash_token(token)
-
-            # Update vector based on hash bits
-            for i in range(self.hash_bits):
-                # Check if bit i is set in token_hash
-                if token_hash & (1 << i):
-                    vector[i] += 1  # Increment for 1
-                else:
-                    vector[i] -= 1  # Decrement for 0
-
-        # Convert vector to fingerprint
-        fingerprint = 0
-        for i in range(self.hash_bits):
-            if vector[i] > 0:
-                fingerprint |= 1 << i
-
-        return fingerprint
+        Raises:
+            ValueError: If no tokens are extracted from text
+        """
+        features = Counter(_shingles(self._tokenize(text), self.shingle_size))
+        return fingerprint_features(features, self.hash_bits)
 
     def distance(self, other: Simhash) -> int:
         """Calculate Hamming distance between two fingerprints.
@@ -170,9 +292,7 @@ class Simhash:
         xor_result = self.fingerprint ^ other.fingerprint
 
         # Count set bits (Hamming distance)
-        distance = bin(xor_result).count("1")
-
-        return distance
+        return xor_result.bit_count()
 
     def similarity(self, other: Simhash) -> float:
         """Calculate similarity percentage between two fingerprints.
@@ -267,11 +387,157 @@ def compare_texts(text1: str, text2: str, hash_bits: int = 64) -> tuple[int, flo
     return sh1.distance(sh2), sh1.similarity(sh2)
 
 
+def _band_layout(hash_bits: int, band_count: int) -> list[tuple[int, int]]:
+    """Split hash_bits into band_count contiguous bands of near-equal width.
+
+    Returns:
+        (shift, mask) of each band, lowest bits first
+    """
+    layout = []
+    shift = 0
+    for band in range(band_count):
+        width = hash_bits // band_count + (1 if band < hash_bits % band_count else 0)
+        layout.append((shift, (1 << width) - 1))
+        shift += width
+    return layout
+
+
+def near_duplicate_pairs(
+    fingerprints: Sequence[int], threshold: int = 3, hash_bits: int = 64
+) -> Iterator[tuple[int, int, int]]:
+    """Find pairs of fingerprints within a Hamming distance threshold.
+
+    Fingerprints are bucketed by each of threshold + 1 bands and only
+    fingerprints sharing a bucket are compared, so the cost grows with the
+    bucket sizes instead of the square of the input size. Each pair is
+    reported once, from the first band the two fingerprints agree on.
+
+    Args:
+        fingerprints: Unsigned fingerprints of hash_bits bits
+        threshold: Maximum Hamming distance for near-duplicates (default: 3)
+        hash_bits: Number of bits in fingerprint (default: 64)
+
+    Yields:
+        Tuples of (index1, index2, distance) where index1 < index2
+
+    Raises:
+        ValueError: If threshold is negative or hash_bits is not positive
+    """
+    if threshold < 0:
+        raise ValueError(f"threshold must not be negative, got {threshold}")
+
+    if hash_bits <= 0:
+        raise ValueError(f"hash_bits must be positive, got {hash_bits}")
+
+    # Guard: every pair is within the threshold, bands cannot prune anything
+    if threshold >= hash_bits:
+        for i in range(len(fingerprints)):
+            for j in range(i + 1, len(fingerprints)):
+                yield i, j, (fingerprints[i] ^ fingerprints[j]).bit_count()
+        return
+
+    layout = _band_layout(hash_bits, threshold + 1)
+    keys = [tuple(fp >> shift & mask for shift, mask in layout) for fp in fingerprints]
+
+    for band in range(len(layout)):
+        buckets: defaultdict[int, list[int]] = defaultdict(list)
+        for index, key in enumerate(keys):
+            buckets[key[band]].append(index)
+
+        for members in buckets.values():
+            for position, i in enumerate(members):
+                key_i = keys[i]
+                for j in members[position + 1 :]:
+                    key_j = keys[j]
+                    # Skip pairs already compared through an earlier band
+                    if any(key_i[earlier] == key_j[earlier] for earlier in range(band)):
+                        continue
+                    distance = (fingerprints[i] ^ fingerprints[j]).bit_count()
+                    if distance <= threshold:
+                        yield i, j, distance
+
+
+class _UnionFind:
+    """Disjoint sets over indexes 0..size-1 (union by size, path halving)."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize with every index in its own set."""
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, index: int) -> int:
+        """Get the root of the set containing index."""
+        parent = self.parent
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(self, a: int, b: int) -> None:
+        """Merge the sets containing a and b."""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+
+    def groups(self) -> list[list[int]]:
+        """Get sets with more than one member, each in ascending order."""
+        members: defaultdict[int, list[int]] = defaultdict(list)
+        for index in range(len(self.parent)):
+            members[self.find(index)].append(index)
+        return [group for group in members.values() if len(group) > 1]
+
+
+def cluster_near_duplicates(
+    fingerprints: Sequence[int], threshold: int = 3, hash_bits: int = 64
+) -> list[list[int]]:
+    """Group fingerprints into clusters of near-duplicates.
+
+    Clusters are connected components of the "within threshold" relation, so two
+    members of a cluster can be further apart than threshold through a chain of
+    close fingerprints. Equal fingerprints are merged before the band search.
+
+    Args:
+        fingerprints: Unsigned fingerprints of hash_bits bits
+        threshold: Maximum Hamming distance for near-duplicates (default: 3)
+        hash_bits: Number of bits in fingerprint (default: 64)
+
+    Returns:
+        Clusters of two or more indexes, each in ascending order, ordered by
+        their smallest index
+
+    Example:
+        >>> cluster_near_duplicates([0b0000, 0b0001, 0xFFFF, 0b0011])
+        [[0, 1, 3]]
+    """
+    sets = _UnionFind(len(fingerprints))
+
+    # First index of each distinct fingerprint
+    distinct: dict[int, int] = {}
+    for index, fingerprint in enumerate(fingerprints):
+        first = distinct.setdefault(fingerprint, index)
+        if first != index:
+            sets.union(first, index)
+
+    representatives = list(distinct.values())
+    for a, b, _ in near_duplicate_pairs(list(distinct), threshold, hash_bits):
+        sets.union(representatives[a], representatives[b])
+
+    return sets.groups()
+
+
 def find_near_duplicates(
     texts: Iterable[str], threshold: int = 3, hash_bits: int = 64
 ) -> list[tuple[int, int, int, float]]:
     """Find near-duplicate pairs in a collection of texts.
 
+    Candidate pairs come from near_duplicate_pairs(), so only texts sharing a
+    fingerprint band are compared.
+
     Args:
         texts: Iterable of text strings
         threshold: Maximum Hamming distance for near-duplicates (default: 3)
@@ -279,7 +545,7 @@ def find_near_duplicates(
 
     Returns:
         List of tuples: (index1, index2, distance, similarity)
-        where index1 < index2 and distance <= threshold
+        where index1 < index2 and distance <= threshold, ordered by index1, index2
 
     Example:
         >>> texts = [
@@ -293,16 +559,10 @@ def find_near_duplicates(
         ...     print(f"Texts {i} and {j}: distance={dist}, similarity={sim:.1f}%")
     """
     # Generate fingerprints
-    text_list = list(texts)
-    fingerprints = [Simhash(text, hash_bits=hash_bits) for text in text_list]
+    fingerprints = fingerprint_many(texts, hash_bits=hash_bits)
+    if None in fingerprints:
+        raise ValueError("No tokens extracted from text")
 
     # Find pairs within threshold
-    duplicates = []
-    for i in range(len(fingerprints)):
-        for j in range(i + 1, len(fingerprints)):
-            distance = fingerprints[i].distance(fingerprints[j])
-            if distance <= threshold:
-                similarity = fingerprints[i].similarity(fingerprints[j])
-                duplicates.append((i, j, distance, similarity))
-
-    return duplicates
+    pairs = near_duplicate_pairs(fingerprints, threshold, hash_bits)  # type: ignore[arg-type]
+    return [(i, j, distance, (1 - distance / hash_bits) * 100) for i, j, distance in sorted(pairs)]
@@ -4,6 +4,14 @@ PostgreSQL BIGINT is signed (-2^63 to 2^63-1), but Simhash fingerprints
 are unsigned 64-bit integers (0 to 2^64-1). These helpers handle the conversion.
 """
 
+# Fingerprints are split into 4 bands of 16 bits for indexed near-duplicate lookup
+SIMHASH_BAND_COUNT = 4
+SIMHASH_BAND_BITS = 16
+
+# Largest Hamming distance for which band lookup finds every match: with d differing
+# bits spread over SIMHASH_BAND_COUNT bands, at least one band is identical if d < 4
+MAX_BANDED_DISTANCE = SIMHASH_BAND_COUNT - 1
+
 
 def to_signed_int64(unsigned: int) -> int:
     """Convert unsigned 64-bit integer to signed for PostgreSQL BIGINT.
@@ -48,3 +56,27 @@ def from_signed_int64(signed: int) -> int:
     if signed < 0:
         return signed + (1 << 64)
     return signed
+
+
+def simhash_bands(fingerprint: int) -> tuple[int, ...]:
+    """Split a 64-bit fingerprint into its 16-bit bands, lowest bits first.
+
+    Works for both signed and unsigned representations, since masking a
+    two's-complement value yields the same bits.
+
+    Args:
+        fingerprint: 64-bit Simhash fingerprint (signed or unsigned)
+
+    Returns:
+        Tuple of SIMHASH_BAND_COUNT band values (0 to 65535)
+
+    Example:
+        >>> simhash_bands(0x0004000300020001)
+        (1, 2, 3, 4)
+        >>> simhash_bands(-1)
+        (65535, 65535, 65535, 65535)
+    """
+    mask = (1 << SIMHASH_BAND_BITS) - 1
+    return tuple(
+        (fingerprint >> (band * SIMHASH_BAND_BITS)) & mask for band in range(SIMHASH_BAND_COUNT)
+    )
@@ -7,32 +7,56 @@ This worker:
 4. Executes the crawl job
 5. Updates job status
 6. Acknowledges or rejects the message
+
+Up to ``settings.worker_concurrency`` jobs run concurrently in one process. Each
+message is acked/nak'd as soon as its own job finishes, and long-running jobs send
+periodic in-progress acks so JetStream does not redeliver them.
 """
 
 import asyncio
 import json
 import signal
 from contextlib import aclosing
-from typing import Any
+from datetime import UTC, datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from nats.js.api import AckPolicy, ConsumerConfig
+from prometheus_client import start_http_server
 
 from config import Settings, get_settings
+from crawler.core import metrics
 from crawler.core.logging import get_logger, setup_logging
 from crawler.db.generated.models import StatusEnum
 from crawler.db.repositories import CrawlJobRepository, WebsiteRepository
-from crawler.db.session import get_db
+from crawler.db.session import engine, get_db
+from crawler.services.job_checkpoint import JobCheckpoint
 from crawler.services.job_retry_handler import create_retry_handler
 from crawler.services.nats_queue import NATSQueueService
-from crawler.services.redis_cache import JobCancellationFlag, URLDeduplicationCache
+from crawler.services.page_pipeline import PagePersistencePipeline
+from crawler.services.redis_cache import (
+    HostRateLimiter,
+    JobCancellationFlag,
+    JobCancellationRegistry,
+    LogBuffer,
+    URLDeduplicationCache,
+)
 from crawler.services.result_persistence import ResultPersistenceService
+from crawler.services.step_execution_context import StepExecutionContext
 from crawler.services.step_orchestrator import StepOrchestrator
 
+if TYPE_CHECKING:
+    from crawler.services.crawl_log_sink import CrawlLogSink
+    from crawler.services.storage import StorageService
+
 logger = get_logger(__name__)
 
 # Global shutdown flag
 _shutdown = False
 
+# Seconds between shutdown flag checks while every processing slot is busy
+SHUTDOWN_CHECK_INTERVAL = 1.0
+
 
 def signal_handler(signum: int, frame: Any) -> None:
     """Handle shutdown signals gracefully."""
@@ -54,6 +78,10 @@ class CrawlJobWorker:
         dedup_cache: URLDeduplicationCache,
         settings: Settings,
         retry_scheduler_cache: Any | None = None,
+        storage: StorageService | None = None,
+        log_sink: CrawlLogSink | None = None,
+        host_limiter: HostRateLimiter | None = None,
+        cancellation_registry: JobCancellationRegistry | None = None,
     ):
         """Initialize worker with injected dependencies.
 
@@ -63,13 +91,28 @@ class CrawlJobWorker:
             dedup_cache: URL deduplication cache service
             settings: Application settings
             retry_scheduler_cache: Optional retry scheduler cache for non-blocking delays
+            storage: Optional object storage for the raw HTML of scraped pages
+            log_sink: Optional sink batching the crawl logs of all jobs in this process
+            host_limiter: Optional per-host request pacing shared across workers
+            cancellation_registry: Optional registry receiving pushed cancellations. Jobs
+                then stop mid-step when cancelled instead of polling between steps.
         """
         self.nats_queue = nats_queue
         self.cancellation_flag = cancellation_flag
         self.dedup_cache = dedup_cache
         self.settings = settings
         self.retry_scheduler_cache = retry_scheduler_cache
-        self.processing = False
+        self.storage = storage
+        self.log_sink = log_sink
+        self.host_limiter = host_limiter
+        self.cancellation_registry = cancellation_registry
+        self.concurrency = settings.worker_concurrency
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    @property
+    def processing(self) -> bool:
+        """Whether any job is currently being processed."""
+        return bool(self._in_flight)
 
     async def setup(self) -> None:
         """Setup worker dependencies and connections."""
@@ -79,12 +122,25 @@ class CrawlJobWorker:
         if not await self.nats_queue.health_check():
             await self.nats_queue.connect()
 
+        if self.log_sink:
+            await self.log_sink.start()
+
+        if self.cancellation_registry:
+            await self.cancellation_registry.start()
+
         logger.info("worker_setup_complete")
 
     async def teardown(self) -> None:
         """Cleanup worker resources."""
         logger.info("worker_teardown_starting")
 
+        if self.cancellation_registry:
+            await self.cancellation_registry.stop()
+
+        # Flush buffered crawl logs while NATS is still connected
+        if self.log_sink:
+            await self.log_sink.close()
+
         if self.nats_queue:
             await self.nats_queue.disconnect()
 
@@ -236,6 +292,18 @@ class CrawlJobWorker:
         # Get website_id from job (inline jobs may not have website_id)
         website_id = str(job.website_id) if job.website_id else None
 
+        # Progress is recorded outside the job's transaction, so a retry can resume
+        checkpoint = (
+            JobCheckpoint(
+                engine.begin,
+                job_id,
+                batch_size=self.settings.job_checkpoint_batch_size,
+                storage=self.storage,
+            )
+            if self.settings.job_checkpoint_enabled
+            else None
+        )
+
         try:
             # Create step orchestrator for multi-step workflow execution
             logger.info(
@@ -245,6 +313,17 @@ class CrawlJobWorker:
                 base_url=base_url,
             )
 
+            # Page writes and validator lookups share the job's connection through
+            # one persistence service
+            persistence_service = ResultPersistenceService(conn, storage=self.storage)
+
+            # Re-crawl pages saved for the website conditionally (inline jobs have none)
+            validator_lookup = (
+                partial(persistence_service.get_page_validators, website_id)
+                if website_id and self.settings.incremental_recrawl_enabled
+                else None
+            )
+
             orchestrator = StepOrchestrator(
                 job_id=job_id,
                 website_id=website_id or job_id,  # Use job_id if no website_id
@@ -252,10 +331,28 @@ class CrawlJobWorker:
                 steps=steps,
                 global_config=global_config,
                 cancellation_flag=self.cancellation_flag,
+                host_limiter=self.host_limiter,
+                pipeline_steps=self.settings.step_pipelining_enabled,
+                pipeline_max_batches=self.settings.step_pipeline_max_batches,
+                validator_lookup=validator_lookup,
+                checkpoint=checkpoint,
+                cancel_event=(
+                    self.cancellation_registry.get_event(job_id)
+                    if self.cancellation_registry
+                    else None
+                ),
+                # Inline jobs have no website row for their crawl log entries
+                log_sink=self.log_sink if website_id else None,
             )
 
-            # Execute workflow
-            context = await orchestrator.execute_workflow()
+            # Execute workflow (scraped pages may be persisted while it runs)
+            context, streamed_stats = await self._execute_workflow(
+                orchestrator,
+                conn,
+                persistence_service,
+                job_id=job_id,
+                website_id=website_id or job_id,
+            )
 
             logger.info(
                 "workflow_completed",
@@ -274,6 +371,8 @@ class CrawlJobWorker:
                     completed_at=None,
                     error_message=None,
                 )
+                if checkpoint:
+                    await checkpoint.clear()
                 logger.info(
                     "job_cancelled_during_execution",
                     job_id=job_id,
@@ -287,12 +386,17 @@ class CrawlJobWorker:
             if not failed_steps:
                 # All steps succeeded - persist results to database
                 try:
-                    persistence_service = ResultPersistenceService(conn)
                     stats = await persistence_service.persist_workflow_results(
                         job_id=job_id,
                         website_id=website_id or job_id,
                         context=context,
                     )
+                    if streamed_stats:
+                        stats = {key: stats[key] + streamed_stats[key] for key in stats}
+                    stats.update(self._recrawl_stats(context))
+
+                    # Report changed/unchanged page counts with the job
+                    await job_repo.update_progress(job_id, stats)
 
                     # Commit transaction after persisting results (required for sqlc inserts)
                     if session:
@@ -303,6 +407,8 @@ class CrawlJobWorker:
                         job_id=job_id,
                         pages_saved=stats["pages_saved"],
                         pages_failed=stats["pages_failed"],
+                        pages_changed=stats["pages_changed"],
+                        pages_unchanged=stats["pages_unchanged"],
                     )
                 except Exception as e:
                     logger.error(
@@ -325,6 +431,8 @@ class CrawlJobWorker:
                     completed_at=None,
                     error_message=None,
                 )
+                if checkpoint:
+                    await checkpoint.clear()
                 logger.info("job_completed_successfully", job_id=job_id)
                 return True
             else:
@@ -362,6 +470,9 @@ class CrawlJobWorker:
                 # and (optionally) added it to the DLQ.
                 # In both cases the failure has been fully handled, so we should ack
                 # the current message and NOT rely on JetStream requeue.
+                # Checkpoints are kept only for the retry to resume from.
+                if checkpoint and not will_retry:
+                    await checkpoint.clear()
                 if will_retry:
                     logger.info("job_will_retry", job_id=job_id, failed_steps=failed_steps)
                 else:
@@ -383,6 +494,8 @@ class CrawlJobWorker:
                 exc=e,
                 error_message=error_msg,
             )
+            if checkpoint and not will_retry:
+                await checkpoint.clear()
 
             logger.error(
                 "workflow_validation_error", job_id=job_id, error=str(e), will_retry=will_retry
@@ -402,6 +515,8 @@ class CrawlJobWorker:
                 exc=e,
                 error_message=error_msg,
             )
+            if checkpoint and not will_retry:
+                await checkpoint.clear()
 
             logger.error(
                 "workflow_execution_error",
@@ -413,6 +528,84 @@ class CrawlJobWorker:
             # Failure already handled by JobRetryHandler; always ack.
             return True
 
+    async def _execute_workflow(
+        self,
+        orchestrator: StepOrchestrator,
+        conn: Any,
+        persistence_service: ResultPersistenceService,
+        job_id: str,
+        website_id: str,
+    ) -> tuple[StepExecutionContext, dict[str, int] | None]:
+        """Execute the workflow, streaming scraped pages to the database if enabled.
+
+        Streamed pages are written inside a savepoint that is released only when
+        every step succeeds. Failed or cancelled workflows therefore leave no pages
+        behind, as when results are persisted after the workflow.
+
+        Args:
+            orchestrator: Orchestrator for the job's workflow
+            conn: Database connection
+            persistence_service: Persistence service writing the job's pages
+            job_id: Job UUID
+            website_id: Website UUID (or job UUID for inline jobs)
+
+        Returns:
+            Tuple of (execution context, streamed page statistics or None if streaming
+            is disabled)
+        """
+        # Guard: streaming disabled - pages are persisted from the context afterwards
+        if not self.settings.scrape_streaming_enabled:
+            return await orchestrator.execute_workflow(), None
+
+        savepoint = await conn.begin_nested()
+        pipeline = PagePersistencePipeline(
+            persistence_service,
+            job_id=job_id,
+            website_id=website_id,
+            max_pending=self.settings.scrape_pipeline_max_pending,
+        )
+        orchestrator.page_sink = pipeline.submit
+        await pipeline.start()
+
+        try:
+            context = await orchestrator.execute_workflow()
+        except BaseException:
+            await pipeline.stop()
+            await savepoint.rollback()
+            raise
+
+        stats = await pipeline.stop()
+
+        if context.metadata.get("cancelled") or context.get_failed_steps():
+            await savepoint.rollback()
+            if stats["pages_saved"]:
+                logger.info(
+                    "streamed_pages_discarded",
+                    job_id=job_id,
+                    pages_discarded=stats["pages_saved"],
+                )
+        else:
+            await savepoint.commit()
+
+        return context, stats
+
+    @staticmethod
+    def _recrawl_stats(context: StepExecutionContext) -> dict[str, int]:
+        """Count scraped pages that changed or not since their last crawl.
+
+        Args:
+            context: Execution context with step results
+
+        Returns:
+            Dictionary with pages_changed and pages_unchanged
+        """
+        pages_changed = 0
+        pages_unchanged = 0
+        for step_result in context.step_results.values():
+            pages_changed += step_result.metadata.get("changed_urls", 0)
+            pages_unchanged += step_result.metadata.get("unchanged_urls", 0)
+        return {"pages_changed": pages_changed, "pages_unchanged": pages_unchanged}
+
     async def process_job(self, job_id: str, job_data: dict[str, Any], conn: Any = None) -> bool:
         """Process a single crawl job.
 
@@ -426,13 +619,21 @@ class CrawlJobWorker:
         """
         logger.info("processing_job", job_id=job_id, job_data=job_data)
 
-        # Guard: check if job is cancelled before starting
-        if self.cancellation_flag and await self.cancellation_flag.is_cancelled(job_id):
-            logger.info("job_cancelled_before_start", job_id=job_id)
-            # Job is cancelled - acknowledge to remove from queue
-            return True
+        # Watch for cancellations pushed while the job runs (reads the flag once)
+        if self.cancellation_registry:
+            cancelled = (await self.cancellation_registry.register(job_id)).is_set()
+        else:
+            cancelled = bool(self.cancellation_flag) and await self.cancellation_flag.is_cancelled(
+                job_id
+            )
 
         try:
+            # Guard: check if job is cancelled before starting
+            if cancelled:
+                logger.info("job_cancelled_before_start", job_id=job_id)
+                # Job is cancelled - acknowledge to remove from queue
+                return True
+
             # Use provided connection or get new one
             if conn is not None:
                 # Test mode - use provided connection
@@ -453,12 +654,136 @@ class CrawlJobWorker:
             logger.error("job_processing_failed", job_id=job_id, error=str(e), exc_info=True)
             # Return False to trigger negative acknowledgment and requeue
             return False
+        finally:
+            if self.cancellation_registry:
+                self.cancellation_registry.unregister(job_id)
+
+    async def _heartbeat(self, msg: Any, job_id: str) -> None:
+        """Periodically mark a message as in progress to extend its ack deadline.
+
+        Args:
+            msg: JetStream message being processed
+            job_id: Job UUID (for logging)
+        """
+        interval = self.settings.worker_heartbeat_interval
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await msg.in_progress()
+                logger.debug("message_in_progress_sent", job_id=job_id)
+            except Exception as e:
+                logger.warning("message_in_progress_failed", job_id=job_id, error=str(e))
+
+    async def handle_message(self, msg: Any) -> None:
+        """Process a single queue message and ack/nak it when the job finishes.
+
+        Args:
+            msg: JetStream message containing the job payload
+        """
+        job_id = None
+        try:
+            # Parse message
+            data = json.loads(msg.data.decode("utf-8"))
+            job_id = data.get("job_id")
+
+            if not job_id:
+                logger.warning("message_missing_job_id", data=data)
+                # Acknowledge bad message to remove from queue
+                await msg.ack()
+                return
+
+            # Process the job, keeping the message alive while it runs
+            heartbeat = asyncio.create_task(self._heartbeat(msg, job_id))
+            try:
+                success = await self.process_job(job_id, data)
+            finally:
+                heartbeat.cancel()
+
+            # Write the job's buffered crawl logs before acknowledging it
+            if self.log_sink:
+                await self.log_sink.flush()
+
+            if success:
+                # Job processed successfully - acknowledge
+                await msg.ack()
+                logger.info("message_acknowledged", job_id=job_id)
+            else:
+                # Job failed - negative acknowledge for requeue
+                await msg.nak()
+                logger.warning("message_rejected_for_requeue", job_id=job_id)
+
+        except asyncio.CancelledError:
+            # Drain timed out - hand the job back to the queue for another worker
+            logger.warning("message_processing_cancelled", job_id=job_id)
+            await msg.nak()
+            raise
+        except Exception as e:
+            logger.error("message_processing_error", job_id=job_id, error=str(e), exc_info=True)
+            # Negative ack on error to requeue
+            await msg.nak()
+
+    def _start_message(self, msg: Any) -> None:
+        """Schedule a message for concurrent processing.
+
+        Args:
+            msg: JetStream message containing the job payload
+        """
+        self._record_queue_metrics(msg)
+        task = asyncio.create_task(self.handle_message(msg))
+        self._in_flight.add(task)
+        metrics.active_crawl_tasks.set(len(self._in_flight))
+        task.add_done_callback(self._finish_message)
+
+    def _finish_message(self, task: asyncio.Task[None]) -> None:
+        """Release the processing slot of a finished message.
+
+        Args:
+            task: Task that processed the message
+        """
+        self._in_flight.discard(task)
+        metrics.active_crawl_tasks.set(len(self._in_flight))
+
+    def _record_queue_metrics(self, msg: Any) -> None:
+        """Record how long a message waited in the queue and how many are still waiting.
+
+        Args:
+            msg: JetStream message about to be processed
+        """
+        try:
+            metadata = msg.metadata
+        except Exception:
+            # Not a JetStream message (no delivery metadata in its reply subject)
+            return
+
+        # Redelivered messages keep their publish time, so lag includes retry delays
+        queue_name = self.settings.nats_stream_name
+        lag = (datetime.now(UTC) - metadata.timestamp).total_seconds()
+        metrics.queue_lag_seconds.labels(queue_name=queue_name).set(max(lag, 0.0))
+        metrics.queue_messages_pending.labels(queue_name=queue_name).set(metadata.num_pending)
+
+    async def _drain(self) -> None:
+        """Wait for in-flight jobs to finish, requeueing any that exceed the drain timeout."""
+        if not self._in_flight:
+            return
+
+        logger.info("worker_draining", in_flight=len(self._in_flight))
+        _, pending = await asyncio.wait(
+            set(self._in_flight), timeout=self.settings.worker_drain_timeout
+        )
+
+        if pending:
+            logger.warning("worker_drain_timeout", pending=len(pending))
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        logger.info("worker_drained")
 
     async def run(self) -> None:
         """Run the worker main loop."""
         global _shutdown
 
-        logger.info("worker_starting")
+        logger.info("worker_starting", concurrency=self.concurrency)
 
         try:
             await self.setup()
@@ -478,48 +803,20 @@ class CrawlJobWorker:
 
             # Main processing loop
             while not _shutdown:
-                try:
-                    # Fetch messages in batches
-                    msgs = await psub.fetch(batch=1, timeout=5.0)
-
-                    for msg in msgs:
-                        # Guard: check shutdown flag
-                        if _shutdown:
-                            logger.info("shutdown_requested_stopping_processing")
-                            # Negative ack to requeue for another worker
-                            await msg.nak()
-                            break
-
-                        try:
-                            # Parse message
-                            data = json.loads(msg.data.decode("utf-8"))
-                            job_id = data.get("job_id")
-
-                            if not job_id:
-                                logger.warning("message_missing_job_id", data=data)
-                                # Acknowledge bad message to remove from queue
-                                await msg.ack()
-                                continue
-
-                            # Process the job
-                            self.processing = True
-                            success = await self.process_job(job_id, data)
-                            self.processing = False
-
-                            if success:
-                                # Job processed successfully - acknowledge
-                                await msg.ack()
-                                logger.info("message_acknowledged", job_id=job_id)
-                            else:
-                                # Job failed - negative acknowledge for requeue
-                                await msg.nak()
-                                logger.warning("message_rejected_for_requeue", job_id=job_id)
-
-                        except Exception as e:
-                            logger.error("message_processing_error", error=str(e), exc_info=True)
-                            # Negative ack on error to requeue
-                            await msg.nak()
+                # Guard: all slots busy - wait for a job to finish before fetching more,
+                # waking up regularly so a shutdown starts draining without delay
+                free_slots = self.concurrency - len(self._in_flight)
+                if free_slots <= 0:
+                    await asyncio.wait(
+                        set(self._in_flight),
+                        timeout=SHUTDOWN_CHECK_INTERVAL,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    continue
 
+                try:
+                    # Fetch only as many messages as we have free slots for
+                    msgs = await psub.fetch(batch=free_slots, timeout=5.0)
                 except TimeoutError:
                     # No messages available - this is normal
                     logger.debug("no_messages_available")
@@ -527,12 +824,25 @@ class CrawlJobWorker:
                 except Exception as e:
                     logger.error("fetch_error", error=str(e), exc_info=True)
                     await asyncio.sleep(5)  # Wait before retrying
+                    continue
+
+                for msg in msgs:
+                    # Guard: check shutdown flag
+                    if _shutdown:
+                        logger.info("shutdown_requested_stopping_processing")
+                        # Negative ack to requeue for another worker
+                        await msg.nak()
+                        continue
+
+                    self._start_message(msg)
 
             logger.info("worker_main_loop_exited")
 
         except Exception as e:
             logger.error("worker_fatal_error", error=str(e), exc_info=True)
         finally:
+            # Let in-flight jobs finish before disconnecting
+            await self._drain()
             await self.teardown()
 
 
@@ -548,6 +858,11 @@ async def main() -> None:
     # Get settings
     settings = get_settings()
 
+    # Serve this worker's metrics for Prometheus to scrape
+    if settings.enable_metrics:
+        start_http_server(settings.metrics_port)
+        logger.info("worker_metrics_server_started", port=settings.metrics_port)
+
     # Setup dependencies
     logger.info("initializing_worker_dependencies")
 
@@ -561,11 +876,46 @@ async def main() -> None:
     cancellation_flag = JobCancellationFlag(redis_client, settings)
     dedup_cache = URLDeduplicationCache(redis_client, settings)
 
+    # Learn about cancellations as they are published instead of polling for them
+    cancellation_registry = (
+        JobCancellationRegistry(cancellation_flag)
+        if settings.job_cancellation_push_enabled
+        else None
+    )
+
+    # Pace requests per host across every worker sharing this Redis
+    host_limiter = (
+        HostRateLimiter(redis_client, settings) if settings.host_rate_limit_enabled else None
+    )
+
     # Create retry scheduler cache for non-blocking retry delays
     from crawler.services.retry_scheduler_cache import RetrySchedulerCache
 
     retry_scheduler_cache = RetrySchedulerCache(redis_client, settings)
 
+    # Create object storage for raw HTML if enabled
+    storage = None
+    if settings.raw_html_storage_enabled:
+        from crawler.services.storage import StorageService
+
+        storage = StorageService(settings)
+
+    # Create the crawl log sink; NATS is connected first so flushed logs stream live
+    from crawler.services.crawl_log_sink import CrawlLogSink, LogDropPolicy
+    from crawler.services.log_publisher import LogPublisher
+
+    await nats_queue.connect()
+    log_sink = CrawlLogSink(
+        engine.begin,
+        log_publisher=LogPublisher(
+            nats_client=nats_queue.client, log_buffer=LogBuffer(redis_client, settings)
+        ),
+        max_buffer_size=settings.crawl_log_buffer_size,
+        batch_size=settings.crawl_log_batch_size,
+        flush_interval=settings.crawl_log_flush_interval,
+        drop_policy=LogDropPolicy(settings.crawl_log_drop_policy),
+    )
+
     # Create and run worker with dependency injection
     worker = CrawlJobWorker(
         nats_queue=nats_queue,
@@ -573,12 +923,18 @@ async def main() -> None:
         dedup_cache=dedup_cache,
         settings=settings,
         retry_scheduler_cache=retry_scheduler_cache,
+        storage=storage,
+        log_sink=log_sink,
+        host_limiter=host_limiter,
+        cancellation_registry=cancellation_registry,
     )
 
     try:
         await worker.run()
     finally:
         # Cleanup
+        if storage:
+            await storage.close()
         await redis_client.aclose()  # type: ignore[attr-defined]
 
 
@@ -24,6 +24,10 @@ from crawler.core.dependencies import (
 )
 from crawler.core.logging import get_logger
 from crawler.services.dlq_metrics_updater import start_dlq_metrics_updater, stop_dlq_metrics_updater
+from crawler.services.website_stats_rollup import (
+    start_website_stats_rollup,
+    stop_website_stats_rollup,
+)
 
 logger = get_logger(__name__)
 
@@ -70,6 +74,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         logger.error("dlq_metrics_updater_start_failed_on_startup", error=str(e))
         # Continue without DLQ metrics - app can still function
 
+    # Start statistics rollup (folds job/page counter deltas into website_stats)
+    try:
+        settings = get_app_settings()
+        await start_website_stats_rollup(
+            interval_seconds=settings.website_stats_fold_interval,
+            batch_size=settings.website_stats_fold_batch_size,
+        )
+        logger.info("website_stats_rollup_started")
+    except Exception as e:
+        logger.error("website_stats_rollup_start_failed_on_startup", error=str(e))
+        # Continue without folding - statistics stay exact, reads just sum more deltas
+
     # Start retry scheduler (non-blocking retry delays)
     try:
         await start_retry_scheduler_service(interval_seconds=5, batch_size=100)
@@ -105,6 +121,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     except Exception as e:
         logger.error("retry_scheduler_stop_failed_on_shutdown", error=str(e))
 
+    # Stop statistics rollup
+    try:
+        await stop_website_stats_rollup()
+        logger.info("website_stats_rollup_stopped")
+    except Exception as e:
+        logger.error("website_stats_rollup_stop_failed_on_shutdown", error=str(e))
+
     # Stop DLQ metrics updater
     try:
         await stop_dlq_metrics_updater()
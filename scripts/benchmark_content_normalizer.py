@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Parity check and benchmark for ContentNormalizer.
+
+Normalizes every page of the fixture corpus, compares the output with the
+expected output recorded from the original BeautifulSoup implementation, and
+times normalize_for_hash() over the corpus.
+
+Usage:
+    # Check parity and time 200 passes over the corpus
+    python scripts/benchmark_content_normalizer.py
+
+    # More passes, or another corpus with its own expected.json
+    python scripts/benchmark_content_normalizer.py --iterations 1000
+    python scripts/benchmark_content_normalizer.py --corpus path/to/corpus
+
+Exits with status 1 if any output differs from the expected output.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+# Add parent directory to path to import from crawler
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crawler.services.content_normalizer import ContentNormalizer
+
+DEFAULT_CORPUS = Path(__file__).parent.parent / "tests" / "fixtures" / "normalizer"
+
+# normalize() arguments for each mode recorded in expected.json
+MODES: dict[str, dict[str, Any]] = {
+    "hash": {},
+    "structured": {"preserve_structure": True},
+    "full_document": {"extract_main_only": False, "remove_timestamps": False},
+}
+
+
+def check_parity(normalizer: ContentNormalizer, pages: dict[str, str], expected: dict) -> int:
+    """Compare normalizer output with the expected output for every page and mode.
+
+    Returns:
+        Number of mismatches
+    """
+    mismatches = 0
+    for name, html in pages.items():
+        for mode, kwargs in MODES.items():
+            actual = normalizer.normalize(html, **kwargs)
+            if actual != expected[name][mode]:
+                mismatches += 1
+                print(f"MISMATCH {name} [{mode}]")
+                print(f"  expected: {expected[name][mode]!r}")
+                print(f"  actual:   {actual!r}")
+    return mismatches
+
+
+def benchmark(normalizer: ContentNormalizer, pages: dict[str, str], iterations: int) -> None:
+    """Time normalize_for_hash() over the corpus and print throughput."""
+    documents = list(pages.values())
+    total_bytes = sum(len(html.encode("utf-8")) for html in documents) * iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for html in documents:
+            normalizer.normalize_for_hash(html)
+    elapsed = time.perf_counter() - start
+
+    page_count = len(documents) * iterations
+    print(f"pages:      {page_count}")
+    print(f"total:      {elapsed:.3f}s")
+    print(f"per page:   {elapsed / page_count * 1000:.3f}ms")
+    print(f"throughput: {page_count / elapsed:.0f} pages/s, {total_bytes / elapsed / 1e6:.1f} MB/s")
+
+
+def main() -> int:
+    """Run the parity check and benchmark."""
+    parser = argparse.ArgumentParser(description="ContentNormalizer parity check and benchmark")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="Corpus directory")
+    parser.add_argument("--iterations", type=int, default=200, help="Passes over the corpus")
+    args = parser.parse_args()
+
+    # Keep per-page debug logs out of the measurement
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    pages = {
+        path.name: path.read_text(encoding="utf-8") for path in sorted(args.corpus.glob("*.html"))
+    }
+    expected = json.loads((args.corpus / "expected.json").read_text(encoding="utf-8"))
+    normalizer = ContentNormalizer()
+
+    mismatches = check_parity(normalizer, pages, expected)
+    print(f"parity: {len(pages) * len(MODES) - mismatches}/{len(pages) * len(MODES)} outputs match")
+
+    benchmark(normalizer, pages, args.iterations)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
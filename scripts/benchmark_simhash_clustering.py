@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark for banded near-duplicate clustering of Simhash fingerprints.
+
+Generates synthetic fingerprint sets (random fingerprints plus planted clusters
+of near-duplicates a few flipped bits away from a seed), times
+cluster_near_duplicates() on each, and checks that every planted cluster is
+found. With --verify, the band search is also compared with an all-pairs scan
+on a small set.
+
+Usage:
+    # Time 10k, 100k and 1M fingerprints
+    python scripts/benchmark_simhash_clustering.py
+
+    # Custom sizes and threshold, with an all-pairs check on 3,000 fingerprints
+    python scripts/benchmark_simhash_clustering.py --sizes 50000 500000 --threshold 5 --verify
+
+Exits with status 1 if a planted cluster is missed or the check fails.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import from crawler
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crawler.utils.simhash import cluster_near_duplicates, near_duplicate_pairs
+
+HASH_BITS = 64
+
+# Fraction of fingerprints that belong to a planted cluster, and members per cluster
+PLANTED_FRACTION = 0.1
+PLANTED_CLUSTER_SIZE = 5
+
+# Fingerprints compared all-pairs with --verify
+VERIFY_SIZE = 3000
+
+
+def synthetic_fingerprints(
+    size: int, threshold: int, rng: random.Random
+) -> tuple[list[int], list[list[int]]]:
+    """Generate random fingerprints with planted near-duplicate clusters.
+
+    Each planted member differs from its cluster seed by at most threshold bits.
+
+    Returns:
+        Tuple of (shuffled fingerprints, indexes of each planted cluster)
+    """
+    planted_count = int(size * PLANTED_FRACTION) // PLANTED_CLUSTER_SIZE
+    labelled: list[tuple[int, int | None]] = []
+    for cluster in range(planted_count):
+        seed = rng.getrandbits(HASH_BITS)
+        labelled.append((seed, cluster))
+        for _ in range(PLANTED_CLUSTER_SIZE - 1):
+            member = seed
+            for bit in rng.sample(range(HASH_BITS), rng.randint(0, threshold)):
+                member ^= 1 << bit
+            labelled.append((member, cluster))
+    while len(labelled) < size:
+        labelled.append((rng.getrandbits(HASH_BITS), None))
+    rng.shuffle(labelled)
+
+    planted: list[list[int]] = [[] for _ in range(planted_count)]
+    for index, (_, cluster) in enumerate(labelled):
+        if cluster is not None:
+            planted[cluster].append(index)
+    return [fingerprint for fingerprint, _ in labelled], planted
+
+
+def benchmark(size: int, threshold: int, rng: random.Random) -> bool:
+    """Time clustering of one synthetic set and check the planted clusters.
+
+    Returns:
+        True if every planted cluster lies within a single found cluster
+    """
+    fingerprints, planted = synthetic_fingerprints(size, threshold, rng)
+
+    start = time.perf_counter()
+    clusters = cluster_near_duplicates(fingerprints, threshold=threshold, hash_bits=HASH_BITS)
+    elapsed = time.perf_counter() - start
+
+    cluster_of = {index: number for number, cluster in enumerate(clusters) for index in cluster}
+    missed = sum(1 for members in planted if len({cluster_of.get(index) for index in members}) != 1)
+
+    print(
+        f"{size:>10,} fingerprints  {elapsed:8.2f}s  "
+        f"{size / elapsed:>10,.0f}/s  clusters: {len(clusters):,}  "
+        f"planted missed: {missed}/{len(planted)}"
+    )
+    return missed == 0
+
+
+def verify(threshold: int, rng: random.Random) -> bool:
+    """Compare the band search with an all-pairs scan on a small set.
+
+    Returns:
+        True if both find the same pairs
+    """
+    fingerprints, _ = synthetic_fingerprints(VERIFY_SIZE, threshold, rng)
+    expected = [
+        (i, j, (fingerprints[i] ^ fingerprints[j]).bit_count())
+        for i, j in itertools.combinations(range(len(fingerprints)), 2)
+        if (fingerprints[i] ^ fingerprints[j]).bit_count() <= threshold
+    ]
+    actual = sorted(near_duplicate_pairs(fingerprints, threshold, HASH_BITS))
+
+    matches = actual == expected
+    print(f"verify: {len(actual)} pairs, {'matches' if matches else 'DIFFERS FROM'} all-pairs scan")
+    return matches
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Simhash clustering benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="Set sizes"
+    )
+    parser.add_argument("--threshold", type=int, default=3, help="Maximum Hamming distance")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--verify", action="store_true", help="Check against all-pairs scan")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    ok = True
+    if args.verify:
+        ok = verify(args.threshold, rng)
+    for size in args.sizes:
+        ok = benchmark(size, args.threshold, rng) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,7 +13,10 @@ Usage:
     # Drop old partitions (uses settings.log_retention_days)
     python scripts/maintain_partitions.py drop-old
 
-    # Run both operations (create + drop)
+    # Build missing message search indexes without blocking writes
+    python scripts/maintain_partitions.py create-indexes
+
+    # Run all operations (create + index + drop)
     python scripts/maintain_partitions.py maintain
 
     # Show partition information
@@ -80,6 +83,66 @@ async def create_future_partitions(conn: asyncpg.Connection, months_ahead: int)
         raise
 
 
+async def create_search_indexes(conn: asyncpg.Connection) -> None:
+    """Create the message search index on partitions that lack a valid one.
+
+    Partitions created by create_crawl_log_partition already have the index. This
+    backfills partitions created before it existed, building each index
+    concurrently so log writes are not blocked while it is built.
+
+    Args:
+        conn: Database connection (must not be inside a transaction).
+    """
+    logger.info("create_search_indexes_start")
+
+    try:
+        partitions = await conn.fetch(
+            "SELECT partition_name FROM crawl_log_partitions ORDER BY partition_month"
+        )
+
+        created_count = 0
+        for row in partitions:
+            partition_name = row["partition_name"]
+            index_name = f"{partition_name}_message_trgm_idx"
+
+            is_valid = await conn.fetchval(
+                """
+                SELECT i.indisvalid
+                FROM pg_class c
+                JOIN pg_index i ON i.indexrelid = c.oid
+                WHERE c.relname = $1
+                """,
+                index_name,
+            )
+            if is_valid:
+                continue
+
+            # An interrupted concurrent build leaves an invalid index behind
+            if is_valid is False:
+                await conn.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"')
+
+            await conn.execute(
+                f'CREATE INDEX CONCURRENTLY "{index_name}" ON "{partition_name}" '
+                "USING gin (job_id, message gin_trgm_ops)"
+            )
+            created_count += 1
+            logger.info("search_index_created", partition=partition_name, index=index_name)
+            print(f"✓ Created {index_name}")
+
+        if created_count == 0:
+            print("✓ All partitions have a search index")
+
+        logger.info(
+            "create_search_indexes_complete",
+            partitions_checked=len(partitions),
+            indexes_created=created_count,
+        )
+
+    except Exception as e:
+        logger.error("create_search_indexes_failed", error=str(e))
+        raise
+
+
 async def drop_old_partitions(conn: asyncpg.Connection, retention_days: int) -> None:
     """Drop old partitions based on retention policy.
 
@@ -194,7 +257,7 @@ async def maintain_partitions(
     months_ahead: int,
     retention_days: int,
 ) -> None:
-    """Run full maintenance: create future partitions and drop old ones.
+    """Run full maintenance: create future partitions and indexes, drop old partitions.
 
     Args:
         conn: Database connection.
@@ -214,10 +277,13 @@ async def maintain_partitions(
     print("\n1. Creating future partitions...")
     await create_future_partitions(conn, months_ahead)
 
-    print("\n2. Dropping old partitions...")
+    print("\n2. Creating search indexes...")
+    await create_search_indexes(conn)
+
+    print("\n3. Dropping old partitions...")
     await drop_old_partitions(conn, retention_days)
 
-    print("\n3. Current partition status:")
+    print("\n4. Current partition status:")
     await list_partitions(conn)
 
     logger.info("partition_maintenance_complete")
@@ -236,7 +302,7 @@ async def main() -> None:
 
     parser.add_argument(
         "command",
-        choices=["create-future", "drop-old", "maintain", "list"],
+        choices=["create-future", "create-indexes", "drop-old", "maintain", "list"],
         help="Command to execute",
     )
 
@@ -268,6 +334,9 @@ async def main() -> None:
         if args.command == "create-future":
             await create_future_partitions(conn, months_ahead)
 
+        elif args.command == "create-indexes":
+            await create_search_indexes(conn)
+
         elif args.command == "drop-old":
             await drop_old_partitions(conn, retention_days)
 
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Rebuild duplicate groups from stored content hashes.
+
+Clusters the Simhash fingerprints in content_hash with a banded near-duplicate
+search and replaces every 'exact_hash' and 'fuzzy_match' duplicate group with
+one group per cluster. Manual and URL matches are kept. The rebuild runs in a
+single transaction.
+
+Usage:
+    # Rebuild with the default fuzzy threshold (Hamming distance 3)
+    python scripts/rebuild_duplicate_groups.py
+
+    # Use a looser threshold and larger query batches
+    python scripts/rebuild_duplicate_groups.py --max-distance 5 --batch-size 50000
+
+    # Compute the groups and report statistics without saving them
+    python scripts/rebuild_duplicate_groups.py --dry-run
+
+Recommended cron schedule (run weekly, off-peak):
+    0 3 * * 0 /path/to/python /path/to/scripts/rebuild_duplicate_groups.py
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import from crawler
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crawler.core.logging import get_logger
+from crawler.db.session import engine
+from crawler.services.duplicate_clustering import (
+    CLUSTERING_BATCH_SIZE,
+    DuplicateClusteringService,
+)
+from crawler.services.result_persistence import FUZZY_MAX_DISTANCE
+
+logger = get_logger(__name__)
+
+
+async def rebuild(max_distance: int, batch_size: int, dry_run: bool) -> dict[str, int]:
+    """Rebuild duplicate groups in one transaction.
+
+    Args:
+        max_distance: Maximum Hamming distance between near-duplicate fingerprints.
+        batch_size: Content hashes read or resolved to pages per query.
+        dry_run: Roll the transaction back instead of committing it.
+
+    Returns:
+        Rebuild statistics.
+    """
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            service = DuplicateClusteringService(conn, batch_size=batch_size)
+            stats = await service.rebuild_groups(max_distance=max_distance)
+        except Exception:
+            await transaction.rollback()
+            raise
+
+        if dry_run:
+            await transaction.rollback()
+        else:
+            await transaction.commit()
+        return stats
+
+
+async def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Rebuild duplicate groups from content_hash fingerprints",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--max-distance",
+        type=int,
+        default=FUZZY_MAX_DISTANCE,
+        help=f"Maximum Hamming distance for near-duplicates (default: {FUZZY_MAX_DISTANCE})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=CLUSTERING_BATCH_SIZE,
+        help=f"Content hashes per query (default: {CLUSTERING_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report statistics without saving the rebuilt groups",
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        stats = await rebuild(args.max_distance, args.batch_size, args.dry_run)
+    except Exception as e:
+        logger.error("duplicate_group_rebuild_error", error=str(e))
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+    print(f"content hashes:   {stats['content_hashes']}")
+    print(f"clusters:         {stats['clusters']}")
+    print(f"groups:           {stats['groups']}")
+    print(f"exact duplicates: {stats['exact_duplicates']}")
+    print(f"fuzzy duplicates: {stats['fuzzy_duplicates']}")
+    print(f"elapsed:          {time.perf_counter() - start:.1f}s")
+    if args.dry_run:
+        print("✓ Dry run, changes rolled back")
+    else:
+        print("✓ Duplicate groups rebuilt")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Rebuild the statistics rollups from crawl jobs, pages and duplicate relationships.
+
+Recomputes website_stats from crawl_job and crawled_page, discarding the pending
+deltas the recount already includes, and recomputes duplicate_group_stats from
+duplicate_relationship. Use it to backfill after restoring data or to repair
+counters after manual SQL changes. The rebuild runs in a single transaction.
+
+Usage:
+    # Rebuild all statistics
+    python scripts/rebuild_website_stats.py
+
+    # Report what would be rebuilt without saving it
+    python scripts/rebuild_website_stats.py --dry-run
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import from crawler
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crawler.core.logging import get_logger
+from crawler.db.repositories import DuplicateGroupRepository, WebsiteStatsRepository
+from crawler.db.session import engine
+
+logger = get_logger(__name__)
+
+
+async def rebuild(dry_run: bool) -> dict[str, int]:
+    """Rebuild website and duplicate group statistics in one transaction.
+
+    Args:
+        dry_run: Roll the transaction back instead of committing it.
+
+    Returns:
+        Rebuild statistics.
+    """
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            stats_repo = WebsiteStatsRepository(conn)
+            pending_deltas = await stats_repo.count_pending_deltas()
+            await stats_repo.rebuild()
+            await DuplicateGroupRepository(conn).rebuild_group_stats()
+        except Exception:
+            await transaction.rollback()
+            raise
+
+        if dry_run:
+            await transaction.rollback()
+        else:
+            await transaction.commit()
+        return {"pending_deltas": pending_deltas}
+
+
+async def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Rebuild website and duplicate group statistics rollups",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Run the rebuild and roll it back",
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        stats = await rebuild(args.dry_run)
+    except Exception as e:
+        logger.error("website_stats_rebuild_error", error=str(e))
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+    print(f"pending deltas replaced: {stats['pending_deltas']}")
+    print(f"elapsed:                 {time.perf_counter() - start:.1f}s")
+    if args.dry_run:
+        print("✓ Dry run, changes rolled back")
+    else:
+        print("✓ Statistics rebuilt")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -77,6 +77,92 @@ WHERE simhash_fingerprint IS NOT NULL
 ORDER BY hamming_distance ASC
 LIMIT sqlc.arg(limit_count);
 
+-- name: FindSimilarContentByBands :many
+-- Find content with similar Simhash fingerprints using the 16-bit band indexes
+-- Any fingerprint within Hamming distance 3 shares at least one band with the target
+-- (pigeonhole over 4 bands), so candidates come from index probes and only they are
+-- verified. Exact for max_distance <= 3; use FindSimilarContent for larger distances.
+-- Band expressions must match the idx_content_hash_simhash_band_* index definitions.
+SELECT *,
+    length(replace((simhash_fingerprint # sqlc.arg(target_fingerprint)::BIGINT)::bit(64)::text, '0', '')) as hamming_distance
+FROM content_hash
+WHERE simhash_fingerprint IS NOT NULL
+    AND (
+        ((simhash_fingerprint >> 0) & 65535) = sqlc.arg(band_0)::BIGINT
+        OR ((simhash_fingerprint >> 16) & 65535) = sqlc.arg(band_1)::BIGINT
+        OR ((simhash_fingerprint >> 32) & 65535) = sqlc.arg(band_2)::BIGINT
+        OR ((simhash_fingerprint >> 48) & 65535) = sqlc.arg(band_3)::BIGINT
+    )
+    AND length(replace((simhash_fingerprint # sqlc.arg(target_fingerprint)::BIGINT)::bit(64)::text, '0', '')) <= sqlc.arg(max_distance)
+    AND content_hash != sqlc.arg(exclude_hash)
+ORDER BY hamming_distance ASC
+LIMIT sqlc.arg(limit_count);
+
 -- name: GetContentHashByFingerprint :one
 SELECT * FROM content_hash
 WHERE simhash_fingerprint = sqlc.arg(simhash_fingerprint);
+
+-- name: BulkUpsertContentHashes :exec
+-- Batch version of UpsertContentHashWithSimhash. Each content hash must appear once;
+-- occurrence_counts carries how many pages of the batch share it.
+-- Use NULL fingerprints for content without a Simhash.
+INSERT INTO content_hash (
+    content_hash,
+    first_seen_page_id,
+    occurrence_count,
+    simhash_fingerprint,
+    last_seen_at
+)
+SELECT
+    hash.content_hash,
+    hash.first_seen_page_id,
+    hash.occurrence_count,
+    hash.simhash_fingerprint,
+    CURRENT_TIMESTAMP
+FROM unnest(
+    sqlc.arg(content_hashes)::VARCHAR[],
+    sqlc.arg(first_seen_page_ids)::UUID[],
+    sqlc.arg(occurrence_counts)::INTEGER[],
+    sqlc.arg(simhash_fingerprints)::BIGINT[]
+) AS hash(content_hash, first_seen_page_id, occurrence_count, simhash_fingerprint)
+ON CONFLICT (content_hash)
+DO UPDATE SET
+    occurrence_count = content_hash.occurrence_count + EXCLUDED.occurrence_count,
+    simhash_fingerprint = COALESCE(EXCLUDED.simhash_fingerprint, content_hash.simhash_fingerprint),
+    last_seen_at = CURRENT_TIMESTAMP;
+
+-- name: FindSimilarContentBatch :many
+-- Batch version of FindSimilarContentByBands: closest match for each target fingerprint
+-- Probes the band indexes once per target inside a single statement. Exact for
+-- max_distance <= 3. Targets without a match are omitted from the result.
+SELECT
+    target.fingerprint AS target_fingerprint,
+    match.content_hash,
+    match.hamming_distance
+FROM unnest(sqlc.arg(target_fingerprints)::BIGINT[]) AS target(fingerprint)
+CROSS JOIN LATERAL (
+    SELECT
+        content_hash.content_hash,
+        length(replace((content_hash.simhash_fingerprint # target.fingerprint)::bit(64)::text, '0', '')) AS hamming_distance
+    FROM content_hash
+    WHERE content_hash.simhash_fingerprint IS NOT NULL
+        AND (
+            ((content_hash.simhash_fingerprint >> 0) & 65535) = ((target.fingerprint >> 0) & 65535)
+            OR ((content_hash.simhash_fingerprint >> 16) & 65535) = ((target.fingerprint >> 16) & 65535)
+            OR ((content_hash.simhash_fingerprint >> 32) & 65535) = ((target.fingerprint >> 32) & 65535)
+            OR ((content_hash.simhash_fingerprint >> 48) & 65535) = ((target.fingerprint >> 48) & 65535)
+        )
+        AND length(replace((content_hash.simhash_fingerprint # target.fingerprint)::bit(64)::text, '0', '')) <= sqlc.arg(max_distance)
+    ORDER BY hamming_distance ASC
+    LIMIT 1
+) AS match;
+
+-- name: ListContentHashesForClustering :many
+-- Keyset page of content hashes that can belong to a duplicate group: hashes with a
+-- fingerprint, or shared by more than one page
+SELECT content_hash, simhash_fingerprint, occurrence_count
+FROM content_hash
+WHERE content_hash > sqlc.arg(after_hash)
+    AND (simhash_fingerprint IS NOT NULL OR occurrence_count > 1)
+ORDER BY content_hash
+LIMIT sqlc.arg(limit_count);
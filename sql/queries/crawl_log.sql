@@ -18,6 +18,42 @@ INSERT INTO crawl_log (
 )
 RETURNING *;
 
+-- name: BulkCreateCrawlLogs :many
+-- Insert a batch of buffered log entries in one statement, in array order
+INSERT INTO crawl_log (
+    job_id,
+    website_id,
+    step_name,
+    log_level,
+    message,
+    context,
+    trace_id,
+    created_at
+)
+SELECT
+    entry.job_id,
+    entry.website_id,
+    entry.step_name,
+    entry.log_level::log_level_enum,
+    entry.message,
+    entry.context::jsonb,
+    entry.trace_id,
+    entry.created_at
+FROM unnest(
+    sqlc.arg(job_ids)::UUID[],
+    sqlc.arg(website_ids)::UUID[],
+    sqlc.arg(step_names)::VARCHAR[],
+    sqlc.arg(log_levels)::TEXT[],
+    sqlc.arg(messages)::TEXT[],
+    sqlc.arg(contexts)::TEXT[],
+    sqlc.arg(trace_ids)::UUID[],
+    sqlc.arg(created_ats)::TIMESTAMPTZ[]
+) WITH ORDINALITY AS entry(
+    job_id, website_id, step_name, log_level, message, context, trace_id, created_at, position
+)
+ORDER BY entry.position
+RETURNING *;
+
 -- name: GetCrawlLogByID :one
 SELECT
     id,
@@ -192,21 +228,99 @@ SELECT
     message,
     context,
     trace_id,
-    created_at,
-    COUNT(*) OVER() as total_count
+    created_at
 FROM crawl_log
 WHERE job_id = sqlc.arg(job_id)
     AND log_level = COALESCE(sqlc.arg(log_level), log_level)
     AND (sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE)
     AND (sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE)
-    AND (sqlc.arg(search_text)::TEXT IS NULL OR message ILIKE '%' || sqlc.arg(search_text)::TEXT || '%')
-ORDER BY created_at ASC
+ORDER BY created_at ASC, id ASC
 OFFSET sqlc.arg(offset_count) LIMIT sqlc.arg(limit_count);
 
+-- name: GetJobLogsAfterCursor :many
+-- Keyset page of GetJobLogsFiltered: logs after the (created_at, id) of the previous page
+SELECT
+    id,
+    job_id,
+    website_id,
+    step_name,
+    log_level,
+    message,
+    context,
+    trace_id,
+    created_at
+FROM crawl_log
+WHERE job_id = sqlc.arg(job_id)
+    AND log_level = COALESCE(sqlc.arg(log_level), log_level)
+    AND (sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE)
+    AND (sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE)
+    AND (created_at, id) > (sqlc.arg(cursor_created_at)::TIMESTAMP WITH TIME ZONE, sqlc.arg(cursor_id)::BIGINT)
+ORDER BY created_at ASC, id ASC
+LIMIT sqlc.arg(limit_count);
+
 -- name: CountJobLogsFiltered :one
-SELECT COUNT(*) FROM crawl_log
+-- Counts at most count_cap matching logs; a NULL count_cap counts them all
+SELECT COUNT(*) FROM (
+    SELECT 1 FROM crawl_log
+    WHERE job_id = sqlc.arg(job_id)
+        AND log_level = COALESCE(sqlc.arg(log_level), log_level)
+        AND (sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE)
+        AND (sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE)
+    LIMIT sqlc.arg(count_cap)
+) AS matched_logs;
+
+-- name: SearchJobLogs :many
+-- GetJobLogsFiltered with a required message search. The unconditional ILIKE lets
+-- the planner use the per-partition (job_id, message gin_trgm_ops) index in every plan
+SELECT
+    id,
+    job_id,
+    website_id,
+    step_name,
+    log_level,
+    message,
+    context,
+    trace_id,
+    created_at
+FROM crawl_log
+WHERE job_id = sqlc.arg(job_id)
+    AND message ILIKE '%' || sqlc.arg(search_text)::TEXT || '%'
+    AND log_level = COALESCE(sqlc.arg(log_level), log_level)
+    AND (sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE)
+    AND (sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE)
+ORDER BY created_at ASC, id ASC
+OFFSET sqlc.arg(offset_count) LIMIT sqlc.arg(limit_count);
+
+-- name: SearchJobLogsAfterCursor :many
+-- Keyset page of SearchJobLogs: matching logs after the (created_at, id) of the previous page
+SELECT
+    id,
+    job_id,
+    website_id,
+    step_name,
+    log_level,
+    message,
+    context,
+    trace_id,
+    created_at
+FROM crawl_log
 WHERE job_id = sqlc.arg(job_id)
+    AND message ILIKE '%' || sqlc.arg(search_text)::TEXT || '%'
     AND log_level = COALESCE(sqlc.arg(log_level), log_level)
     AND (sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE)
     AND (sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE)
-    AND (sqlc.arg(search_text)::TEXT IS NULL OR message ILIKE '%' || sqlc.arg(search_text)::TEXT || '%');
+    AND (created_at, id) > (sqlc.arg(cursor_created_at)::TIMESTAMP WITH TIME ZONE, sqlc.arg(cursor_id)::BIGINT)
+ORDER BY created_at ASC, id ASC
+LIMIT sqlc.arg(limit_count);
+
+-- name: CountJobLogSearch :one
+-- Counts at most count_cap logs matching SearchJobLogs; a NULL count_cap counts them all
+SELECT COUNT(*) FROM (
+    SELECT 1 FROM crawl_log
+    WHERE job_id = sqlc.arg(job_id)
+        AND message ILIKE '%' || sqlc.arg(search_text)::TEXT || '%'
+        AND log_level = COALESCE(sqlc.arg(log_level), log_level)
+        AND (sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at >= sqlc.arg(start_time)::TIMESTAMP WITH TIME ZONE)
+        AND (sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE IS NULL OR created_at <= sqlc.arg(end_time)::TIMESTAMP WITH TIME ZONE)
+    LIMIT sqlc.arg(count_cap)
+) AS matched_logs;
@@ -53,9 +53,19 @@ LIMIT 1;
 -- name: ListPagesByJob :many
 SELECT * FROM crawled_page
 WHERE job_id = sqlc.arg(job_id)
-ORDER BY crawled_at DESC
+ORDER BY crawled_at DESC, id DESC
 OFFSET sqlc.arg(offset_count) LIMIT sqlc.arg(limit_count);
 
+-- name: ListPagesByJobAfterCursor :many
+-- Pages of a job in (created_at, id) order, after the cursor when one is given.
+-- A NULL limit_count returns every remaining page, for streaming exports.
+SELECT * FROM crawled_page
+WHERE job_id = sqlc.arg(job_id)
+    AND (sqlc.arg(cursor_created_at)::TIMESTAMP WITH TIME ZONE IS NULL
+        OR (created_at, id) > (sqlc.arg(cursor_created_at)::TIMESTAMP WITH TIME ZONE, sqlc.arg(cursor_id)::UUID))
+ORDER BY created_at ASC, id ASC
+LIMIT sqlc.arg(limit_count);
+
 -- name: CountPagesByJob :one
 SELECT COUNT(*) FROM crawled_page
 WHERE job_id = sqlc.arg(job_id);
@@ -63,9 +73,19 @@ WHERE job_id = sqlc.arg(job_id);
 -- name: ListPagesByWebsite :many
 SELECT * FROM crawled_page
 WHERE website_id = sqlc.arg(website_id)
-ORDER BY crawled_at DESC
+ORDER BY crawled_at DESC, id DESC
 OFFSET sqlc.arg(offset_count) LIMIT sqlc.arg(limit_count);
 
+-- name: ListPagesByWebsiteAfterCursor :many
+-- Pages of a website in (created_at, id) order, after the cursor when one is given.
+-- A NULL limit_count returns every remaining page, for streaming exports.
+SELECT * FROM crawled_page
+WHERE website_id = sqlc.arg(website_id)
+    AND (sqlc.arg(cursor_created_at)::TIMESTAMP WITH TIME ZONE IS NULL
+        OR (created_at, id) > (sqlc.arg(cursor_created_at)::TIMESTAMP WITH TIME ZONE, sqlc.arg(cursor_id)::UUID))
+ORDER BY created_at ASC, id ASC
+LIMIT sqlc.arg(limit_count);
+
 -- name: CountPagesByWebsite :one
 SELECT COUNT(*) FROM crawled_page
 WHERE website_id = sqlc.arg(website_id);
@@ -108,10 +128,117 @@ WHERE crawled_at < CURRENT_TIMESTAMP - INTERVAL '90 days'
     AND website_id = sqlc.arg(website_id);
 
 -- name: GetPageStats :one
+-- Folded counters in website_stats plus the deltas not yet folded into them
+WITH pending AS (
+    SELECT
+        COALESCE(SUM(total_pages), 0) AS total_pages,
+        COALESCE(SUM(duplicate_pages), 0) AS duplicate_pages,
+        COALESCE(SUM(duplicate_similarity_sum), 0) AS duplicate_similarity_sum,
+        COALESCE(SUM(scored_duplicate_pages), 0) AS scored_duplicate_pages
+    FROM website_stats_delta
+    WHERE website_id = sqlc.arg(website_id)
+),
+totals AS (
+    SELECT
+        COALESCE(ws.total_pages, 0) + p.total_pages AS total_pages,
+        COALESCE(ws.duplicate_pages, 0) + p.duplicate_pages AS duplicate_pages,
+        COALESCE(ws.duplicate_similarity_sum, 0) + p.duplicate_similarity_sum
+            AS duplicate_similarity_sum,
+        COALESCE(ws.scored_duplicate_pages, 0) + p.scored_duplicate_pages
+            AS scored_duplicate_pages
+    FROM pending p
+    LEFT JOIN website_stats ws ON ws.website_id = sqlc.arg(website_id)
+)
+SELECT
+    total_pages::BIGINT as total_pages,
+    (total_pages - duplicate_pages)::BIGINT as unique_pages,
+    duplicate_pages::BIGINT as duplicate_pages,
+    (duplicate_similarity_sum::FLOAT / NULLIF(scored_duplicate_pages, 0))::FLOAT
+        as avg_similarity_score
+FROM totals;
+
+-- name: BulkUpsertCrawledPages :many
+-- Insert or update a batch of pages in one statement (one row per array element)
+-- The caller must not pass the same url_hash twice: ON CONFLICT cannot update a row
+-- more than once per statement.
+INSERT INTO crawled_page (
+    website_id,
+    job_id,
+    url,
+    url_hash,
+    content_hash,
+    title,
+    extracted_content,
+    metadata,
+    gcs_html_path,
+    crawled_at
+)
 SELECT
-    COUNT(*) as total_pages,
-    COUNT(*) FILTER (WHERE is_duplicate = false) as unique_pages,
-    COUNT(*) FILTER (WHERE is_duplicate = true) as duplicate_pages,
-    AVG(similarity_score) FILTER (WHERE is_duplicate = true) as avg_similarity_score
+    sqlc.arg(website_id)::UUID,
+    sqlc.arg(job_id)::UUID,
+    page.url,
+    page.url_hash,
+    page.content_hash,
+    page.title,
+    page.extracted_content,
+    page.metadata::JSONB,
+    page.gcs_html_path,
+    sqlc.arg(crawled_at)::TIMESTAMPTZ
+FROM unnest(
+    sqlc.arg(urls)::VARCHAR[],
+    sqlc.arg(url_hashes)::VARCHAR[],
+    sqlc.arg(content_hashes)::VARCHAR[],
+    sqlc.arg(titles)::VARCHAR[],
+    sqlc.arg(extracted_contents)::TEXT[],
+    sqlc.arg(metadatas)::TEXT[],
+    sqlc.arg(gcs_html_paths)::VARCHAR[]
+) AS page(url, url_hash, content_hash, title, extracted_content, metadata, gcs_html_path)
+ON CONFLICT (website_id, url_hash)
+DO UPDATE SET
+    job_id = EXCLUDED.job_id,
+    content_hash = EXCLUDED.content_hash,
+    title = EXCLUDED.title,
+    extracted_content = EXCLUDED.extracted_content,
+    metadata = EXCLUDED.metadata,
+    gcs_html_path = EXCLUDED.gcs_html_path,
+    gcs_documents = EXCLUDED.gcs_documents,
+    crawled_at = EXCLUDED.crawled_at
+RETURNING id, url_hash;
+
+-- name: GetFirstPagesByContentHashes :many
+-- Batch version of GetPageByContentHash: earliest page for each of the given hashes
+SELECT DISTINCT ON (content_hash) id, content_hash
 FROM crawled_page
-WHERE website_id = sqlc.arg(website_id);
+WHERE content_hash = ANY(sqlc.arg(content_hashes)::VARCHAR[])
+ORDER BY content_hash, crawled_at ASC;
+
+-- name: BulkMarkPagesAsDuplicate :exec
+UPDATE crawled_page
+SET
+    is_duplicate = true,
+    duplicate_of = dup.duplicate_of,
+    similarity_score = dup.similarity_score
+FROM unnest(
+    sqlc.arg(page_ids)::UUID[],
+    sqlc.arg(duplicate_of_ids)::UUID[],
+    sqlc.arg(similarity_scores)::INTEGER[]
+) AS dup(id, duplicate_of, similarity_score)
+WHERE crawled_page.id = dup.id;
+
+-- name: ListPageIdsByContentHashes :many
+-- All pages with any of the given hashes, earliest first
+SELECT id, content_hash
+FROM crawled_page
+WHERE content_hash = ANY(sqlc.arg(content_hashes)::VARCHAR[])
+ORDER BY crawled_at ASC, id ASC;
+
+-- name: GetPageValidatorsByURLHashes :many
+-- Stored validators of previously crawled URLs, for conditional re-crawls
+SELECT
+    url_hash,
+    content_hash,
+    (metadata->>'etag')::VARCHAR AS etag,
+    (metadata->>'last_modified')::VARCHAR AS last_modified
+FROM crawled_page
+WHERE website_id = sqlc.arg(website_id)
+    AND url_hash = ANY(sqlc.arg(url_hashes)::VARCHAR[]);
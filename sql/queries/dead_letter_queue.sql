@@ -38,9 +38,21 @@ WHERE ($1::error_category_enum IS NULL OR error_category = $1)
   AND ($3::boolean IS NULL OR
        ($3 = true AND resolved_at IS NULL) OR
        ($3 = false AND resolved_at IS NOT NULL))
-ORDER BY added_to_dlq_at DESC
+ORDER BY added_to_dlq_at DESC, id DESC
 LIMIT $4 OFFSET $5;
 
+-- name: ListDLQEntriesAfterCursor :many
+-- Keyset page of ListDLQEntries: entries older than the (added_to_dlq_at, id) of the previous page
+SELECT * FROM dead_letter_queue
+WHERE ($1::error_category_enum IS NULL OR error_category = $1)
+  AND ($2::uuid IS NULL OR website_id = $2)
+  AND ($3::boolean IS NULL OR
+       ($3 = true AND resolved_at IS NULL) OR
+       ($3 = false AND resolved_at IS NOT NULL))
+  AND (added_to_dlq_at, id) < ($4::TIMESTAMP WITH TIME ZONE, $5::BIGINT)
+ORDER BY added_to_dlq_at DESC, id DESC
+LIMIT $6;
+
 -- name: CountDLQEntries :one
 -- Count DLQ entries with filtering
 SELECT COUNT(*) FROM dead_letter_queue
@@ -75,23 +75,29 @@ WHERE dg.id = $1;
 -- name: ListAllDuplicateGroups :many
 -- List all duplicate groups with pagination
 SELECT * FROM duplicate_group
-ORDER BY created_at DESC
+ORDER BY created_at DESC, id DESC
 LIMIT $1 OFFSET $2;
 
+-- name: ListDuplicateGroupsAfterCursor :many
+-- Keyset page of ListAllDuplicateGroups: groups older than the (created_at, id) of the previous page
+SELECT * FROM duplicate_group
+WHERE (created_at, id) < (sqlc.arg(cursor_created_at)::TIMESTAMP WITH TIME ZONE, sqlc.arg(cursor_id)::UUID)
+ORDER BY created_at DESC, id DESC
+LIMIT sqlc.arg(limit_count);
+
 -- name: GetDuplicateGroupStats :one
--- Get statistics for a duplicate group
+-- Get statistics for a duplicate group from the trigger-maintained duplicate_group_stats
 SELECT
     dg.id,
     dg.canonical_page_id,
     dg.group_size,
-    COUNT(dr.id) as relationship_count,
-    AVG(dr.similarity_score) as avg_similarity,
-    MIN(dr.detected_at) as first_detected,
-    MAX(dr.detected_at) as last_detected
+    COALESCE(dgs.relationship_count, 0)::BIGINT as relationship_count,
+    (dgs.similarity_sum::FLOAT / NULLIF(dgs.scored_relationship_count, 0))::FLOAT as avg_similarity,
+    dgs.first_detected_at as first_detected,
+    dgs.last_detected_at as last_detected
 FROM duplicate_group dg
-LEFT JOIN duplicate_relationship dr ON dr.group_id = dg.id
-WHERE dg.id = $1
-GROUP BY dg.id, dg.canonical_page_id, dg.group_size;
+LEFT JOIN duplicate_group_stats dgs ON dgs.group_id = dg.id
+WHERE dg.id = $1;
 
 -- name: RemoveDuplicateRelationship :exec
 -- Remove a duplicate relationship (will trigger group_size update)
@@ -137,3 +143,97 @@ FROM crawled_page cp
 JOIN duplicate_group dg ON dg.canonical_page_id = cp.id
 JOIN duplicate_relationship dr ON dr.group_id = dg.id
 WHERE dr.duplicate_page_id = $1;
+
+-- name: DeleteDetectedDuplicateRelationships :exec
+-- Remove relationships found by hash or fingerprint detection, keeping manual and URL matches
+DELETE FROM duplicate_relationship
+WHERE detection_method IN ('exact_hash', 'fuzzy_match');
+
+-- name: DeleteEmptyDuplicateGroups :exec
+-- Remove groups left without any relationship
+DELETE FROM duplicate_group dg
+WHERE NOT EXISTS (
+    SELECT 1 FROM duplicate_relationship dr
+    WHERE dr.group_id = dg.id
+);
+
+-- name: BulkGetOrCreateDuplicateGroups :many
+-- Get the group of each canonical page, creating groups for pages without one
+WITH canonical AS (
+    SELECT DISTINCT unnest(sqlc.arg(canonical_page_ids)::UUID[]) AS page_id
+),
+existing AS (
+    SELECT DISTINCT ON (dg.canonical_page_id) dg.id, dg.canonical_page_id
+    FROM duplicate_group dg
+    JOIN canonical c ON c.page_id = dg.canonical_page_id
+    ORDER BY dg.canonical_page_id, dg.created_at ASC
+),
+inserted AS (
+    INSERT INTO duplicate_group (canonical_page_id)
+    SELECT c.page_id
+    FROM canonical c
+    WHERE NOT EXISTS (
+        SELECT 1 FROM existing e
+        WHERE e.canonical_page_id = c.page_id
+    )
+    RETURNING id, canonical_page_id
+)
+SELECT id, canonical_page_id FROM existing
+UNION ALL
+SELECT id, canonical_page_id FROM inserted;
+
+-- name: BulkAddDuplicateRelationships :exec
+-- Batch version of AddDuplicateRelationship; pages already in a group are skipped
+INSERT INTO duplicate_relationship (
+    group_id,
+    duplicate_page_id,
+    detection_method,
+    similarity_score,
+    confidence_threshold,
+    detected_by
+)
+SELECT
+    rel.group_id,
+    rel.duplicate_page_id,
+    rel.detection_method,
+    rel.similarity_score,
+    rel.confidence_threshold,
+    sqlc.arg(detected_by)
+FROM unnest(
+    sqlc.arg(group_ids)::UUID[],
+    sqlc.arg(duplicate_page_ids)::UUID[],
+    sqlc.arg(detection_methods)::VARCHAR[],
+    sqlc.arg(similarity_scores)::INTEGER[],
+    sqlc.arg(confidence_thresholds)::INTEGER[]
+) AS rel(group_id, duplicate_page_id, detection_method, similarity_score, confidence_threshold)
+WHERE NOT EXISTS (
+    SELECT 1 FROM duplicate_relationship dr
+    WHERE dr.duplicate_page_id = rel.duplicate_page_id
+);
+
+-- name: RebuildDuplicateGroupStats :exec
+-- Recompute duplicate_group_stats from duplicate_relationship (backfill or repair)
+INSERT INTO duplicate_group_stats (
+    group_id,
+    relationship_count,
+    similarity_sum,
+    scored_relationship_count,
+    first_detected_at,
+    last_detected_at
+)
+SELECT
+    dg.id,
+    COUNT(dr.id),
+    COALESCE(SUM(dr.similarity_score), 0),
+    COUNT(dr.similarity_score),
+    MIN(dr.detected_at),
+    MAX(dr.detected_at)
+FROM duplicate_group dg
+LEFT JOIN duplicate_relationship dr ON dr.group_id = dg.id
+GROUP BY dg.id
+ON CONFLICT (group_id) DO UPDATE SET
+    relationship_count = EXCLUDED.relationship_count,
+    similarity_sum = EXCLUDED.similarity_sum,
+    scored_relationship_count = EXCLUDED.scored_relationship_count,
+    first_detected_at = EXCLUDED.first_detected_at,
+    last_detected_at = EXCLUDED.last_detected_at;
@@ -0,0 +1,63 @@
+-- Job Checkpoint Queries
+-- Durable progress of a job's workflow, so a retried job resumes where the failed
+-- attempt stopped. Checkpoints are written outside the job's transaction.
+
+-- name: UpsertJobStepCheckpoint :exec
+-- Record the output of a completed step
+INSERT INTO job_step_checkpoint (job_id, step_name, config_hash, result)
+VALUES (
+    sqlc.arg(job_id),
+    sqlc.arg(step_name),
+    sqlc.arg(config_hash),
+    sqlc.arg(result)::JSONB
+)
+ON CONFLICT (job_id, step_name)
+DO UPDATE SET
+    config_hash = EXCLUDED.config_hash,
+    result = EXCLUDED.result,
+    created_at = CURRENT_TIMESTAMP;
+
+-- name: ListJobStepCheckpoints :many
+SELECT * FROM job_step_checkpoint
+WHERE job_id = sqlc.arg(job_id)
+ORDER BY created_at ASC;
+
+-- name: BulkUpsertJobPageCheckpoints :exec
+-- Record a batch of scraped pages of one step (one row per array element)
+-- The caller must not pass the same url_hash twice: ON CONFLICT cannot update a row
+-- more than once per statement.
+INSERT INTO job_page_checkpoint (job_id, step_name, url_hash, config_hash, url, page)
+SELECT
+    sqlc.arg(job_id)::UUID,
+    sqlc.arg(step_name)::VARCHAR,
+    checkpoint.url_hash,
+    sqlc.arg(config_hash)::VARCHAR,
+    checkpoint.url,
+    checkpoint.page::JSONB
+FROM unnest(
+    sqlc.arg(url_hashes)::VARCHAR[],
+    sqlc.arg(urls)::TEXT[],
+    sqlc.arg(pages)::TEXT[]
+) AS checkpoint(url_hash, url, page)
+ON CONFLICT (job_id, step_name, url_hash)
+DO UPDATE SET
+    config_hash = EXCLUDED.config_hash,
+    url = EXCLUDED.url,
+    page = EXCLUDED.page,
+    created_at = CURRENT_TIMESTAMP;
+
+-- name: StreamJobPageCheckpoints :many
+-- Pages a step scraped with the given configuration, read through a server-side cursor
+SELECT url, page FROM job_page_checkpoint
+WHERE job_id = sqlc.arg(job_id)
+    AND step_name = sqlc.arg(step_name)
+    AND config_hash = sqlc.arg(config_hash);
+
+-- name: DeleteJobCheckpoints :exec
+-- Drop all progress of a job once it has finished for good
+WITH deleted_pages AS (
+    DELETE FROM job_page_checkpoint
+    WHERE job_id = sqlc.arg(job_id)
+)
+DELETE FROM job_step_checkpoint
+WHERE job_id = sqlc.arg(job_id);
@@ -69,42 +69,49 @@ WHERE id = sqlc.arg(id)
 RETURNING *;
 
 -- name: GetWebsiteStatistics :one
-WITH job_stats AS (
+-- Folded counters in website_stats plus the deltas not yet folded into them.
+-- last_crawl_at is read from crawl_job (partial index), since a rolled-up MAX
+-- would go stale when the latest completed job is deleted or changes status.
+WITH pending AS (
     SELECT
-        website_id,
-        COUNT(*) AS total_jobs,
-        COUNT(*) FILTER (WHERE status = 'completed') AS completed_jobs,
-        COUNT(*) FILTER (WHERE status = 'failed') AS failed_jobs,
-        COUNT(*) FILTER (WHERE status = 'cancelled') AS cancelled_jobs,
-        MAX(completed_at) FILTER (WHERE status = 'completed') AS last_crawl_at
-    FROM crawl_job
+        COALESCE(SUM(total_jobs), 0) AS total_jobs,
+        COALESCE(SUM(completed_jobs), 0) AS completed_jobs,
+        COALESCE(SUM(failed_jobs), 0) AS failed_jobs,
+        COALESCE(SUM(cancelled_jobs), 0) AS cancelled_jobs,
+        COALESCE(SUM(total_pages), 0) AS total_pages
+    FROM website_stats_delta
     WHERE website_id = sqlc.arg(website_id)
-    GROUP BY website_id
 ),
-page_stats AS (
+totals AS (
     SELECT
-        cj.website_id,
-        COUNT(cp.id) AS total_pages_crawled
-    FROM crawl_job cj
-    JOIN crawled_page cp ON cp.job_id = cj.id
-    WHERE cj.website_id = sqlc.arg(website_id)
-    GROUP BY cj.website_id
+        COALESCE(ws.total_jobs, 0) + p.total_jobs AS total_jobs,
+        COALESCE(ws.completed_jobs, 0) + p.completed_jobs AS completed_jobs,
+        COALESCE(ws.failed_jobs, 0) + p.failed_jobs AS failed_jobs,
+        COALESCE(ws.cancelled_jobs, 0) + p.cancelled_jobs AS cancelled_jobs,
+        COALESCE(ws.total_pages, 0) + p.total_pages AS total_pages,
+        (
+            SELECT MAX(cj.completed_at)
+            FROM crawl_job cj
+            WHERE cj.website_id = w.id
+              AND cj.status = 'completed'
+        ) AS last_crawl_at
+    FROM website w
+    LEFT JOIN website_stats ws ON ws.website_id = w.id
+    CROSS JOIN pending p
+    WHERE w.id = sqlc.arg(website_id)
 )
 SELECT
-    COALESCE(js.total_jobs, 0)::INTEGER AS total_jobs,
-    COALESCE(js.completed_jobs, 0)::INTEGER AS completed_jobs,
-    COALESCE(js.failed_jobs, 0)::INTEGER AS failed_jobs,
-    COALESCE(js.cancelled_jobs, 0)::INTEGER AS cancelled_jobs,
+    total_jobs::INTEGER AS total_jobs,
+    completed_jobs::INTEGER AS completed_jobs,
+    failed_jobs::INTEGER AS failed_jobs,
+    cancelled_jobs::INTEGER AS cancelled_jobs,
     CASE
-        WHEN COALESCE(js.total_jobs, 0) = 0 THEN 0.0
-        ELSE (COALESCE(js.completed_jobs, 0)::FLOAT / js.total_jobs::FLOAT * 100.0)
+        WHEN total_jobs = 0 THEN 0.0
+        ELSE (completed_jobs::FLOAT / total_jobs::FLOAT * 100.0)
     END AS success_rate,
-    COALESCE(ps.total_pages_crawled, 0)::INTEGER AS total_pages_crawled,
-    js.last_crawl_at
-FROM website w
-LEFT JOIN job_stats js ON w.id = js.website_id
-LEFT JOIN page_stats ps ON w.id = ps.website_id
-WHERE w.id = sqlc.arg(website_id);
+    total_pages::INTEGER AS total_pages_crawled,
+    last_crawl_at
+FROM totals;
 
 -- name: DeleteCrawledPagesByWebsite :exec
 DELETE FROM crawled_page WHERE website_id = sqlc.arg(website_id);
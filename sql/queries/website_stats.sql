@@ -0,0 +1,141 @@
+-- Website Statistics Rollup Queries
+-- Triggers on crawl_job and crawled_page append signed changes to website_stats_delta.
+-- These queries fold the changes into website_stats and rebuild both tables.
+
+-- name: FoldWebsiteStatsDeltas :one
+-- Move up to batch_size of the oldest deltas into website_stats in one statement.
+-- Rows locked by a concurrent fold are skipped. Deltas of deleted websites are dropped.
+WITH folded AS (
+    DELETE FROM website_stats_delta
+    WHERE id IN (
+        SELECT id FROM website_stats_delta
+        ORDER BY id
+        LIMIT sqlc.arg(batch_size)
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING *
+),
+totals AS (
+    SELECT
+        website_id,
+        SUM(total_jobs) AS total_jobs,
+        SUM(completed_jobs) AS completed_jobs,
+        SUM(failed_jobs) AS failed_jobs,
+        SUM(cancelled_jobs) AS cancelled_jobs,
+        SUM(total_pages) AS total_pages,
+        SUM(duplicate_pages) AS duplicate_pages,
+        SUM(duplicate_similarity_sum) AS duplicate_similarity_sum,
+        SUM(scored_duplicate_pages) AS scored_duplicate_pages
+    FROM folded
+    GROUP BY website_id
+),
+upserted AS (
+    INSERT INTO website_stats (
+        website_id,
+        total_jobs,
+        completed_jobs,
+        failed_jobs,
+        cancelled_jobs,
+        total_pages,
+        duplicate_pages,
+        duplicate_similarity_sum,
+        scored_duplicate_pages
+    )
+    SELECT
+        t.website_id,
+        t.total_jobs,
+        t.completed_jobs,
+        t.failed_jobs,
+        t.cancelled_jobs,
+        t.total_pages,
+        t.duplicate_pages,
+        t.duplicate_similarity_sum,
+        t.scored_duplicate_pages
+    FROM totals t
+    JOIN website w ON w.id = t.website_id
+    ON CONFLICT (website_id) DO UPDATE SET
+        total_jobs = website_stats.total_jobs + EXCLUDED.total_jobs,
+        completed_jobs = website_stats.completed_jobs + EXCLUDED.completed_jobs,
+        failed_jobs = website_stats.failed_jobs + EXCLUDED.failed_jobs,
+        cancelled_jobs = website_stats.cancelled_jobs + EXCLUDED.cancelled_jobs,
+        total_pages = website_stats.total_pages + EXCLUDED.total_pages,
+        duplicate_pages = website_stats.duplicate_pages + EXCLUDED.duplicate_pages,
+        duplicate_similarity_sum = website_stats.duplicate_similarity_sum
+            + EXCLUDED.duplicate_similarity_sum,
+        scored_duplicate_pages = website_stats.scored_duplicate_pages
+            + EXCLUDED.scored_duplicate_pages,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING website_id
+)
+SELECT
+    (SELECT COUNT(*) FROM folded)::INTEGER AS deltas_folded,
+    (SELECT COUNT(*) FROM upserted)::INTEGER AS websites_updated;
+
+-- name: CountWebsiteStatsDeltas :one
+-- Number of deltas waiting to be folded
+SELECT COUNT(*) FROM website_stats_delta;
+
+-- name: RebuildWebsiteStats :exec
+-- Recompute website_stats from crawl_job and crawled_page (backfill or repair).
+-- Deltas visible to this statement are already reflected in the counts it reads,
+-- so they are deleted in the same statement; later deltas are folded as usual.
+WITH cleared AS (
+    DELETE FROM website_stats_delta
+    RETURNING id
+),
+job_totals AS (
+    SELECT
+        website_id,
+        COUNT(*) AS total_jobs,
+        COUNT(*) FILTER (WHERE status = 'completed') AS completed_jobs,
+        COUNT(*) FILTER (WHERE status = 'failed') AS failed_jobs,
+        COUNT(*) FILTER (WHERE status = 'cancelled') AS cancelled_jobs
+    FROM crawl_job
+    WHERE website_id IS NOT NULL
+    GROUP BY website_id
+),
+page_totals AS (
+    SELECT
+        website_id,
+        COUNT(*) AS total_pages,
+        COUNT(*) FILTER (WHERE is_duplicate) AS duplicate_pages,
+        COALESCE(SUM(similarity_score) FILTER (WHERE is_duplicate), 0)
+            AS duplicate_similarity_sum,
+        COUNT(similarity_score) FILTER (WHERE is_duplicate) AS scored_duplicate_pages
+    FROM crawled_page
+    GROUP BY website_id
+)
+INSERT INTO website_stats (
+    website_id,
+    total_jobs,
+    completed_jobs,
+    failed_jobs,
+    cancelled_jobs,
+    total_pages,
+    duplicate_pages,
+    duplicate_similarity_sum,
+    scored_duplicate_pages
+)
+SELECT
+    w.id,
+    COALESCE(jt.total_jobs, 0),
+    COALESCE(jt.completed_jobs, 0),
+    COALESCE(jt.failed_jobs, 0),
+    COALESCE(jt.cancelled_jobs, 0),
+    COALESCE(pt.total_pages, 0),
+    COALESCE(pt.duplicate_pages, 0),
+    COALESCE(pt.duplicate_similarity_sum, 0),
+    COALESCE(pt.scored_duplicate_pages, 0)
+FROM website w
+LEFT JOIN job_totals jt ON jt.website_id = w.id
+LEFT JOIN page_totals pt ON pt.website_id = w.id
+ON CONFLICT (website_id) DO UPDATE SET
+    total_jobs = EXCLUDED.total_jobs,
+    completed_jobs = EXCLUDED.completed_jobs,
+    failed_jobs = EXCLUDED.failed_jobs,
+    cancelled_jobs = EXCLUDED.cancelled_jobs,
+    total_pages = EXCLUDED.total_pages,
+    duplicate_pages = EXCLUDED.duplicate_pages,
+    duplicate_similarity_sum = EXCLUDED.duplicate_similarity_sum,
+    scored_duplicate_pages = EXCLUDED.scored_duplicate_pages,
+    updated_at = CURRENT_TIMESTAMP;
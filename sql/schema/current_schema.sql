@@ -96,6 +96,128 @@ CREATE TYPE status_enum AS ENUM (
 );
 
 
+--
+-- Name: record_crawl_job_stats_delta(); Type: FUNCTION; Schema: public; Owner: -
+--
+
+CREATE FUNCTION record_crawl_job_stats_delta() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND OLD.website_id IS NOT DISTINCT FROM NEW.website_id THEN
+            IF NEW.website_id IS NOT NULL AND OLD.status IS DISTINCT FROM NEW.status THEN
+                INSERT INTO website_stats_delta (
+                    website_id, completed_jobs, failed_jobs, cancelled_jobs
+                ) VALUES (
+                    NEW.website_id,
+                    (NEW.status = 'completed')::INT - (OLD.status = 'completed')::INT,
+                    (NEW.status = 'failed')::INT - (OLD.status = 'failed')::INT,
+                    (NEW.status = 'cancelled')::INT - (OLD.status = 'cancelled')::INT
+                );
+            END IF;
+            RETURN NULL;
+        END IF;
+
+        IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.website_id IS NOT NULL THEN
+            INSERT INTO website_stats_delta (
+                website_id, total_jobs, completed_jobs, failed_jobs, cancelled_jobs
+            ) VALUES (
+                OLD.website_id,
+                -1,
+                -(OLD.status = 'completed')::INT,
+                -(OLD.status = 'failed')::INT,
+                -(OLD.status = 'cancelled')::INT
+            );
+        END IF;
+
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.website_id IS NOT NULL THEN
+            INSERT INTO website_stats_delta (
+                website_id, total_jobs, completed_jobs, failed_jobs, cancelled_jobs
+            ) VALUES (
+                NEW.website_id,
+                1,
+                (NEW.status = 'completed')::INT,
+                (NEW.status = 'failed')::INT,
+                (NEW.status = 'cancelled')::INT
+            );
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+
+
+--
+-- Name: record_crawled_page_stats_delta(); Type: FUNCTION; Schema: public; Owner: -
+--
+
+CREATE FUNCTION record_crawled_page_stats_delta() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO website_stats_delta (
+                website_id, total_pages, duplicate_pages, duplicate_similarity_sum,
+                scored_duplicate_pages
+            )
+            SELECT
+                website_id,
+                COUNT(*),
+                COUNT(*) FILTER (WHERE is_duplicate),
+                COALESCE(SUM(similarity_score) FILTER (WHERE is_duplicate), 0),
+                COUNT(similarity_score) FILTER (WHERE is_duplicate)
+            FROM new_pages
+            GROUP BY website_id;
+        ELSIF TG_OP = 'DELETE' THEN
+            INSERT INTO website_stats_delta (
+                website_id, total_pages, duplicate_pages, duplicate_similarity_sum,
+                scored_duplicate_pages
+            )
+            SELECT
+                website_id,
+                -COUNT(*),
+                -COUNT(*) FILTER (WHERE is_duplicate),
+                -COALESCE(SUM(similarity_score) FILTER (WHERE is_duplicate), 0),
+                -COUNT(similarity_score) FILTER (WHERE is_duplicate)
+            FROM old_pages
+            GROUP BY website_id;
+        ELSE
+            INSERT INTO website_stats_delta (
+                website_id, total_pages, duplicate_pages, duplicate_similarity_sum,
+                scored_duplicate_pages
+            )
+            SELECT
+                website_id,
+                SUM(pages),
+                SUM(duplicates),
+                SUM(similarity),
+                SUM(scored)
+            FROM (
+                SELECT
+                    website_id,
+                    1 AS pages,
+                    is_duplicate::INT AS duplicates,
+                    CASE WHEN is_duplicate THEN COALESCE(similarity_score, 0) ELSE 0 END
+                        AS similarity,
+                    (is_duplicate AND similarity_score IS NOT NULL)::INT AS scored
+                FROM new_pages
+                UNION ALL
+                SELECT
+                    website_id,
+                    -1,
+                    -is_duplicate::INT,
+                    CASE WHEN is_duplicate THEN -COALESCE(similarity_score, 0) ELSE 0 END,
+                    -(is_duplicate AND similarity_score IS NOT NULL)::INT
+                FROM old_pages
+            ) changes
+            GROUP BY website_id
+            HAVING SUM(pages) <> 0 OR SUM(duplicates) <> 0
+                OR SUM(similarity) <> 0 OR SUM(scored) <> 0;
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+
+
 --
 -- Name: update_duplicate_group_size(); Type: FUNCTION; Schema: public; Owner: -
 --
@@ -120,6 +242,71 @@ CREATE FUNCTION update_duplicate_group_size() RETURNS trigger
     $$;
 
 
+--
+-- Name: update_duplicate_group_stats(); Type: FUNCTION; Schema: public; Owner: -
+--
+
+CREATE FUNCTION update_duplicate_group_stats() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO duplicate_group_stats (
+                group_id, relationship_count, similarity_sum, scored_relationship_count,
+                first_detected_at, last_detected_at
+            ) VALUES (
+                NEW.group_id,
+                1,
+                COALESCE(NEW.similarity_score, 0),
+                (NEW.similarity_score IS NOT NULL)::INT,
+                NEW.detected_at,
+                NEW.detected_at
+            )
+            ON CONFLICT (group_id) DO UPDATE SET
+                relationship_count = duplicate_group_stats.relationship_count + 1,
+                similarity_sum = duplicate_group_stats.similarity_sum
+                    + EXCLUDED.similarity_sum,
+                scored_relationship_count = duplicate_group_stats.scored_relationship_count
+                    + EXCLUDED.scored_relationship_count,
+                first_detected_at = LEAST(
+                    duplicate_group_stats.first_detected_at, EXCLUDED.first_detected_at
+                ),
+                last_detected_at = GREATEST(
+                    duplicate_group_stats.last_detected_at, EXCLUDED.last_detected_at
+                );
+        ELSIF TG_OP = 'UPDATE' THEN
+            UPDATE duplicate_group_stats
+            SET similarity_sum = similarity_sum
+                    - COALESCE(OLD.similarity_score, 0) + COALESCE(NEW.similarity_score, 0),
+                scored_relationship_count = scored_relationship_count
+                    - (OLD.similarity_score IS NOT NULL)::INT
+                    + (NEW.similarity_score IS NOT NULL)::INT
+            WHERE group_id = NEW.group_id;
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE duplicate_group_stats
+            SET relationship_count = relationship_count - 1,
+                similarity_sum = similarity_sum - COALESCE(OLD.similarity_score, 0),
+                scored_relationship_count = scored_relationship_count
+                    - (OLD.similarity_score IS NOT NULL)::INT
+            WHERE group_id = OLD.group_id;
+
+            -- Only re-read the group when the removed relationship bounded its range
+            UPDATE duplicate_group_stats s
+            SET first_detected_at = r.first_detected,
+                last_detected_at = r.last_detected
+            FROM (
+                SELECT MIN(detected_at) AS first_detected, MAX(detected_at) AS last_detected
+                FROM duplicate_relationship
+                WHERE group_id = OLD.group_id
+            ) r
+            WHERE s.group_id = OLD.group_id
+              AND OLD.detected_at IN (s.first_detected_at, s.last_detected_at);
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+
+
 SET default_table_access_method = heap;
 
 --
@@ -478,6 +665,20 @@ CREATE TABLE duplicate_group (
 );
 
 
+--
+-- Name: duplicate_group_stats; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE duplicate_group_stats (
+    group_id uuid NOT NULL,
+    relationship_count integer DEFAULT 0 NOT NULL,
+    similarity_sum bigint DEFAULT 0 NOT NULL,
+    scored_relationship_count integer DEFAULT 0 NOT NULL,
+    first_detected_at timestamp with time zone,
+    last_detected_at timestamp with time zone
+);
+
+
 --
 -- Name: duplicate_relationship; Type: TABLE; Schema: public; Owner: -
 --
@@ -516,6 +717,34 @@ CREATE SEQUENCE duplicate_relationship_id_seq
 ALTER SEQUENCE duplicate_relationship_id_seq OWNED BY duplicate_relationship.id;
 
 
+--
+-- Name: job_page_checkpoint; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE job_page_checkpoint (
+    job_id uuid NOT NULL,
+    step_name character varying(255) NOT NULL,
+    url_hash character varying(64) NOT NULL,
+    config_hash character varying(64) NOT NULL,
+    url text NOT NULL,
+    page jsonb NOT NULL,
+    created_at timestamp with time zone DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+
+--
+-- Name: job_step_checkpoint; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE job_step_checkpoint (
+    job_id uuid NOT NULL,
+    step_name character varying(255) NOT NULL,
+    config_hash character varying(64) NOT NULL,
+    result jsonb NOT NULL,
+    created_at timestamp with time zone DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+
 --
 -- Name: retry_history; Type: TABLE; Schema: public; Owner: -
 --
@@ -735,6 +964,62 @@ COMMENT ON COLUMN website_config_history.changed_by IS 'User or system that made
 COMMENT ON COLUMN website_config_history.change_reason IS 'Optional description of why the change was made';
 
 
+--
+-- Name: website_stats; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE website_stats (
+    website_id uuid NOT NULL,
+    total_jobs integer DEFAULT 0 NOT NULL,
+    completed_jobs integer DEFAULT 0 NOT NULL,
+    failed_jobs integer DEFAULT 0 NOT NULL,
+    cancelled_jobs integer DEFAULT 0 NOT NULL,
+    total_pages bigint DEFAULT 0 NOT NULL,
+    duplicate_pages bigint DEFAULT 0 NOT NULL,
+    duplicate_similarity_sum bigint DEFAULT 0 NOT NULL,
+    scored_duplicate_pages bigint DEFAULT 0 NOT NULL,
+    updated_at timestamp with time zone DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+
+--
+-- Name: website_stats_delta; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE website_stats_delta (
+    id bigint NOT NULL,
+    website_id uuid NOT NULL,
+    total_jobs integer DEFAULT 0 NOT NULL,
+    completed_jobs integer DEFAULT 0 NOT NULL,
+    failed_jobs integer DEFAULT 0 NOT NULL,
+    cancelled_jobs integer DEFAULT 0 NOT NULL,
+    total_pages bigint DEFAULT 0 NOT NULL,
+    duplicate_pages bigint DEFAULT 0 NOT NULL,
+    duplicate_similarity_sum bigint DEFAULT 0 NOT NULL,
+    scored_duplicate_pages bigint DEFAULT 0 NOT NULL,
+    created_at timestamp with time zone DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+
+--
+-- Name: website_stats_delta_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+CREATE SEQUENCE website_stats_delta_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+--
+-- Name: website_stats_delta_id_seq; Type: SEQUENCE OWNED BY; Schema: public; Owner: -
+--
+
+ALTER SEQUENCE website_stats_delta_id_seq OWNED BY website_stats_delta.id;
+
+
 --
 -- Name: crawl_log_2025_08; Type: TABLE ATTACH; Schema: public; Owner: -
 --
@@ -812,6 +1097,13 @@ ALTER TABLE ONLY duplicate_relationship ALTER COLUMN id SET DEFAULT nextval('dup
 ALTER TABLE ONLY retry_history ALTER COLUMN id SET DEFAULT nextval('retry_history_id_seq'::regclass);
 
 
+--
+-- Name: website_stats_delta id; Type: DEFAULT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY website_stats_delta ALTER COLUMN id SET DEFAULT nextval('website_stats_delta_id_seq'::regclass);
+
+
 --
 -- Name: alembic_version alembic_version_pkc; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -924,6 +1216,14 @@ ALTER TABLE ONLY duplicate_group
     ADD CONSTRAINT duplicate_group_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: duplicate_group_stats duplicate_group_stats_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY duplicate_group_stats
+    ADD CONSTRAINT duplicate_group_stats_pkey PRIMARY KEY (group_id);
+
+
 --
 -- Name: duplicate_relationship duplicate_relationship_pkey; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -932,6 +1232,22 @@ ALTER TABLE ONLY duplicate_relationship
     ADD CONSTRAINT duplicate_relationship_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: job_page_checkpoint job_page_checkpoint_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY job_page_checkpoint
+    ADD CONSTRAINT job_page_checkpoint_pkey PRIMARY KEY (job_id, step_name, url_hash);
+
+
+--
+-- Name: job_step_checkpoint job_step_checkpoint_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY job_step_checkpoint
+    ADD CONSTRAINT job_step_checkpoint_pkey PRIMARY KEY (job_id, step_name);
+
+
 --
 -- Name: retry_history retry_history_pkey; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -996,6 +1312,22 @@ ALTER TABLE ONLY website
     ADD CONSTRAINT website_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: website_stats_delta website_stats_delta_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY website_stats_delta
+    ADD CONSTRAINT website_stats_delta_pkey PRIMARY KEY (id);
+
+
+--
+-- Name: website_stats website_stats_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY website_stats
+    ADD CONSTRAINT website_stats_pkey PRIMARY KEY (website_id);
+
+
 --
 -- Name: crawl_log_2025_08_job_created_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -1017,6 +1349,13 @@ CREATE INDEX crawl_log_2025_08_job_id_idx ON crawl_log_2025_08 USING btree (job_
 CREATE INDEX crawl_log_2025_08_log_level_idx ON crawl_log_2025_08 USING btree (log_level);
 
 
+--
+-- Name: crawl_log_2025_08_message_trgm_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX crawl_log_2025_08_message_trgm_idx ON crawl_log_2025_08 USING gin (job_id, message gin_trgm_ops);
+
+
 --
 -- Name: crawl_log_2025_08_trace_id_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -1052,6 +1391,13 @@ CREATE INDEX crawl_log_2025_09_job_id_idx ON crawl_log_2025_09 USING btree (job_
 CREATE INDEX crawl_log_2025_09_log_level_idx ON crawl_log_2025_09 USING btree (log_level);
 
 
+--
+-- Name: crawl_log_2025_09_message_trgm_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX crawl_log_2025_09_message_trgm_idx ON crawl_log_2025_09 USING gin (job_id, message gin_trgm_ops);
+
+
 --
 -- Name: crawl_log_2025_09_trace_id_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -1087,6 +1433,13 @@ CREATE INDEX crawl_log_2025_10_job_id_idx ON crawl_log_2025_10 USING btree (job_
 CREATE INDEX crawl_log_2025_10_log_level_idx ON crawl_log_2025_10 USING btree (log_level);
 
 
+--
+-- Name: crawl_log_2025_10_message_trgm_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX crawl_log_2025_10_message_trgm_idx ON crawl_log_2025_10 USING gin (job_id, message gin_trgm_ops);
+
+
 --
 -- Name: crawl_log_2025_10_trace_id_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -1122,6 +1475,13 @@ CREATE INDEX crawl_log_2025_11_job_id_idx ON crawl_log_2025_11 USING btree (job_
 CREATE INDEX crawl_log_2025_11_log_level_idx ON crawl_log_2025_11 USING btree (log_level);
 
 
+--
+-- Name: crawl_log_2025_11_message_trgm_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX crawl_log_2025_11_message_trgm_idx ON crawl_log_2025_11 USING gin (job_id, message gin_trgm_ops);
+
+
 --
 -- Name: crawl_log_2025_11_trace_id_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -1157,6 +1517,13 @@ CREATE INDEX crawl_log_2025_12_job_id_idx ON crawl_log_2025_12 USING btree (job_
 CREATE INDEX crawl_log_2025_12_log_level_idx ON crawl_log_2025_12 USING btree (log_level);
 
 
+--
+-- Name: crawl_log_2025_12_message_trgm_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX crawl_log_2025_12_message_trgm_idx ON crawl_log_2025_12 USING gin (job_id, message gin_trgm_ops);
+
+
 --
 -- Name: crawl_log_2025_12_trace_id_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -1192,6 +1559,13 @@ CREATE INDEX crawl_log_2026_01_job_id_idx ON crawl_log_2026_01 USING btree (job_
 CREATE INDEX crawl_log_2026_01_log_level_idx ON crawl_log_2026_01 USING btree (log_level);
 
 
+--
+-- Name: crawl_log_2026_01_message_trgm_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX crawl_log_2026_01_message_trgm_idx ON crawl_log_2026_01 USING gin (job_id, message gin_trgm_ops);
+
+
 --
 -- Name: crawl_log_2026_01_trace_id_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -1227,6 +1601,13 @@ CREATE INDEX crawl_log_2026_02_job_id_idx ON crawl_log_2026_02 USING btree (job_
 CREATE INDEX crawl_log_2026_02_log_level_idx ON crawl_log_2026_02 USING btree (log_level);
 
 
+--
+-- Name: crawl_log_2026_02_message_trgm_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX crawl_log_2026_02_message_trgm_idx ON crawl_log_2026_02 USING gin (job_id, message gin_trgm_ops);
+
+
 --
 -- Name: crawl_log_2026_02_trace_id_idx; Type: INDEX; Schema: public; Owner: -
 --
@@ -1249,10 +1630,38 @@ CREATE INDEX idx_content_hash_simhash ON content_hash USING btree (simhash_finge
 
 
 --
--- Name: idx_dlq_added_at; Type: INDEX; Schema: public; Owner: -
+-- Name: idx_content_hash_simhash_band_0; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_content_hash_simhash_band_0 ON content_hash USING btree (((simhash_fingerprint >> 0) & (65535)::bigint)) WHERE (simhash_fingerprint IS NOT NULL);
+
+
+--
+-- Name: idx_content_hash_simhash_band_1; Type: INDEX; Schema: public; Owner: -
 --
 
-CREATE INDEX idx_dlq_added_at ON dead_letter_queue USING btree (added_to_dlq_at DESC);
+CREATE INDEX idx_content_hash_simhash_band_1 ON content_hash USING btree (((simhash_fingerprint >> 16) & (65535)::bigint)) WHERE (simhash_fingerprint IS NOT NULL);
+
+
+--
+-- Name: idx_content_hash_simhash_band_2; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_content_hash_simhash_band_2 ON content_hash USING btree (((simhash_fingerprint >> 32) & (65535)::bigint)) WHERE (simhash_fingerprint IS NOT NULL);
+
+
+--
+-- Name: idx_content_hash_simhash_band_3; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_content_hash_simhash_band_3 ON content_hash USING btree (((simhash_fingerprint >> 48) & (65535)::bigint)) WHERE (simhash_fingerprint IS NOT NULL);
+
+
+--
+-- Name: idx_dlq_added_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_dlq_added_at_id ON dead_letter_queue USING btree (added_to_dlq_at, id);
 
 
 --
@@ -1395,6 +1804,13 @@ CREATE INDEX ix_crawl_job_seed_url ON crawl_job USING btree (seed_url);
 CREATE INDEX ix_crawl_job_status ON crawl_job USING btree (status);
 
 
+--
+-- Name: ix_crawl_job_website_completed_at; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_crawl_job_website_completed_at ON crawl_job USING btree (website_id, completed_at) WHERE (status = 'completed'::status_enum);
+
+
 --
 -- Name: ix_crawl_job_website_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -1437,6 +1853,13 @@ CREATE INDEX ix_crawled_page_is_duplicate ON crawled_page USING btree (is_duplic
 CREATE INDEX ix_crawled_page_job_id ON crawled_page USING btree (job_id);
 
 
+--
+-- Name: ix_crawled_page_job_id_created_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_crawled_page_job_id_created_at_id ON crawled_page USING btree (job_id, created_at, id);
+
+
 --
 -- Name: ix_crawled_page_url_hash; Type: INDEX; Schema: public; Owner: -
 --
@@ -1451,6 +1874,13 @@ CREATE INDEX ix_crawled_page_url_hash ON crawled_page USING btree (url_hash);
 CREATE INDEX ix_crawled_page_website_id ON crawled_page USING btree (website_id);
 
 
+--
+-- Name: ix_crawled_page_website_id_created_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_crawled_page_website_id_created_at_id ON crawled_page USING btree (website_id, created_at, id);
+
+
 --
 -- Name: ix_crawled_page_website_url_hash; Type: INDEX; Schema: public; Owner: -
 --
@@ -1465,6 +1895,13 @@ CREATE UNIQUE INDEX ix_crawled_page_website_url_hash ON crawled_page USING btree
 CREATE INDEX ix_duplicate_group_canonical_page_id ON duplicate_group USING btree (canonical_page_id);
 
 
+--
+-- Name: ix_duplicate_group_created_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_duplicate_group_created_at_id ON duplicate_group USING btree (created_at, id);
+
+
 --
 -- Name: ix_duplicate_relationship_detection_method; Type: INDEX; Schema: public; Owner: -
 --
@@ -1563,6 +2000,13 @@ CREATE INDEX ix_website_deleted_at ON website USING btree (deleted_at) WHERE (de
 CREATE INDEX ix_website_status ON website USING btree (status);
 
 
+--
+-- Name: ix_website_stats_delta_website_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_website_stats_delta_website_id ON website_stats_delta USING btree (website_id);
+
+
 --
 -- Name: uq_website_config_history_website_version; Type: INDEX; Schema: public; Owner: -
 --
@@ -1619,6 +2063,34 @@ ALTER INDEX crawl_log_pkey1 ATTACH PARTITION crawl_log_2026_01_pkey;
 ALTER INDEX crawl_log_pkey1 ATTACH PARTITION crawl_log_2026_02_pkey;
 
 
+--
+-- Name: crawl_job trigger_record_crawl_job_stats_delta; Type: TRIGGER; Schema: public; Owner: -
+--
+
+CREATE TRIGGER trigger_record_crawl_job_stats_delta AFTER INSERT OR DELETE OR UPDATE OF status, website_id ON crawl_job FOR EACH ROW EXECUTE FUNCTION record_crawl_job_stats_delta();
+
+
+--
+-- Name: crawled_page trigger_record_crawled_page_delete_stats_delta; Type: TRIGGER; Schema: public; Owner: -
+--
+
+CREATE TRIGGER trigger_record_crawled_page_delete_stats_delta AFTER DELETE ON crawled_page REFERENCING OLD TABLE AS old_pages FOR EACH STATEMENT EXECUTE FUNCTION record_crawled_page_stats_delta();
+
+
+--
+-- Name: crawled_page trigger_record_crawled_page_insert_stats_delta; Type: TRIGGER; Schema: public; Owner: -
+--
+
+CREATE TRIGGER trigger_record_crawled_page_insert_stats_delta AFTER INSERT ON crawled_page REFERENCING NEW TABLE AS new_pages FOR EACH STATEMENT EXECUTE FUNCTION record_crawled_page_stats_delta();
+
+
+--
+-- Name: crawled_page trigger_record_crawled_page_update_stats_delta; Type: TRIGGER; Schema: public; Owner: -
+--
+
+CREATE TRIGGER trigger_record_crawled_page_update_stats_delta AFTER UPDATE ON crawled_page REFERENCING OLD TABLE AS old_pages NEW TABLE AS new_pages FOR EACH STATEMENT EXECUTE FUNCTION record_crawled_page_stats_delta();
+
+
 --
 -- Name: duplicate_relationship trigger_update_duplicate_group_size; Type: TRIGGER; Schema: public; Owner: -
 --
@@ -1626,6 +2098,13 @@ ALTER INDEX crawl_log_pkey1 ATTACH PARTITION crawl_log_2026_02_pkey;
 CREATE TRIGGER trigger_update_duplicate_group_size AFTER INSERT OR DELETE ON duplicate_relationship FOR EACH ROW EXECUTE FUNCTION update_duplicate_group_size();
 
 
+--
+-- Name: duplicate_relationship trigger_update_duplicate_group_stats; Type: TRIGGER; Schema: public; Owner: -
+--
+
+CREATE TRIGGER trigger_update_duplicate_group_stats AFTER INSERT OR DELETE OR UPDATE OF similarity_score ON duplicate_relationship FOR EACH ROW EXECUTE FUNCTION update_duplicate_group_stats();
+
+
 --
 -- Name: content_hash content_hash_first_seen_page_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
@@ -1690,6 +2169,14 @@ ALTER TABLE ONLY duplicate_group
     ADD CONSTRAINT duplicate_group_canonical_page_id_fkey FOREIGN KEY (canonical_page_id) REFERENCES crawled_page(id) ON DELETE CASCADE;
 
 
+--
+-- Name: duplicate_group_stats duplicate_group_stats_group_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY duplicate_group_stats
+    ADD CONSTRAINT duplicate_group_stats_group_id_fkey FOREIGN KEY (group_id) REFERENCES duplicate_group(id) ON DELETE CASCADE;
+
+
 --
 -- Name: duplicate_relationship duplicate_relationship_duplicate_page_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
@@ -1722,6 +2209,22 @@ ALTER TABLE crawl_log
     ADD CONSTRAINT fk_crawl_log_website FOREIGN KEY (website_id) REFERENCES website(id) ON DELETE CASCADE;
 
 
+--
+-- Name: job_page_checkpoint job_page_checkpoint_job_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY job_page_checkpoint
+    ADD CONSTRAINT job_page_checkpoint_job_id_fkey FOREIGN KEY (job_id) REFERENCES crawl_job(id) ON DELETE CASCADE;
+
+
+--
+-- Name: job_step_checkpoint job_step_checkpoint_job_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY job_step_checkpoint
+    ADD CONSTRAINT job_step_checkpoint_job_id_fkey FOREIGN KEY (job_id) REFERENCES crawl_job(id) ON DELETE CASCADE;
+
+
 --
 -- Name: retry_history retry_history_job_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
@@ -1746,6 +2249,14 @@ ALTER TABLE ONLY website_config_history
     ADD CONSTRAINT website_config_history_website_id_fkey FOREIGN KEY (website_id) REFERENCES website(id) ON DELETE CASCADE;
 
 
+--
+-- Name: website_stats website_stats_website_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY website_stats
+    ADD CONSTRAINT website_stats_website_id_fkey FOREIGN KEY (website_id) REFERENCES website(id) ON DELETE CASCADE;
+
+
 --
 -- PostgreSQL database dump complete
 --
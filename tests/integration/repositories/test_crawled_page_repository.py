@@ -47,3 +47,39 @@ class TestCrawledPageRepository:
         fetched = await page_repo.get_by_url_hash(str(website.id), "a" * 64)
         assert fetched is not None
         assert fetched.url == "https://test.com/page1"
+
+    async def test_list_by_job_after_cursor(self, db_session: AsyncSession) -> None:
+        """Test keyset pages cover every page once, and streaming matches them."""
+        conn = await db_session.connection()
+        website = await WebsiteRepository(conn).create(
+            name="page-cursor-site", base_url="https://test.com", config={}
+        )
+        job = await CrawlJobRepository(conn).create(
+            seed_url="https://test.com", website_id=str(website.id)
+        )
+        page_repo = CrawledPageRepository(conn)
+
+        # Pages created in one transaction share created_at, so id breaks the ties
+        for index in range(5):
+            await page_repo.create(
+                website_id=str(website.id),
+                job_id=str(job.id),
+                url=f"https://test.com/page{index}",
+                url_hash=f"cursor_url_hash_{index}",
+                content_hash=f"cursor_content_hash_{index}",
+                crawled_at=datetime.now(UTC),
+            )
+
+        seen = []
+        page = await page_repo.list_by_job_after(job.id, limit=2)
+        while page:
+            seen.extend(page)
+            page = await page_repo.list_by_job_after(
+                job.id, cursor_created_at=page[-1].created_at, cursor_id=page[-1].id, limit=2
+            )
+
+        assert len({p.id for p in seen}) == 5
+        assert [p.id for p in seen] == [p.id async for p in page_repo.stream_by_job(job.id)]
+        assert [p.id for p in seen] == [
+            p.id for p in await page_repo.list_by_website_after(website.id, limit=10)
+        ]
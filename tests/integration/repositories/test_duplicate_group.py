@@ -465,6 +465,26 @@ class TestDuplicateGroupRepository:
         assert len(groups) >= 1
         assert any(g.id == group1.id for g in groups)
 
+    async def test_list_groups_after_cursor(
+        self,
+        duplicate_group_repo: DuplicateGroupRepository,
+        canonical_page,
+        duplicate_page1,
+        duplicate_page2,
+    ) -> None:
+        """Test keyset pages continue the newest-first order of offset pages."""
+        for page in (canonical_page, duplicate_page1, duplicate_page2):
+            await duplicate_group_repo.create_group(str(page.id))
+
+        expected = await duplicate_group_repo.list_all_groups(limit=100, offset=0)
+
+        first = await duplicate_group_repo.list_all_groups(limit=1, offset=0)
+        rest = await duplicate_group_repo.list_groups_after(
+            cursor_created_at=first[-1].created_at, cursor_id=first[-1].id, limit=100
+        )
+
+        assert [g.id for g in first + rest] == [g.id for g in expected]
+
     async def test_get_relationship_by_page(
         self,
         duplicate_group_repo: DuplicateGroupRepository,
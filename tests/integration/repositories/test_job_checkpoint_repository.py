@@ -0,0 +1,84 @@
+"""Integration tests for JobCheckpointRepository.
+
+These tests require a running PostgreSQL database.
+Run with: make test-integration
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from crawler.db.repositories import (
+    CrawlJobRepository,
+    JobCheckpointRepository,
+    WebsiteRepository,
+)
+
+
+async def _create_job(conn: AsyncConnection) -> str:
+    """Create a website with one template-based job."""
+    website = await WebsiteRepository(conn).create(
+        name="checkpoint-site", base_url="https://example.com", config={}
+    )
+    assert website is not None
+    job = await CrawlJobRepository(conn).create_template_based_job(
+        website_id=str(website.id), seed_url="https://example.com"
+    )
+    assert job is not None
+    return str(job.id)
+
+
+@pytest.mark.asyncio
+class TestJobCheckpointRepository:
+    """Tests for JobCheckpointRepository."""
+
+    async def test_save_step_replaces_earlier_result(self, db_connection: AsyncConnection) -> None:
+        """Test a step keeps only its latest result and hash."""
+        job_id = await _create_job(db_connection)
+        repo = JobCheckpointRepository(db_connection)
+
+        await repo.save_step(job_id, "crawl", "hash-1", {"extracted_data": {"urls": ["a"]}})
+        await repo.save_step(job_id, "crawl", "hash-2", {"extracted_data": {"urls": ["b"]}})
+
+        steps = await repo.list_steps(job_id)
+        assert len(steps) == 1
+        assert steps[0].config_hash == "hash-2"
+        assert steps[0].result == {"extracted_data": {"urls": ["b"]}}
+
+    async def test_stream_pages_by_config_hash(self, db_connection: AsyncConnection) -> None:
+        """Test pages are streamed for their step configuration only, once per URL."""
+        job_id = await _create_job(db_connection)
+        repo = JobCheckpointRepository(db_connection)
+
+        await repo.save_pages(
+            job_id,
+            "scrape",
+            "hash-1",
+            [
+                {"_url": "https://example.com/1", "title": "old"},
+                {"_url": "https://example.com/2", "title": "two"},
+            ],
+        )
+        await repo.save_pages(
+            job_id, "scrape", "hash-1", [{"_url": "https://example.com/1", "title": "new"}]
+        )
+        await repo.save_pages(
+            job_id, "scrape", "hash-2", [{"_url": "https://example.com/3", "title": "three"}]
+        )
+
+        pages = [page async for page in repo.stream_pages(job_id, "scrape", "hash-1")]
+        assert sorted(pages, key=lambda page: page["_url"]) == [
+            {"_url": "https://example.com/1", "title": "new"},
+            {"_url": "https://example.com/2", "title": "two"},
+        ]
+
+    async def test_delete(self, db_connection: AsyncConnection) -> None:
+        """Test deleting removes the step and page checkpoints of the job."""
+        job_id = await _create_job(db_connection)
+        repo = JobCheckpointRepository(db_connection)
+        await repo.save_step(job_id, "crawl", "hash-1", {"extracted_data": {}})
+        await repo.save_pages(job_id, "scrape", "hash-1", [{"_url": "https://example.com/1"}])
+
+        await repo.delete(job_id)
+
+        assert await repo.list_steps(job_id) == []
+        assert [page async for page in repo.stream_pages(job_id, "scrape", "hash-1")] == []
@@ -0,0 +1,147 @@
+"""Integration tests for WebsiteStatsRepository.
+
+These tests require a running PostgreSQL database.
+Run with: make test-integration
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from crawler.db.generated.models import StatusEnum
+from crawler.db.repositories import (
+    CrawledPageRepository,
+    CrawlJobRepository,
+    WebsiteRepository,
+    WebsiteStatsRepository,
+)
+
+
+async def _crawl_website(conn: AsyncConnection) -> str:
+    """Create a website with three jobs (completed, failed, running) and three pages."""
+    website = await WebsiteRepository(conn).create(
+        name="stats-site", base_url="https://example.com", config={}
+    )
+    assert website is not None
+    website_id = str(website.id)
+
+    job_repo = CrawlJobRepository(conn)
+    jobs = [
+        await job_repo.create_template_based_job(
+            website_id=website_id, seed_url=f"https://example.com/{index}"
+        )
+        for index in range(3)
+    ]
+    await job_repo.update_status(jobs[0].id, StatusEnum.RUNNING)
+    await job_repo.update_status(
+        jobs[0].id, StatusEnum.COMPLETED, completed_at=datetime(2026, 1, 2, tzinfo=UTC)
+    )
+    await job_repo.update_status(jobs[1].id, StatusEnum.FAILED, error_message="boom")
+    await job_repo.update_status(jobs[2].id, StatusEnum.RUNNING)
+
+    page_repo = CrawledPageRepository(conn)
+    pages = [
+        await page_repo.create(
+            website_id=website_id,
+            job_id=str(jobs[0].id),
+            url=f"https://example.com/page/{index}",
+            url_hash=f"url_hash_{index}",
+            content_hash=f"content_hash_{index}",
+            crawled_at=datetime.now(UTC),
+        )
+        for index in range(3)
+    ]
+    await page_repo.mark_as_duplicate(pages[1].id, pages[0].id, similarity_score=90)
+    await page_repo.mark_as_duplicate(pages[2].id, pages[0].id, similarity_score=80)
+    return website_id
+
+
+@pytest.mark.asyncio
+class TestWebsiteStatsRepository:
+    """Tests for WebsiteStatsRepository."""
+
+    async def test_statistics_include_pending_deltas(self, db_connection: AsyncConnection) -> None:
+        """Test statistics are exact before and after deltas are folded."""
+        website_id = await _crawl_website(db_connection)
+        website_repo = WebsiteRepository(db_connection)
+        page_repo = CrawledPageRepository(db_connection)
+        stats_repo = WebsiteStatsRepository(db_connection)
+
+        assert await stats_repo.count_pending_deltas() > 0
+        before = await website_repo.get_statistics(website_id)
+        pages_before = await page_repo.get_stats(website_id)
+
+        result = await stats_repo.fold_deltas(batch_size=1000)
+
+        assert result.websites_updated == 1
+        assert await stats_repo.count_pending_deltas() == 0
+        after = await website_repo.get_statistics(website_id)
+        assert after == before
+        assert after.total_jobs == 3
+        assert after.completed_jobs == 1
+        assert after.failed_jobs == 1
+        assert after.cancelled_jobs == 0
+        assert after.total_pages_crawled == 3
+        assert after.last_crawl_at == datetime(2026, 1, 2, tzinfo=UTC)
+
+        pages_after = await page_repo.get_stats(website_id)
+        assert pages_after == pages_before
+        assert pages_after.total_pages == 3
+        assert pages_after.unique_pages == 1
+        assert pages_after.duplicate_pages == 2
+        assert pages_after.avg_similarity_score == 85.0
+
+    async def test_last_crawl_at_follows_deleted_jobs(self, db_connection: AsyncConnection) -> None:
+        """Test last_crawl_at drops once the latest completed job is deleted."""
+        website_id = await _crawl_website(db_connection)
+        website_repo = WebsiteRepository(db_connection)
+        await WebsiteStatsRepository(db_connection).fold_deltas(batch_size=1000)
+
+        await db_connection.execute(
+            text("DELETE FROM crawl_job WHERE website_id = :website_id AND status = 'completed'"),
+            {"website_id": website_id},
+        )
+
+        stats = await website_repo.get_statistics(website_id)
+        assert stats.completed_jobs == 0
+        assert stats.last_crawl_at is None
+
+    async def test_fold_in_batches(self, db_connection: AsyncConnection) -> None:
+        """Test a fold moves at most batch_size deltas."""
+        await _crawl_website(db_connection)
+        stats_repo = WebsiteStatsRepository(db_connection)
+        pending = await stats_repo.count_pending_deltas()
+
+        result = await stats_repo.fold_deltas(batch_size=2)
+
+        assert result.deltas_folded == 2
+        assert await stats_repo.count_pending_deltas() == pending - 2
+
+    async def test_rebuild_matches_incremental_counters(
+        self, db_connection: AsyncConnection
+    ) -> None:
+        """Test a rebuild recomputes the same statistics and clears pending deltas."""
+        website_id = await _crawl_website(db_connection)
+        website_repo = WebsiteRepository(db_connection)
+        stats_repo = WebsiteStatsRepository(db_connection)
+        incremental = await website_repo.get_statistics(website_id)
+
+        await stats_repo.rebuild()
+
+        assert await stats_repo.count_pending_deltas() == 0
+        assert await website_repo.get_statistics(website_id) == incremental
+
+    async def test_deleted_pages_are_subtracted(self, db_connection: AsyncConnection) -> None:
+        """Test deleting pages produces negative deltas."""
+        website_id = await _crawl_website(db_connection)
+        website_repo = WebsiteRepository(db_connection)
+        stats_repo = WebsiteStatsRepository(db_connection)
+        await stats_repo.fold_deltas(batch_size=1000)
+
+        await website_repo.delete_crawled_pages_by_website(website_id)
+
+        stats = await website_repo.get_statistics(website_id)
+        assert stats.total_pages_crawled == 0
+        assert stats.total_jobs == 3
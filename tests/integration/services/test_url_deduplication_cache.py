@@ -199,6 +199,28 @@ class TestURLDeduplicationCache:
         assert hashes[2] not in existing
         assert hashes[3] not in existing
 
+    async def test_set_batch_stores_compact_values(
+        self, redis_client: redis.Redis, settings: Settings
+    ) -> None:
+        """Test batch set writes new hashes only, with the job ID as value."""
+        cache = URLDeduplicationCache(redis_client, settings)
+        await cache.set("batch_hash_existing", {"job_id": "job1"})
+
+        written = await cache.set_batch(
+            {"batch_hash_new": "job2", "batch_hash_existing": "job2"}, ttl=300
+        )
+
+        assert written == 1
+        assert await cache.get("batch_hash_new") == {"job_id": "job2"}
+        # Existing entries keep their original value
+        assert await cache.get("batch_hash_existing") == {"job_id": "job1"}
+        assert await cache.exists_batch(["batch_hash_new", "batch_hash_existing"]) == {
+            "batch_hash_new",
+            "batch_hash_existing",
+        }
+        ttl = await redis_client.ttl("url:dedup:batch_hash_new")
+        assert 290 < ttl <= 300
+
     async def test_empty_batch_check(self, redis_client: redis.Redis, settings: Settings) -> None:
         """Test batch checking with empty list."""
         cache = URLDeduplicationCache(redis_client, settings)
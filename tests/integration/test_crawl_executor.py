@@ -1,5 +1,6 @@
 """Integration tests for CrawlExecutor."""
 
+import asyncio
 from unittest.mock import patch
 
 import httpx
@@ -535,6 +536,113 @@ class TestCrawlExecutor:
         assert result.error is not None
         assert "Crawl execution error" in result.error
 
+    @pytest.mark.asyncio
+    async def test_crawl_multiple_seeds_concurrently(self, crawl_executor):
+        """Test seeds are crawled concurrently within the per-host cap."""
+        step_config = {
+            "method": "http",
+            "timeout": 30,
+            "pagination": {"enabled": True, "max_pages": 2},
+            "rate_limit": {"max_in_flight_per_host": 2},
+        }
+        selectors = {
+            "urls": {
+                "selector": "a.article-link",
+                "attribute": "href",
+                "type": "array",
+            }
+        }
+        seeds = [f"https://example.com/category{n}?page=1" for n in range(4)]
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def request(method, url, **kwargs):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            category, page = url.split("/category")[1].split("?page=")
+            return httpx.Response(
+                status_code=200,
+                content=(
+                    f'<html><a class="article-link" href="/article/{category}-{page}">A</a>'
+                    '<a class="article-link" href="/about">About</a></html>'
+                ).encode(),
+                headers={"content-type": "text/html"},
+                request=httpx.Request(method, url),
+            )
+
+        streamed: list[list[str]] = []
+
+        async def url_sink(urls):
+            streamed.append(urls)
+
+        with patch("httpx.AsyncClient.request", side_effect=request):
+            result = await crawl_executor.execute(
+                url=seeds,
+                step_config=step_config,
+                selectors=selectors,
+                url_sink=url_sink,
+            )
+
+        assert result.success
+        assert peak_in_flight == 2
+        # URLs are merged in seed order and deduplicated across seeds
+        assert result.extracted_data["urls"] == [
+            "https://example.com/article/0-1",
+            "https://example.com/about",
+            "https://example.com/article/0-2",
+        ] + [f"https://example.com/article/{n}-{page}" for n in range(1, 4) for page in (1, 2)]
+        crawl_metadata = result.extracted_data["_crawl_metadata"]
+        assert crawl_metadata["pages_crawled"] == 8
+        assert crawl_metadata["duplicate_urls"] == 7
+        assert [seed["seed_url"] for seed in crawl_metadata["seeds"]] == seeds
+        assert all(seed["pages_crawled"] == 2 for seed in crawl_metadata["seeds"])
+        assert result.metadata["total_seeds"] == 4
+        assert result.metadata["total_pages"] == 8
+        # Each URL is streamed once, whichever seed found it first
+        streamed_urls = [url for batch in streamed for url in batch]
+        assert sorted(streamed_urls) == sorted(result.extracted_data["urls"])
+
+    @pytest.mark.asyncio
+    async def test_crawl_failed_seed_does_not_fail_others(self, crawl_executor):
+        """Test a seed whose pages fail is reported without failing the crawl."""
+        step_config = {
+            "method": "http",
+            "timeout": 30,
+        }
+        selectors = {
+            "urls": {
+                "selector": "a.article-link",
+                "attribute": "href",
+                "type": "array",
+            }
+        }
+
+        async def request(method, url, **kwargs):
+            if url.endswith("/broken"):
+                raise httpx.ConnectError("connection refused")
+            return httpx.Response(
+                status_code=200,
+                content=b'<html><a class="article-link" href="/article1">A</a></html>',
+                headers={"content-type": "text/html"},
+                request=httpx.Request(method, url),
+            )
+
+        with patch("httpx.AsyncClient.request", side_effect=request):
+            result = await crawl_executor.execute(
+                url=["https://example.com/broken", "https://example.com/working"],
+                step_config=step_config,
+                selectors=selectors,
+            )
+
+        assert result.success
+        assert result.extracted_data["urls"] == ["https://example.com/article1"]
+        seed_stats = result.extracted_data["_crawl_metadata"]["seeds"]
+        assert [seed["pages_failed"] for seed in seed_stats] == [1, 0]
+        assert len(result.metadata["errors"]) == 1
+
     @pytest.mark.asyncio
     async def test_crawl_cleanup(self, crawl_executor):
         """Test crawl executor cleanup."""
@@ -252,6 +252,76 @@ async def test_list_dlq_entries_with_pagination(
     assert data["offset"] == 5
 
 
+@pytest.mark.asyncio
+async def test_list_dlq_entries_with_cursor(
+    test_client: AsyncClient,
+    test_dlq_entry: tuple[models.DeadLetterQueue, models.CrawlJob],
+    db_connection: AsyncConnection,
+) -> None:
+    """Test cursor pagination returns the same entries as offset pagination."""
+    dlq_entry, job = test_dlq_entry
+    dlq_repo = DeadLetterQueueRepository(db_connection)
+    crawl_job_repo = CrawlJobRepository(db_connection)
+
+    for i in range(4):
+        extra_job = await crawl_job_repo.create(
+            seed_url=f"https://example.com/cursor{i}",
+            website_id=job.website_id,
+            job_type=JobTypeEnum.ONE_TIME,
+            priority=5,
+        )
+        await dlq_repo.add_to_dlq(
+            job_id=str(extra_job.id),
+            seed_url=f"https://example.com/cursor{i}",
+            website_id=str(job.website_id),
+            job_type=JobTypeEnum.ONE_TIME,
+            priority=5,
+            error_category=ErrorCategoryEnum.NOT_FOUND,
+            error_message=f"Page {i} not found",
+            stack_trace=None,
+            http_status=404,
+            total_attempts=3,
+            first_attempt_at=datetime.now(UTC),
+            last_attempt_at=datetime.now(UTC),
+        )
+    await db_connection.commit()
+
+    url = f"/api/v1/dlq/entries?website_id={job.website_id}"
+    response = await test_client.get(f"{url}&limit=100")
+    offset_ids = [entry["id"] for entry in response.json()["entries"]]
+
+    url = f"{url}&limit=2"
+
+    cursor_ids = []
+    response = await test_client.get(url)
+    while True:
+        assert response.status_code == 200
+        data = response.json()
+        cursor_ids.extend(entry["id"] for entry in data["entries"])
+        if data["next_cursor"] is None:
+            break
+        response = await test_client.get(f"{url}&cursor={data['next_cursor']}")
+        assert response.json()["total"] is None
+
+    assert cursor_ids == offset_ids
+    assert dlq_entry.id in cursor_ids
+    assert len(cursor_ids) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_dlq_entries_invalid_cursor(
+    test_client: AsyncClient,
+) -> None:
+    """Test malformed cursors and cursor with offset are rejected."""
+    response = await test_client.get("/api/v1/dlq/entries?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+    response = await test_client.get(
+        "/api/v1/dlq/entries?offset=5&cursor=WyIyMDI1LTEwLTI5VDEwOjAwOjAwKzAwOjAwIiw0Ml0"
+    )
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_list_dlq_entries_invalid_limit(
     test_client: AsyncClient,
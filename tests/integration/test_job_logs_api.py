@@ -184,6 +184,49 @@ async def test_get_job_logs_with_search(
     assert "error" in data["logs"][0]["message"].lower()
 
 
+@pytest.mark.asyncio
+async def test_get_job_logs_with_estimated_count(
+    test_client: AsyncClient,
+    db_connection: AsyncConnection,
+    test_job: tuple[models.CrawlJob, models.Website],
+) -> None:
+    """Test an estimated count below the cap is the exact total."""
+    job, website = test_job
+
+    crawl_log_repo = CrawlLogRepository(db_connection)
+    for i in range(6):
+        await crawl_log_repo.create(
+            job_id=job.id,
+            website_id=website.id,
+            message=f"Timeout fetching page {i}" if i % 2 else f"Fetched page {i}",
+            log_level=LogLevelEnum.INFO,
+        )
+
+    # Commit transaction so test_client can see the data
+    await db_connection.commit()
+
+    response = await test_client.get(
+        f"/api/v1/jobs/{job.id}/logs?search=timeout&limit=2&count_mode=estimated"
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["total"] == 3
+    assert data["total_is_estimate"] is False
+    assert len(data["logs"]) == 2
+    assert all("timeout" in log["message"].lower() for log in data["logs"])
+
+    # Cursor pages of a search continue with the same filter
+    response = await test_client.get(
+        f"/api/v1/jobs/{job.id}/logs?search=timeout&limit=2&cursor={data['next_cursor']}"
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert len(data["logs"]) == 1
+    assert data["logs"][0]["message"] == "Timeout fetching page 5"
+
+
 @pytest.mark.asyncio
 async def test_get_job_logs_with_pagination(
     test_client: AsyncClient,
@@ -227,6 +270,63 @@ async def test_get_job_logs_with_pagination(
     assert data["offset"] == 5
 
 
+@pytest.mark.asyncio
+async def test_get_job_logs_with_cursor(
+    test_client: AsyncClient,
+    db_connection: AsyncConnection,
+    test_job: tuple[models.CrawlJob, models.Website],
+) -> None:
+    """Test cursor pagination walks every log once, in offset order."""
+    job, website = test_job
+
+    crawl_log_repo = CrawlLogRepository(db_connection)
+    for i in range(10):
+        await crawl_log_repo.create(
+            job_id=job.id,
+            website_id=website.id,
+            message=f"Log message {i}",
+            log_level=LogLevelEnum.INFO,
+        )
+    await db_connection.commit()
+
+    response = await test_client.get(f"/api/v1/jobs/{job.id}/logs?limit=100")
+    offset_ids = [log["id"] for log in response.json()["logs"]]
+
+    # First page carries the total and a cursor for the next page
+    response = await test_client.get(f"/api/v1/jobs/{job.id}/logs?limit=4")
+    data = response.json()
+    assert data["total"] == 10
+    cursor_ids = [log["id"] for log in data["logs"]]
+
+    while data["next_cursor"] is not None:
+        response = await test_client.get(
+            f"/api/v1/jobs/{job.id}/logs?limit=4&cursor={data['next_cursor']}"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        cursor_ids.extend(log["id"] for log in data["logs"])
+
+    assert cursor_ids == offset_ids
+    assert len(cursor_ids) == 10
+
+
+@pytest.mark.asyncio
+async def test_get_job_logs_invalid_cursor(
+    test_client: AsyncClient,
+    test_job: tuple[models.CrawlJob, models.Website],
+) -> None:
+    """Test malformed cursors and cursor with offset are rejected."""
+    job, _website = test_job
+
+    response = await test_client.get(f"/api/v1/jobs/{job.id}/logs?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+    cursor = "WyIyMDI1LTEwLTI5VDEwOjAwOjA1KzAwOjAwIiwxMjM0Nl0"
+    response = await test_client.get(f"/api/v1/jobs/{job.id}/logs?offset=5&cursor={cursor}")
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_get_job_logs_with_time_range(
     test_client: AsyncClient,
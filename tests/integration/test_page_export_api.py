@@ -0,0 +1,134 @@
+"""Integration tests for crawled page export API endpoints."""
+
+import gzip
+import json
+import uuid
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from crawler.db.generated import models
+from crawler.db.repositories import CrawledPageRepository, CrawlJobRepository, WebsiteRepository
+
+
+@pytest.fixture
+async def crawled_job(
+    db_connection: AsyncConnection,
+) -> AsyncGenerator[tuple[models.CrawlJob, list[models.CrawledPage]]]:
+    """Create a website and job with three crawled pages.
+
+    Returns:
+        Tuple of (job, pages) that can be used in tests
+    """
+    unique_id = str(uuid.uuid4())[:8]
+    website = await WebsiteRepository(db_connection).create(
+        name=f"Export Website {unique_id}",
+        base_url=f"https://example-{unique_id}.com",
+        config={},
+    )
+    assert website is not None
+
+    job = await CrawlJobRepository(db_connection).create(
+        seed_url=f"https://example-{unique_id}.com", website_id=website.id
+    )
+    assert job is not None
+
+    page_repo = CrawledPageRepository(db_connection)
+    pages = []
+    for index in range(3):
+        page = await page_repo.create(
+            website_id=str(website.id),
+            job_id=str(job.id),
+            url=f"https://example-{unique_id}.com/page/{index}",
+            url_hash=f"export_url_hash_{unique_id}_{index}",
+            content_hash=f"export_content_hash_{unique_id}_{index}",
+            title=f"Page {index}",
+            extracted_content="content " * 100,
+            metadata={"index": index},
+            crawled_at=datetime.now(UTC),
+        )
+        assert page is not None
+        pages.append(page)
+
+    # Commit so the export connection can see the data
+    await db_connection.commit()
+
+    yield job, pages
+
+
+@pytest.mark.asyncio
+async def test_export_job_pages_ndjson(
+    test_client: AsyncClient,
+    crawled_job: tuple[models.CrawlJob, list[models.CrawledPage]],
+) -> None:
+    """Test a job export streams one JSON page per line."""
+    job, pages = crawled_job
+
+    response = await test_client.get(f"/api/v1/jobs/{job.id}/pages/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert f"job-{job.id}-pages.ndjson" in response.headers["content-disposition"]
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["id"] for line in lines) == sorted(str(page.id) for page in pages)
+    assert all(line["metadata"]["index"] in (0, 1, 2) for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_export_job_pages_gzip(
+    test_client: AsyncClient,
+    crawled_job: tuple[models.CrawlJob, list[models.CrawledPage]],
+) -> None:
+    """Test a gzip export decompresses to the plain NDJSON export."""
+    job, _pages = crawled_job
+
+    plain = await test_client.get(f"/api/v1/jobs/{job.id}/pages/export")
+    compressed = await test_client.get(f"/api/v1/jobs/{job.id}/pages/export?compression=gzip")
+
+    assert compressed.status_code == 200
+    assert compressed.headers["content-type"] == "application/gzip"
+    assert gzip.decompress(compressed.content) == plain.content
+
+
+@pytest.mark.asyncio
+async def test_export_website_pages(
+    test_client: AsyncClient,
+    crawled_job: tuple[models.CrawlJob, list[models.CrawledPage]],
+) -> None:
+    """Test a website export contains the pages of its jobs."""
+    job, pages = crawled_job
+
+    response = await test_client.get(f"/api/v1/websites/{job.website_id}/pages/export")
+    assert response.status_code == 200
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == [
+        str(page.id) for page in sorted(pages, key=lambda p: (p.created_at, p.id))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_not_found(test_client: AsyncClient) -> None:
+    """Test exports of missing jobs and websites return 404 before streaming."""
+    missing_id = "550e8400-e29b-41d4-a716-446655440000"
+
+    response = await test_client.get(f"/api/v1/jobs/{missing_id}/pages/export")
+    assert response.status_code == 404
+
+    response = await test_client.get(f"/api/v1/websites/{missing_id}/pages/export")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_export_invalid_compression(
+    test_client: AsyncClient,
+    crawled_job: tuple[models.CrawlJob, list[models.CrawledPage]],
+) -> None:
+    """Test an unknown compression is a validation error."""
+    job, _pages = crawled_job
+
+    response = await test_client.get(f"/api/v1/jobs/{job.id}/pages/export?compression=zstd")
+    assert response.status_code == 422
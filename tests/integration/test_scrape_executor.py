@@ -1,10 +1,13 @@
 """Integration tests for ScrapeExecutor."""
 
+import asyncio
+import hashlib
 from unittest.mock import patch
 
 import httpx
 import pytest
 
+from crawler.services.page_validators import PageValidators
 from crawler.services.selector_processor import SelectorProcessor
 from crawler.services.step_executors import (
     APIExecutor,
@@ -12,6 +15,7 @@ from crawler.services.step_executors import (
     HTTPExecutor,
     ScrapeExecutor,
 )
+from crawler.services.step_executors.base import ExecutionResult
 
 
 class TestScrapeExecutor:
@@ -230,10 +234,10 @@ class TestScrapeExecutor:
             assert result.metadata["failed_urls"] == 2
 
     @pytest.mark.asyncio
-    async def test_scrape_batch_processing(self, scrape_executor):
-        """Test scraping processes URLs in batches."""
-        # Create executor with small batch size for testing
-        scrape_executor.batch_size = 2
+    async def test_scrape_sliding_window(self, scrape_executor):
+        """Test scraping keeps results in URL order with a small in-flight window."""
+        # Create executor with a small window for testing
+        scrape_executor.max_in_flight = 2
 
         step_config = {
             "method": "http",
@@ -243,7 +247,6 @@ class TestScrapeExecutor:
             "title": "h1",
         }
 
-        # Create 5 URLs (should be processed in 3 batches: 2, 2, 1)
         urls = [f"https://example.com/article/{i}" for i in range(1, 6)]
 
         with patch("httpx.AsyncClient.request") as mock_request:
@@ -265,12 +268,74 @@ class TestScrapeExecutor:
             )
 
             assert result.success
-            assert len(result.extracted_data["items"]) == 5
+            assert [item["_url"] for item in result.extracted_data["items"]] == urls
             assert result.metadata["total_urls"] == 5
             assert result.metadata["successful_urls"] == 5
-            # Verify all requests were made (batching doesn't skip URLs)
+            # Verify all requests were made (the window doesn't skip URLs)
             assert mock_request.call_count == 5
 
+    @pytest.mark.asyncio
+    async def test_scrape_slow_url_does_not_block_others(self, scrape_executor):
+        """Test a slow URL only holds its own slot while the others keep flowing."""
+        urls = [f"https://example.com/article/{i}" for i in range(1, 6)]
+        slow_url = urls[0]
+        slow_release = asyncio.Event()
+        finished: list[str] = []
+
+        async def fake_execute(url, step_config, selectors):
+            if url == slow_url:
+                await slow_release.wait()
+            else:
+                await asyncio.sleep(0)
+            finished.append(url)
+            # Release the slow URL only once every other URL is done
+            if len(finished) == len(urls) - 1:
+                slow_release.set()
+            return ExecutionResult(success=True, extracted_data={"title": url})
+
+        with patch.object(scrape_executor.http_executor, "execute", side_effect=fake_execute):
+            result = await scrape_executor.execute(
+                url=urls,
+                step_config={"method": "http", "rate_limit": {"max_in_flight": 2}},
+                selectors={"title": "h1"},
+            )
+
+        assert result.success
+        assert finished[-1] == slow_url
+        assert [item["_url"] for item in result.extracted_data["items"]] == urls
+
+    @pytest.mark.asyncio
+    async def test_scrape_limits_in_flight_per_host(self, scrape_executor):
+        """Test no host exceeds its in-flight cap while other hosts use free slots."""
+        urls = [f"https://a.example.com/{i}" for i in range(6)] + [
+            f"https://b.example.com/{i}" for i in range(2)
+        ]
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def fake_execute(url, step_config, selectors):
+            host = url.split("/")[2]
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return ExecutionResult(success=True, extracted_data={"title": url})
+
+        step_config = {
+            "method": "http",
+            "rate_limit": {"max_in_flight": 5, "max_in_flight_per_host": 2},
+        }
+        with patch.object(scrape_executor.http_executor, "execute", side_effect=fake_execute):
+            result = await scrape_executor.execute(
+                url=urls,
+                step_config=step_config,
+                selectors={"title": "h1"},
+            )
+
+        assert result.success
+        assert result.metadata["successful_urls"] == 8
+        assert peak == {"a.example.com": 2, "b.example.com": 2}
+
     @pytest.mark.asyncio
     async def test_scrape_empty_url_list(self, scrape_executor):
         """Test scraping handles empty URL list gracefully."""
@@ -406,6 +471,212 @@ class TestScrapeExecutor:
             # Verify all requests were made
             assert mock_request.call_count == 150
 
+    @pytest.mark.asyncio
+    async def test_scrape_streams_pages_to_sink(self, scrape_executor):
+        """Test scraped pages go to the page sink instead of the step result."""
+        step_config = {
+            "method": "http",
+            "timeout": 30,
+        }
+        selectors = {
+            "title": "h1",
+        }
+        urls = [f"https://example.com/article/{i}" for i in range(3)]
+        streamed = []
+
+        async def page_sink(page_data):
+            streamed.append(page_data)
+
+        with patch("httpx.AsyncClient.request") as mock_request:
+            mock_request.return_value = httpx.Response(
+                status_code=200,
+                content=b"<html><body><h1>Article</h1></body></html>",
+                headers={"content-type": "text/html"},
+            )
+
+            result = await scrape_executor.execute(
+                url=urls,
+                step_config=step_config,
+                selectors=selectors,
+                page_sink=page_sink,
+            )
+
+        assert result.success
+        assert result.extracted_data == {}
+        assert result.metadata["streamed"] is True
+        assert result.metadata["successful_urls"] == 3
+        assert sorted(page["_url"] for page in streamed) == urls
+        assert all(page["title"] == "Article" and page["_content"] for page in streamed)
+
+    @pytest.mark.asyncio
+    async def test_scrape_consumes_streamed_url_batches(self, scrape_executor):
+        """Test URLs arriving in batches are scraped as the stream delivers them."""
+        step_config = {
+            "method": "http",
+            "timeout": 30,
+        }
+        selectors = {
+            "title": "h1",
+        }
+        requested = []
+        second_batch_sent = asyncio.Event()
+
+        async def url_batches():
+            yield ["https://example.com/article/0", "https://example.com/article/1"]
+            # The first batch is scraped before the producer sends more
+            await asyncio.sleep(0.01)
+            assert len(requested) == 2
+            second_batch_sent.set()
+            yield ["https://example.com/article/2"]
+
+        async def request(method, url, **kwargs):
+            requested.append(url)
+            return httpx.Response(
+                status_code=200,
+                content=b"<html><body><h1>Article</h1></body></html>",
+                headers={"content-type": "text/html"},
+                request=httpx.Request(method, url),
+            )
+
+        with patch("httpx.AsyncClient.request", side_effect=request):
+            result = await scrape_executor.execute(
+                url=[],
+                step_config=step_config,
+                selectors=selectors,
+                url_batches=url_batches(),
+            )
+
+        assert second_batch_sent.is_set()
+        assert result.success
+        assert result.metadata["total_urls"] == 3
+        assert [item["_url"] for item in result.extracted_data["items"]] == [
+            f"https://example.com/article/{i}" for i in range(3)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_scrape_empty_url_stream(self, scrape_executor):
+        """Test a URL stream that ends without URLs scrapes nothing."""
+
+        async def url_batches():
+            return
+            yield
+
+        result = await scrape_executor.execute(
+            url=[],
+            step_config={"method": "http"},
+            selectors={"title": "h1"},
+            url_batches=url_batches(),
+        )
+
+        assert result.success
+        assert result.metadata["total_urls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_scrape_conditional_recrawl_skips_unchanged_pages(self, scrape_executor):
+        """Test known URLs are fetched conditionally and unchanged pages are skipped."""
+        step_config = {
+            "method": "http",
+            "timeout": 30,
+        }
+        selectors = {
+            "title": "h1",
+        }
+        same_body = "<html><body><h1>Same</h1></body></html>"
+        saved = {
+            "https://example.com/not-modified": PageValidators(
+                content_hash="0" * 64, etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT"
+            ),
+            "https://example.com/same-body": PageValidators(
+                content_hash=hashlib.sha256(same_body.encode()).hexdigest()
+            ),
+        }
+        looked_up: list[list[str]] = []
+        request_headers: dict[str, dict[str, str]] = {}
+
+        async def validator_lookup(urls):
+            looked_up.append(urls)
+            return {url: saved[url] for url in urls if url in saved}
+
+        async def request(method, url, headers=None, **kwargs):
+            request_headers[url] = headers
+            if headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(status_code=304, request=httpx.Request(method, url))
+            body = same_body if url.endswith("same-body") else "<html><h1>New</h1></html>"
+            return httpx.Response(
+                status_code=200,
+                content=body.encode(),
+                headers={"content-type": "text/html", "etag": '"v2"'},
+                request=httpx.Request(method, url),
+            )
+
+        urls = [
+            "https://example.com/not-modified",
+            "https://example.com/same-body",
+            "https://example.com/new",
+        ]
+        with patch("httpx.AsyncClient.request", side_effect=request):
+            result = await scrape_executor.execute(
+                url=urls,
+                step_config=step_config,
+                selectors=selectors,
+                validator_lookup=validator_lookup,
+            )
+
+        assert result.success
+        assert looked_up == [urls]
+        assert request_headers["https://example.com/not-modified"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert request_headers["https://example.com/new"] == {}
+        # Only the changed page is returned, with its validators for the next re-crawl
+        assert result.extracted_data["items"] == [
+            {
+                "_url": "https://example.com/new",
+                "_content": "<html><h1>New</h1></html>",
+                "title": "New",
+                "_etag": '"v2"',
+            }
+        ]
+        assert result.metadata["successful_urls"] == 3
+        assert result.metadata["unchanged_urls"] == 2
+        assert result.metadata["changed_urls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scrape_failed_validator_lookup_fetches_every_page(self, scrape_executor):
+        """Test a failing validator lookup falls back to unconditional requests."""
+        step_config = {
+            "method": "http",
+            "timeout": 30,
+        }
+        streamed = []
+
+        async def validator_lookup(urls):
+            raise RuntimeError("database unavailable")
+
+        async def page_sink(page_data):
+            streamed.append(page_data)
+
+        with patch("httpx.AsyncClient.request") as mock_request:
+            mock_request.return_value = httpx.Response(
+                status_code=200,
+                content=b"<html><body><h1>Article</h1></body></html>",
+                headers={"content-type": "text/html"},
+            )
+
+            result = await scrape_executor.execute(
+                url=[f"https://example.com/article/{i}" for i in range(3)],
+                step_config=step_config,
+                selectors={"title": "h1"},
+                page_sink=page_sink,
+                validator_lookup=validator_lookup,
+            )
+
+        assert result.success
+        assert len(streamed) == 3
+        assert result.metadata["unchanged_urls"] == 0
+        assert result.metadata["changed_urls"] == 3
+
     @pytest.mark.asyncio
     async def test_scrape_cleanup(self, scrape_executor):
         """Test scrape executor cleanup."""
@@ -1,10 +1,14 @@
 """Integration tests for step orchestrator."""
 
+import asyncio
+from typing import Any, ClassVar
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
+from crawler.services.dependency_validator import DependencyValidator
+from crawler.services.step_execution_context import StepResult
 from crawler.services.step_orchestrator import StepOrchestrator
 
 
@@ -115,6 +119,53 @@ class TestStepOrchestrator:
                 assert "title" in item
                 assert "content" in item
 
+    @pytest.mark.asyncio
+    async def test_final_scrape_step_streams_to_page_sink(self):
+        """Test scrape steps nobody depends on stream pages to the page sink."""
+        steps = [
+            {
+                "name": "fetch_articles",
+                "method": "http",
+                "type": "scrape",
+                "config": {"url": "https://example.com/article1"},
+                "selectors": {"title": "h1.title"},
+            },
+            {
+                "name": "fetch_more",
+                "method": "http",
+                "type": "scrape",
+                "config": {"url": "https://example.com/article2"},
+                "selectors": {"title": "h1.title"},
+                "skip_if": "{{fetch_articles.title}} == 'skip'",
+            },
+        ]
+        streamed = []
+
+        async def page_sink(page_data):
+            streamed.append(page_data)
+
+        orchestrator = StepOrchestrator(
+            job_id="test-job-stream",
+            website_id="test-site-stream",
+            base_url="https://example.com",
+            steps=steps,
+            page_sink=page_sink,
+        )
+
+        with patch("httpx.AsyncClient.request") as mock_request:
+            mock_request.return_value = httpx.Response(
+                status_code=200,
+                content=b'<html><body><h1 class="title">Article</h1></body></html>',
+                headers={"content-type": "text/html"},
+            )
+
+            context = await orchestrator.execute_workflow()
+
+        # fetch_more reads fetch_articles in its condition, so only fetch_more streams
+        assert context.step_results["fetch_articles"].extracted_data["title"] == "Article"
+        assert context.step_results["fetch_more"].metadata["streamed"] is True
+        assert [page["_url"] for page in streamed] == ["https://example.com/article2"]
+
     @pytest.mark.asyncio
     async def test_single_url_workflow_preserves_structure(self):
         """Test that single URL results are not wrapped in 'items' array."""
@@ -556,8 +607,8 @@ class TestStepOrchestrator:
             assert all(title == "Page Title" for title in step2.extracted_data["title"])
 
     @pytest.mark.asyncio
-    async def test_crawl_executor_with_multiple_urls_uses_first(self):
-        """Test that CrawlExecutor uses only the first URL when given a list."""
+    async def test_crawl_executor_with_multiple_urls_crawls_every_seed(self):
+        """Test that CrawlExecutor crawls every URL it is given as a seed."""
         steps = [
             {
                 "name": "fetch_list",
@@ -573,9 +624,9 @@ class TestStepOrchestrator:
                 },
             },
             {
-                "name": "crawl_from_first",
+                "name": "crawl_categories",
                 "method": "http",
-                "type": "crawl",  # CrawlExecutor uses only first URL
+                "type": "crawl",  # Every category URL becomes a seed
                 "input_from": "fetch_list.urls",
                 "selectors": {
                     "links": {
@@ -588,58 +639,53 @@ class TestStepOrchestrator:
         ]
 
         orchestrator = StepOrchestrator(
-            job_id="test-job-crawl-first",
-            website_id="test-site-crawl-first",
+            job_id="test-job-crawl-seeds",
+            website_id="test-site-crawl-seeds",
             base_url="https://example.com",
             steps=steps,
         )
 
-        with patch("httpx.AsyncClient.request") as mock_request:
-            # List page with 3 URLs
-            list_response = httpx.Response(
+        pages = {
+            # List page with 3 category URLs
+            "https://example.com/list": (
+                '<a href="/page1">Page 1</a><a href="/page2">Page 2</a><a href="/page3">Page 3</a>'
+            ),
+            # Category pages share /shared, which is kept once
+            "https://example.com/page1": '<a href="/link1">1</a><a href="/shared">S</a>',
+            "https://example.com/page2": '<a href="/link2">2</a><a href="/shared">S</a>',
+            "https://example.com/page3": '<a href="/link3">3</a>',
+        }
+
+        async def request(method, url, **kwargs):
+            return httpx.Response(
                 status_code=200,
-                content=b"""
-                <html>
-                    <a href="/page1">Page 1</a>
-                    <a href="/page2">Page 2</a>
-                    <a href="/page3">Page 3</a>
-                </html>
-            """,
-                headers={"content-type": "text/html"},
-            )
-
-            # Only the first page should be crawled
-            first_page_response = httpx.Response(
-                status_code=200,
-                content=b"""
-                <html>
-                    <a href="/link1">Link 1</a>
-                    <a href="/link2">Link 2</a>
-                </html>
-            """,
+                content=f"<html>{pages[url]}</html>".encode(),
                 headers={"content-type": "text/html"},
+                request=httpx.Request(method, url),
             )
 
-            mock_request.side_effect = [list_response, first_page_response]
-
+        with patch("httpx.AsyncClient.request", side_effect=request):
             context = await orchestrator.execute_workflow()
 
-            # Verify step 1 completed successfully
-            assert "fetch_list" in context.step_results
-            step1 = context.step_results["fetch_list"]
-            assert step1.success
-            assert len(step1.extracted_data["urls"]) == 3
-
-            # Verify step 2 only crawled the first URL
-            assert "crawl_from_first" in context.step_results
-            step2 = context.step_results["crawl_from_first"]
-            assert step2.success
-            # Should have crawled only 1 page (the first URL)
-            assert "_crawl_metadata" in step2.extracted_data
-            assert step2.extracted_data["_crawl_metadata"]["pages_crawled"] == 1
-            # Should have extracted links from that one page
-            assert "links" in step2.extracted_data
-            assert len(step2.extracted_data["links"]) == 2
+        # Verify step 1 completed successfully
+        step1 = context.step_results["fetch_list"]
+        assert step1.success
+        assert len(step1.extracted_data["urls"]) == 3
+
+        # Verify step 2 crawled all 3 seeds and merged their links in seed order
+        step2 = context.step_results["crawl_categories"]
+        assert step2.success
+        assert step2.extracted_data["links"] == [
+            "https://example.com/link1",
+            "https://example.com/shared",
+            "https://example.com/link2",
+            "https://example.com/link3",
+        ]
+        crawl_metadata = step2.extracted_data["_crawl_metadata"]
+        assert crawl_metadata["pages_crawled"] == 3
+        assert crawl_metadata["duplicate_urls"] == 1
+        assert [seed["new_urls"] for seed in crawl_metadata["seeds"]] == [2, 1, 1]
+        assert step2.metadata["total_seeds"] == 3
 
     @pytest.mark.asyncio
     async def test_workflow_cancellation_between_steps(self):
@@ -706,3 +752,331 @@ class TestStepOrchestrator:
             # Cancellation flag should have been checked twice:
             # once before first step (returns False), once before second step (returns True)
             assert mock_cancellation_flag.is_cancelled.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resume_from_checkpoint(self):
+        """Test a retried job restores the crawl step and scrapes only the URLs left."""
+        steps = [
+            {
+                "name": "fetch_list",
+                "method": "http",
+                "type": "crawl",
+                "config": {"url": "https://example.com/articles"},
+                "selectors": {"article_urls": {"selector": "a", "type": "array"}},
+            },
+            {
+                "name": "fetch_articles",
+                "method": "http",
+                "type": "scrape",
+                "input_from": "fetch_list.article_urls",
+                "selectors": {"title": "h1.title"},
+            },
+        ]
+        article_urls = [f"https://example.com/article{index}" for index in range(1, 4)]
+        recorded = []
+
+        async def resumed_pages():
+            yield {"_url": article_urls[0], "_content": "", "title": "Saved"}
+
+        async def record(page_data):
+            recorded.append(page_data)
+
+        checkpoint = MagicMock()
+        checkpoint.load = AsyncMock()
+        checkpoint.save_step = AsyncMock()
+        checkpoint.flush = AsyncMock()
+        checkpoint.get_step = MagicMock(
+            side_effect=lambda config: StepResult(
+                step_name=config["name"],
+                extracted_data={"article_urls": article_urls},
+                metadata={"resumed": True},
+            )
+        )
+        checkpoint.iter_pages = MagicMock(side_effect=lambda config: resumed_pages())
+        checkpoint.page_recorder = MagicMock(return_value=record)
+
+        orchestrator = StepOrchestrator(
+            job_id="test-job-resume",
+            website_id="test-site-resume",
+            base_url="https://example.com",
+            steps=steps,
+            checkpoint=checkpoint,
+        )
+
+        with patch("httpx.AsyncClient.request") as mock_request:
+            mock_request.return_value = httpx.Response(
+                status_code=200,
+                content=b'<html><body><h1 class="title">Article</h1></body></html>',
+                headers={"content-type": "text/html"},
+            )
+
+            context = await orchestrator.execute_workflow()
+
+        # The crawl is restored, and only the two unscraped articles are requested
+        assert mock_request.call_count == 2
+        assert context.step_results["fetch_list"].metadata["resumed"] is True
+        scrape = context.step_results["fetch_articles"]
+        assert scrape.success
+        assert scrape.metadata["total_urls"] == 3
+        assert scrape.metadata["successful_urls"] == 3
+        assert scrape.metadata["resumed_urls"] == 1
+        assert [item["title"] for item in scrape.extracted_data["items"]] == [
+            "Saved",
+            "Article",
+            "Article",
+        ]
+        assert sorted(page["_url"] for page in recorded) == article_urls[1:]
+        checkpoint.load.assert_awaited_once()
+        checkpoint.save_step.assert_not_called()
+        checkpoint.flush.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_step_progress_written_to_crawl_log(self):
+        """Test step starts, completions and failures go to the job's crawl log."""
+        steps = [
+            {
+                "name": "fetch_list",
+                "method": "http",
+                "type": "crawl",
+                "config": {"url": "https://example.com/articles"},
+                "selectors": {"title": "h1"},
+            },
+            {
+                "name": "fetch_missing",
+                "method": "http",
+                "type": "crawl",
+                "config": {"url": "https://example.com/missing"},
+                "selectors": {"title": "h1"},
+            },
+        ]
+        log_sink = MagicMock()
+        orchestrator = StepOrchestrator(
+            job_id="test-job-log",
+            website_id="test-site-log",
+            base_url="https://example.com",
+            steps=steps,
+            log_sink=log_sink,
+        )
+
+        def respond(method, url, **kwargs):
+            status_code = 404 if url.endswith("/missing") else 200
+            return httpx.Response(
+                status_code=status_code,
+                content=b"<html><body><h1>Articles</h1></body></html>",
+                headers={"content-type": "text/html"},
+                request=httpx.Request(method, url),
+            )
+
+        with patch("httpx.AsyncClient.request", side_effect=respond):
+            await orchestrator.execute_workflow()
+
+        written = [
+            (call.kwargs["step_name"], call.kwargs["log_level"].value, call.kwargs["message"])
+            for call in log_sink.write.call_args_list
+        ]
+        assert written[:3] == [
+            ("fetch_list", "INFO", "Step started"),
+            ("fetch_list", "INFO", "Step completed"),
+            ("fetch_missing", "INFO", "Step started"),
+        ]
+        assert written[3][:2] == ("fetch_missing", "ERROR")
+        assert written[3][2].startswith("Step failed")
+        assert {call.kwargs["job_id"] for call in log_sink.write.call_args_list} == {"test-job-log"}
+
+    @pytest.mark.asyncio
+    async def test_cancel_event_interrupts_running_step(self):
+        """Test a pushed cancellation stops a step mid-request and closes its pages."""
+        steps = [
+            {
+                "name": "fetch_articles",
+                "method": "http",
+                "type": "scrape",
+                "config": {"url": "https://example.com/slow"},
+                "selectors": {"title": "h1"},
+            }
+        ]
+        cancel_event = asyncio.Event()
+        started = asyncio.Event()
+
+        async def hang(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(60)
+
+        orchestrator = StepOrchestrator(
+            job_id="test-job-cancel-event",
+            website_id="test-site-cancel-event",
+            base_url="https://example.com",
+            steps=steps,
+            cancel_event=cancel_event,
+        )
+        page = MagicMock()
+        page.close = AsyncMock()
+        orchestrator.browser_executor.open_pages.add(page)
+
+        with patch("httpx.AsyncClient.request", side_effect=hang):
+            workflow = asyncio.create_task(orchestrator.execute_workflow())
+            await asyncio.wait_for(started.wait(), timeout=5)
+            cancel_event.set()
+            context = await asyncio.wait_for(workflow, timeout=5)
+
+        assert context.metadata.get("cancelled") is True
+        assert "fetch_articles" not in context.step_results
+        page.close.assert_awaited()
+
+
+class TestStepOrchestratorPipelining:
+    """Tests for crawl and scrape steps pipelined through a URL channel."""
+
+    STEPS: ClassVar[list[dict[str, Any]]] = [
+        {
+            "name": "fetch_list",
+            "method": "http",
+            "type": "crawl",
+            "config": {
+                "url": "https://example.com/list?page=1",
+                "pagination": {
+                    "enabled": True,
+                    "url_template": "https://example.com/list?page={page}",
+                    "max_pages": 3,
+                },
+            },
+            "selectors": {
+                "article_urls": {
+                    "selector": "a.article-link",
+                    "attribute": "href",
+                    "type": "array",
+                }
+            },
+        },
+        {
+            "name": "fetch_articles",
+            "method": "http",
+            "type": "scrape",
+            "input_from": "fetch_list.article_urls",
+            "selectors": {"title": "h1.title"},
+        },
+    ]
+
+    @staticmethod
+    def _mock_site(requested: list[str], list_status: int = 200):
+        """Create a request mock serving slow list pages and fast article pages."""
+
+        async def request(method, url, **kwargs):
+            requested.append(url)
+            if "/list" in url:
+                await asyncio.sleep(0.02)
+                page = url.rsplit("=", 1)[1]
+                content = (
+                    f'<a class="article-link" href="/article/{page}-a">A</a>'
+                    f'<a class="article-link" href="/article/{page}-b">B</a>'
+                )
+                status = list_status
+            else:
+                content = '<h1 class="title">Article</h1>'
+                status = 200
+            return httpx.Response(
+                status_code=status,
+                content=f"<html><body>{content}</body></html>".encode(),
+                headers={"content-type": "text/html"},
+                request=httpx.Request(method, url),
+            )
+
+        return request
+
+    @pytest.mark.asyncio
+    async def test_scrape_starts_before_crawl_finishes(self):
+        """Test articles of the first list page are scraped while the crawl continues."""
+        requested: list[str] = []
+        orchestrator = StepOrchestrator(
+            job_id="test-job-pipeline",
+            website_id="test-site-pipeline",
+            base_url="https://example.com",
+            steps=self.STEPS,
+            pipeline_steps=True,
+        )
+
+        with patch("httpx.AsyncClient.request", side_effect=self._mock_site(requested)):
+            context = await orchestrator.execute_workflow()
+
+        assert requested.index("https://example.com/article/1-a") < requested.index(
+            "https://example.com/list?page=3"
+        )
+        crawl = context.step_results["fetch_list"]
+        scrape = context.step_results["fetch_articles"]
+        assert crawl.success
+        assert len(crawl.extracted_data["article_urls"]) == 6
+        assert scrape.success
+        assert scrape.metadata["total_urls"] == 6
+        assert len(scrape.extracted_data["items"]) == 6
+        assert context.execution_order == ["fetch_list", "fetch_articles"]
+
+    @pytest.mark.asyncio
+    async def test_scrape_fails_when_crawl_fails(self):
+        """Test a pipelined scrape fails like a sequential one when its crawl fails."""
+        requested: list[str] = []
+        orchestrator = StepOrchestrator(
+            job_id="test-job-pipeline-fail",
+            website_id="test-site-pipeline-fail",
+            base_url="https://example.com",
+            steps=self.STEPS,
+            pipeline_steps=True,
+        )
+
+        with patch(
+            "httpx.AsyncClient.request",
+            side_effect=self._mock_site(requested, list_status=500),
+        ):
+            context = await orchestrator.execute_workflow()
+
+        assert not context.step_results["fetch_list"].success
+        scrape = context.step_results["fetch_articles"]
+        assert not scrape.success
+        assert "depends on 'fetch_list' which failed" in scrape.error
+        assert context.get_failed_steps() == ["fetch_list", "fetch_articles"]
+
+    @pytest.mark.asyncio
+    async def test_cancellation_stops_crawl_mid_stream(self):
+        """Test cancelling while URLs stream stops both pipelined steps."""
+        requested: list[str] = []
+        mock_cancellation_flag = MagicMock()
+        # Not cancelled before the crawl starts, cancelled at the first URL batch
+        mock_cancellation_flag.is_cancelled = AsyncMock(side_effect=[False, True])
+        orchestrator = StepOrchestrator(
+            job_id="test-job-pipeline-cancel",
+            website_id="test-site-pipeline-cancel",
+            base_url="https://example.com",
+            steps=self.STEPS,
+            cancellation_flag=mock_cancellation_flag,
+            pipeline_steps=True,
+        )
+
+        with patch("httpx.AsyncClient.request", side_effect=self._mock_site(requested)):
+            context = await orchestrator.execute_workflow()
+
+        assert context.metadata.get("cancelled") is True
+        assert "fetch_list" not in context.step_results
+        assert "https://example.com/list?page=3" not in requested
+        assert not any("/article/" in url for url in requested)
+
+    @pytest.mark.asyncio
+    async def test_only_unconditional_scrape_is_pipelined(self):
+        """Test a scrape step with a condition waits for its crawl step."""
+        conditional_steps = [
+            self.STEPS[0],
+            {**self.STEPS[1], "skip_if": "{{fetch_list.article_urls}} empty"},
+        ]
+
+        for steps, expected in [(self.STEPS, "fetch_articles"), (conditional_steps, None)]:
+            orchestrator = StepOrchestrator(
+                job_id="test-job-pipeline-condition",
+                website_id="test-site-pipeline-condition",
+                base_url="https://example.com",
+                steps=steps,
+                pipeline_steps=True,
+            )
+            orchestrator.dependency_validator = DependencyValidator(steps)
+            orchestrator.dependency_validator.validate()
+
+            consumer = orchestrator._get_pipeline_consumer(steps[0])
+
+            assert (consumer["name"] if consumer else None) == expected
@@ -7,6 +7,7 @@ from uuid import UUID, uuid7
 import pytest
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from crawler.db.generated import content_hash
 from crawler.db.generated.models import ContentHash
 from crawler.db.repositories.content_hash import ContentHashRepository
 
@@ -166,3 +167,120 @@ class TestContentHashRepository:
         )  # None because already exists
         assert result2.occurrence_count == 2
         assert result2.first_seen_page_id == first_result.first_seen_page_id  # Unchanged
+
+    async def test_find_similar_uses_band_index_for_small_distances(self) -> None:
+        """Test find_similar probes the band indexes when max_distance <= 3."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = ContentHashRepository(mock_conn)
+
+        captured: dict = {}
+
+        async def fake_banded(**kwargs):
+            captured.update(kwargs)
+            for row in ():
+                yield row
+
+        repo._querier.find_similar_content_by_bands = fake_banded
+        repo._querier.find_similar_content = MagicMock()
+
+        fingerprint = 0xFFFF000300020001  # Above 2^63, stored as negative BIGINT
+        await repo.find_similar(target_fingerprint=fingerprint, max_distance=3, limit=1)
+
+        assert captured["target_fingerprint"] == fingerprint - (1 << 64)
+        assert (captured["band_0"], captured["band_1"], captured["band_2"]) == (1, 2, 3)
+        assert captured["band_3"] == 0xFFFF
+        assert captured["max_distance"] == 3
+        repo._querier.find_similar_content.assert_not_called()
+
+    async def test_find_similar_falls_back_to_scan_for_large_distances(self) -> None:
+        """Test find_similar uses the full-scan query when bands cannot guarantee recall."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = ContentHashRepository(mock_conn)
+
+        async def fake_scan(**kwargs):
+            for row in ():
+                yield row
+
+        repo._querier.find_similar_content = MagicMock(side_effect=fake_scan)
+        repo._querier.find_similar_content_by_bands = MagicMock()
+
+        await repo.find_similar(target_fingerprint=12345, max_distance=10)
+
+        repo._querier.find_similar_content.assert_called_once()
+        repo._querier.find_similar_content_by_bands.assert_not_called()
+
+    async def test_bulk_upsert_converts_fingerprints_to_signed(self) -> None:
+        """Test bulk_upsert stores fingerprints as signed BIGINT and keeps missing ones."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = ContentHashRepository(mock_conn)
+        repo._querier.bulk_upsert_content_hashes = AsyncMock()
+
+        page_ids = [uuid7(), uuid7()]
+        await repo.bulk_upsert(
+            content_hashes=["hash1", "hash2"],
+            first_seen_page_ids=page_ids,
+            occurrence_counts=[2, 1],
+            simhash_fingerprints=[1 << 63, None],
+        )
+
+        called_args = repo._querier.bulk_upsert_content_hashes.call_args
+        assert called_args.kwargs["content_hashes"] == ["hash1", "hash2"]
+        assert called_args.kwargs["first_seen_page_ids"] == page_ids
+        assert called_args.kwargs["occurrence_counts"] == [2, 1]
+        assert called_args.kwargs["simhash_fingerprints"] == [-(1 << 63), None]
+
+    async def test_find_similar_batch_maps_matches_to_unsigned_targets(self) -> None:
+        """Test find_similar_batch keys matches by the caller's unsigned fingerprint."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = ContentHashRepository(mock_conn)
+
+        fingerprint = 0xFFFF000300020001
+        captured: dict = {}
+
+        async def fake_batch(**kwargs):
+            captured.update(kwargs)
+            yield content_hash.FindSimilarContentBatchRow(
+                target_fingerprint=fingerprint - (1 << 64),
+                content_hash="original",
+                hamming_distance=2,
+            )
+
+        repo._querier.find_similar_content_batch = fake_batch
+
+        matches = await repo.find_similar_batch(target_fingerprints=[fingerprint, 42])
+
+        assert captured["target_fingerprints"] == [fingerprint - (1 << 64), 42]
+        assert captured["max_distance"] == 3
+        assert list(matches) == [fingerprint]
+        assert matches[fingerprint].content_hash == "original"
+
+    async def test_find_similar_batch_rejects_large_distances(self) -> None:
+        """Test find_similar_batch refuses distances the band indexes cannot answer."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = ContentHashRepository(mock_conn)
+
+        with pytest.raises(ValueError, match="max_distance"):
+            await repo.find_similar_batch(target_fingerprints=[1], max_distance=4)
+
+    async def test_list_for_clustering_returns_unsigned_fingerprints(self) -> None:
+        """Test list_for_clustering pages by hash and converts fingerprints to unsigned."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = ContentHashRepository(mock_conn)
+
+        captured: dict = {}
+
+        async def fake_list(**kwargs):
+            captured.update(kwargs)
+            yield content_hash.ListContentHashesForClusteringRow(
+                content_hash="b", simhash_fingerprint=-1, occurrence_count=1
+            )
+            yield content_hash.ListContentHashesForClusteringRow(
+                content_hash="c", simhash_fingerprint=None, occurrence_count=3
+            )
+
+        repo._querier.list_content_hashes_for_clustering = fake_list
+
+        rows = await repo.list_for_clustering(after_hash="a", limit=2)
+
+        assert captured == {"after_hash": "a", "limit_count": 2}
+        assert [row.simhash_fingerprint for row in rows] == [(1 << 64) - 1, None]
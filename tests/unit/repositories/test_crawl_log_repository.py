@@ -291,3 +291,70 @@ class TestCrawlLogRepository:
         assert called_args.kwargs["context"] == json.dumps(context)
         assert isinstance(called_args.kwargs["trace_id"], UUID)
         assert result == mock_log
+
+    async def test_get_job_logs_filtered_routes_search_to_search_query(self) -> None:
+        """Test a search uses the indexed search queries and passes the count cap."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = CrawlLogRepository(mock_conn)
+
+        mock_logs = [
+            CrawlLog(
+                id=i,
+                job_id=uuid7(),
+                website_id=uuid7(),
+                step_name=None,
+                log_level=LogLevelEnum.ERROR,
+                message=f"Error {i}",
+                context=None,
+                trace_id=None,
+                created_at=datetime.now(UTC),
+            )
+            for i in range(2)
+        ]
+
+        async def mock_generator():
+            for log in mock_logs:
+                yield log
+
+        repo._querier.search_job_logs = MagicMock(return_value=mock_generator())
+        repo._querier.get_job_logs_filtered = MagicMock()
+        repo._querier.count_job_log_search = AsyncMock(return_value=7)
+
+        logs, total = await repo.get_job_logs_filtered(
+            job_id=uuid7(), search_text="error", limit=2, count_cap=5
+        )
+
+        assert logs == mock_logs
+        assert total == 7
+        repo._querier.get_job_logs_filtered.assert_not_called()
+        assert repo._querier.search_job_logs.call_args.kwargs["search_text"] == "error"
+        assert repo._querier.count_job_log_search.call_args.kwargs["count_cap"] == 5
+
+    async def test_get_job_logs_filtered_skips_count_for_short_first_page(self) -> None:
+        """Test a first page shorter than the limit is used as the total."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = CrawlLogRepository(mock_conn)
+
+        mock_log = CrawlLog(
+            id=1,
+            job_id=uuid7(),
+            website_id=uuid7(),
+            step_name=None,
+            log_level=LogLevelEnum.INFO,
+            message="Only log",
+            context=None,
+            trace_id=None,
+            created_at=datetime.now(UTC),
+        )
+
+        async def mock_generator():
+            yield mock_log
+
+        repo._querier.get_job_logs_filtered = MagicMock(return_value=mock_generator())
+        repo._querier.count_job_logs_filtered = AsyncMock()
+
+        logs, total = await repo.get_job_logs_filtered(job_id=uuid7(), limit=10)
+
+        assert logs == [mock_log]
+        assert total == 1
+        repo._querier.count_job_logs_filtered.assert_not_called()
@@ -8,6 +8,7 @@ from uuid import UUID, uuid7
 import pytest
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from crawler.db.generated import crawled_page
 from crawler.db.generated.models import CrawledPage
 from crawler.db.repositories.crawled_page import CrawledPageRepository
 
@@ -263,3 +264,53 @@ class TestCrawledPageRepository:
         called_args = repo._querier.mark_page_as_duplicate.call_args
         assert called_args.kwargs["duplicate_of"] is None
         assert result == mock_page
+
+    async def test_bulk_upsert_maps_url_hashes_to_ids(self) -> None:
+        """Test bulk_upsert converts IDs and returns page IDs keyed by URL hash."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = CrawledPageRepository(mock_conn)
+
+        page_ids = {"hash1": uuid7(), "hash2": uuid7()}
+        captured: dict = {}
+
+        async def fake_bulk_upsert(**kwargs):
+            captured.update(kwargs)
+            for url_hash in kwargs["url_hashes"]:
+                yield crawled_page.BulkUpsertCrawledPagesRow(
+                    id=page_ids[url_hash], url_hash=url_hash
+                )
+
+        repo._querier.bulk_upsert_crawled_pages = fake_bulk_upsert
+
+        website_id = "550e8400-e29b-41d4-a716-446655440000"
+        result = await repo.bulk_upsert(
+            website_id=website_id,
+            job_id=uuid7(),
+            crawled_at=datetime.now(UTC),
+            urls=["https://example.com/1", "https://example.com/2"],
+            url_hashes=["hash1", "hash2"],
+            content_hashes=["content1", "content2"],
+            titles=["Page 1", None],
+            extracted_contents=["{}", "{}"],
+        )
+
+        assert result == page_ids
+        assert isinstance(captured["website_id"], UUID)
+        assert str(captured["website_id"]) == website_id
+        assert captured["titles"] == ["Page 1", None]
+
+    async def test_get_first_by_content_hashes_returns_mapping(self) -> None:
+        """Test get_first_by_content_hashes collects rows into a hash-to-ID mapping."""
+        mock_conn = MagicMock(spec=AsyncConnection)
+        repo = CrawledPageRepository(mock_conn)
+
+        page_id = uuid7()
+
+        async def fake_first_pages(**kwargs):
+            yield crawled_page.GetFirstPagesByContentHashesRow(id=page_id, content_hash="content1")
+
+        repo._querier.get_first_pages_by_content_hashes = fake_first_pages
+
+        result = await repo.get_first_by_content_hashes(["content1", "missing"])
+
+        assert result == {"content1": page_id}
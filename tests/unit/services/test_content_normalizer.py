@@ -1,9 +1,23 @@
 """Unit tests for ContentNormalizer service."""
 
+import json
+from pathlib import Path
+
 import pytest
 
 from crawler.services.content_normalizer import ContentNormalizer
 
+# Pages with outputs recorded from the original BeautifulSoup implementation
+CORPUS_DIR = Path(__file__).parents[2] / "fixtures" / "normalizer"
+EXPECTED = json.loads((CORPUS_DIR / "expected.json").read_text(encoding="utf-8"))
+
+# normalize() arguments for each mode recorded in expected.json
+MODES = {
+    "hash": {},
+    "structured": {"preserve_structure": True},
+    "full_document": {"extract_main_only": False, "remove_timestamps": False},
+}
+
 
 @pytest.fixture
 def normalizer() -> ContentNormalizer:
@@ -658,3 +672,57 @@ class TestContentNormalizer:
         # Should still remove boilerplate tags (nav, header, footer)
         # but won't isolate to <main> or <article>
         assert "content" in result
+
+    def test_comment_separates_strings(self, normalizer: ContentNormalizer) -> None:
+        """Test text around a removed comment stays two separate strings."""
+        html = "<html><body><p>before<!-- note -->after</p></body></html>"
+
+        assert normalizer.normalize(html) == "before after"
+
+    def test_hidden_text_is_ignored(self, normalizer: ContentNormalizer) -> None:
+        """Test template content and ruby annotations are not part of the text."""
+        html = """
+        <html><body>
+            <p><ruby>漢<rt>kan</rt></ruby> text</p>
+            <template><p>Template row</p></template>
+        </body></html>
+        """
+
+        assert normalizer.normalize(html) == "漢 text"
+
+    def test_structure_excludes_paragraph_wrapping_main(
+        self, normalizer: ContentNormalizer
+    ) -> None:
+        """Test a paragraph that contains the main element is not one of its paragraphs."""
+        html = "<html><body><p><main><li>Item</li></main></p></body></html>"
+
+        assert normalizer.normalize(html, preserve_structure=True) == "item"
+
+    def test_ad_class_on_root_removes_everything(self, normalizer: ContentNormalizer) -> None:
+        """Test an ad class on the html element leaves no content."""
+        html = '<html class="ad-wrapper"><body><p>Content</p></body></html>'
+
+        assert normalizer.normalize(html) == ""
+
+
+class TestFixtureParity:
+    """Output on the fixture corpus matches the original BeautifulSoup implementation."""
+
+    @pytest.mark.parametrize("page", sorted(EXPECTED))
+    @pytest.mark.parametrize("mode", sorted(MODES))
+    def test_matches_expected_output(
+        self, normalizer: ContentNormalizer, page: str, mode: str
+    ) -> None:
+        """Test normalized output equals the recorded output."""
+        html = (CORPUS_DIR / page).read_text(encoding="utf-8")
+
+        assert normalizer.normalize(html, **MODES[mode]) == EXPECTED[page][mode]
+
+    def test_bytes_input_matches_string_input(self, normalizer: ContentNormalizer) -> None:
+        """Test bytes are decoded as UTF-8 before parsing."""
+        html = (CORPUS_DIR / "hidden_text.html").read_text(encoding="utf-8")
+
+        assert (
+            normalizer.normalize_for_hash(html.encode("utf-8"))
+            == EXPECTED["hidden_text.html"]["hash"]
+        )
@@ -0,0 +1,165 @@
+"""Unit tests for the buffered crawl log sink."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from crawler.db.generated.models import LogLevelEnum
+from crawler.services.crawl_log_sink import CrawlLogSink, LogDropPolicy
+
+JOB_ID = str(uuid4())
+WEBSITE_ID = str(uuid4())
+
+
+@asynccontextmanager
+async def _connection() -> AsyncIterator[MagicMock]:
+    """Yield a fake database connection."""
+    yield MagicMock()
+
+
+@pytest.fixture
+def repo() -> Iterator[MagicMock]:
+    """Patch the crawl log repository used by the sink."""
+    repository = MagicMock()
+
+    async def create_many(**kwargs):
+        return [MagicMock() for _ in kwargs["messages"]]
+
+    repository.create_many = AsyncMock(side_effect=create_many)
+    with patch("crawler.services.crawl_log_sink.CrawlLogRepository", return_value=repository):
+        yield repository
+
+
+def _written(repo: MagicMock) -> list[str]:
+    """Messages passed to create_many, in call order."""
+    return [
+        message for call in repo.create_many.call_args_list for message in call.kwargs["messages"]
+    ]
+
+
+class TestCrawlLogSink:
+    """Tests for CrawlLogSink."""
+
+    async def test_flush_writes_buffered_entries_in_batches(self, repo: MagicMock) -> None:
+        """flush() writes every buffered entry, at most batch_size per INSERT."""
+        sink = CrawlLogSink(_connection, batch_size=2, max_buffer_size=10)
+
+        for index in range(5):
+            assert sink.write(JOB_ID, WEBSITE_ID, f"log {index}", step_name="list")
+
+        assert await sink.flush() == 5
+        assert _written(repo) == [f"log {index}" for index in range(5)]
+        assert [len(call.kwargs["messages"]) for call in repo.create_many.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+        kwargs = repo.create_many.call_args.kwargs
+        assert str(kwargs["job_ids"][0]) == JOB_ID
+        assert kwargs["log_levels"] == [LogLevelEnum.INFO]
+        assert kwargs["step_names"] == ["list"]
+        assert sink.pending == 0
+
+    async def test_drop_oldest_keeps_recent_entries(self, repo: MagicMock) -> None:
+        """A full buffer evicts its oldest entry under the drop_oldest policy."""
+        sink = CrawlLogSink(_connection, max_buffer_size=3)
+
+        results = [sink.write(JOB_ID, WEBSITE_ID, f"log {index}") for index in range(5)]
+        await sink.flush()
+
+        assert results == [True] * 5
+        assert _written(repo) == ["log 2", "log 3", "log 4"]
+        assert sink.entries_dropped == 2
+
+    async def test_drop_newest_keeps_buffered_entries(self, repo: MagicMock) -> None:
+        """A full buffer rejects new entries under the drop_newest policy."""
+        sink = CrawlLogSink(_connection, max_buffer_size=3, drop_policy=LogDropPolicy.DROP_NEWEST)
+
+        results = [sink.write(JOB_ID, WEBSITE_ID, f"log {index}") for index in range(5)]
+        await sink.flush()
+
+        assert results == [True, True, True, False, False]
+        assert _written(repo) == ["log 0", "log 1", "log 2"]
+        assert sink.entries_dropped == 2
+
+    async def test_full_batch_triggers_flush(self, repo: MagicMock) -> None:
+        """The background task flushes as soon as a batch fills up."""
+        sink = CrawlLogSink(_connection, batch_size=2, flush_interval=60)
+        await sink.start()
+
+        sink.write(JOB_ID, WEBSITE_ID, "first")
+        sink.write(JOB_ID, WEBSITE_ID, "second")
+        await asyncio.sleep(0.01)
+
+        assert _written(repo) == ["first", "second"]
+        await sink.close()
+
+    async def test_interval_flushes_partial_batch(self, repo: MagicMock) -> None:
+        """A partial batch is flushed once the flush interval passes."""
+        sink = CrawlLogSink(_connection, batch_size=100, flush_interval=0.01)
+        await sink.start()
+
+        sink.write(JOB_ID, WEBSITE_ID, "only")
+        await asyncio.sleep(0.05)
+
+        assert _written(repo) == ["only"]
+        await sink.close()
+
+    async def test_failed_flush_drops_batch(self, repo: MagicMock) -> None:
+        """A batch that fails to insert is counted as dropped instead of raising."""
+        repo.create_many.side_effect = RuntimeError("database unavailable")
+        sink = CrawlLogSink(_connection)
+
+        sink.write(JOB_ID, WEBSITE_ID, "lost")
+
+        assert await sink.flush() == 0
+        assert sink.entries_dropped == 1
+        assert sink.pending == 0
+
+    async def test_publishes_batch_after_commit(self, repo: MagicMock) -> None:
+        """Entries are published only once the transaction inserting them commits."""
+        events: list[str] = []
+
+        @asynccontextmanager
+        async def connection() -> AsyncIterator[MagicMock]:
+            yield MagicMock()
+            events.append("commit")
+
+        publisher = MagicMock()
+        publisher.publish_logs_batch = AsyncMock(
+            side_effect=lambda logs: events.append(f"publish {len(logs)}")
+        )
+        sink = CrawlLogSink(connection, log_publisher=publisher)
+
+        sink.write(JOB_ID, WEBSITE_ID, "first")
+        sink.write(JOB_ID, WEBSITE_ID, "second")
+        await sink.flush()
+
+        assert events == ["commit", "publish 2"]
+
+    async def test_publish_failure_keeps_written_entries(self, repo: MagicMock) -> None:
+        """A failed publish does not count committed entries as dropped."""
+        publisher = MagicMock()
+        publisher.publish_logs_batch = AsyncMock(side_effect=RuntimeError("nats down"))
+        sink = CrawlLogSink(_connection, log_publisher=publisher)
+
+        sink.write(JOB_ID, WEBSITE_ID, "saved")
+
+        assert await sink.flush() == 1
+        assert sink.entries_dropped == 0
+
+    async def test_close_flushes_and_rejects_later_writes(self, repo: MagicMock) -> None:
+        """close() writes what is buffered; entries written afterwards are dropped."""
+        sink = CrawlLogSink(_connection, flush_interval=60)
+        await sink.start()
+        sink.write(JOB_ID, WEBSITE_ID, "before close")
+
+        await sink.close()
+
+        assert not sink.is_running
+        assert _written(repo) == ["before close"]
+        assert sink.write(JOB_ID, WEBSITE_ID, "after close") is False
@@ -0,0 +1,136 @@
+"""Unit tests for duplicate clustering service."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from crawler.db.generated.content_hash import ListContentHashesForClusteringRow
+from crawler.db.generated.crawled_page import ListPageIdsByContentHashesRow
+from crawler.services.duplicate_clustering import DETECTED_BY, DuplicateClusteringService
+
+
+class TestDuplicateClusteringService:
+    """Tests for DuplicateClusteringService class."""
+
+    @pytest.fixture
+    def service(self) -> DuplicateClusteringService:
+        """Create service with repositories mocked."""
+        service = DuplicateClusteringService(MagicMock(), batch_size=2)
+        service.content_hash_repo = MagicMock()
+        service.page_repo = MagicMock()
+
+        async def get_or_create_groups(canonical_page_ids):
+            return {page_id: uuid4() for page_id in canonical_page_ids}
+
+        service.duplicate_repo = MagicMock()
+        service.duplicate_repo.remove_detected_groups = AsyncMock()
+        service.duplicate_repo.get_or_create_groups = AsyncMock(side_effect=get_or_create_groups)
+        service.duplicate_repo.add_duplicates_bulk = AsyncMock()
+        return service
+
+    @staticmethod
+    def _hashes(*rows: tuple[str, int | None]) -> list[ListContentHashesForClusteringRow]:
+        """Create content hash rows from (hash, fingerprint) pairs."""
+        return [
+            ListContentHashesForClusteringRow(
+                content_hash=value, simhash_fingerprint=fingerprint, occurrence_count=2
+            )
+            for value, fingerprint in rows
+        ]
+
+    @staticmethod
+    def _pages(*rows: tuple[UUID, str]) -> AsyncMock:
+        """Create a page lookup returning the (id, hash) rows of the requested hashes."""
+
+        async def list_ids_by_content_hashes(content_hashes):
+            return [
+                ListPageIdsByContentHashesRow(id=page_id, content_hash=value)
+                for page_id, value in rows
+                if value in content_hashes
+            ]
+
+        return AsyncMock(side_effect=list_ids_by_content_hashes)
+
+    async def test_loads_content_hashes_with_keyset_paging(
+        self, service: DuplicateClusteringService
+    ) -> None:
+        """Content hashes are read page by page after the last hash of each page."""
+        service.content_hash_repo.list_for_clustering = AsyncMock(
+            side_effect=[self._hashes(("a", 1), ("b", 2)), self._hashes(("c", None))] * 2
+        )
+        service.page_repo.list_ids_by_content_hashes = AsyncMock(return_value=[])
+
+        stats = await service.rebuild_groups()
+
+        # Read once for the fingerprints and once for the groups
+        calls = service.content_hash_repo.list_for_clustering.call_args_list
+        assert [call.kwargs["after_hash"] for call in calls] == ["", "b", "", "b"]
+        assert stats["content_hashes"] == 3
+        assert stats["groups"] == 0
+        service.duplicate_repo.remove_detected_groups.assert_awaited_once()
+
+    async def test_groups_exact_and_fuzzy_duplicates(
+        self, service: DuplicateClusteringService
+    ) -> None:
+        """Pages of near-duplicate hashes join the group of the earliest page."""
+        service.batch_size = 100
+        service.content_hash_repo.list_for_clustering = AsyncMock(
+            return_value=self._hashes(
+                ("original", 0b0000), ("near", 0b0011), ("other", (1 << 64) - 1)
+            )
+        )
+        first, exact, fuzzy = uuid4(), uuid4(), uuid4()
+        service.page_repo.list_ids_by_content_hashes = self._pages(
+            (first, "original"), (fuzzy, "near"), (exact, "original"), (uuid4(), "other")
+        )
+
+        stats = await service.rebuild_groups(max_distance=3)
+
+        service.duplicate_repo.get_or_create_groups.assert_awaited_once_with([first])
+        kwargs = service.duplicate_repo.add_duplicates_bulk.call_args.kwargs
+        assert kwargs["duplicate_page_ids"] == [fuzzy, exact]
+        assert kwargs["detection_methods"] == ["fuzzy_match", "exact_hash"]
+        assert kwargs["similarity_scores"] == [96, None]  # Distance 2
+        assert kwargs["confidence_thresholds"] == [2, None]
+        assert kwargs["detected_by"] == DETECTED_BY
+        assert len(set(kwargs["group_ids"])) == 1
+        assert stats == {
+            "content_hashes": 3,
+            "clusters": 2,
+            "groups": 1,
+            "exact_duplicates": 1,
+            "fuzzy_duplicates": 1,
+        }
+
+    async def test_writes_groups_in_batches(self, service: DuplicateClusteringService) -> None:
+        """Clusters are resolved to pages a batch of content hashes at a time."""
+        service.content_hash_repo.list_for_clustering = AsyncMock(
+            side_effect=[self._hashes(("a", None), ("b", None)), self._hashes(("c", None))] * 2
+        )
+        service.page_repo.list_ids_by_content_hashes = AsyncMock(return_value=[])
+
+        await service.rebuild_groups()
+
+        calls = service.page_repo.list_ids_by_content_hashes.call_args_list
+        assert [call.args[0] for call in calls] == [["a", "b"], ["c"]]
+
+    async def test_stores_distance_to_canonical_page(
+        self, service: DuplicateClusteringService
+    ) -> None:
+        """Members joined through a chain store their own distance to the canonical page."""
+        service.batch_size = 100
+        service.content_hash_repo.list_for_clustering = AsyncMock(
+            return_value=self._hashes(("a", 0b0000), ("b", 0b0011), ("c", 0b1111))
+        )
+        first, middle, last = uuid4(), uuid4(), uuid4()
+        service.page_repo.list_ids_by_content_hashes = self._pages(
+            (first, "a"), (middle, "b"), (last, "c")
+        )
+
+        stats = await service.rebuild_groups(max_distance=2)
+
+        kwargs = service.duplicate_repo.add_duplicates_bulk.call_args.kwargs
+        assert kwargs["duplicate_page_ids"] == [middle, last]
+        assert kwargs["confidence_thresholds"] == [2, 4]
+        assert stats["fuzzy_duplicates"] == 2
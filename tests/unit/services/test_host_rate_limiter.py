@@ -0,0 +1,89 @@
+"""Unit tests for the cluster-wide per-host rate limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crawler.services.redis_cache import HostRateLimiter
+
+
+@pytest.fixture
+def settings() -> MagicMock:
+    """Create settings with host rate limit defaults."""
+    settings = MagicMock()
+    settings.host_requests_per_second = 2.0
+    settings.host_rate_limit_burst = 10
+    settings.host_rate_limit_lease_size = 4
+    return settings
+
+
+def _limiter(settings: MagicMock, *responses: object) -> tuple[HostRateLimiter, AsyncMock]:
+    """Create a limiter whose GCRA script returns the given responses in order."""
+    script = AsyncMock(side_effect=list(responses))
+    redis_client = MagicMock()
+    redis_client.register_script.return_value = script
+    return HostRateLimiter(redis_client, settings), script
+
+
+class TestHostRateLimiter:
+    """Tests for HostRateLimiter class."""
+
+    async def test_leased_slots_avoid_round_trips(self, settings: MagicMock) -> None:
+        """One script call grants a lease that serves the next requests to the host."""
+        limiter, script = _limiter(settings, [4, "0"])
+
+        for _ in range(4):
+            assert await limiter.acquire("https://Example.com/page") == pytest.approx(0, abs=0.05)
+
+        script.assert_awaited_once()
+        kwargs = script.call_args.kwargs
+        assert kwargs["keys"] == ["politeness:host:example.com"]
+        assert kwargs["args"] == [500.0, 10, 4]
+
+    async def test_hosts_are_paced_separately(self, settings: MagicMock) -> None:
+        """Each host has its own key and lease."""
+        limiter, script = _limiter(settings, [1, "0"], [1, "0"])
+
+        await limiter.acquire("https://a.example.com/")
+        await limiter.acquire("https://b.example.com/")
+
+        keys = [call.kwargs["keys"][0] for call in script.call_args_list]
+        assert keys == ["politeness:host:a.example.com", "politeness:host:b.example.com"]
+
+    async def test_waits_until_slot_is_granted(self, settings: MagicMock) -> None:
+        """A denied request sleeps for the returned delay and asks again."""
+        limiter, script = _limiter(settings, [0, "20"], [1, "0"])
+
+        waited = await limiter.acquire("https://example.com/", requests_per_second=50, burst=1)
+
+        assert script.await_count == 2
+        assert waited >= 0.015
+        assert script.call_args.kwargs["args"] == [20.0, 1, 1]
+
+    async def test_redis_errors_do_not_block_requests(self, settings: MagicMock) -> None:
+        """Requests proceed when Redis is unavailable."""
+        limiter, script = _limiter(settings, ConnectionError("redis down"))
+
+        assert await limiter.acquire("https://example.com/") == pytest.approx(0, abs=0.05)
+        script.assert_awaited_once()
+
+    async def test_url_without_host_is_not_paced(self, settings: MagicMock) -> None:
+        """URLs without a host skip the script entirely."""
+        limiter, script = _limiter(settings)
+
+        assert await limiter.acquire("not a url") == 0.0
+        script.assert_not_awaited()
+
+    async def test_idle_hosts_are_forgotten(self, settings: MagicMock) -> None:
+        """Hosts with an expired lease and no request in progress are dropped."""
+        limiter, _ = _limiter(settings, [1, "0"], [1, "0"])
+        limiter.PRUNE_INTERVAL = 0
+
+        await limiter.acquire("https://a.example.com/", requests_per_second=1000)
+        assert "a.example.com" not in limiter._locks
+        await asyncio.sleep(0.01)  # a's lease expires after 1 ms
+        await limiter.acquire("https://b.example.com/", requests_per_second=1000)
+
+        assert list(limiter._leases) == ["b.example.com"]
+        assert limiter._locks == {}
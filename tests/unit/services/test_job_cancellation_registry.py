@@ -0,0 +1,109 @@
+"""Unit tests for pushed job cancellations."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crawler.services.redis_cache import JobCancellationFlag, JobCancellationRegistry
+
+
+@pytest.fixture
+def redis_client() -> MagicMock:
+    """Create a Redis client mock without any cancellation flags set."""
+    client = MagicMock()
+    client.setex = AsyncMock()
+    client.publish = AsyncMock()
+    client.exists = AsyncMock(return_value=0)
+    return client
+
+
+@pytest.fixture
+def flag(redis_client: MagicMock) -> JobCancellationFlag:
+    """Create cancellation flags on the Redis client mock."""
+    settings = MagicMock()
+    settings.redis_ttl = 3600
+    return JobCancellationFlag(redis_client, settings)
+
+
+def _pubsub(*job_ids: bytes) -> MagicMock:
+    """Create a pub/sub mock delivering a cancellation message per job ID."""
+
+    async def listen():
+        for job_id in job_ids:
+            yield {"type": "message", "data": job_id}
+        # Stay subscribed like a live connection
+        await asyncio.Event().wait()
+
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.aclose = AsyncMock()
+    pubsub.listen = listen
+    return pubsub
+
+
+class TestJobCancellationFlag:
+    """Tests for JobCancellationFlag publishing."""
+
+    async def test_set_cancellation_publishes_job_id(
+        self, flag: JobCancellationFlag, redis_client: MagicMock
+    ) -> None:
+        """Setting a flag pushes the job ID to listening workers."""
+        assert await flag.set_cancellation("job-1", reason="user request")
+
+        redis_client.setex.assert_awaited_once()
+        redis_client.publish.assert_awaited_once_with("job:cancel", "job-1")
+
+    async def test_publish_failure_keeps_flag(
+        self, flag: JobCancellationFlag, redis_client: MagicMock
+    ) -> None:
+        """A failed push still reports success, since workers find the flag."""
+        redis_client.publish.side_effect = ConnectionError("down")
+
+        assert await flag.set_cancellation("job-1")
+
+
+class TestJobCancellationRegistry:
+    """Tests for JobCancellationRegistry class."""
+
+    async def test_register_reads_flag(
+        self, flag: JobCancellationFlag, redis_client: MagicMock
+    ) -> None:
+        """A job cancelled before it registers starts with its event set."""
+        redis_client.exists.return_value = 1
+        registry = JobCancellationRegistry(flag)
+
+        event = await registry.register("job-1")
+
+        assert event.is_set()
+        assert registry.get_event("job-1") is event
+
+    async def test_cancel_only_affects_registered_jobs(self, flag: JobCancellationFlag) -> None:
+        """Cancellations of jobs running elsewhere are ignored."""
+        registry = JobCancellationRegistry(flag)
+        event = await registry.register("job-1")
+
+        assert registry.cancel("job-2") is False
+        assert not event.is_set()
+        assert registry.cancel("job-1") is True
+        assert event.is_set()
+
+        registry.unregister("job-1")
+        assert registry.get_event("job-1") is None
+
+    async def test_listener_sets_event_of_published_job(
+        self, flag: JobCancellationFlag, redis_client: MagicMock
+    ) -> None:
+        """A published cancellation sets the job's event without polling."""
+        redis_client.pubsub.return_value = _pubsub(b"job-2", b"job-1")
+        registry = JobCancellationRegistry(flag)
+        event = await registry.register("job-1")
+
+        await registry.start()
+        try:
+            await asyncio.wait_for(event.wait(), timeout=1)
+        finally:
+            await registry.stop()
+
+        redis_client.pubsub.return_value.subscribe.assert_awaited_once_with("job:cancel")
+        assert redis_client.exists.await_count == 2  # on register and after subscribing
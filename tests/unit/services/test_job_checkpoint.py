@@ -0,0 +1,140 @@
+"""Unit tests for job checkpoints."""
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from crawler.db.generated.models import JobStepCheckpoint
+from crawler.services.job_checkpoint import JobCheckpoint, config_hash
+from crawler.services.result_persistence import hash_content
+from crawler.services.step_execution_context import StepResult
+
+JOB_ID = str(uuid4())
+STEP = {"name": "list", "type": "crawl", "config": {"url": "https://example.com"}}
+
+
+@asynccontextmanager
+async def _connection() -> AsyncIterator[MagicMock]:
+    """Yield a fake database connection."""
+    yield MagicMock()
+
+
+@pytest.fixture
+def repo() -> Iterator[MagicMock]:
+    """Patch the job checkpoint repository used by the checkpoint."""
+    repository = MagicMock()
+    repository.list_steps = AsyncMock(return_value=[])
+    repository.save_step = AsyncMock()
+    repository.save_pages = AsyncMock()
+    repository.delete = AsyncMock()
+    with patch("crawler.services.job_checkpoint.JobCheckpointRepository", return_value=repository):
+        yield repository
+
+
+class TestJobCheckpoint:
+    """Tests for JobCheckpoint."""
+
+    def test_config_hash_ignores_key_order(self) -> None:
+        """The hash identifies a configuration regardless of key order."""
+        reordered = {"config": {"url": "https://example.com"}, "type": "crawl", "name": "list"}
+
+        assert config_hash(reordered) == config_hash(STEP)
+        assert config_hash({**STEP, "type": "scrape"}) != config_hash(STEP)
+
+    async def test_restores_step_saved_with_same_config(self, repo: MagicMock) -> None:
+        """A step is restored only while its configuration is unchanged."""
+        repo.list_steps.return_value = [
+            JobStepCheckpoint(
+                job_id=uuid4(),
+                step_name="list",
+                config_hash=config_hash(STEP),
+                result={"status_code": 200, "extracted_data": {"urls": ["a"]}, "metadata": {}},
+                created_at=datetime.now(UTC),
+            )
+        ]
+        checkpoint = JobCheckpoint(_connection, JOB_ID)
+
+        await checkpoint.load()
+        restored = checkpoint.get_step(STEP)
+
+        assert restored is not None
+        assert restored.extracted_data == {"urls": ["a"]}
+        assert restored.metadata["resumed"] is True
+        assert checkpoint.get_step({**STEP, "config": {"url": "https://other.com"}}) is None
+
+    async def test_save_step_leaves_content_out(self, repo: MagicMock) -> None:
+        """Saved steps keep extracted data and metadata, not raw content."""
+        checkpoint = JobCheckpoint(_connection, JOB_ID)
+
+        await checkpoint.save_step(
+            STEP,
+            StepResult(
+                step_name="list", status_code=200, content="<html>", extracted_data={"a": 1}
+            ),
+        )
+
+        job_id, step_name, step_hash, payload = repo.save_step.call_args.args
+        assert (job_id, step_name, step_hash) == (JOB_ID, "list", config_hash(STEP))
+        assert payload == {"status_code": 200, "extracted_data": {"a": 1}, "metadata": {}}
+        assert checkpoint.get_step(STEP) is not None
+
+    async def test_pages_written_in_batches(self, repo: MagicMock) -> None:
+        """Recorded pages are written once a batch fills up and on flush."""
+        checkpoint = JobCheckpoint(_connection, JOB_ID, batch_size=2)
+        record = checkpoint.page_recorder(STEP)
+
+        for index in range(3):
+            await record({"_url": f"https://example.com/{index}"})
+        assert repo.save_pages.await_count == 1
+
+        await checkpoint.flush()
+
+        assert [len(call.args[3]) for call in repo.save_pages.call_args_list] == [2, 1]
+
+    async def test_pages_recorded_without_raw_content(self, repo: MagicMock) -> None:
+        """Pages keep their URL, fields and content hash; the raw HTML is not written."""
+        checkpoint = JobCheckpoint(_connection, JOB_ID)
+        record = checkpoint.page_recorder(STEP)
+
+        await record({"_url": "https://example.com", "_content": "<html>", "title": "A"})
+        await checkpoint.flush()
+
+        [page] = repo.save_pages.call_args.args[3]
+        assert page == {
+            "_url": "https://example.com",
+            "_content_hash": hash_content("<html>"),
+            "title": "A",
+        }
+
+    async def test_pages_reference_uploaded_html(self, repo: MagicMock) -> None:
+        """With storage configured, the raw HTML is uploaded and its key recorded."""
+        storage = MagicMock()
+        storage.store_html = AsyncMock(side_effect=[OSError("bucket unavailable"), "html/b"])
+        checkpoint = JobCheckpoint(_connection, JOB_ID, storage=storage)
+        record = checkpoint.page_recorder(STEP)
+
+        await record({"_url": "https://example.com/a", "_content": "<a>"})
+        await record({"_url": "https://example.com/b", "_content": "<b>"})
+        await checkpoint.flush()
+
+        pages = repo.save_pages.call_args.args[3]
+        assert [page.get("_html_path") for page in pages] == [None, "html/b"]
+        assert all("_content" not in page for page in pages)
+        storage.store_html.assert_any_await("<b>", hash_content("<b>"))
+
+    async def test_storage_errors_are_swallowed(self, repo: MagicMock) -> None:
+        """A failing database never fails the job."""
+        repo.list_steps.side_effect = RuntimeError("db down")
+        repo.save_pages.side_effect = RuntimeError("db down")
+        repo.delete.side_effect = RuntimeError("db down")
+        checkpoint = JobCheckpoint(_connection, JOB_ID, batch_size=1)
+
+        await checkpoint.load()
+        await checkpoint.page_recorder(STEP)({"_url": "https://example.com"})
+        await checkpoint.clear()
+
+        assert checkpoint.get_step(STEP) is None
@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -296,3 +297,24 @@ class TestLocalRateLimiter:
             semaphore_acquired = False
 
         assert semaphore_acquired, "Semaphore should have been released when task was cancelled"
+
+    async def test_acquire_with_url_waits_for_host_limiter(self) -> None:
+        """acquire(url) also takes a cluster-wide slot for the URL's host."""
+        host_limiter = AsyncMock()
+        limiter = LocalRateLimiter(requests_per_second=5.0, burst=20, host_limiter=host_limiter)
+
+        async with limiter.acquire("https://example.com/page"):
+            pass
+
+        host_limiter.acquire.assert_awaited_once_with("https://example.com/page", 5.0, 20)
+
+    async def test_acquire_without_url_skips_host_limiter(self) -> None:
+        """Without a URL only the local limits apply."""
+        host_limiter = AsyncMock()
+        limiter = LocalRateLimiter.from_config({"requests_per_second": 5.0}, host_limiter)
+
+        async with limiter.acquire():
+            pass
+
+        assert limiter.host_limiter is host_limiter
+        host_limiter.acquire.assert_not_awaited()
@@ -0,0 +1,108 @@
+"""Unit tests for the streaming page persistence pipeline."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crawler.services.page_pipeline import PagePersistencePipeline
+
+
+def _page(index: int) -> dict:
+    """Create scraped page data."""
+    return {"_url": f"https://example.com/{index}", "_content": f"<p>{index}</p>"}
+
+
+@pytest.fixture
+def persistence() -> MagicMock:
+    """Create a persistence service that saves every page it receives."""
+    service = MagicMock()
+
+    async def persist_pages(job_id, website_id, pages):
+        return len(pages), 0
+
+    service.persist_pages = AsyncMock(side_effect=persist_pages)
+    return service
+
+
+class TestPagePersistencePipeline:
+    """Tests for PagePersistencePipeline."""
+
+    async def test_persists_all_submitted_pages(self, persistence: MagicMock) -> None:
+        """Every submitted page is written, in batches no larger than batch_size."""
+        pipeline = PagePersistencePipeline(
+            persistence, job_id="job", website_id="site", max_pending=10, batch_size=3
+        )
+        await pipeline.start()
+
+        for index in range(7):
+            await pipeline.submit(_page(index))
+        stats = await pipeline.stop()
+
+        assert stats == {"pages_saved": 7, "pages_failed": 0}
+        written = [
+            page["_url"]
+            for call in persistence.persist_pages.call_args_list
+            for page in call.kwargs["pages"]
+        ]
+        assert written == [_page(index)["_url"] for index in range(7)]
+        assert all(
+            len(call.kwargs["pages"]) <= 3 for call in persistence.persist_pages.call_args_list
+        )
+        assert persistence.persist_pages.call_args.kwargs["job_id"] == "job"
+
+    async def test_submit_waits_while_pipeline_is_full(self, persistence: MagicMock) -> None:
+        """Producers block once max_pending pages are waiting for persistence."""
+        release = asyncio.Event()
+
+        async def slow_persist(job_id, website_id, pages):
+            await release.wait()
+            return len(pages), 0
+
+        persistence.persist_pages = AsyncMock(side_effect=slow_persist)
+        pipeline = PagePersistencePipeline(
+            persistence, job_id="job", website_id="site", max_pending=2, batch_size=1
+        )
+        await pipeline.start()
+
+        # First page is taken by the consumer, the next two fill the queue
+        for index in range(3):
+            await pipeline.submit(_page(index))
+        await asyncio.sleep(0)
+
+        blocked = asyncio.create_task(pipeline.submit(_page(3)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        stats = await pipeline.stop()
+
+        assert stats["pages_saved"] == 4
+
+    async def test_counts_failed_batches(self, persistence: MagicMock) -> None:
+        """A batch that raises is counted as failed and later batches still run."""
+        persistence.persist_pages = AsyncMock(side_effect=[Exception("db down"), (1, 0)])
+        pipeline = PagePersistencePipeline(
+            persistence, job_id="job", website_id="site", batch_size=1
+        )
+        await pipeline.start()
+
+        await pipeline.submit(_page(0))
+        await pipeline.submit(_page(1))
+        stats = await pipeline.stop()
+
+        assert stats == {"pages_saved": 1, "pages_failed": 1}
+
+    async def test_submit_requires_running_pipeline(self, persistence: MagicMock) -> None:
+        """Pages cannot be submitted before start or after stop."""
+        pipeline = PagePersistencePipeline(persistence, job_id="job", website_id="site")
+
+        with pytest.raises(RuntimeError):
+            await pipeline.submit(_page(0))
+
+        await pipeline.start()
+        await pipeline.stop()
+
+        with pytest.raises(RuntimeError):
+            await pipeline.submit(_page(0))
@@ -1,5 +1,7 @@
 """Integration tests for PaginationService."""
 
+import asyncio
+
 import pytest
 
 from crawler.api.generated import PaginationConfig
@@ -437,6 +439,119 @@ class TestPaginationServiceWithStopDetection:
         assert len(results) == 1
         assert call_count == 2  # Fetched 2 times, stopped on 2nd
 
+    @pytest.mark.asyncio
+    async def test_prefetch_window_fetches_concurrently_in_order(self) -> None:
+        """Test prefetched pages run concurrently but are yielded in order."""
+        service = PaginationService()
+        config = PaginationConfig(enabled=True, max_pages=6, prefetch_window=3)
+
+        running = 0
+        max_running = 0
+
+        async def mock_fetch(url: str) -> tuple[int, bytes]:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            # Later pages finish first to prove ordering is preserved
+            await asyncio.sleep(0.01 * (7 - int(url.rsplit("/", 1)[1])))
+            running -= 1
+            return 200, f"Page content for {url}. ".encode() * 10
+
+        results = []
+        async for url, _status, _content in service.generate_with_stop_detection(
+            seed_url="https://example.com/page/1",
+            config=config,
+            fetch_fn=mock_fetch,
+        ):
+            results.append(url)
+
+        assert results == [f"https://example.com/page/{page}" for page in range(1, 7)]
+        assert max_running == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_window_cancels_overshoot_on_stop(self) -> None:
+        """Test in-flight fetches are cancelled once the stop detector fires."""
+        service = PaginationService()
+        config = PaginationConfig(enabled=True, max_pages=10, prefetch_window=4)
+
+        started: list[int] = []
+        cancelled: list[int] = []
+
+        async def mock_fetch(url: str) -> tuple[int, bytes]:
+            page = int(url.rsplit("/", 1)[1])
+            started.append(page)
+            if page == 2:
+                return 404, b"Not Found"
+            try:
+                # Pages after the stop never finish on their own
+                await asyncio.sleep(0 if page == 1 else 10)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+            return 200, f"Page {page} content here. ".encode() * 10
+
+        results = []
+        async for url, _status, _content in service.generate_with_stop_detection(
+            seed_url="https://example.com/page/1",
+            config=config,
+            fetch_fn=mock_fetch,
+        ):
+            results.append(url)
+
+        # Stop detection stays authoritative: only page 1 is yielded
+        assert results == ["https://example.com/page/1"]
+        assert {3, 4} <= set(cancelled)
+        # Never more than the window ahead of the page being checked
+        assert max(started) <= 5
+
+    @pytest.mark.asyncio
+    async def test_prefetch_window_cancels_when_consumer_stops(self) -> None:
+        """Test closing the generator early cancels prefetched fetches."""
+        service = PaginationService()
+        config = PaginationConfig(enabled=True, max_pages=10, prefetch_window=3)
+
+        cancelled: list[str] = []
+
+        async def mock_fetch(url: str) -> tuple[int, bytes]:
+            try:
+                await asyncio.sleep(0 if url.endswith("/1") else 10)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+            return 200, f"Page content for {url}. ".encode() * 10
+
+        pages = service.generate_with_stop_detection(
+            seed_url="https://example.com/page/1",
+            config=config,
+            fetch_fn=mock_fetch,
+        )
+        url, _status, _content = await anext(pages)
+        await pages.aclose()
+
+        assert url == "https://example.com/page/1"
+        assert sorted(cancelled) == ["https://example.com/page/2", "https://example.com/page/3"]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_window_continues_after_fetch_error(self) -> None:
+        """Test a failed prefetched page is skipped like in sequential mode."""
+        service = PaginationService()
+        config = PaginationConfig(enabled=True, max_pages=3, prefetch_window=3)
+
+        async def mock_fetch(url: str) -> tuple[int, bytes]:
+            if url.endswith("/2"):
+                raise ConnectionError("connection reset")
+            return 200, f"Page content for {url}. ".encode() * 10
+
+        results = []
+        async for url, _status, _content in service.generate_with_stop_detection(
+            seed_url="https://example.com/page/1",
+            config=config,
+            fetch_fn=mock_fetch,
+        ):
+            results.append(url)
+
+        assert results == ["https://example.com/page/1", "https://example.com/page/3"]
+
 
 class TestPaginationServiceEdgeCases:
     """Edge case tests for PaginationService."""
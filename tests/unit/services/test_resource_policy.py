@@ -0,0 +1,250 @@
+"""Unit tests for browser request interception."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from crawler.services.resource_policy import (
+    ResourcePolicy,
+    StaticAssetCache,
+    freshness_lifetime,
+    site_of,
+)
+
+# Headers of a response a shared cache may keep for a minute
+FRESH = {"cache-control": "max-age=60"}
+
+
+def make_route(
+    url: str,
+    resource_type: str,
+    method: str = "GET",
+    is_navigation: bool = False,
+    headers: dict[str, str] | None = None,
+) -> MagicMock:
+    """Create a mock Playwright route for a request."""
+    route = MagicMock()
+    route.request.url = url
+    route.request.resource_type = resource_type
+    route.request.method = method
+    route.request.all_headers = AsyncMock(return_value=headers or {})
+    route.request.is_navigation_request = MagicMock(return_value=is_navigation)
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    route.fulfill = AsyncMock()
+    route.fetch = AsyncMock()
+    return route
+
+
+async def install(
+    policy: ResourcePolicy, cache: StaticAssetCache | None = None
+) -> tuple[MagicMock, object]:
+    """Apply a policy to a mock page and return the page and its route handler."""
+    page = MagicMock()
+    page.route = AsyncMock()
+    await policy.apply(page, "https://www.example.go.id/articles", cache)
+    pattern, handler = page.route.call_args.args
+    assert pattern == "**/*"
+    return page, handler
+
+
+class TestSiteOf:
+    """Tests for site_of function."""
+
+    def test_registrable_site(self) -> None:
+        """Test subdomains collapse to the registrable site."""
+        assert site_of("https://cdn.example.com/app.js") == "example.com"
+        assert site_of("https://example.com") == "example.com"
+
+    def test_second_level_country_domain(self) -> None:
+        """Test names under go.id and co.uk keep three labels."""
+        assert site_of("https://jdih.mahkamahagung.go.id/x") == "mahkamahagung.go.id"
+        assert site_of("https://static.example.co.uk/a.css") == "example.co.uk"
+
+    def test_no_host(self) -> None:
+        """Test URLs without a host have no site."""
+        assert site_of("data:image/png;base64,AAAA") == ""
+
+
+class TestResourcePolicy:
+    """Tests for ResourcePolicy class."""
+
+    def test_from_config_absent(self) -> None:
+        """Test steps without a policy do not intercept requests."""
+        assert ResourcePolicy.from_config(None) is None
+
+    def test_from_config_defaults(self) -> None:
+        """Test an empty policy blocks images, media and fonts and caches assets."""
+        policy = ResourcePolicy.from_config({})
+
+        assert policy is not None
+        assert policy.block_resource_types == frozenset({"image", "media", "font"})
+        assert policy.block_url_patterns == ()
+        assert policy.block_third_party is False
+        assert policy.cache_static is True
+
+    def test_block_reason(self) -> None:
+        """Test each blocking rule and its metric reason."""
+        policy = ResourcePolicy(block_url_patterns=("*analytics*",), block_third_party=True)
+        site = "example.go.id"
+
+        assert policy.block_reason("https://example.go.id/a.png", "image", False, site) == (
+            "resource_type"
+        )
+        assert policy.block_reason("https://example.go.id/analytics.js", "script", False, site) == (
+            "url_pattern"
+        )
+        assert policy.block_reason("https://cdn.other.com/app.js", "script", False, site) == (
+            "third_party"
+        )
+        assert policy.block_reason("https://cdn.example.go.id/a.js", "script", False, site) is None
+
+    def test_navigation_never_blocked(self) -> None:
+        """Test navigation requests load even when they match a rule."""
+        policy = ResourcePolicy(
+            block_resource_types=frozenset({"document"}), block_third_party=True
+        )
+
+        assert policy.block_reason("https://other.com/", "document", True, "example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_handler_aborts_blocked_request(self) -> None:
+        """Test a blocked request is aborted and never fetched."""
+        _page, handler = await install(ResourcePolicy())
+        route = make_route("https://www.example.go.id/logo.png", "image")
+
+        await handler(route)
+
+        route.abort.assert_called_once_with("blockedbyclient")
+        route.continue_.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handler_continues_uncacheable_request(self) -> None:
+        """Test documents and XHR pass through untouched."""
+        _page, handler = await install(ResourcePolicy(), StaticAssetCache(1024 * 1024))
+        route = make_route("https://www.example.go.id/api/items", "xhr")
+
+        await handler(route)
+
+        route.continue_.assert_called_once()
+        route.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handler_serves_static_asset_from_cache(self) -> None:
+        """Test a stylesheet is fetched once, then served from the shared cache."""
+        cache = StaticAssetCache(1024 * 1024)
+        _page, handler = await install(ResourcePolicy(), cache)
+        response = MagicMock()
+        response.status = 200
+        response.headers = {"content-type": "text/css", **FRESH}
+        response.body = AsyncMock(return_value=b"body{}")
+
+        first = make_route("https://www.example.go.id/site.css", "stylesheet")
+        first.fetch = AsyncMock(return_value=response)
+        await handler(first)
+        first.fulfill.assert_called_once_with(response=response, body=b"body{}")
+
+        second = make_route("https://www.example.go.id/site.css", "stylesheet")
+        await handler(second)
+        second.fetch.assert_not_called()
+        second.fulfill.assert_called_once_with(
+            status=200, headers={"content-type": "text/css", **FRESH}, body=b"body{}"
+        )
+        assert cache.get_stats()["bytes_saved"] == len(b"body{}")
+
+    @pytest.mark.asyncio
+    async def test_handler_skips_cache_for_credentialed_request(self) -> None:
+        """Test requests carrying cookies or authorization bypass the shared cache."""
+        cache = StaticAssetCache(1024 * 1024)
+        cache.put("https://www.example.go.id/app.js", 200, FRESH, b"shared")
+        _page, handler = await install(ResourcePolicy(), cache)
+        route = make_route(
+            "https://www.example.go.id/app.js", "script", headers={"cookie": "session=1"}
+        )
+
+        await handler(route)
+
+        route.continue_.assert_called_once()
+        route.fulfill.assert_not_called()
+        assert cache.get_stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_handler_without_cache_continues_static_asset(self) -> None:
+        """Test static assets load normally when caching is off."""
+        _page, handler = await install(ResourcePolicy(cache_static=False), StaticAssetCache(1024))
+        route = make_route("https://www.example.go.id/app.js", "script")
+
+        await handler(route)
+
+        route.continue_.assert_called_once()
+        route.fetch.assert_not_called()
+
+
+class TestStaticAssetCache:
+    """Tests for StaticAssetCache class."""
+
+    def test_hit_and_miss_stats(self) -> None:
+        """Test hits count saved bytes and misses do not."""
+        cache = StaticAssetCache(1000)
+        cache.put("https://a/x.js", 200, FRESH, b"12345")
+
+        assert cache.get("https://a/missing.js") is None
+        assert cache.get("https://a/x.js") == (200, FRESH, b"12345")
+        assert cache.get_stats() == {
+            "entries": 1,
+            "size_bytes": 5,
+            "hits": 1,
+            "misses": 1,
+            "bytes_saved": 5,
+        }
+
+    def test_unstorable_responses_skipped(self) -> None:
+        """Test errors, unshareable, lifetime-less and oversized responses are not cached."""
+        cache = StaticAssetCache(1000)
+        cache.put("https://a/404.js", 404, FRESH, b"x")
+        cache.put("https://a/no-store.js", 200, {"cache-control": "no-store"}, b"x")
+        cache.put("https://a/private.js", 200, {"cache-control": "private, max-age=60"}, b"x")
+        cache.put("https://a/vary.js", 200, {**FRESH, "vary": "Accept-Encoding, *"}, b"x")
+        cache.put("https://a/cookie.js", 200, {**FRESH, "vary": "Cookie"}, b"x")
+        cache.put("https://a/no-lifetime.js", 200, {}, b"x")
+        cache.put("https://a/big.js", 200, FRESH, b"x" * 101)
+
+        assert cache.get_stats()["entries"] == 0
+
+    def test_freshness_lifetime(self) -> None:
+        """Test s-maxage, max-age and Expires set the lifetime, less the Age header."""
+        date = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+        assert freshness_lifetime({"cache-control": "max-age=60, s-maxage=30"}) == 30
+        assert freshness_lifetime({"cache-control": "max-age=60", "age": "20"}) == 40
+        assert freshness_lifetime({"date": date, "expires": "Mon, 01 Jan 2024 00:02:00 GMT"}) == 120
+        assert freshness_lifetime({"date": date, "expires": "0"}) is None
+        assert freshness_lifetime({"cache-control": "max-age=soon"}) is None
+
+    def test_drops_expired_entries(self) -> None:
+        """Test a response is only served until its lifetime runs out."""
+        cache = StaticAssetCache(1000)
+        with patch("crawler.services.resource_policy.time.monotonic", return_value=100.0):
+            cache.put("https://a/x.js", 200, FRESH, b"12345")
+
+        with patch("crawler.services.resource_policy.time.monotonic", return_value=159.0):
+            assert cache.get("https://a/x.js") is not None
+        with patch("crawler.services.resource_policy.time.monotonic", return_value=160.0):
+            assert cache.get("https://a/x.js") is None
+
+        assert cache.get_stats()["entries"] == 0
+        assert cache.get_stats()["size_bytes"] == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the cache stays within max_bytes by evicting the oldest entry."""
+        cache = StaticAssetCache(200)
+        cache.put("https://a/1.js", 200, FRESH, b"x" * 20)
+        cache.put("https://a/2.js", 200, FRESH, b"x" * 20)
+        cache.get("https://a/1.js")
+        for index in range(3, 11):
+            cache.put(f"https://a/{index}.js", 200, FRESH, b"x" * 20)
+        cache.put("https://a/11.js", 200, FRESH, b"x" * 20)
+
+        assert cache.get_stats()["size_bytes"] <= 200
+        assert cache.get("https://a/2.js") is None
+        assert cache.get("https://a/1.js") is not None
@@ -1,5 +1,6 @@
 """Unit tests for result persistence service."""
 
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -7,6 +8,7 @@ from uuid import uuid4
 import pytest
 
 from crawler.db.generated.models import CrawledPage
+from crawler.services.page_validators import PageValidators
 from crawler.services.result_persistence import ResultPersistenceService
 from crawler.services.step_execution_context import StepExecutionContext, StepResult
 
@@ -519,3 +521,266 @@ class TestResultPersistenceService:
 
         assert stats["pages_saved"] == 1
         assert stats["pages_failed"] == 1
+
+
+class TestBulkPersistence:
+    """Tests for the chunked bulk persistence path."""
+
+    @pytest.fixture
+    def service(self) -> ResultPersistenceService:
+        """Create service with bulk repository methods mocked."""
+        service = ResultPersistenceService(MagicMock())
+
+        async def bulk_upsert(**kwargs):
+            return {url_hash: uuid4() for url_hash in kwargs["url_hashes"]}
+
+        service.page_repo = MagicMock()
+        service.page_repo.bulk_upsert = AsyncMock(side_effect=bulk_upsert)
+        service.page_repo.get_first_by_content_hashes = AsyncMock(return_value={})
+        service.page_repo.bulk_mark_as_duplicate = AsyncMock()
+        service.page_repo.create = AsyncMock()
+
+        service.content_hash_repo = MagicMock()
+        service.content_hash_repo.find_similar_batch = AsyncMock(return_value={})
+        service.content_hash_repo.bulk_upsert = AsyncMock()
+
+        service.normalizer = MagicMock()
+        service.normalizer.normalize_for_hash.side_effect = lambda content: content
+        return service
+
+    @staticmethod
+    def _context(*pages: dict) -> StepExecutionContext:
+        """Create a context with one scrape step returning the given pages."""
+        context = StepExecutionContext(job_id="job", website_id="website", variables={})
+        context.add_result(StepResult(step_name="scrape", extracted_data={"items": list(pages)}))
+        return context
+
+    async def test_writes_pages_with_bulk_statements(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """All pages of a step are written with one statement per table."""
+        context = self._context(
+            *({"_url": f"https://example.com/{i}", "_content": f"page {i}"} for i in range(5))
+        )
+
+        stats = await service.persist_workflow_results(
+            job_id=str(uuid4()), website_id=str(uuid4()), context=context
+        )
+
+        assert stats == {"pages_saved": 5, "pages_failed": 0}
+        service.page_repo.bulk_upsert.assert_awaited_once()
+        assert len(service.page_repo.bulk_upsert.call_args.kwargs["urls"]) == 5
+        service.content_hash_repo.bulk_upsert.assert_awaited_once()
+        service.page_repo.bulk_mark_as_duplicate.assert_not_awaited()
+        service.page_repo.create.assert_not_awaited()
+
+    async def test_saves_response_validators_as_metadata(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """ETag and Last-Modified of a page are saved for conditional re-crawls."""
+        context = self._context(
+            {
+                "_url": "https://example.com/a",
+                "_content": "a",
+                "_etag": '"v1"',
+                "_last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            },
+            {"_url": "https://example.com/b", "_content": "b"},
+        )
+
+        await service.persist_workflow_results(job_id=str(uuid4()), website_id="w", context=context)
+
+        upsert_kwargs = service.page_repo.bulk_upsert.call_args.kwargs
+        metadatas = [json.loads(value) if value else None for value in upsert_kwargs["metadatas"]]
+        assert metadatas == [
+            {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            None,
+        ]
+        assert "_etag" not in upsert_kwargs["extracted_contents"][0]
+
+    async def test_get_page_validators_maps_rows_to_urls(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """Stored validators are returned per URL, omitting unknown URLs."""
+        known_url = "https://example.com/known"
+        service.page_repo.get_validators = AsyncMock(
+            return_value=[
+                MagicMock(
+                    url_hash=service._hash_url(known_url),
+                    content_hash="abc",
+                    etag='"v1"',
+                    last_modified=None,
+                )
+            ]
+        )
+
+        validators = await service.get_page_validators(
+            "website", [known_url, "https://example.com/new"]
+        )
+
+        assert validators == {known_url: PageValidators(content_hash="abc", etag='"v1"')}
+        assert validators[known_url].conditional_headers() == {"If-None-Match": '"v1"'}
+
+    async def test_marks_exact_duplicates_from_database_and_chunk(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """Pages matching stored content or earlier pages in the chunk are duplicates."""
+        existing_id = uuid4()
+        existing_hash = service._hash_content("stored")
+        service.page_repo.get_first_by_content_hashes = AsyncMock(
+            return_value={existing_hash: existing_id}
+        )
+        context = self._context(
+            {"_url": "https://example.com/a", "_content": "stored"},
+            {"_url": "https://example.com/b", "_content": "fresh"},
+            {"_url": "https://example.com/c", "_content": "fresh"},
+        )
+
+        await service.persist_workflow_results(job_id=str(uuid4()), website_id="w", context=context)
+
+        mark_kwargs = service.page_repo.bulk_mark_as_duplicate.call_args.kwargs
+        upsert_kwargs = service.content_hash_repo.bulk_upsert.call_args.kwargs
+        fresh_index = upsert_kwargs["content_hashes"].index(service._hash_content("fresh"))
+
+        assert mark_kwargs["duplicate_of_ids"] == [
+            existing_id,
+            upsert_kwargs["first_seen_page_ids"][fresh_index],
+        ]
+        assert mark_kwargs["similarity_scores"] == [100, 100]
+        assert upsert_kwargs["occurrence_counts"][fresh_index] == 2
+
+    async def test_marks_fuzzy_duplicates_from_database_and_chunk(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """Near-duplicate fingerprints are matched against stored and earlier chunk pages."""
+        fingerprints = {"near-stored": 0b0011, "first": 0xF0F0, "near-first": 0xF0F1}
+        stored_id = uuid4()
+        match = MagicMock(content_hash="stored_hash", hamming_distance=2)
+        service.content_hash_repo.find_similar_batch = AsyncMock(
+            return_value={fingerprints["near-stored"]: match}
+        )
+        service.page_repo.get_first_by_content_hashes = AsyncMock(
+            side_effect=[{}, {"stored_hash": stored_id}]
+        )
+        context = self._context(
+            *({"_url": f"https://example.com/{name}", "_content": name} for name in fingerprints)
+        )
+
+        with patch(
+            "crawler.services.result_persistence.fingerprint_many",
+            side_effect=lambda texts, hash_bits: [fingerprints[text] for text in texts],
+        ):
+            await service.persist_workflow_results(
+                job_id=str(uuid4()), website_id="w", context=context
+            )
+
+        mark_kwargs = service.page_repo.bulk_mark_as_duplicate.call_args.kwargs
+        assert len(mark_kwargs["page_ids"]) == 2
+        assert mark_kwargs["duplicate_of_ids"][0] == stored_id
+        assert mark_kwargs["similarity_scores"] == [96, 98]  # Distances 2 and 1
+
+    async def test_keeps_last_page_for_repeated_url(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """A URL appearing twice in a chunk is written once with its latest content."""
+        context = self._context(
+            {"_url": "https://example.com/a", "_content": "old", "title": "Old"},
+            {"_url": "https://example.com/a", "_content": "new", "title": "New"},
+        )
+
+        stats = await service.persist_workflow_results(
+            job_id=str(uuid4()), website_id="w", context=context
+        )
+
+        assert stats["pages_saved"] == 2
+        assert service.page_repo.bulk_upsert.call_args.kwargs["titles"] == ["New"]
+
+    async def test_splits_steps_into_chunks(self, service: ResultPersistenceService) -> None:
+        """Steps larger than the chunk size are written in several bulk statements."""
+        context = self._context(
+            *({"_url": f"https://example.com/{i}", "_content": f"page {i}"} for i in range(5))
+        )
+
+        with patch("crawler.services.result_persistence.BULK_CHUNK_SIZE", 2):
+            stats = await service.persist_workflow_results(
+                job_id=str(uuid4()), website_id="w", context=context
+            )
+
+        assert stats["pages_saved"] == 5
+        assert service.page_repo.bulk_upsert.await_count == 3
+
+    async def test_falls_back_to_single_page_saves_when_chunk_fails(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """A failed bulk write is retried page by page so good pages are kept."""
+        service.page_repo.bulk_upsert = AsyncMock(side_effect=Exception("bulk failed"))
+        service.page_repo.get_by_content_hash = AsyncMock(return_value=None)
+        service.page_repo.create = AsyncMock(side_effect=[MagicMock(id=uuid4()), Exception("bad")])
+        service.content_hash_repo.find_similar = AsyncMock(return_value=[])
+        service.content_hash_repo.upsert_with_simhash = AsyncMock()
+        context = self._context(
+            {"_url": "https://example.com/1", "_content": "one"},
+            {"_url": "https://example.com/2", "_content": "two"},
+        )
+
+        stats = await service.persist_workflow_results(
+            job_id=str(uuid4()), website_id="w", context=context
+        )
+
+        assert stats == {"pages_saved": 1, "pages_failed": 1}
+        assert service.page_repo.create.await_count == 2
+
+    async def test_stores_html_once_per_content_hash(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """Raw HTML is uploaded once per body and its key saved on every page."""
+        service.storage = MagicMock()
+        service.storage.store_html = AsyncMock(side_effect=lambda html, value: f"html/{value}")
+        context = self._context(
+            {"_url": "https://example.com/a", "_content": "<p>same</p>"},
+            {"_url": "https://example.com/b", "_content": "<p>same</p>"},
+            {"_url": "https://example.com/c", "_content": "<p>other</p>"},
+        )
+
+        await service.persist_workflow_results(job_id=str(uuid4()), website_id="w", context=context)
+
+        assert service.storage.store_html.await_count == 2
+        upsert_kwargs = service.page_repo.bulk_upsert.call_args.kwargs
+        assert upsert_kwargs["gcs_html_paths"] == [
+            f"html/{content_hash}" for content_hash in upsert_kwargs["content_hashes"]
+        ]
+
+    async def test_saves_page_without_html_path_when_upload_fails(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """A failed HTML upload does not fail the page."""
+        service.storage = MagicMock()
+        service.storage.store_html = AsyncMock(side_effect=OSError("bucket unavailable"))
+        context = self._context({"_url": "https://example.com/a", "_content": "<p>page</p>"})
+
+        stats = await service.persist_workflow_results(
+            job_id=str(uuid4()), website_id="w", context=context
+        )
+
+        assert stats == {"pages_saved": 1, "pages_failed": 0}
+        assert service.page_repo.bulk_upsert.call_args.kwargs["gcs_html_paths"] == [None]
+
+    async def test_saves_checkpointed_page_with_recorded_hash_and_html_path(
+        self, service: ResultPersistenceService
+    ) -> None:
+        """A page restored from a checkpoint keeps the content hash and HTML key it recorded."""
+        context = self._context(
+            {
+                "_url": "https://example.com/a",
+                "_content_hash": "abc123",
+                "_html_path": "html/abc123",
+                "title": "A",
+            }
+        )
+
+        await service.persist_workflow_results(job_id=str(uuid4()), website_id="w", context=context)
+
+        upsert_kwargs = service.page_repo.bulk_upsert.call_args.kwargs
+        assert upsert_kwargs["content_hashes"] == ["abc123"]
+        assert upsert_kwargs["gcs_html_paths"] == ["html/abc123"]
+        assert json.loads(upsert_kwargs["extracted_contents"][0]) == {"title": "A"}
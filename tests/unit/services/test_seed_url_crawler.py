@@ -3,11 +3,12 @@
 Tests the explicit key requirement for detail_urls and container selectors.
 """
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from crawler.api.generated import CrawlStep, MethodEnum, StepConfig, StepTypeEnum
+from crawler.db.generated.models import LogLevelEnum
 from crawler.services import CrawlOutcome, SeedURLCrawler, SeedURLCrawlerConfig
 from crawler.services.url_extractor import ExtractedURL
 from crawler.utils.url import hash_url, normalize_url
@@ -355,3 +356,60 @@ class TestCancellationDetection:
         assert result.total_urls_extracted == 3
         assert result.extracted_urls == extracted_urls
         assert len(result.extracted_urls) == 3
+
+
+class TestWriteLog:
+    """Tests for _write_log method."""
+
+    @pytest.fixture
+    def sample_step(self) -> CrawlStep:
+        """Create a sample step for testing."""
+        return CrawlStep(
+            name="test",
+            type=StepTypeEnum.crawl,
+            description="Test step",
+            method=MethodEnum.http,
+            config=StepConfig(url="https://example.com"),
+            selectors={"detail_urls": "a.product-link"},
+            output=None,
+        )
+
+    def test_buffers_entry_in_log_sink(
+        self, crawler: SeedURLCrawler, sample_step: CrawlStep
+    ) -> None:
+        """Test entries go to the log sink instead of the repository."""
+        log_sink = MagicMock()
+        crawl_log_repo = MagicMock()
+        crawl_log_repo.create = AsyncMock()
+        config = SeedURLCrawlerConfig(
+            step=sample_step,
+            job_id="test-job-123",
+            website_id="test-site-123",
+            log_sink=log_sink,
+            crawl_log_repo=crawl_log_repo,
+        )
+
+        crawler._write_log(
+            config, "Page crawled", LogLevelEnum.WARNING, step_name="test", context={"page": 2}
+        )
+
+        log_sink.write.assert_called_once_with(
+            job_id="test-job-123",
+            website_id="test-site-123",
+            message="Page crawled",
+            log_level=LogLevelEnum.WARNING,
+            step_name="test",
+            context={"page": 2},
+        )
+        crawl_log_repo.create.assert_not_called()
+
+    def test_skips_log_sink_without_website(
+        self, crawler: SeedURLCrawler, sample_step: CrawlStep
+    ) -> None:
+        """Test entries without a website are not buffered."""
+        log_sink = MagicMock()
+        config = SeedURLCrawlerConfig(step=sample_step, job_id="test-job-123", log_sink=log_sink)
+
+        crawler._write_log(config, "Page crawled")
+
+        log_sink.write.assert_not_called()
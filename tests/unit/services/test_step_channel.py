@@ -0,0 +1,71 @@
+"""Unit tests for the URL channel between pipelined steps."""
+
+import asyncio
+
+import pytest
+
+from crawler.services.step_channel import URLChannel
+
+
+class TestURLChannel:
+    """Tests for URLChannel class."""
+
+    async def test_batches_arrive_in_order_until_closed(self) -> None:
+        """Batches sent before close are received in order, then iteration ends."""
+        channel = URLChannel(max_batches=4)
+
+        assert await channel.send(["https://example.com/a"])
+        assert await channel.send(["https://example.com/b", "https://example.com/c"])
+        await channel.close()
+
+        batches = [batch async for batch in channel]
+
+        assert batches == [
+            ["https://example.com/a"],
+            ["https://example.com/b", "https://example.com/c"],
+        ]
+        assert channel.batches_sent == 2
+        assert channel.urls_sent == 3
+
+    async def test_send_waits_while_full(self) -> None:
+        """A full channel makes the producer wait until a batch is received."""
+        channel = URLChannel(max_batches=1)
+        await channel.send(["https://example.com/a"])
+
+        blocked = asyncio.create_task(channel.send(["https://example.com/b"]))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        assert await channel.receive() == ["https://example.com/a"]
+        assert await blocked is True
+        assert await channel.receive() == ["https://example.com/b"]
+
+    async def test_close_releases_blocked_sender(self) -> None:
+        """Closing the channel drops the batch of a waiting producer."""
+        channel = URLChannel(max_batches=1)
+        await channel.send(["https://example.com/a"])
+        blocked = asyncio.create_task(channel.send(["https://example.com/b"]))
+        await asyncio.sleep(0.01)
+
+        await channel.close()
+
+        assert await blocked is False
+        assert await channel.send(["https://example.com/c"]) is False
+        assert channel.urls_sent == 1
+
+    async def test_receive_waits_for_batch(self) -> None:
+        """A consumer waits until the producer sends or closes."""
+        channel = URLChannel()
+        receiving = asyncio.create_task(channel.receive())
+        await asyncio.sleep(0.01)
+        assert not receiving.done()
+
+        await channel.close()
+
+        assert await receiving is None
+        assert channel.is_closed
+
+    def test_rejects_invalid_size(self) -> None:
+        """max_batches must be positive."""
+        with pytest.raises(ValueError):
+            URLChannel(max_batches=0)
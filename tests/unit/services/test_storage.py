@@ -0,0 +1,156 @@
+"""Unit tests for object storage backends and StorageService."""
+
+import gzip
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from config import Settings
+from crawler.services.storage import (
+    GCSStorageBackend,
+    LocalStorageBackend,
+    StorageService,
+    compress,
+    decompress,
+)
+
+CONTENT_HASH = "ab" + "0" * 62
+
+
+@pytest.fixture
+def backend(tmp_path: Path) -> LocalStorageBackend:
+    """Create local backend in a temporary directory."""
+    return LocalStorageBackend(tmp_path / "storage")
+
+
+def _service(backend: LocalStorageBackend, compression: str = "gzip") -> StorageService:
+    """Create storage service on the given backend."""
+    settings = Settings(storage_backend="local", storage_compression=compression)
+    return StorageService(settings, backend=backend)
+
+
+class TestCompression:
+    """Tests for compress and decompress helpers."""
+
+    def test_gzip_round_trip(self) -> None:
+        """Gzip output is decompressed by key suffix."""
+        data = b"<html>" * 100
+
+        compressed = compress(data, "gzip")
+
+        assert len(compressed) < len(data)
+        assert decompress(compressed, "html/page.html.gz") == data
+
+    def test_zstd_round_trip(self) -> None:
+        """Zstandard output is decompressed by key suffix."""
+        pytest.importorskip("compression.zstd")
+        data = b"<html>" * 100
+
+        assert decompress(compress(data, "zstd"), "html/page.html.zst") == data
+
+    def test_rejects_unknown_compression(self) -> None:
+        """Unknown compression names raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            compress(b"data", "brotli")
+
+
+class TestLocalStorageBackend:
+    """Tests for the filesystem backend."""
+
+    async def test_upload_and_download(self, backend: LocalStorageBackend) -> None:
+        """Uploaded bytes are read back and listed by prefix."""
+        await backend.upload("html/ab/one.html", b"one", content_type="text/html")
+        await backend.upload("tasks/1/two.html", b"two", content_type="text/html")
+
+        assert await backend.download("html/ab/one.html") == b"one"
+        assert await backend.exists("html/ab/one.html")
+        assert await backend.list_keys("html/") == ["html/ab/one.html"]
+        assert len(await backend.list_keys()) == 2
+
+    async def test_delete(self, backend: LocalStorageBackend) -> None:
+        """Deleted objects no longer exist."""
+        await backend.upload("page.html", b"page", content_type="text/html")
+
+        await backend.delete("page.html")
+
+        assert not await backend.exists("page.html")
+
+    async def test_rejects_keys_outside_root(self, backend: LocalStorageBackend) -> None:
+        """Keys cannot escape the storage root."""
+        with pytest.raises(ValueError, match="escapes"):
+            await backend.upload("../outside.html", b"x", content_type="text/html")
+
+
+class TestGCSStorageBackend:
+    """Tests for the GCS backend with a mocked client."""
+
+    async def test_upload_runs_client_call_with_encoding(self) -> None:
+        """Uploads set the content encoding and call the client off the event loop."""
+        client = MagicMock()
+        blob = client.bucket.return_value.blob.return_value
+        backend = GCSStorageBackend(client, bucket_name="bucket", max_concurrency=2)
+
+        await backend.upload("html/page.html.gz", b"data", "text/html", content_encoding="gzip")
+        await backend.close()
+
+        client.bucket.assert_called_once_with("bucket")
+        assert blob.content_encoding == "gzip"
+        blob.upload_from_string.assert_called_once_with(b"data", content_type="text/html")
+
+    async def test_download_skips_transcoding(self) -> None:
+        """Downloads return stored bytes without GCS decompressing them."""
+        client = MagicMock()
+        blob = client.bucket.return_value.blob.return_value
+        blob.download_as_bytes.return_value = b"compressed"
+        backend = GCSStorageBackend(client, bucket_name="bucket")
+
+        assert await backend.download("html/page.html.gz") == b"compressed"
+        blob.download_as_bytes.assert_called_once_with(raw_download=True)
+        await backend.close()
+
+
+class TestStorageService:
+    """Tests for content-addressed HTML storage."""
+
+    async def test_store_html_uses_content_addressed_key(
+        self, backend: LocalStorageBackend
+    ) -> None:
+        """HTML is stored compressed under a key derived from its content hash."""
+        service = _service(backend)
+
+        key = await service.store_html("<p>hello</p>", CONTENT_HASH)
+
+        assert key == f"html/ab/{CONTENT_HASH}.html.gz"
+        assert gzip.decompress(await backend.download(key)) == b"<p>hello</p>"
+        assert await service.download_html(key) == "<p>hello</p>"
+
+    async def test_store_html_skips_identical_bodies(self, backend: LocalStorageBackend) -> None:
+        """A body already stored is not uploaded again."""
+        service = _service(backend, compression="none")
+        backend.upload = AsyncMock(wraps=backend.upload)  # type: ignore[method-assign]
+
+        await service.store_html("<p>hello</p>", CONTENT_HASH)
+        await service.store_html("<p>hello</p>", CONTENT_HASH)
+
+        # A new service instance finds the object in the backend
+        await _service(backend, compression="none").store_html("<p>hello</p>", CONTENT_HASH)
+
+        backend.upload.assert_awaited_once()
+
+    async def test_upload_html_by_task(self, backend: LocalStorageBackend) -> None:
+        """Task uploads use a stable URL hash in the key."""
+        service = _service(backend)
+
+        first = await service.upload_html("https://example.com/a", "<p>a</p>", "task-1")
+        second = await service.upload_html("https://example.com/a", "<p>a</p>", "task-1")
+
+        assert first == second
+        assert first.startswith("tasks/task-1/")
+        assert await service.list_blobs("tasks/") == [first]
+
+    async def test_delete_html_reports_failure(self, backend: LocalStorageBackend) -> None:
+        """Deleting a missing object returns False."""
+        service = _service(backend)
+
+        assert not await service.delete_html("missing.html")
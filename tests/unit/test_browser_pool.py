@@ -13,16 +13,65 @@ from crawler.services.browser_pool import BrowserCrashError, BrowserInstance, Br
 
 @pytest.fixture
 def settings():
-    """Create test settings."""
+    """Create test settings (fresh context per acquisition, no reuse)."""
     return Settings(
         browser_pool_size=2,
         browser_max_contexts_per_browser=3,
         browser_context_timeout=60,
         browser_health_check_interval=30,
         browser_default_type="chromium",
+        browser_warm_contexts_per_browser=0,
+        browser_context_max_uses=1,
     )
 
 
+@pytest.fixture
+def warm_settings():
+    """Create test settings with warm, reusable contexts."""
+    return Settings(
+        browser_pool_size=2,
+        browser_max_contexts_per_browser=3,
+        browser_context_timeout=60,
+        browser_health_check_interval=30,
+        browser_default_type="chromium",
+        browser_warm_contexts_per_browser=1,
+        browser_context_max_uses=2,
+    )
+
+
+def make_browser(contexts):
+    """Create a mock browser whose new_context returns the given contexts in order."""
+    browser = AsyncMock()
+    browser.is_connected = MagicMock(return_value=True)
+    browser.new_context = AsyncMock(side_effect=contexts)
+    browser.close = AsyncMock()
+    return browser
+
+
+def make_context():
+    """Create a mock browser context with no open pages.
+
+    Event handlers registered with on() are kept in context.handlers by event name.
+    """
+    context = AsyncMock()
+    context.pages = []
+    context.handlers = {}
+    context.on = MagicMock(
+        side_effect=lambda event, handler: context.handlers.setdefault(event, handler)
+    )
+    return context
+
+
+def open_page(context, url):
+    """Emit a new page on a mock context, navigate it to url and close it."""
+    page = MagicMock()
+    handlers = {}
+    page.on = MagicMock(side_effect=lambda event, handler: handlers.setdefault(event, handler))
+    context.handlers["page"](page)
+    handlers["framenavigated"](MagicMock(url=url))
+    return handlers
+
+
 @pytest.fixture
 def mock_playwright():
     """Create mock playwright."""
@@ -1426,3 +1475,212 @@ class TestBrowserCrashDetection:
 
         # Clean up
         await pool.shutdown()
+
+
+class TestWarmContextPool:
+    """Tests for warm context reuse and least-loaded placement."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_prewarms_contexts(self, warm_settings, mock_playwright):
+        """Test each browser gets its warm contexts at startup."""
+        mock_playwright.chromium.launch = AsyncMock(
+            side_effect=[make_browser([make_context()]), make_browser([make_context()])]
+        )
+        pool = BrowserPool(warm_settings)
+        await pool.initialize()
+
+        assert [len(b.idle_contexts) for b in pool._browsers] == [1, 1]
+        assert pool.get_pool_stats()["warm_contexts"] == 2
+
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_released_context_is_reset_and_reused(self, warm_settings, mock_playwright):
+        """Test a released context is cleaned, kept open and handed out again."""
+        warm_context = make_context()
+        mock_playwright.chromium.launch = AsyncMock(
+            side_effect=[make_browser([warm_context]), make_browser([make_context()])]
+        )
+        pool = BrowserPool(warm_settings)
+        await pool.initialize()
+
+        async with pool.acquire_context() as context:
+            assert context is warm_context
+            assert pool._browsers[0].idle_contexts == []
+
+        warm_context.clear_cookies.assert_called_once()
+        warm_context.close.assert_not_called()
+        assert pool._browsers[0].idle_contexts[0].context is warm_context
+
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_context_recycled_after_max_uses(self, warm_settings, mock_playwright):
+        """Test a context is closed once it reaches browser_context_max_uses."""
+        warm_context = make_context()
+        mock_playwright.chromium.launch = AsyncMock(
+            side_effect=[make_browser([warm_context]), make_browser([make_context()])]
+        )
+        pool = BrowserPool(warm_settings)
+        await pool.initialize()
+        pool._browsers[1].is_healthy = False  # Pin acquisitions to browser 0
+
+        for _ in range(2):
+            async with pool.acquire_context() as context:
+                assert context is warm_context
+
+        warm_context.close.assert_called_once()
+        assert pool._browsers[0].idle_contexts == []
+
+        pool._browsers[1].is_healthy = True
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_context_recycled_when_caller_fails(self, warm_settings, mock_playwright):
+        """Test a context whose user raised is closed instead of reused."""
+        warm_context = make_context()
+        mock_playwright.chromium.launch = AsyncMock(
+            side_effect=[make_browser([warm_context]), make_browser([make_context()])]
+        )
+        pool = BrowserPool(warm_settings)
+        await pool.initialize()
+
+        with pytest.raises(ValueError, match="scrape failed"):
+            async with pool.acquire_context():
+                raise ValueError("scrape failed")
+
+        warm_context.close.assert_called_once()
+        assert pool._browsers[0].idle_contexts == []
+
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_close_idle_contexts_retires_in_use_contexts(
+        self, warm_settings, mock_playwright
+    ):
+        """Test memory pressure closes warm contexts and retires contexts in use."""
+        warm_contexts = [make_context(), make_context()]
+        mock_playwright.chromium.launch = AsyncMock(
+            side_effect=[make_browser([warm_contexts[0]]), make_browser([warm_contexts[1]])]
+        )
+        pool = BrowserPool(warm_settings)
+        await pool.initialize()
+
+        async with pool.acquire_context() as context:
+            closed = await pool.close_idle_contexts(min_idle_seconds=0)
+            assert closed == 1
+
+        # The context in use was created before the pressure, so it is not reused
+        context.close.assert_called_once()
+        assert pool.get_pool_stats()["warm_contexts"] == 0
+
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_get_available_browser_least_loaded(self, settings, mock_playwright):
+        """Test placement picks the browser with the fewest active contexts."""
+        pool = BrowserPool(settings)
+        await pool.initialize()
+
+        pool._browsers[0].active_contexts = 2
+        pool._browsers[1].active_contexts = 1
+
+        browser_instance = await pool._get_available_browser()
+
+        assert browser_instance is pool._browsers[1]
+
+        pool._browsers[0].active_contexts = 0
+        pool._browsers[1].active_contexts = 0
+        await pool.shutdown()
+
+
+class TestContextStorageReset:
+    """Tests for clearing the storage of origins a warm context visited."""
+
+    @staticmethod
+    async def _pool(warm_settings, mock_playwright, warm_context):
+        """Create a pool whose acquisitions all get warm_context from browser 0."""
+        mock_playwright.chromium.launch = AsyncMock(
+            side_effect=[make_browser([warm_context]), make_browser([make_context()])]
+        )
+        pool = BrowserPool(warm_settings)
+        await pool.initialize()
+        pool._browsers[1].is_healthy = False  # Pin acquisitions to browser 0
+        return pool
+
+    @pytest.mark.asyncio
+    async def test_clears_origins_of_pages_closed_before_release(
+        self, warm_settings, mock_playwright
+    ):
+        """Test origins are cleared through CDP even though their pages are closed."""
+        warm_context = make_context()
+        warm_context.pages = [AsyncMock()]  # The blank page left by the last reset
+        session = AsyncMock()
+        warm_context.new_cdp_session = AsyncMock(return_value=session)
+        pool = await self._pool(warm_settings, mock_playwright, warm_context)
+
+        async with pool.acquire_context() as context:
+            open_page(context, "https://example.com/articles?page=2")
+            open_page(context, "about:blank")
+
+        session.send.assert_awaited_once_with(
+            "Storage.clearDataForOrigin",
+            {"origin": "https://example.com", "storageTypes": "all"},
+        )
+        session.detach.assert_awaited_once()
+        warm_context.close.assert_not_called()
+        assert pool._browsers[0].idle_contexts[0].origins == set()
+
+        pool._browsers[1].is_healthy = True
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_closes_context_whose_storage_cannot_be_cleared(
+        self, warm_settings, mock_playwright
+    ):
+        """Test a context is closed when the storage of a visited origin is not cleared."""
+        warm_context = make_context()
+        pool = await self._pool(warm_settings, mock_playwright, warm_context)
+        pool._browsers[0].browser_type = "firefox"
+
+        async with pool.acquire_context() as context:
+            open_page(context, "https://example.com/")
+
+        warm_context.new_cdp_session.assert_not_called()
+        warm_context.close.assert_called_once()
+        assert pool._browsers[0].idle_contexts == []
+
+        pool._browsers[1].is_healthy = True
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_closes_crashed_context(self, warm_settings, mock_playwright):
+        """Test a context with a crashed page is never reused."""
+        warm_context = make_context()
+        pool = await self._pool(warm_settings, mock_playwright, warm_context)
+
+        async with pool.acquire_context() as context:
+            page_handlers = open_page(context, "about:blank")
+            page_handlers["crash"](MagicMock())
+
+        warm_context.close.assert_called_once()
+        assert pool._browsers[0].idle_contexts == []
+
+        pool._browsers[1].is_healthy = True
+        await pool.shutdown()
+
+    def test_recycle_reason_for_closed_context(self, warm_settings):
+        """Test closed contexts and failed resets are not reusable."""
+        pool = BrowserPool(warm_settings)
+        browser_instance = BrowserInstance(
+            browser=MagicMock(), browser_type="chromium", created_at=datetime.now(UTC)
+        )
+        pool._browsers = [browser_instance]
+        metadata = MagicMock(closed=False, crashed=False, generation=0, use_count=1)
+
+        assert pool._recycle_reason(browser_instance, metadata, True) is None
+        assert pool._recycle_reason(browser_instance, metadata, True, reset=False) == (
+            "reset_failed"
+        )
+        metadata.closed = True
+        assert pool._recycle_reason(browser_instance, metadata, True) == "closed"
@@ -427,3 +427,47 @@ class TestHTMLParserService:
         # Should include text from all child elements
         assert "This is bold text" in p_text
         assert "Some italic and span content" in inner_div_text
+
+    def test_apply_xpath_with_compiled_expression(
+        self, html_parser: HTMLParserService, sample_html: str
+    ) -> None:
+        """Test applying a pre-compiled XPath expression."""
+        from lxml import etree
+
+        tree = html_parser.parse_html_raw(sample_html)
+        links = html_parser.apply_xpath(
+            tree, etree.XPath("//a[@class='article-link']"), attribute="href"
+        )
+
+        assert links == ["/article/1", "/article/2"]
+
+    def test_parse_html_fast_empty_content(self, html_parser: HTMLParserService) -> None:
+        """Test fast parsing rejects empty content."""
+        with pytest.raises(ValueError, match="HTML content cannot be empty"):
+            html_parser.parse_html_fast("")
+
+    def test_apply_fast_css_selector_matches_css(
+        self, html_parser: HTMLParserService, sample_html: str
+    ) -> None:
+        """Test selectolax fast path returns the same values as BeautifulSoup."""
+        tree = html_parser.parse_html_fast(sample_html)
+        soup = html_parser.parse_html(sample_html)
+
+        for selector, attribute in (
+            (".article-title", None),
+            ("article a", "href"),
+            ("nav a", "class"),
+        ):
+            fast = html_parser.apply_fast_css_selector(tree, selector, attribute, select_all=True)
+            slow = html_parser.apply_css_selector(soup, selector, attribute, select_all=True)
+            assert fast == slow
+
+    def test_apply_fast_css_selector_ignores_script_text(
+        self, html_parser: HTMLParserService
+    ) -> None:
+        """Test fast path skips script and style contents like get_text()."""
+        tree = html_parser.parse_html_fast(
+            "<div><p>Hello <script>var x = 1;</script><style>.a {}</style>world</p></div>"
+        )
+
+        assert html_parser.apply_fast_css_selector(tree, "div p") == ["Helloworld"]
@@ -1,5 +1,7 @@
 """Unit tests for selector processor."""
 
+from unittest.mock import patch
+
 import pytest
 
 from crawler.services.selector_processor import SelectorProcessor
@@ -194,3 +196,95 @@ class TestSelectorProcessor:
         result = processor.process_selectors(html_content, selectors)
 
         assert result["first_link"] == "/link1"
+
+    def test_compile_plan_is_cached(self):
+        """Test that identical selector configurations reuse the compiled plan."""
+        processor = SelectorProcessor()
+        selectors = {"title": "h1.title", "links": {"selector": "a", "type": "array"}}
+
+        plan = processor.compile_plan(selectors)
+
+        assert processor.compile_plan(dict(selectors)) is plan
+        assert [f.engine for f in plan.fields] == ["fast_css", "fast_css"]
+
+    def test_compile_plan_selects_engine(self):
+        """Test engine selection for XPath, plain CSS and complex CSS selectors."""
+        processor = SelectorProcessor()
+        selectors = {
+            "xpath": "//h1/text()",
+            "plain": ".content p",
+            "complex": "ul > li:first-child a",
+            "invalid": {"attribute": "href"},
+        }
+
+        plan = processor.compile_plan(selectors)
+        fields = {f.field_name: f for f in plan.fields}
+
+        assert fields["xpath"].engine == "xpath"
+        assert fields["xpath"].xpath is not None
+        assert fields["plain"].engine == "fast_css"
+        assert fields["complex"].engine == "css"
+        assert fields["invalid"].error is not None
+
+    def test_process_selectors_parses_once_per_engine(self, html_content):
+        """Test that a document is parsed once no matter how many fields use it."""
+        processor = SelectorProcessor()
+        parser = processor.html_parser
+        selectors = {
+            "title": "h1.title",
+            "paragraphs": {"selector": ".content p", "type": "array"},
+            "links": {"selector": "a.article", "attribute": "href", "type": "array"},
+            "first_item": "ul > li:first-child a",
+            "heading": "//h1/text()",
+        }
+
+        with (
+            patch.object(parser, "parse_html_fast", wraps=parser.parse_html_fast) as fast,
+            patch.object(parser, "parse_html", wraps=parser.parse_html) as soup,
+            patch.object(parser, "parse_html_raw", wraps=parser.parse_html_raw) as raw,
+        ):
+            result = processor.process_selectors(html_content, selectors)
+
+        assert fast.call_count == 1
+        assert soup.call_count == 1
+        assert raw.call_count == 1
+        assert result == {
+            "title": "Main Title",
+            "paragraphs": ["Paragraph 1", "Paragraph 2"],
+            "links": ["/link1", "/link2", "/link3"],
+            "first_item": "Article 1",
+            "heading": "Main Title",
+        }
+
+    def test_fast_path_matches_beautifulsoup(self):
+        """Test that the selectolax fast path returns the same values as BeautifulSoup."""
+        processor = SelectorProcessor()
+        html = (
+            '<div class="post  featured"><p> Hello <b>world</b>'
+            "<script>var x = 1;</script><!-- note --> end </p></div>"
+        )
+
+        for selector, attribute in (("div p", None), ("div", "class"), ("div.post", None)):
+            fast = processor.extract_single_field(html, selector, attribute)
+            soup = processor.html_parser.extract_data(html, selector, attribute)
+            assert fast == soup
+
+    def test_empty_html_content_returns_none(self):
+        """Test that unparseable content yields None for every field."""
+        processor = SelectorProcessor()
+
+        result = processor.process_selectors("", {"title": "h1", "body": "//body"})
+
+        assert result == {"title": None, "body": None}
+
+    def test_invalid_xpath_returns_empty(self, html_content):
+        """Test that an invalid XPath expression yields no matches."""
+        processor = SelectorProcessor()
+        selectors = {
+            "bad": "//div[",
+            "bad_array": {"selector": "//div[", "type": "array"},
+        }
+
+        result = processor.process_selectors(html_content, selectors)
+
+        assert result == {"bad": None, "bad_array": []}
@@ -51,6 +51,12 @@ class TestCrawlStepInput:
             CrawlStepInput(url=["", "https://example.com"])
         assert "cannot be empty string" in str(exc_info.value)
 
+    def test_empty_later_seed_in_list_fails(self):
+        """Test that every seed in the list is validated, not just the first."""
+        with pytest.raises(ValidationError) as exc_info:
+            CrawlStepInput(url=["https://example.com", " "])
+        assert "URL at index 1 cannot be empty string" in str(exc_info.value)
+
     def test_whitespace_only_url_fails(self):
         """Test that whitespace-only URL fails validation."""
         with pytest.raises(ValidationError) as exc_info:
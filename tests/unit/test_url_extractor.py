@@ -8,6 +8,7 @@ from crawler.api.generated import SelectorConfig
 from crawler.services.html_parser import HTMLParserService
 from crawler.services.redis_cache import URLDeduplicationCache
 from crawler.services.url_extractor import ExtractedURL, URLExtractorService
+from crawler.utils.bloom_filter import BloomFilter
 
 
 @pytest.fixture
@@ -215,8 +216,41 @@ class TestURLExtractorService:
 
         # Batch check should have been called once for all URLs
         assert url_extractor_with_cache.dedup_cache.exists_batch.call_count == 1
-        # Cache should have been called to store URLs
-        assert url_extractor_with_cache.dedup_cache.set.call_count == 4
+        # New URLs should have been stored in one batch, with the job ID as value
+        url_extractor_with_cache.dedup_cache.set_batch.assert_awaited_once_with(
+            {url.url_hash: "job-123" for url in results}
+        )
+        assert url_extractor_with_cache.dedup_cache.set.call_count == 0
+
+    async def test_seen_filter_skips_cache_for_known_urls(
+        self, html_parser: HTMLParserService, mock_dedup_cache: AsyncMock, sample_list_html: str
+    ) -> None:
+        """Test that URLs seen earlier in the job are skipped without a cache lookup."""
+        mock_dedup_cache.exists_batch = AsyncMock(return_value=set())
+        extractor = URLExtractorService(
+            html_parser=html_parser,
+            dedup_cache=mock_dedup_cache,
+            seen_filter=BloomFilter(capacity=100),
+        )
+
+        first = await extractor.extract_urls(
+            html_content=sample_list_html,
+            base_url="https://example.com",
+            url_selector="a.article-link",
+            job_id="job-123",
+        )
+        second = await extractor.extract_urls(
+            html_content=sample_list_html,
+            base_url="https://example.com",
+            url_selector="a.article-link",
+            job_id="job-123",
+        )
+
+        assert len(first) == 4
+        assert second == []
+        # The second page was resolved by the filter alone
+        assert mock_dedup_cache.exists_batch.call_count == 1
+        assert mock_dedup_cache.set_batch.call_count == 1
 
     async def test_extract_urls_skip_cached(
         self, url_extractor_with_cache: URLExtractorService, sample_list_html: str
@@ -0,0 +1,344 @@
+"""Unit tests for concurrent message consumption in CrawlJobWorker."""
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from config import Settings
+from crawler import worker as worker_module
+from crawler.worker import CrawlJobWorker
+
+
+def _make_msg(job_id: str | None, queued_for: float = 0.0, num_pending: int = 0) -> MagicMock:
+    """Create a mock JetStream message."""
+    msg = MagicMock()
+    payload = {"job_id": job_id} if job_id else {}
+    msg.data = json.dumps(payload).encode("utf-8")
+    msg.metadata = SimpleNamespace(
+        timestamp=datetime.now(UTC) - timedelta(seconds=queued_for), num_pending=num_pending
+    )
+    msg.ack = AsyncMock()
+    msg.nak = AsyncMock()
+    msg.in_progress = AsyncMock()
+    return msg
+
+
+@pytest.fixture
+def settings() -> Settings:
+    """Create settings with a small concurrency level."""
+    return Settings(
+        worker_concurrency=2,
+        worker_heartbeat_interval=0.01,
+        worker_drain_timeout=1.0,
+    )
+
+
+@pytest.fixture
+def worker(settings: Settings) -> CrawlJobWorker:
+    """Create worker with mocked dependencies."""
+    nats_queue = MagicMock()
+    nats_queue.health_check = AsyncMock(return_value=True)
+    nats_queue.disconnect = AsyncMock()
+    return CrawlJobWorker(
+        nats_queue=nats_queue,
+        cancellation_flag=AsyncMock(),
+        dedup_cache=AsyncMock(),
+        settings=settings,
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_shutdown_flag():
+    """Ensure the module-level shutdown flag does not leak between tests."""
+    worker_module._shutdown = False
+    yield
+    worker_module._shutdown = False
+
+
+class TestHandleMessage:
+    """Tests for per-message processing and acknowledgement."""
+
+    async def test_acks_on_success(self, worker: CrawlJobWorker) -> None:
+        """Successful jobs are acknowledged."""
+        msg = _make_msg("job-1")
+
+        with patch.object(worker, "process_job", AsyncMock(return_value=True)):
+            await worker.handle_message(msg)
+
+        msg.ack.assert_awaited_once()
+        msg.nak.assert_not_awaited()
+
+    async def test_naks_on_failure(self, worker: CrawlJobWorker) -> None:
+        """Jobs that request a requeue are negatively acknowledged."""
+        msg = _make_msg("job-1")
+
+        with patch.object(worker, "process_job", AsyncMock(return_value=False)):
+            await worker.handle_message(msg)
+
+        msg.nak.assert_awaited_once()
+        msg.ack.assert_not_awaited()
+
+    async def test_acks_message_without_job_id(self, worker: CrawlJobWorker) -> None:
+        """Malformed messages are acknowledged to remove them from the queue."""
+        msg = _make_msg(None)
+
+        with patch.object(worker, "process_job", AsyncMock()) as process_job:
+            await worker.handle_message(msg)
+
+        process_job.assert_not_awaited()
+        msg.ack.assert_awaited_once()
+
+    async def test_sends_in_progress_for_long_jobs(self, worker: CrawlJobWorker) -> None:
+        """Long-running jobs send heartbeats until they finish."""
+        msg = _make_msg("job-1")
+
+        async def slow_job(job_id, data):
+            await asyncio.sleep(0.05)
+            return True
+
+        with patch.object(worker, "process_job", side_effect=slow_job):
+            await worker.handle_message(msg)
+
+        assert msg.in_progress.await_count >= 1
+        msg.ack.assert_awaited_once()
+
+    async def test_naks_when_cancelled(self, worker: CrawlJobWorker) -> None:
+        """Jobs cancelled during drain are handed back to the queue."""
+        msg = _make_msg("job-1")
+        started = asyncio.Event()
+
+        async def hanging_job(job_id, data):
+            started.set()
+            await asyncio.sleep(10)
+            return True
+
+        with patch.object(worker, "process_job", side_effect=hanging_job):
+            task = asyncio.create_task(worker.handle_message(msg))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        msg.nak.assert_awaited_once()
+
+
+class TestRunConcurrency:
+    """Tests for the concurrent main loop."""
+
+    async def test_processes_jobs_concurrently_up_to_limit(self, worker: CrawlJobWorker) -> None:
+        """Jobs run in parallel, and fetches never exceed the free slot count."""
+        msgs = [_make_msg(f"job-{i}") for i in range(4)]
+        batches = []
+        running = 0
+        peak = 0
+
+        async def fetch(batch, timeout):
+            batches.append(batch)
+            if not msgs:
+                worker_module._shutdown = True
+                raise TimeoutError
+            taken = msgs[:batch]
+            del msgs[:batch]
+            return taken
+
+        async def job(job_id, data):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return True
+
+        psub = MagicMock()
+        psub.fetch = AsyncMock(side_effect=fetch)
+        worker.nats_queue.js = MagicMock()
+        worker.nats_queue.js.pull_subscribe = AsyncMock(return_value=psub)
+
+        with patch.object(worker, "process_job", side_effect=job):
+            await worker.run()
+
+        assert peak == 2
+        assert all(batch <= 2 for batch in batches)
+        assert not worker.processing
+        assert REGISTRY.get_sample_value("active_crawl_tasks") == 0
+        worker.nats_queue.disconnect.assert_awaited_once()
+
+    async def test_drains_in_flight_jobs_on_shutdown(self, worker: CrawlJobWorker) -> None:
+        """In-flight jobs finish and are acked after shutdown is requested."""
+        msg = _make_msg("job-1")
+        fetched = False
+
+        async def fetch(batch, timeout):
+            nonlocal fetched
+            if fetched:
+                # Real fetches block until the timeout; yield so the job can run
+                await asyncio.sleep(0.01)
+                raise TimeoutError
+            fetched = True
+            return [msg]
+
+        async def job(job_id, data):
+            worker_module._shutdown = True
+            await asyncio.sleep(0.02)
+            return True
+
+        psub = MagicMock()
+        psub.fetch = AsyncMock(side_effect=fetch)
+        worker.nats_queue.js = MagicMock()
+        worker.nats_queue.js.pull_subscribe = AsyncMock(return_value=psub)
+
+        with patch.object(worker, "process_job", side_effect=job):
+            await worker.run()
+
+        msg.ack.assert_awaited_once()
+        worker.nats_queue.disconnect.assert_awaited_once()
+
+    async def test_shutdown_drains_when_all_slots_are_busy(self, worker: CrawlJobWorker) -> None:
+        """Shutdown is noticed while every slot runs a long job, which is requeued."""
+        fetched = [_make_msg("job-1"), _make_msg("job-2")]
+        msgs = list(fetched)
+
+        async def fetch(batch, timeout):
+            if not msgs:
+                raise TimeoutError
+            taken = msgs[:batch]
+            del msgs[:batch]
+            return taken
+
+        async def job(job_id, data):
+            asyncio.get_running_loop().call_later(0.05, setattr, worker_module, "_shutdown", True)
+            await asyncio.Event().wait()  # Never finishes on its own
+
+        psub = MagicMock()
+        psub.fetch = AsyncMock(side_effect=fetch)
+        worker.nats_queue.js = MagicMock()
+        worker.nats_queue.js.pull_subscribe = AsyncMock(return_value=psub)
+
+        with (
+            patch.object(worker_module, "SHUTDOWN_CHECK_INTERVAL", 0.01),
+            patch.object(worker, "process_job", side_effect=job),
+        ):
+            await asyncio.wait_for(worker.run(), timeout=3)
+
+        for msg in fetched:
+            msg.nak.assert_awaited_once()
+            msg.ack.assert_not_awaited()
+
+
+class TestQueueMetrics:
+    """Tests for the queue metrics recorded when a message is picked up."""
+
+    async def test_records_queue_lag_and_pending(
+        self, worker: CrawlJobWorker, settings: Settings
+    ) -> None:
+        """Starting a message records how long it waited and how many are left."""
+        msg = _make_msg("job-1", queued_for=30.0, num_pending=5)
+        labels = {"queue_name": settings.nats_stream_name}
+
+        with patch.object(worker, "process_job", AsyncMock(return_value=True)):
+            worker._start_message(msg)
+            assert REGISTRY.get_sample_value("active_crawl_tasks") == 1
+            await asyncio.gather(*worker._in_flight)
+
+        assert REGISTRY.get_sample_value("queue_lag_seconds", labels) == pytest.approx(30, abs=1)
+        assert REGISTRY.get_sample_value("queue_messages_pending", labels) == 5
+        assert REGISTRY.get_sample_value("active_crawl_tasks") == 0
+
+
+class TestExecuteWorkflow:
+    """Tests for streaming scraped pages during workflow execution."""
+
+    @staticmethod
+    def _conn() -> tuple[MagicMock, MagicMock]:
+        """Create a mock connection and the savepoint it hands out."""
+        savepoint = MagicMock()
+        savepoint.commit = AsyncMock()
+        savepoint.rollback = AsyncMock()
+        conn = MagicMock()
+        conn.begin_nested = AsyncMock(return_value=savepoint)
+        return conn, savepoint
+
+    @staticmethod
+    def _orchestrator(failed_steps: list[str]) -> MagicMock:
+        """Create an orchestrator that streams one page through its page sink."""
+        orchestrator = MagicMock()
+        context = MagicMock()
+        context.metadata = {}
+        context.get_failed_steps.return_value = failed_steps
+
+        async def execute_workflow():
+            await orchestrator.page_sink({"_url": "https://example.com/1"})
+            return context
+
+        orchestrator.execute_workflow = AsyncMock(side_effect=execute_workflow)
+        return orchestrator
+
+    async def test_keeps_streamed_pages_when_workflow_succeeds(
+        self, worker: CrawlJobWorker
+    ) -> None:
+        """Pages streamed by a successful workflow are kept."""
+        conn, savepoint = self._conn()
+        orchestrator = self._orchestrator(failed_steps=[])
+
+        with patch.object(
+            worker_module.ResultPersistenceService,
+            "persist_pages",
+            AsyncMock(return_value=(1, 0)),
+        ):
+            _, stats = await worker._execute_workflow(
+                orchestrator,
+                conn,
+                worker_module.ResultPersistenceService(conn),
+                job_id="job-1",
+                website_id="site-1",
+            )
+
+        assert stats == {"pages_saved": 1, "pages_failed": 0}
+        savepoint.commit.assert_awaited_once()
+        savepoint.rollback.assert_not_awaited()
+
+    async def test_discards_streamed_pages_when_workflow_fails(
+        self, worker: CrawlJobWorker
+    ) -> None:
+        """Pages streamed by a failed workflow are rolled back."""
+        conn, savepoint = self._conn()
+        orchestrator = self._orchestrator(failed_steps=["scrape"])
+
+        with patch.object(
+            worker_module.ResultPersistenceService,
+            "persist_pages",
+            AsyncMock(return_value=(1, 0)),
+        ):
+            await worker._execute_workflow(
+                orchestrator,
+                conn,
+                worker_module.ResultPersistenceService(conn),
+                job_id="job-1",
+                website_id="site-1",
+            )
+
+        savepoint.rollback.assert_awaited_once()
+        savepoint.commit.assert_not_awaited()
+
+    async def test_skips_streaming_when_disabled(self, worker: CrawlJobWorker) -> None:
+        """With streaming disabled no savepoint or page sink is used."""
+        worker.settings.scrape_streaming_enabled = False
+        conn, _ = self._conn()
+        orchestrator = MagicMock()
+        orchestrator.execute_workflow = AsyncMock(return_value=MagicMock())
+
+        _, stats = await worker._execute_workflow(
+            orchestrator,
+            conn,
+            worker_module.ResultPersistenceService(conn),
+            job_id="job-1",
+            website_id="site-1",
+        )
+
+        assert stats is None
+        conn.begin_nested.assert_not_awaited()
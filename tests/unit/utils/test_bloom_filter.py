@@ -0,0 +1,73 @@
+"""Unit tests for the Bloom filter used to pre-filter URL hashes."""
+
+import pytest
+
+from crawler.utils.bloom_filter import BloomFilter
+from crawler.utils.url import hash_url
+
+
+def _hashes(count: int, offset: int = 0) -> list[str]:
+    """Create URL hashes for distinct pages."""
+    return [
+        hash_url(f"https://example.com/page/{index}") for index in range(offset, offset + count)
+    ]
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter class."""
+
+    def test_contains_every_added_key(self) -> None:
+        """Test added keys are always found."""
+        seen = BloomFilter(capacity=1000)
+        hashes = _hashes(1000)
+
+        for url_hash in hashes:
+            assert seen.add(url_hash) is True
+
+        assert all(url_hash in seen for url_hash in hashes)
+        assert len(seen) == 1000
+
+    def test_false_positive_rate_within_bound(self) -> None:
+        """Test unseen keys are rarely reported at capacity."""
+        seen = BloomFilter(capacity=2000, error_rate=0.01)
+        for url_hash in _hashes(2000):
+            seen.add(url_hash)
+
+        false_positives = sum(url_hash in seen for url_hash in _hashes(10000, offset=2000))
+
+        assert false_positives / 10000 < 0.02
+
+    def test_stops_accepting_keys_at_capacity(self) -> None:
+        """Test a full filter rejects new keys instead of degrading."""
+        seen = BloomFilter(capacity=2)
+        first, second, third = _hashes(3)
+
+        assert seen.add(first) and seen.add(second)
+        assert seen.is_full
+        assert seen.add(third) is False
+        assert len(seen) == 2
+
+    def test_readding_key_uses_no_capacity(self) -> None:
+        """Test keys already present do not count towards capacity."""
+        seen = BloomFilter(capacity=2)
+        first, second = _hashes(2)
+
+        for _ in range(3):
+            assert seen.add(first)
+        assert len(seen) == 1
+        assert seen.add(second)
+        assert seen.is_full
+        assert seen.add(first)
+
+    def test_sizing(self) -> None:
+        """Test bit and hash counts follow the standard formulas."""
+        seen = BloomFilter(capacity=1_000_000, error_rate=1e-6)
+
+        assert seen.bit_count == 28_755_176
+        assert seen.hash_count == 20
+
+    @pytest.mark.parametrize(("capacity", "error_rate"), [(0, 0.01), (10, 0.0), (10, 1.0)])
+    def test_rejects_invalid_parameters(self, capacity: int, error_rate: float) -> None:
+        """Test invalid sizing parameters raise ValueError."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, error_rate=error_rate)
@@ -0,0 +1,37 @@
+"""Unit tests for keyset pagination cursors."""
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from crawler.utils.cursor import decode_cursor, encode_cursor
+
+
+class TestCursor:
+    """Tests for cursor encoding and decoding."""
+
+    def test_round_trip_integer_id(self) -> None:
+        """Test integer ids decode back to int with the exact timestamp."""
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    def test_round_trip_uuid_id(self) -> None:
+        """Test UUID ids decode back to their string form."""
+        created_at = datetime(2026, 1, 2, tzinfo=UTC)
+        row_id = uuid.uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, str(row_id))
+
+    def test_cursor_is_url_safe(self) -> None:
+        """Test cursors can be passed as query parameters without escaping."""
+        cursor = encode_cursor(datetime(2026, 1, 2, tzinfo=UTC), uuid.uuid4())
+
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "eyJhIjogMX0", "WyJ4IiwxXQ"])
+    def test_invalid_cursor(self, cursor: str) -> None:
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
@@ -4,9 +4,20 @@ Tests cover tokenization, hash generation, fingerprint creation,
 distance calculation, and similarity metrics with known examples.
 """
 
+import itertools
+import random
+
 import pytest
 
-from crawler.utils.simhash import Simhash, compare_texts, find_near_duplicates
+from crawler.utils.simhash import (
+    Simhash,
+    cluster_near_duplicates,
+    compare_texts,
+    find_near_duplicates,
+    fingerprint_features,
+    fingerprint_many,
+    near_duplicate_pairs,
+)
 
 
 class TestSimhashTokenization:
@@ -307,6 +318,100 @@ class TestSimhashHelperFunctions:
         assert len(duplicates) == 0
 
 
+class TestFingerprintCompatibility:
+    """Tests that fingerprints match those stored by the original implementation."""
+
+    @pytest.mark.parametrize(
+        ("text", "fingerprint_64", "fingerprint_16"),
+        [
+            ("The quick brown fox jumps over the lazy dog", 0x2D826D2221CA8B1F, 0x8B1F),
+            ("Hello 世界 мир", 0xBB35CD03151AF390, 0xF390),
+            ("word word word other", 0x3245F128B5FDE62A, 0xE62A),
+        ],
+    )
+    def test_recorded_fingerprints(
+        self, text: str, fingerprint_64: int, fingerprint_16: int
+    ) -> None:
+        """Test fingerprints equal values recorded before the packed accumulation."""
+        assert Simhash(text).fingerprint == fingerprint_64
+        assert Simhash(text, hash_bits=16).fingerprint == fingerprint_16
+
+    def test_fingerprint_many_matches_simhash(self) -> None:
+        """Test batch fingerprints equal per-text fingerprints, None without tokens."""
+        texts = ["The quick brown fox", "Python programming language", "!!! ???"]
+
+        fingerprints = fingerprint_many(texts)
+
+        assert fingerprints[:2] == [Simhash(text).fingerprint for text in texts[:2]]
+        assert fingerprints[2] is None
+
+    def test_repeated_words_count_as_weight(self) -> None:
+        """Test a repeated word weighs the same as a feature with that weight."""
+        assert Simhash("spam spam spam eggs").fingerprint == fingerprint_features(
+            {"spam": 3, "eggs": 1}
+        )
+
+    def test_shingles_group_consecutive_words(self) -> None:
+        """Test shingle features are overlapping word groups."""
+        sh = Simhash("a b c", shingle_size=2)
+
+        assert sh.fingerprint == fingerprint_features({"a b": 1, "b c": 1})
+        assert fingerprint_many(["a b c"], shingle_size=2) == [sh.fingerprint]
+
+    def test_invalid_feature_weight_raises_error(self) -> None:
+        """Test non-positive feature weights raise ValueError."""
+        with pytest.raises(ValueError, match="must be positive"):
+            fingerprint_features({"word": 0})
+
+    def test_invalid_shingle_size_raises_error(self) -> None:
+        """Test non-positive shingle sizes raise ValueError."""
+        with pytest.raises(ValueError, match="shingle_size must be positive"):
+            Simhash("test", shingle_size=0)
+
+
+class TestNearDuplicateSearch:
+    """Tests for banded near-duplicate search and clustering."""
+
+    @pytest.mark.parametrize("threshold", [0, 1, 3, 7])
+    def test_pairs_match_brute_force(self, threshold: int) -> None:
+        """Test band search finds exactly the pairs an all-pairs scan finds."""
+        rng = random.Random(threshold)
+        base = [rng.getrandbits(64) for _ in range(50)]
+        flipped = [fp ^ (1 << rng.randrange(64)) ^ (1 << rng.randrange(64)) for fp in base]
+        fingerprints = base + flipped
+
+        expected = [
+            (i, j, (fingerprints[i] ^ fingerprints[j]).bit_count())
+            for i, j in itertools.combinations(range(len(fingerprints)), 2)
+            if (fingerprints[i] ^ fingerprints[j]).bit_count() <= threshold
+        ]
+
+        assert sorted(near_duplicate_pairs(fingerprints, threshold)) == expected
+
+    def test_pairs_reported_once(self) -> None:
+        """Test a pair agreeing on several bands is reported once."""
+        assert list(near_duplicate_pairs([0x1234, 0x1234, 0x1235], threshold=3)) == [
+            (0, 1, 0),
+            (0, 2, 1),
+            (1, 2, 1),
+        ]
+
+    def test_negative_threshold_raises_error(self) -> None:
+        """Test negative thresholds raise ValueError."""
+        with pytest.raises(ValueError, match="threshold"):
+            list(near_duplicate_pairs([1, 2], threshold=-1))
+
+    def test_clusters_are_transitive(self) -> None:
+        """Test chains of near-duplicates form one cluster."""
+        fingerprints = [0b0000, 0xFFFF_0000, 0b0111, 0b0111_1111, 0xFFFF_0000]
+
+        assert cluster_near_duplicates(fingerprints, threshold=4) == [[0, 2, 3], [1, 4]]
+
+    def test_no_clusters_for_distinct_fingerprints(self) -> None:
+        """Test fingerprints far apart form no clusters."""
+        assert cluster_near_duplicates([0, (1 << 64) - 1, 0xFFFF_FFFF]) == []
+
+
 class TestSimhashProperties:
     """Tests for Simhash properties and methods."""
 
@@ -0,0 +1,47 @@
+"""Unit tests for Simhash PostgreSQL helpers."""
+
+import random
+
+from crawler.utils.simhash_helpers import (
+    MAX_BANDED_DISTANCE,
+    from_signed_int64,
+    simhash_bands,
+    to_signed_int64,
+)
+
+
+class TestSignedConversion:
+    """Tests for signed/unsigned BIGINT conversion."""
+
+    def test_round_trip(self) -> None:
+        """Test conversion round-trips across the full unsigned range."""
+        for value in (0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1):
+            assert from_signed_int64(to_signed_int64(value)) == value
+
+
+class TestSimhashBands:
+    """Tests for 16-bit band splitting used by the band index lookup."""
+
+    def test_bands_lowest_first(self) -> None:
+        """Test bands are returned lowest bits first."""
+        assert simhash_bands(0x0004000300020001) == (1, 2, 3, 4)
+
+    def test_signed_and_unsigned_bands_match(self) -> None:
+        """Test bands are identical for signed and unsigned representations."""
+        fingerprint = 0xFEDCBA9876543210
+        assert simhash_bands(fingerprint) == simhash_bands(to_signed_int64(fingerprint))
+
+    def test_near_duplicates_share_a_band(self) -> None:
+        """Test fingerprints within MAX_BANDED_DISTANCE always share a band."""
+        rng = random.Random(42)
+        for _ in range(500):
+            fingerprint = rng.getrandbits(64)
+            flipped = fingerprint
+            for bit in rng.sample(range(64), MAX_BANDED_DISTANCE):
+                flipped ^= 1 << bit
+
+            shared = [
+                a == b
+                for a, b in zip(simhash_bands(fingerprint), simhash_bands(flipped), strict=True)
+            ]
+            assert any(shared)